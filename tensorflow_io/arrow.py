@@ -16,6 +16,7 @@
 
 @@ArrowDataset
 @@ArrowFeatherDataset
+@@ArrowFlightDataset
 @@ArrowStreamDataset
 @@list_feather_columns
 """
@@ -25,6 +26,7 @@ from tensorflow.python.util.all_util import remove_undocumented
 
 from tensorflow_io.python.ops.arrow_dataset_ops import ArrowDataset
 from tensorflow_io.python.ops.arrow_dataset_ops import ArrowFeatherDataset
+from tensorflow_io.python.ops.arrow_dataset_ops import ArrowFlightDataset
 from tensorflow_io.python.ops.arrow_dataset_ops import ArrowStreamDataset
 from tensorflow_io.python.ops.arrow_dataset_ops import list_feather_columns
 
@@ -32,6 +34,7 @@ from tensorflow_io.python.ops.arrow_dataset_ops import list_feather_columns
 _allowed_symbols = [
     "ArrowDataset",
     "ArrowFeatherDataset",
+    "ArrowFlightDataset",
     "ArrowStreamDataset",
     "list_feather_columns",
 ]
@@ -13,12 +13,21 @@ See the License for the specific language governing permissions and
 limitations under the License.
 ==============================================================================*/
 
+#include <deque>
+#include <functional>
+
+#include "absl/memory/memory.h"
 #include "arrow/api.h"
+#include "arrow/flight/api.h"
+#include "arrow/io/file.h"
 #include "arrow/io/stdio.h"
 #include "arrow/ipc/api.h"
 #include "arrow/result.h"
 #include "tensorflow/core/framework/dataset.h"
 #include "tensorflow/core/graph/graph.h"
+#include "tensorflow/core/lib/gtl/cleanup.h"
+#include "tensorflow/core/platform/env.h"
+#include "tensorflow/core/platform/mutex.h"
 #include "tensorflow/core/public/version.h"
 #include "tensorflow_io/core/kernels/arrow/arrow_kernels.h"
 #include "tensorflow_io/core/kernels/arrow/arrow_stream_client.h"
@@ -107,9 +116,9 @@ class ArrowDatasetBase : public DatasetBase {
         TF_RETURN_IF_ERROR(SetupStreamsLocked(ctx->env()));
       }
 
-      std::vector<Tensor>* result_tensors = out_tensors;
-      auto partial_batches =
-          std::vector<std::shared_ptr<std::vector<Tensor>>>();
+      // Tensors of a batch that spans record batches. They are allocated for
+      // the full batch size once and each record batch fills a slice.
+      std::vector<Tensor> partial_tensors;
       int64 partial_batch_size = 0;
       bool have_result = false;
 
@@ -130,9 +139,10 @@ class ArrowDatasetBase : public DatasetBase {
           if (partial_batch_size > 0 &&
               this->dataset()->batch_mode_ !=
                   ArrowBatchMode::BATCH_DROP_REMAINDER) {
-            // Copy partial batched tensors to output tensors
-            TF_RETURN_IF_ERROR(AppendPartialTensors(
-                ctx, partial_batch_size, partial_batches, out_tensors));
+            // Trim the partial batch to the rows that were filled
+            for (Tensor& tensor : partial_tensors) {
+              out_tensors->emplace_back(tensor.Slice(0, partial_batch_size));
+            }
             have_result = true;
             // No more results, so end the sequence
           } else {
@@ -149,36 +159,57 @@ class ArrowDatasetBase : public DatasetBase {
                   // Use set batch size minus any partials already read
                   this->dataset()->batch_size_ - partial_batch_size;
 
-          // Prepare a partial batch to save, either current record batch is too
-          // small or continuing to fill previous partial batch
+          // Fill a slice of a partial batch, either current record batch is
+          // too small or continuing to fill previous partial batch
           if (batch_size != 0 &&
               (partial_batch_size > 0 ||
                current_row_idx_ + batch_size > current_batch_->num_rows())) {
             int64 rows_remaining =
                 current_batch_->num_rows() - current_row_idx_;
             batch_size = std::min(batch_size, rows_remaining);
-            partial_batches.push_back(std::make_shared<std::vector<Tensor>>());
-            result_tensors = partial_batches.back().get();
-            partial_batch_size += batch_size;
-          }
 
-          // Assign Tensors for each column in the current row
-          for (size_t i = 0; i < this->dataset()->columns_.size(); ++i) {
-            int32 col = this->dataset()->columns_[i];
-            DataType output_type = this->dataset()->output_types_[i];
-            std::shared_ptr<arrow::Array> arr = current_batch_->column(col);
-
-            // Get the TensorShape for the column batch
-            TensorShape output_shape = TensorShape({});
-            TF_RETURN_IF_ERROR(ArrowUtil::AssignShape(
-                arr, current_row_idx_, batch_size, &output_shape));
-
-            // Allocate a new tensor and assign Arrow data to it
-            Tensor tensor(ctx->allocator({}), output_type, output_shape);
-            TF_RETURN_IF_ERROR(
-                ArrowUtil::AssignTensor(arr, current_row_idx_, &tensor));
-
-            result_tensors->emplace_back(std::move(tensor));
+            for (size_t i = 0; i < this->dataset()->columns_.size(); ++i) {
+              int32 col = BatchColumn(i);
+              std::shared_ptr<arrow::Array> arr = current_batch_->column(col);
+
+              // Allocate the full batch on the first slice
+              if (partial_batch_size == 0) {
+                TensorShape output_shape = TensorShape({});
+                TF_RETURN_IF_ERROR(ArrowUtil::AssignShape(
+                    arr, current_row_idx_, batch_size, &output_shape));
+                output_shape.set_dim(0, this->dataset()->batch_size_);
+                partial_tensors.emplace_back(ctx->allocator({}),
+                                             this->dataset()->output_types_[i],
+                                             output_shape);
+              }
+
+              // Assign Arrow data directly into the slice of the batch
+              Tensor slice = partial_tensors[i].Slice(
+                  partial_batch_size, partial_batch_size + batch_size);
+              TF_RETURN_IF_ERROR(
+                  ArrowUtil::AssignTensor(arr, current_row_idx_, &slice));
+            }
+            partial_batch_size += batch_size;
+          } else {
+            // The row or batch is contained in the current record batch, so
+            // each column is aliased or copied with a single assignment
+            for (size_t i = 0; i < this->dataset()->columns_.size(); ++i) {
+              int32 col = BatchColumn(i);
+              DataType output_type = this->dataset()->output_types_[i];
+              std::shared_ptr<arrow::Array> arr = current_batch_->column(col);
+
+              // Get the TensorShape for the column batch
+              TensorShape output_shape = TensorShape({});
+              TF_RETURN_IF_ERROR(ArrowUtil::AssignShape(
+                  arr, current_row_idx_, batch_size, &output_shape));
+
+              Tensor tensor;
+              TF_RETURN_IF_ERROR(ArrowUtil::MakeTensor(
+                  arr, current_row_idx_, output_type, output_shape,
+                  ctx->allocator({}), AllowAliasLocked(), &tensor));
+
+              out_tensors->emplace_back(std::move(tensor));
+            }
           }
 
           // If not batching or have a full batch, then have a result to return
@@ -186,10 +217,9 @@ class ArrowDatasetBase : public DatasetBase {
               partial_batch_size == this->dataset()->batch_size_) {
             have_result = true;
 
-            // If have partial batches, copy partial tensors to output tensors
-            if (!partial_batches.empty()) {
-              TF_RETURN_IF_ERROR(AppendPartialTensors(
-                  ctx, partial_batch_size, partial_batches, out_tensors));
+            // If have a partial batch, it is now complete
+            if (!partial_tensors.empty()) {
+              *out_tensors = std::move(partial_tensors);
             }
           }
 
@@ -203,76 +233,6 @@ class ArrowDatasetBase : public DatasetBase {
       return Status::OK();
     }
 
-   private:
-    Status AppendPartialTensors(
-        IteratorContext* ctx, int64 batch_size,
-        const std::vector<std::shared_ptr<std::vector<Tensor>>>& partials,
-        std::vector<Tensor>* out_tensors) {
-      int64 batch_index = 0;
-
-      // If only one partial batch, can just move to output
-      if (partials.size() == 1) {
-        *out_tensors = std::move(*partials.at(0).get());
-        return Status::OK();
-      }
-
-      // Copy all partial tensors to a single output tensor
-      for (auto it_partial = partials.begin(); it_partial != partials.end();
-           it_partial++) {
-        int64 partial_batch_size = 0;
-        for (size_t i = 0; i < (*it_partial)->size(); ++i) {
-          const Tensor& element = (*it_partial)->at(i);
-          partial_batch_size = element.dim_size(0);
-
-          // Allocate tensor sized to batch on first iteration
-          if (it_partial == partials.begin()) {
-            TensorShape shape = element.shape();
-            shape.set_dim(0, batch_size);
-            Tensor output(ctx->allocator({}), element.dtype(), shape);
-            out_tensors->emplace_back(std::move(output));
-          }
-
-          // Copy partial batch to the output batch
-          TF_RETURN_IF_ERROR(
-              CopyElementsToParent(element, &out_tensors->at(i), batch_index));
-        }
-        batch_index += partial_batch_size;
-      }
-      return Status::OK();
-    }
-
-    template <typename T>
-    Status HandleElementsToParent(const Tensor& element, Tensor* parent,
-                                  int64 index) {
-      // TODO: look into removing this loop, move tensor instead of copy
-      for (int64 i = 0; i < element.dim_size(0); ++i) {
-        parent->flat_outer_dims<T>().chip(index + i, 0) =
-            element.flat_outer_dims<T>().chip(i, 0);
-      }
-      return Status::OK();
-    }
-
-    Status CopyElementsToParent(const Tensor& element, Tensor* parent,
-                                int64 index) {
-#define HANDLE_TYPE(T)                                                   \
-  case DataTypeToEnum<T>::value: {                                       \
-    return HandleElementsToParent<T>(std::move(element), parent, index); \
-  }
-
-      switch (element.dtype()) {
-        TF_CALL_ALL_TYPES(HANDLE_TYPE);
-        TF_CALL_QUANTIZED_TYPES(HANDLE_TYPE);
-#if TF_MAJOR_VERSION == 2 && TF_MINOR_VERSION == 3
-        TF_CALL_uint32(HANDLE_TYPE);
-        TF_CALL_uint64(HANDLE_TYPE);
-#endif
-#undef HANDLE_TYPE
-        default:
-          return errors::Unimplemented(
-              "CopyElementsToParent Unhandled data type: ", element.dtype());
-      }
-    }
-
    protected:
     Status SaveInternal(SerializationContext* ctx,
                         IteratorStateWriter* writer) override {
@@ -285,6 +245,12 @@ class ArrowDatasetBase : public DatasetBase {
           "RestoreInternal is currently not supported");
     }
 
+    // Whether output tensors may share the memory of Arrow buffers. Datasets
+    // whose buffers are not owned by Arrow must copy instead.
+    virtual bool AllowAliasLocked() TF_EXCLUSIVE_LOCKS_REQUIRED(mu_) {
+      return true;
+    }
+
     // Setup Arrow record batch consumer and initialze current_batch_
     virtual Status SetupStreamsLocked(Env* env)
         TF_EXCLUSIVE_LOCKS_REQUIRED(mu_) = 0;
@@ -304,10 +270,16 @@ class ArrowDatasetBase : public DatasetBase {
       current_row_idx_ = 1;
     }
 
+    // Index in the record batch of the column for output i. Readers that
+    // only decode the selected columns override this.
+    virtual int32 BatchColumn(size_t i) const {
+      return this->dataset()->columns_[i];
+    }
+
     // Check columns of batch in stream are expected data type
     Status CheckBatchColumnTypes(std::shared_ptr<arrow::RecordBatch> batch) {
       for (size_t i = 0; i < this->dataset()->columns_.size(); ++i) {
-        int32 col = this->dataset()->columns_[i];
+        int32 col = BatchColumn(i);
         DataType dt = this->dataset()->output_types_[i];
         std::shared_ptr<arrow::Array> arr = batch->column(col);
         TF_RETURN_IF_ERROR(ArrowUtil::CheckArrayType(arr->type(), dt));
@@ -328,6 +300,126 @@ class ArrowDatasetBase : public DatasetBase {
   const std::vector<PartialTensorShape> output_shapes_;
 };
 
+// Reads record batches from a number of sources on a pool of threads and
+// hands them out in the order they arrive. Each thread claims the next
+// unread source and calls read_source with a callback that queues a batch,
+// the callback returns false once the reader is cancelled and the source
+// should stop. A source blocked on I/O registers a cancel function through
+// set_cancel, which interrupts its reads when the reader is cancelled, and
+// unregisters it with nullptr before the I/O objects go away.
+class ArrowParallelBatchReader {
+ public:
+  using PushFn = std::function<bool(std::shared_ptr<arrow::RecordBatch>)>;
+  using CancelFn = std::function<void()>;
+  using SetCancelFn = std::function<void(CancelFn)>;
+  using ReadSourceFn = std::function<Status(size_t source, const PushFn& push,
+                                            const SetCancelFn& set_cancel)>;
+
+  ArrowParallelBatchReader(Env* env, size_t num_sources, int64 num_threads,
+                           ReadSourceFn read_source)
+      : num_sources_(num_sources),
+        capacity_(2 * num_threads),
+        read_source_(std::move(read_source)),
+        active_threads_(num_threads),
+        cancel_fns_(num_threads) {
+    for (int64 i = 0; i < num_threads; ++i) {
+      threads_.emplace_back(env->StartThread(ThreadOptions(),
+                                             "arrow_batch_reader",
+                                             [this, i]() { ReaderThread(i); }));
+    }
+  }
+
+  // Cancel the readers, interrupt the reads they are blocked on, and wait
+  // for them to finish.
+  ~ArrowParallelBatchReader() {
+    {
+      mutex_lock l(mu_);
+      cancelled_ = true;
+      cv_.notify_all();
+      for (const auto& cancel : cancel_fns_) {
+        if (cancel) {
+          cancel();
+        }
+      }
+    }
+    threads_.clear();
+  }
+
+  // Get the next record batch, or nullptr when all sources are exhausted
+  Status Next(std::shared_ptr<arrow::RecordBatch>* batch) {
+    mutex_lock l(mu_);
+    while (queue_.empty() && active_threads_ > 0 && status_.ok()) {
+      cv_.wait(l);
+    }
+    TF_RETURN_IF_ERROR(status_);
+    if (queue_.empty()) {
+      *batch = nullptr;
+      return Status::OK();
+    }
+    *batch = std::move(queue_.front());
+    queue_.pop_front();
+    cv_.notify_all();
+    return Status::OK();
+  }
+
+ private:
+  void ReaderThread(int64 thread) {
+    SetCancelFn set_cancel = [this, thread](CancelFn cancel) {
+      mutex_lock l(mu_);
+      if (cancelled_ && cancel) {
+        cancel();
+        return;
+      }
+      cancel_fns_[thread] = std::move(cancel);
+    };
+    PushFn push = [this](std::shared_ptr<arrow::RecordBatch> batch) {
+      mutex_lock l(mu_);
+      while (!cancelled_ && queue_.size() >= capacity_) {
+        cv_.wait(l);
+      }
+      if (cancelled_) {
+        return false;
+      }
+      queue_.push_back(std::move(batch));
+      cv_.notify_all();
+      return true;
+    };
+    while (true) {
+      size_t source;
+      {
+        mutex_lock l(mu_);
+        if (cancelled_ || !status_.ok() || next_source_ >= num_sources_) {
+          --active_threads_;
+          cv_.notify_all();
+          return;
+        }
+        source = next_source_++;
+      }
+      Status status = read_source_(source, push, set_cancel);
+      mutex_lock l(mu_);
+      // Errors of reads interrupted by the cancellation are not reported
+      if (!status.ok() && !cancelled_) {
+        status_.Update(status);
+        cv_.notify_all();
+      }
+    }
+  }
+
+  const size_t num_sources_;
+  const size_t capacity_;
+  const ReadSourceFn read_source_;
+
+  mutex mu_;
+  condition_variable cv_;
+  std::deque<std::shared_ptr<arrow::RecordBatch>> queue_ TF_GUARDED_BY(mu_);
+  size_t next_source_ TF_GUARDED_BY(mu_) = 0;
+  int64 active_threads_ TF_GUARDED_BY(mu_);
+  bool cancelled_ TF_GUARDED_BY(mu_) = false;
+  Status status_ TF_GUARDED_BY(mu_);
+  std::vector<CancelFn> cancel_fns_ TF_GUARDED_BY(mu_);
+  std::vector<std::unique_ptr<Thread>> threads_;
+};
+
 // Abstract base class to define an Arrow OpKernel with output_types and
 // output_shapes attributes, and list of column indices. Implementations
 // will define how to create the Arrow Dataset.
@@ -472,6 +564,12 @@ class ArrowZeroCopyDatasetOp : public ArrowOpKernelBase {
           : ArrowBaseIterator<Dataset>(params) {}
 
      private:
+      // The buffer is owned by the Python caller and may be released once the
+      // dataset is gone, so output tensors must not reference it.
+      bool AllowAliasLocked() TF_EXCLUSIVE_LOCKS_REQUIRED(mu_) override {
+        return false;
+      }
+
       Status SetupStreamsLocked(Env* env)
           TF_EXCLUSIVE_LOCKS_REQUIRED(mu_) override {
         buffer_ = std::make_shared<arrow::Buffer>(dataset()->buffer_ptr_,
@@ -601,6 +699,20 @@ class ArrowSerializedDatasetOp : public ArrowOpKernelBase {
     }
 
    private:
+    // Arrow buffer over a scalar string tensor that keeps the tensor alive,
+    // so columns aliased into output tensors outlive the dataset safely.
+    class TensorArrowBuffer : public arrow::Buffer {
+     public:
+      explicit TensorArrowBuffer(const Tensor& tensor)
+          : arrow::Buffer(reinterpret_cast<const uint8_t*>(
+                              tensor.scalar<tstring>()().data()),
+                          tensor.scalar<tstring>()().size()),
+            tensor_(tensor) {}
+
+     private:
+      const Tensor tensor_;
+    };
+
     class Iterator : public ArrowBaseIterator<Dataset> {
      public:
       explicit Iterator(const Params& params)
@@ -609,8 +721,7 @@ class ArrowSerializedDatasetOp : public ArrowOpKernelBase {
      private:
       Status SetupStreamsLocked(Env* env)
           TF_EXCLUSIVE_LOCKS_REQUIRED(mu_) override {
-        const string& batches = dataset()->batches_.scalar<tstring>()();
-        auto buffer = std::make_shared<arrow::Buffer>(batches);
+        auto buffer = std::make_shared<TensorArrowBuffer>(dataset()->batches_);
         auto buffer_reader = std::make_shared<arrow::io::BufferReader>(buffer);
         auto result = arrow::ipc::RecordBatchFileReader::Open(buffer_reader);
         CHECK_ARROW(result.status());
@@ -678,20 +789,48 @@ class ArrowFeatherDatasetOp : public ArrowOpKernelBase {
       filenames.push_back(filenames_tensor->flat<tstring>()(i));
     }
 
-    *output = new Dataset(ctx, filenames, columns, batch_size, batch_mode,
-                          output_types_, output_shapes_);
+    int64 num_shards;
+    OP_REQUIRES_OK(ctx, ParseScalarArgument(ctx, "num_shards", &num_shards));
+    OP_REQUIRES(ctx, num_shards >= 1,
+                errors::InvalidArgument(
+                    "`num_shards` must be at least 1, got: ", num_shards));
+    int64 shard_index;
+    OP_REQUIRES_OK(ctx, ParseScalarArgument(ctx, "shard_index", &shard_index));
+    OP_REQUIRES(ctx, shard_index >= 0 && shard_index < num_shards,
+                errors::InvalidArgument("`shard_index` must be in [0, ",
+                                        num_shards, "), got: ", shard_index));
+
+    *output =
+        new Dataset(ctx, filenames, num_shards, shard_index, columns,
+                    batch_size, batch_mode, output_types_, output_shapes_);
   }
 
  private:
   class Dataset : public ArrowDatasetBase {
    public:
     Dataset(OpKernelContext* ctx, const std::vector<string>& filenames,
+            const int64 num_shards, const int64 shard_index,
             const std::vector<int32>& columns, const int64 batch_size,
             const ArrowBatchMode batch_mode, const DataTypeVector& output_types,
             const std::vector<PartialTensorShape>& output_shapes)
         : ArrowDatasetBase(ctx, columns, batch_size, batch_mode, output_types,
                            output_shapes),
-          filenames_(filenames) {}
+          filenames_(filenames),
+          num_shards_(num_shards),
+          shard_index_(shard_index) {
+      // Only the selected columns are read from each file, record batches
+      // hold them in file order
+      file_columns_.assign(columns_.begin(), columns_.end());
+      std::sort(file_columns_.begin(), file_columns_.end());
+      file_columns_.erase(
+          std::unique(file_columns_.begin(), file_columns_.end()),
+          file_columns_.end());
+      for (int32 col : columns_) {
+        batch_columns_.push_back(
+            std::lower_bound(file_columns_.begin(), file_columns_.end(), col) -
+            file_columns_.begin());
+      }
+    }
 
     string DebugString() const override {
       return "ArrowFeatherDatasetOp::Dataset";
@@ -705,6 +844,10 @@ class ArrowFeatherDatasetOp : public ArrowOpKernelBase {
                               Node** output) const override {
       Node* filenames = nullptr;
       TF_RETURN_IF_ERROR(b->AddVector(filenames_, &filenames));
+      Node* num_shards = nullptr;
+      TF_RETURN_IF_ERROR(b->AddScalar(num_shards_, &num_shards));
+      Node* shard_index = nullptr;
+      TF_RETURN_IF_ERROR(b->AddScalar(shard_index_, &shard_index));
       Node* columns = nullptr;
       TF_RETURN_IF_ERROR(b->AddVector(columns_, &columns));
       Node* batch_size = nullptr;
@@ -714,7 +857,9 @@ class ArrowFeatherDatasetOp : public ArrowOpKernelBase {
       TF_RETURN_IF_ERROR(GetBatchModeStr(batch_mode_, &batch_mode_str));
       TF_RETURN_IF_ERROR(b->AddScalar(batch_mode_str, &batch_mode));
       TF_RETURN_IF_ERROR(b->AddDataset(
-          this, {filenames, columns, batch_size, batch_mode}, output));
+          this,
+          {filenames, num_shards, shard_index, columns, batch_size, batch_mode},
+          output));
       return Status::OK();
     }
 
@@ -733,41 +878,21 @@ class ArrowFeatherDatasetOp : public ArrowOpKernelBase {
      private:
       Status SetupStreamsLocked(Env* env)
           TF_EXCLUSIVE_LOCKS_REQUIRED(mu_) override {
-        const string& filename = dataset()->filenames_[current_file_idx_];
-
-        // Init a TF file from the filename and determine size
-        // TODO: set optional memory to nullptr until input arg is added
-        std::shared_ptr<SizedRandomAccessFile> tf_file(
-            new SizedRandomAccessFile(env, filename, nullptr, 0));
-        uint64 size;
-        TF_RETURN_IF_ERROR(tf_file->GetFileSize(&size));
-
-        // Wrap the TF file in Arrow interface to be used in Feather reader
-        std::shared_ptr<ArrowRandomAccessFile> in_file(
-            new ArrowRandomAccessFile(tf_file.get(), size));
-
-        // Create the Feather reader
-        std::shared_ptr<arrow::ipc::feather::Reader> reader;
-        arrow::Result<std::shared_ptr<arrow::ipc::feather::Reader>> result =
-            arrow::ipc::feather::Reader::Open(in_file);
-        CHECK_ARROW(result.status());
-        reader = std::move(result).ValueUnsafe();
-
-        // Read file columns and build a table
-        std::shared_ptr<::arrow::Table> table;
-        CHECK_ARROW(reader->Read(&table));
-
-        int64_t num_columns = table->num_columns();
-
-        // Convert the table to a sequence of batches
-        arrow::TableBatchReader tr(*table.get());
-        std::shared_ptr<arrow::RecordBatch> batch;
-        CHECK_ARROW(tr.ReadNext(&batch));
-        TF_RETURN_IF_ERROR(CheckBatchColumnTypes(batch));
-        current_batch_ = batch;
-        while (batch != nullptr) {
-          record_batches_.push_back(batch);
-          CHECK_ARROW(tr.ReadNext(&batch));
+        // Open files until one has record batches in this shard, each file
+        // contributes a contiguous range of its record batches to a shard
+        while (current_file_idx_ < dataset()->filenames_.size()) {
+          const string& filename = dataset()->filenames_[current_file_idx_];
+          TF_RETURN_IF_ERROR(ArrowFileReader::Open(
+              env, filename, nullptr, 0, dataset()->file_columns_, &reader_));
+          int64 num_batches = reader_->num_record_batches();
+          current_batch_idx_ =
+              num_batches * dataset()->shard_index_ / dataset()->num_shards_;
+          end_batch_idx_ = num_batches * (dataset()->shard_index_ + 1) /
+                           dataset()->num_shards_;
+          if (current_batch_idx_ < end_batch_idx_) {
+            return ReadBatchLocked();
+          }
+          current_file_idx_++;
         }
         return Status::OK();
       }
@@ -775,11 +900,11 @@ class ArrowFeatherDatasetOp : public ArrowOpKernelBase {
       Status NextStreamLocked(Env* env)
           TF_EXCLUSIVE_LOCKS_REQUIRED(mu_) override {
         ArrowBaseIterator<Dataset>::NextStreamLocked(env);
-        if (++current_batch_idx_ < record_batches_.size()) {
-          current_batch_ = record_batches_[current_batch_idx_];
-        } else if (++current_file_idx_ < dataset()->filenames_.size()) {
-          current_batch_idx_ = 0;
-          record_batches_.clear();
+        if (++current_batch_idx_ < end_batch_idx_) {
+          return ReadBatchLocked();
+        }
+        reader_.reset();
+        if (++current_file_idx_ < dataset()->filenames_.size()) {
           return SetupStreamsLocked(env);
         }
         return Status::OK();
@@ -789,23 +914,46 @@ class ArrowFeatherDatasetOp : public ArrowOpKernelBase {
         ArrowBaseIterator<Dataset>::ResetStreamsLocked();
         current_file_idx_ = 0;
         current_batch_idx_ = 0;
-        record_batches_.clear();
+        end_batch_idx_ = 0;
+        reader_.reset();
+      }
+
+      int32 BatchColumn(size_t i) const override {
+        return dataset()->batch_columns_[i];
+      }
+
+      // Record batches are only read and decoded once they are reached
+      Status ReadBatchLocked() TF_EXCLUSIVE_LOCKS_REQUIRED(mu_) {
+        std::shared_ptr<arrow::RecordBatch> batch;
+        TF_RETURN_IF_ERROR(
+            reader_->ReadRecordBatch(current_batch_idx_, &batch));
+        TF_RETURN_IF_ERROR(CheckBatchColumnTypes(batch));
+        current_batch_ = batch;
+        return Status::OK();
       }
 
       size_t current_file_idx_ TF_GUARDED_BY(mu_) = 0;
-      size_t current_batch_idx_ TF_GUARDED_BY(mu_) = 0;
-      std::vector<std::shared_ptr<arrow::RecordBatch>> record_batches_
-          TF_GUARDED_BY(mu_);
+      int64 current_batch_idx_ TF_GUARDED_BY(mu_) = 0;
+      int64 end_batch_idx_ TF_GUARDED_BY(mu_) = 0;
+      std::unique_ptr<ArrowFileReader> reader_ TF_GUARDED_BY(mu_);
     };
 
     const std::vector<string> filenames_;
+    const int64 num_shards_;
+    const int64 shard_index_;
+    std::vector<int> file_columns_;
+    std::vector<int32> batch_columns_;
   };
 };
 
 // Op to create an Arrow Dataset that consumes record batches from an input
 // stream. Currently supported endpoints are a POSIX IPv4 socket with endpoint
 // "<IP>:<PORT>" or "tcp://<IP>:<PORT>", a Unix Domain Socket with endpoint
-// "unix://<pathname>", and STDIN with endpoint "fd://0" or "fd://-".
+// "unix://<pathname>", an Arrow stream in a shared memory file written by a
+// producer on the same host with endpoint "shm://<pathname>", and STDIN with
+// endpoint "fd://0" or "fd://-". With num_parallel_reads > 1, endpoints are
+// read and decoded concurrently and their record batches are interleaved in
+// the order they arrive.
 class ArrowStreamDatasetOp : public ArrowOpKernelBase {
  public:
   explicit ArrowStreamDatasetOp(OpKernelConstruction* ctx)
@@ -828,20 +976,31 @@ class ArrowStreamDatasetOp : public ArrowOpKernelBase {
       endpoints.push_back(endpoints_tensor->flat<tstring>()(i));
     }
 
-    *output = new Dataset(ctx, endpoints, columns, batch_size, batch_mode,
-                          output_types_, output_shapes_);
+    int64 num_parallel_reads;
+    OP_REQUIRES_OK(ctx, ParseScalarArgument(ctx, "num_parallel_reads",
+                                            &num_parallel_reads));
+    OP_REQUIRES(ctx, num_parallel_reads >= 1,
+                errors::InvalidArgument(
+                    "`num_parallel_reads` must be at least 1, got: ",
+                    num_parallel_reads));
+
+    *output =
+        new Dataset(ctx, endpoints, num_parallel_reads, columns, batch_size,
+                    batch_mode, output_types_, output_shapes_);
   }
 
  private:
   class Dataset : public ArrowDatasetBase {
    public:
     Dataset(OpKernelContext* ctx, const std::vector<string>& endpoints,
-            const std::vector<int32>& columns, const int64 batch_size,
-            const ArrowBatchMode batch_mode, const DataTypeVector& output_types,
+            const int64 num_parallel_reads, const std::vector<int32>& columns,
+            const int64 batch_size, const ArrowBatchMode batch_mode,
+            const DataTypeVector& output_types,
             const std::vector<PartialTensorShape>& output_shapes)
         : ArrowDatasetBase(ctx, columns, batch_size, batch_mode, output_types,
                            output_shapes),
-          endpoints_(endpoints) {}
+          endpoints_(endpoints),
+          num_parallel_reads_(num_parallel_reads) {}
 
     string DebugString() const override {
       return "ArrowStreamDatasetOp::Dataset";
@@ -855,6 +1014,9 @@ class ArrowStreamDatasetOp : public ArrowOpKernelBase {
                               Node** output) const override {
       Node* endpoints = nullptr;
       TF_RETURN_IF_ERROR(b->AddVector(endpoints_, &endpoints));
+      Node* num_parallel_reads = nullptr;
+      TF_RETURN_IF_ERROR(
+          b->AddScalar(num_parallel_reads_, &num_parallel_reads));
       Node* columns = nullptr;
       TF_RETURN_IF_ERROR(b->AddVector(columns_, &columns));
       Node* batch_size = nullptr;
@@ -864,7 +1026,9 @@ class ArrowStreamDatasetOp : public ArrowOpKernelBase {
       TF_RETURN_IF_ERROR(GetBatchModeStr(batch_mode_, &batch_mode_str));
       TF_RETURN_IF_ERROR(b->AddScalar(batch_mode_str, &batch_mode));
       TF_RETURN_IF_ERROR(b->AddDataset(
-          this, {endpoints, columns, batch_size, batch_mode}, output));
+          this,
+          {endpoints, num_parallel_reads, columns, batch_size, batch_mode},
+          output));
       return Status::OK();
     }
 
@@ -878,40 +1042,41 @@ class ArrowStreamDatasetOp : public ArrowOpKernelBase {
     class Iterator : public ArrowBaseIterator<Dataset> {
      public:
       explicit Iterator(const Params& params)
-          : ArrowBaseIterator<Dataset>(params) {}
+          : ArrowBaseIterator<Dataset>(params),
+            num_readers_(std::min<int64>(dataset()->num_parallel_reads_,
+                                         dataset()->endpoints_.size())) {}
 
      private:
       Status SetupStreamsLocked(Env* env)
           TF_EXCLUSIVE_LOCKS_REQUIRED(mu_) override {
-        const string& endpoint = dataset()->endpoints_[current_endpoint_idx_];
-        string endpoint_type;
-        string endpoint_value;
-        TF_RETURN_IF_ERROR(ArrowUtil::ParseEndpoint(endpoint, &endpoint_type,
-                                                    &endpoint_value));
-
-        // Check if endpoint is STDIN
-        if (endpoint_type == "fd" &&
-            (endpoint_value == "0" || endpoint_value == "-")) {
-          in_stream_ = std::make_shared<arrow::io::StdinStream>();
-        } else {
-          // Endpoint is a socket, make a client connection
-          auto socket_stream = std::make_shared<ArrowStreamClient>(endpoint);
-          CHECK_ARROW(socket_stream->Connect());
-          in_stream_ = socket_stream;
+        if (num_readers_ > 1) {
+          parallel_reader_ = absl::make_unique<ArrowParallelBatchReader>(
+              env, dataset()->endpoints_.size(), num_readers_,
+              [this](size_t source,
+                     const ArrowParallelBatchReader::PushFn& push,
+                     const ArrowParallelBatchReader::SetCancelFn& set_cancel) {
+                return ReadEndpoint(dataset()->endpoints_[source], push,
+                                    set_cancel);
+              });
+          return parallel_reader_->Next(&current_batch_);
         }
 
-        auto result =
-            arrow::ipc::RecordBatchStreamReader::Open(in_stream_.get());
-        CHECK_ARROW(result.status());
-        reader_ = std::move(result).ValueUnsafe();
+        const string& endpoint = dataset()->endpoints_[current_endpoint_idx_];
+        TF_RETURN_IF_ERROR(OpenStream(endpoint, &in_stream_, &reader_));
         CHECK_ARROW(reader_->ReadNext(&current_batch_));
-        TF_RETURN_IF_ERROR(CheckBatchColumnTypes(current_batch_));
+        if (current_batch_ != nullptr) {
+          TF_RETURN_IF_ERROR(CheckBatchColumnTypes(current_batch_));
+        }
         return Status::OK();
       }
 
       Status NextStreamLocked(Env* env)
           TF_EXCLUSIVE_LOCKS_REQUIRED(mu_) override {
         ArrowBaseIterator<Dataset>::NextStreamLocked(env);
+        if (parallel_reader_ != nullptr) {
+          return parallel_reader_->Next(&current_batch_);
+        }
+
         CHECK_ARROW(reader_->ReadNext(&current_batch_));
         if (current_batch_ == nullptr &&
             ++current_endpoint_idx_ < dataset()->endpoints_.size()) {
@@ -923,17 +1088,313 @@ class ArrowStreamDatasetOp : public ArrowOpKernelBase {
 
       void ResetStreamsLocked() TF_EXCLUSIVE_LOCKS_REQUIRED(mu_) override {
         ArrowBaseIterator<Dataset>::ResetStreamsLocked();
+        parallel_reader_.reset();
         current_endpoint_idx_ = 0;
         reader_.reset();
         in_stream_.reset();
       }
 
+      // Open the input stream of an endpoint and a record batch reader on it
+      static Status OpenStream(
+          const string& endpoint,
+          std::shared_ptr<arrow::io::InputStream>* in_stream,
+          std::shared_ptr<arrow::ipc::RecordBatchReader>* reader) {
+        TF_RETURN_IF_ERROR(OpenInputStream(endpoint, in_stream));
+        return OpenReader(*in_stream, reader);
+      }
+
+      // Open the input stream of an endpoint
+      static Status OpenInputStream(
+          const string& endpoint,
+          std::shared_ptr<arrow::io::InputStream>* in_stream) {
+        string endpoint_type;
+        string endpoint_value;
+        TF_RETURN_IF_ERROR(ArrowUtil::ParseEndpoint(endpoint, &endpoint_type,
+                                                    &endpoint_value));
+
+        // Check if endpoint is STDIN
+        if (endpoint_type == "fd" &&
+            (endpoint_value == "0" || endpoint_value == "-")) {
+          *in_stream = std::make_shared<arrow::io::StdinStream>();
+        } else if (endpoint_type == "shm") {
+          // Memory map the stream, record batches reference the mapped pages
+          // and are not copied out of a socket
+          auto result = arrow::io::MemoryMappedFile::Open(
+              endpoint_value, arrow::io::FileMode::READ);
+          CHECK_ARROW(result.status());
+          *in_stream = std::move(result).ValueUnsafe();
+        } else {
+          // Endpoint is a socket, make a client connection
+          auto socket_stream = std::make_shared<ArrowStreamClient>(endpoint);
+          CHECK_ARROW(socket_stream->Connect());
+          *in_stream = socket_stream;
+        }
+        return Status::OK();
+      }
+
+      // Open a record batch reader on an input stream
+      static Status OpenReader(
+          const std::shared_ptr<arrow::io::InputStream>& in_stream,
+          std::shared_ptr<arrow::ipc::RecordBatchReader>* reader) {
+        auto result = arrow::ipc::RecordBatchStreamReader::Open(in_stream);
+        CHECK_ARROW(result.status());
+        *reader = std::move(result).ValueUnsafe();
+        return Status::OK();
+      }
+
+      // Read and decode all record batches of an endpoint on a reader thread
+      Status ReadEndpoint(
+          const string& endpoint, const ArrowParallelBatchReader::PushFn& push,
+          const ArrowParallelBatchReader::SetCancelFn& set_cancel) {
+        std::shared_ptr<arrow::io::InputStream> in_stream;
+        std::shared_ptr<arrow::ipc::RecordBatchReader> reader;
+        TF_RETURN_IF_ERROR(OpenInputStream(endpoint, &in_stream));
+        // A socket read blocks until the producer sends more data, so the
+        // connection is shut down to stop the read on cancellation
+        auto socket_stream =
+            std::dynamic_pointer_cast<ArrowStreamClient>(in_stream);
+        if (socket_stream != nullptr) {
+          set_cancel([socket_stream]() { socket_stream->Shutdown(); });
+        }
+        auto unregister =
+            gtl::MakeCleanup([&set_cancel]() { set_cancel(nullptr); });
+        TF_RETURN_IF_ERROR(OpenReader(in_stream, &reader));
+        while (true) {
+          std::shared_ptr<arrow::RecordBatch> batch;
+          CHECK_ARROW(reader->ReadNext(&batch));
+          if (batch == nullptr) {
+            return Status::OK();
+          }
+          TF_RETURN_IF_ERROR(CheckBatchColumnTypes(batch));
+          if (!push(std::move(batch))) {
+            return Status::OK();
+          }
+        }
+      }
+
+      const int64 num_readers_;
       size_t current_endpoint_idx_ TF_GUARDED_BY(mu_) = 0;
       std::shared_ptr<arrow::io::InputStream> in_stream_ TF_GUARDED_BY(mu_);
       std::shared_ptr<arrow::ipc::RecordBatchReader> reader_ TF_GUARDED_BY(mu_);
+      std::unique_ptr<ArrowParallelBatchReader> parallel_reader_
+          TF_GUARDED_BY(mu_);
     };
 
     const std::vector<string> endpoints_;
+    const int64 num_parallel_reads_;
+  };
+};
+
+// Op to create an Arrow Dataset that reads record batches from an Arrow
+// Flight service. The flight is looked up with GetFlightInfo using a command
+// or path descriptor, then each endpoint of the flight is fetched with DoGet,
+// up to num_parallel_reads at once, and record batches are interleaved in
+// the order they arrive.
+class ArrowFlightDatasetOp : public ArrowOpKernelBase {
+ public:
+  explicit ArrowFlightDatasetOp(OpKernelConstruction* ctx)
+      : ArrowOpKernelBase(ctx) {}
+
+  virtual void MakeArrowDataset(
+      OpKernelContext* ctx, const std::vector<int32>& columns,
+      const int64 batch_size, const ArrowBatchMode batch_mode,
+      const DataTypeVector& output_types,
+      const std::vector<PartialTensorShape>& output_shapes,
+      ArrowDatasetBase** output) override {
+    tstring location;
+    OP_REQUIRES_OK(ctx, ParseScalarArgument(ctx, "location", &location));
+
+    tstring descriptor_type;
+    OP_REQUIRES_OK(
+        ctx, ParseScalarArgument(ctx, "descriptor_type", &descriptor_type));
+    OP_REQUIRES(ctx, descriptor_type == "cmd" || descriptor_type == "path",
+                errors::InvalidArgument(
+                    "`descriptor_type` must be 'cmd' or 'path', got: ",
+                    descriptor_type));
+
+    const Tensor* descriptor_tensor;
+    OP_REQUIRES_OK(ctx, ctx->input("descriptor", &descriptor_tensor));
+    OP_REQUIRES(
+        ctx, descriptor_tensor->dims() <= 1,
+        errors::InvalidArgument("`descriptor` must be a scalar or vector."));
+    std::vector<string> descriptor;
+    descriptor.reserve(descriptor_tensor->NumElements());
+    for (int i = 0; i < descriptor_tensor->NumElements(); ++i) {
+      descriptor.push_back(descriptor_tensor->flat<tstring>()(i));
+    }
+    OP_REQUIRES(ctx, descriptor_type == "path" || descriptor.size() == 1,
+                errors::InvalidArgument(
+                    "A 'cmd' `descriptor` must be a single command, got: ",
+                    descriptor.size(), " elements"));
+
+    int64 num_parallel_reads;
+    OP_REQUIRES_OK(ctx, ParseScalarArgument(ctx, "num_parallel_reads",
+                                            &num_parallel_reads));
+    OP_REQUIRES(ctx, num_parallel_reads >= 1,
+                errors::InvalidArgument(
+                    "`num_parallel_reads` must be at least 1, got: ",
+                    num_parallel_reads));
+
+    *output = new Dataset(ctx, location, descriptor_type, descriptor,
+                          num_parallel_reads, columns, batch_size, batch_mode,
+                          output_types_, output_shapes_);
+  }
+
+ private:
+  class Dataset : public ArrowDatasetBase {
+   public:
+    Dataset(OpKernelContext* ctx, const string& location,
+            const string& descriptor_type,
+            const std::vector<string>& descriptor,
+            const int64 num_parallel_reads, const std::vector<int32>& columns,
+            const int64 batch_size, const ArrowBatchMode batch_mode,
+            const DataTypeVector& output_types,
+            const std::vector<PartialTensorShape>& output_shapes)
+        : ArrowDatasetBase(ctx, columns, batch_size, batch_mode, output_types,
+                           output_shapes),
+          location_(location),
+          descriptor_type_(descriptor_type),
+          descriptor_(descriptor),
+          num_parallel_reads_(num_parallel_reads) {}
+
+    string DebugString() const override {
+      return "ArrowFlightDatasetOp::Dataset";
+    }
+
+    Status CheckExternalState() const override { return Status::OK(); }
+
+   protected:
+    Status AsGraphDefInternal(SerializationContext* ctx,
+                              DatasetGraphDefBuilder* b,
+                              Node** output) const override {
+      Node* location = nullptr;
+      TF_RETURN_IF_ERROR(b->AddScalar(location_, &location));
+      Node* descriptor_type = nullptr;
+      TF_RETURN_IF_ERROR(b->AddScalar(descriptor_type_, &descriptor_type));
+      Node* descriptor = nullptr;
+      TF_RETURN_IF_ERROR(b->AddVector(descriptor_, &descriptor));
+      Node* num_parallel_reads = nullptr;
+      TF_RETURN_IF_ERROR(
+          b->AddScalar(num_parallel_reads_, &num_parallel_reads));
+      Node* columns = nullptr;
+      TF_RETURN_IF_ERROR(b->AddVector(columns_, &columns));
+      Node* batch_size = nullptr;
+      TF_RETURN_IF_ERROR(b->AddScalar(batch_size_, &batch_size));
+      Node* batch_mode = nullptr;
+      tstring batch_mode_str;
+      TF_RETURN_IF_ERROR(GetBatchModeStr(batch_mode_, &batch_mode_str));
+      TF_RETURN_IF_ERROR(b->AddScalar(batch_mode_str, &batch_mode));
+      TF_RETURN_IF_ERROR(
+          b->AddDataset(this,
+                        {location, descriptor_type, descriptor,
+                         num_parallel_reads, columns, batch_size, batch_mode},
+                        output));
+      return Status::OK();
+    }
+
+    std::unique_ptr<IteratorBase> MakeIteratorInternal(
+        const string& prefix) const override {
+      return std::unique_ptr<IteratorBase>(
+          new Iterator({this, strings::StrCat(prefix, "::ArrowFlight")}));
+    }
+
+   private:
+    class Iterator : public ArrowBaseIterator<Dataset> {
+     public:
+      explicit Iterator(const Params& params)
+          : ArrowBaseIterator<Dataset>(params) {}
+
+     private:
+      Status SetupStreamsLocked(Env* env)
+          TF_EXCLUSIVE_LOCKS_REQUIRED(mu_) override {
+        arrow::flight::Location location;
+        CHECK_ARROW(
+            arrow::flight::Location::Parse(dataset()->location_, &location));
+        CHECK_ARROW(arrow::flight::FlightClient::Connect(location, &client_));
+
+        arrow::flight::FlightDescriptor descriptor;
+        if (dataset()->descriptor_type_ == "cmd") {
+          descriptor = arrow::flight::FlightDescriptor::Command(
+              dataset()->descriptor_[0]);
+        } else {
+          descriptor =
+              arrow::flight::FlightDescriptor::Path(dataset()->descriptor_);
+        }
+        std::unique_ptr<arrow::flight::FlightInfo> info;
+        CHECK_ARROW(client_->GetFlightInfo(descriptor, &info));
+        endpoints_ = info->endpoints();
+
+        const int64 num_readers = std::max<int64>(
+            1,
+            std::min<int64>(dataset()->num_parallel_reads_, endpoints_.size()));
+        parallel_reader_ = absl::make_unique<ArrowParallelBatchReader>(
+            env, endpoints_.size(), num_readers,
+            [this](size_t source, const ArrowParallelBatchReader::PushFn& push,
+                   const ArrowParallelBatchReader::SetCancelFn& set_cancel) {
+              return ReadEndpoint(endpoints_[source], push, set_cancel);
+            });
+        return parallel_reader_->Next(&current_batch_);
+      }
+
+      Status NextStreamLocked(Env* env)
+          TF_EXCLUSIVE_LOCKS_REQUIRED(mu_) override {
+        ArrowBaseIterator<Dataset>::NextStreamLocked(env);
+        return parallel_reader_->Next(&current_batch_);
+      }
+
+      void ResetStreamsLocked() TF_EXCLUSIVE_LOCKS_REQUIRED(mu_) override {
+        ArrowBaseIterator<Dataset>::ResetStreamsLocked();
+        parallel_reader_.reset();
+        endpoints_.clear();
+        client_.reset();
+      }
+
+      // Fetch the ticket of an endpoint with DoGet on a reader thread. An
+      // endpoint without locations is served by the service that was queried.
+      Status ReadEndpoint(
+          const arrow::flight::FlightEndpoint& endpoint,
+          const ArrowParallelBatchReader::PushFn& push,
+          const ArrowParallelBatchReader::SetCancelFn& set_cancel) {
+        std::unique_ptr<arrow::flight::FlightClient> endpoint_client;
+        arrow::flight::FlightClient* client = client_.get();
+        if (!endpoint.locations.empty()) {
+          CHECK_ARROW(arrow::flight::FlightClient::Connect(
+              endpoint.locations[0], &endpoint_client));
+          client = endpoint_client.get();
+        }
+
+        std::unique_ptr<arrow::flight::FlightStreamReader> stream;
+        CHECK_ARROW(client->DoGet(endpoint.ticket, &stream));
+        arrow::flight::FlightStreamReader* stream_reader = stream.get();
+        set_cancel([stream_reader]() { stream_reader->Cancel(); });
+        auto unregister =
+            gtl::MakeCleanup([&set_cancel]() { set_cancel(nullptr); });
+        while (true) {
+          arrow::flight::FlightStreamChunk chunk;
+          CHECK_ARROW(stream->Next(&chunk));
+          if (chunk.data == nullptr) {
+            return Status::OK();
+          }
+          TF_RETURN_IF_ERROR(CheckBatchColumnTypes(chunk.data));
+          if (!push(std::move(chunk.data))) {
+            // Stop the server from sending the rest of the stream
+            stream->Cancel();
+            return Status::OK();
+          }
+        }
+      }
+
+      // Set up before the reader threads start and read only by them
+      std::unique_ptr<arrow::flight::FlightClient> client_;
+      std::vector<arrow::flight::FlightEndpoint> endpoints_;
+      std::unique_ptr<ArrowParallelBatchReader> parallel_reader_
+          TF_GUARDED_BY(mu_);
+    };
+
+    const string location_;
+    const string descriptor_type_;
+    const std::vector<string> descriptor_;
+    const int64 num_parallel_reads_;
   };
 };
 
@@ -949,5 +1410,8 @@ REGISTER_KERNEL_BUILDER(Name("IO>ArrowFeatherDataset").Device(DEVICE_CPU),
 REGISTER_KERNEL_BUILDER(Name("IO>ArrowStreamDataset").Device(DEVICE_CPU),
                         ArrowStreamDatasetOp);
 
+REGISTER_KERNEL_BUILDER(Name("IO>ArrowFlightDataset").Device(DEVICE_CPU),
+                        ArrowFlightDatasetOp);
+
 }  // namespace data
 }  // namespace tensorflow
@@ -23,6 +23,7 @@ limitations under the License.
 #include "arrow/table.h"
 #include "generated/feather_generated.h"
 #include "tensorflow/core/framework/op_kernel.h"
+#include "tensorflow/core/platform/path.h"
 #include "tensorflow_io/core/kernels/arrow/arrow_util.h"
 #include "tensorflow_io/core/kernels/io_interface.h"
 
@@ -527,6 +528,92 @@ REGISTER_KERNEL_BUILDER(Name("IO>ListFeatherColumns").Device(DEVICE_CPU),
 
 }  // namespace
 
+Status ArrowFileReader::Open(Env* env, const string& filename,
+                             const void* memory_data, const int64 memory_size,
+                             const std::vector<int>& columns,
+                             std::unique_ptr<ArrowFileReader>* reader) {
+  std::unique_ptr<ArrowFileReader> file_reader(new ArrowFileReader());
+
+  StringPiece scheme, host, path;
+  io::ParseURI(filename, &scheme, &host, &path);
+  if (memory_data == nullptr && (scheme.empty() || scheme == "file")) {
+    auto result = arrow::io::MemoryMappedFile::Open(string(path),
+                                                    arrow::io::FileMode::READ);
+    CHECK_ARROW(result.status());
+    file_reader->file_ = std::move(result).ValueUnsafe();
+  } else {
+    file_reader->tf_file_.reset(
+        new SizedRandomAccessFile(env, filename, memory_data, memory_size));
+    uint64 size;
+    TF_RETURN_IF_ERROR(file_reader->tf_file_->GetFileSize(&size));
+    file_reader->file_ = std::make_shared<ArrowRandomAccessFile>(
+        file_reader->tf_file_.get(), size);
+  }
+
+  // Arrow IPC files (Feather V2) start with the magic bytes "ARROW1", any
+  // other file is read as Feather V1
+  static constexpr char kArrowMagicBytes[] = "ARROW1";
+  const int64 magic_length = sizeof(kArrowMagicBytes) - 1;
+  auto magic_result = file_reader->file_->ReadAt(0, magic_length);
+  CHECK_ARROW(magic_result.status());
+  std::shared_ptr<arrow::Buffer> magic = std::move(magic_result).ValueUnsafe();
+  if (magic->size() == magic_length &&
+      memcmp(magic->data(), kArrowMagicBytes, magic_length) == 0) {
+    arrow::ipc::IpcReadOptions options = arrow::ipc::IpcReadOptions::Defaults();
+    options.included_fields = columns;
+    auto result =
+        arrow::ipc::RecordBatchFileReader::Open(file_reader->file_, options);
+    CHECK_ARROW(result.status());
+    file_reader->ipc_reader_ = std::move(result).ValueUnsafe();
+    file_reader->schema_ = file_reader->ipc_reader_->schema();
+  } else {
+    // Not an Arrow IPC file, so read the selected columns as Feather V1
+    auto feather_result = arrow::ipc::feather::Reader::Open(file_reader->file_);
+    CHECK_ARROW(feather_result.status());
+    std::shared_ptr<arrow::ipc::feather::Reader> feather_reader =
+        std::move(feather_result).ValueUnsafe();
+    std::shared_ptr<arrow::Table> table;
+    if (columns.empty()) {
+      CHECK_ARROW(feather_reader->Read(&table));
+    } else {
+      CHECK_ARROW(feather_reader->Read(columns, &table));
+    }
+    file_reader->schema_ = table->schema();
+    arrow::TableBatchReader batch_reader(*table);
+    CHECK_ARROW(batch_reader.ReadAll(&file_reader->batches_));
+  }
+
+  *reader = std::move(file_reader);
+  return Status::OK();
+}
+
+std::shared_ptr<arrow::Schema> ArrowFileReader::schema() const {
+  return schema_;
+}
+
+int ArrowFileReader::num_record_batches() const {
+  if (ipc_reader_ != nullptr) {
+    return ipc_reader_->num_record_batches();
+  }
+  return batches_.size();
+}
+
+Status ArrowFileReader::ReadRecordBatch(
+    int i, std::shared_ptr<arrow::RecordBatch>* batch) {
+  if (i < 0 || i >= num_record_batches()) {
+    return errors::OutOfRange("record batch ", i, " is out of range [0, ",
+                              num_record_batches(), ")");
+  }
+  if (ipc_reader_ != nullptr) {
+    auto result = ipc_reader_->ReadRecordBatch(i);
+    CHECK_ARROW(result.status());
+    *batch = std::move(result).ValueUnsafe();
+    return Status::OK();
+  }
+  *batch = batches_[i];
+  return Status::OK();
+}
+
 class FeatherReadable : public IOReadableInterface {
  public:
   FeatherReadable(Env* env) : env_(env) {}
@@ -539,25 +626,28 @@ class FeatherReadable : public IOReadableInterface {
       return errors::InvalidArgument("more than 1 filename is not supported");
     }
 
-    const string& filename = input[0];
-    file_.reset(
-        new SizedRandomAccessFile(env_, filename, memory_data, memory_size));
-    TF_RETURN_IF_ERROR(file_->GetFileSize(&file_size_));
+    filename_ = input[0];
+    memory_data_ = memory_data;
+    memory_size_ = memory_size;
 
-    std::shared_ptr<ArrowRandomAccessFile> feather_file;
-    feather_file.reset(new ArrowRandomAccessFile(file_.get(), file_size_));
-    auto maybe_reader = arrow::ipc::feather::Reader::Open(feather_file);
-    if (!maybe_reader.ok()) {
-      return errors::Internal(maybe_reader.status().ToString());
-    }
-    std::shared_ptr<arrow::ipc::feather::Reader> reader =
-        maybe_reader.ValueOrDie();
+    // Only the footer is read to get the schema of all columns
+    std::unique_ptr<ArrowFileReader> reader;
+    TF_RETURN_IF_ERROR(ArrowFileReader::Open(env_, filename_, memory_data_,
+                                             memory_size_, {}, &reader));
     std::shared_ptr<arrow::Schema> schema = reader->schema();
 
-    std::shared_ptr<arrow::Table> table;
-    arrow::Status s = reader->Read(&table);
-    if (!s.ok()) {
-      return errors::Internal(s.ToString());
+    // Row offsets of the record batches, from the batches of the first column
+    int64 num_rows = 0;
+    batch_offsets_.push_back(0);
+    if (schema->num_fields() > 0) {
+      ArrowFileReader* column_reader;
+      TF_RETURN_IF_ERROR(GetColumnReader(0, &column_reader));
+      for (int i = 0; i < column_reader->num_record_batches(); i++) {
+        std::shared_ptr<arrow::RecordBatch> batch;
+        TF_RETURN_IF_ERROR(column_reader->ReadRecordBatch(i, &batch));
+        num_rows += batch->num_rows();
+        batch_offsets_.push_back(num_rows);
+      }
     }
 
     for (int i = 0; i < schema->num_fields(); i++) {
@@ -602,7 +692,7 @@ class FeatherReadable : public IOReadableInterface {
         default:
           break;
       }
-      shapes_.push_back(TensorShape({static_cast<int64>(table->num_rows())}));
+      shapes_.push_back(TensorShape({num_rows}));
       dtypes_.push_back(dtype);
       columns_.push_back(schema->field(i)->name());
       columns_index_[schema->field(i)->name()] = i;
@@ -653,36 +743,51 @@ class FeatherReadable : public IOReadableInterface {
       return Status::OK();
     }
 
-    if (feather_file_.get() == nullptr) {
-      feather_file_.reset(new ArrowRandomAccessFile(file_.get(), file_size_));
-      arrow::Result<std::shared_ptr<arrow::ipc::feather::Reader>> result =
-          arrow::ipc::feather::Reader::Open(feather_file_);
-      if (!result.ok()) {
-        return errors::Internal(result.status().ToString());
-      }
-      reader_ = std::move(result).ValueUnsafe();
+    mutex_lock l(mu_);
+    ArrowFileReader* column_reader;
+    TF_RETURN_IF_ERROR(GetColumnReader(column_index, &column_reader));
+
+    // Read only the record batches that overlap the selection
+    int batch_index = std::upper_bound(batch_offsets_.begin(),
+                                       batch_offsets_.end(), element_start) -
+                      batch_offsets_.begin() - 1;
+    int64 element = element_start;
+    while (element < element_stop) {
+      std::shared_ptr<arrow::RecordBatch> batch;
+      TF_RETURN_IF_ERROR(column_reader->ReadRecordBatch(batch_index, &batch));
+      int64 batch_start = element - batch_offsets_[batch_index];
+      int64 batch_stop =
+          std::min(element_stop, batch_offsets_[batch_index + 1]) -
+          batch_offsets_[batch_index];
+      Tensor slice =
+          value->Slice(element - element_start,
+                       element - element_start + (batch_stop - batch_start));
+      TF_RETURN_IF_ERROR(CopyColumn(batch->column(0), batch_start,
+                                    batch_stop - batch_start, &slice));
+      element += batch_stop - batch_start;
+      batch_index++;
     }
+    (*record_read) = element_stop - element_start;
+    return Status::OK();
+  }
 
-    std::shared_ptr<arrow::Table> table;
-    arrow::Status s = reader_->Read(&table);
-    if (!s.ok()) {
-      return errors::Internal(s.ToString());
-    }
-    std::shared_ptr<arrow::ChunkedArray> column = table->column(column_index);
-
-    std::shared_ptr<::arrow::ChunkedArray> slice =
-        column->Slice(element_start, element_stop);
-
-#define FEATHER_PROCESS_TYPE(TTYPE, ATYPE)                     \
-  {                                                            \
-    int64 curr_index = 0;                                      \
-    for (auto chunk : slice->chunks()) {                       \
-      for (int64_t item = 0; item < chunk->length(); item++) { \
-        value->flat<TTYPE>()(curr_index) =                     \
-            (dynamic_cast<ATYPE*>(chunk.get()))->Value(item);  \
-        curr_index++;                                          \
-      }                                                        \
-    }                                                          \
+  string DebugString() const override {
+    mutex_lock l(mu_);
+    return strings::StrCat("FeatherReadable");
+  }
+
+ private:
+  // Copy length values of a column from offset into a tensor. The values
+  // of null slots are copied as they are in the array.
+  static Status CopyColumn(const std::shared_ptr<arrow::Array>& array,
+                           int64 offset, int64 length, Tensor* value) {
+    std::shared_ptr<arrow::Array> slice = array->Slice(offset, length);
+#define FEATHER_PROCESS_TYPE(TTYPE, ATYPE)                   \
+  {                                                          \
+    const ATYPE* chunk = dynamic_cast<ATYPE*>(slice.get());  \
+    for (int64_t item = 0; item < chunk->length(); item++) { \
+      value->flat<TTYPE>()(item) = chunk->Value(item);       \
+    }                                                        \
   }
     switch (value->dtype()) {
       case DT_BOOL:
@@ -723,36 +828,41 @@ class FeatherReadable : public IOReadableInterface {
                              ::arrow::NumericArray<::arrow::DoubleType>);
         break;
       case DT_STRING: {
-        int64 curr_index = 0;
-        for (auto chunk : slice->chunks()) {
-          for (int64_t item = 0; item < chunk->length(); item++) {
-            value->flat<tstring>()(curr_index) =
-                (dynamic_cast<::arrow::BinaryArray*>(chunk.get()))
-                    ->GetString(item);
-            curr_index++;
-          }
+        const ::arrow::BinaryArray* chunk =
+            dynamic_cast<::arrow::BinaryArray*>(slice.get());
+        for (int64_t item = 0; item < chunk->length(); item++) {
+          value->flat<tstring>()(item) = chunk->GetString(item);
         }
       } break;
       default:
         return errors::InvalidArgument("data type is not supported: ",
                                        DataTypeString(value->dtype()));
     }
-    (*record_read) = element_stop - element_start;
+#undef FEATHER_PROCESS_TYPE
     return Status::OK();
   }
 
-  string DebugString() const override {
-    mutex_lock l(mu_);
-    return strings::StrCat("FeatherReadable");
+  // Reader that decodes only the given column, opened on first use
+  Status GetColumnReader(int64 column_index, ArrowFileReader** reader) {
+    std::unique_ptr<ArrowFileReader>& column_reader =
+        column_readers_[column_index];
+    if (column_reader == nullptr) {
+      TF_RETURN_IF_ERROR(ArrowFileReader::Open(
+          env_, filename_, memory_data_, memory_size_,
+          {static_cast<int>(column_index)}, &column_reader));
+    }
+    *reader = column_reader.get();
+    return Status::OK();
   }
 
- private:
   mutable mutex mu_;
   Env* env_ TF_GUARDED_BY(mu_);
-  std::unique_ptr<SizedRandomAccessFile> file_ TF_GUARDED_BY(mu_);
-  uint64 file_size_ TF_GUARDED_BY(mu_);
-  std::shared_ptr<ArrowRandomAccessFile> feather_file_ TF_GUARDED_BY(mu_);
-  std::shared_ptr<arrow::ipc::feather::Reader> reader_ TF_GUARDED_BY(mu_);
+  string filename_;
+  const void* memory_data_ = nullptr;
+  int64 memory_size_ = 0;
+  std::unordered_map<int64, std::unique_ptr<ArrowFileReader>> column_readers_
+      TF_GUARDED_BY(mu_);
+  std::vector<int64> batch_offsets_;
 
   std::vector<DataType> dtypes_;
   std::vector<TensorShape> shapes_;
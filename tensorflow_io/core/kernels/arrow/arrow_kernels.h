@@ -18,6 +18,7 @@ limitations under the License.
 
 #include "arrow/buffer.h"
 #include "arrow/io/api.h"
+#include "arrow/ipc/api.h"
 #include "arrow/type.h"
 #include "parquet/windows_compatibility.h"
 #include "tensorflow/core/framework/op_kernel.h"
@@ -92,6 +93,38 @@ class ArrowRandomAccessFile : public ::arrow::io::RandomAccessFile {
   int64 position_;
 };
 
+// Reads record batches of a Feather or Arrow IPC file. Local files are memory
+// mapped, so only the pages of the record batches and columns that are read
+// are loaded and buffers reference the mapping instead of being copied.
+// Feather V2 / Arrow IPC files are read one record batch at a time and only
+// the selected columns are decoded. Feather V1 files have no record batches
+// and are read whole.
+class ArrowFileReader {
+ public:
+  // Open a file, or the given memory if not null, reading the selected
+  // columns of the file schema, all columns if empty. Record batches hold
+  // the selected columns in file order.
+  static Status Open(Env* env, const string& filename, const void* memory_data,
+                     const int64 memory_size, const std::vector<int>& columns,
+                     std::unique_ptr<ArrowFileReader>* reader);
+
+  // Schema of the selected columns
+  std::shared_ptr<arrow::Schema> schema() const;
+
+  int num_record_batches() const;
+
+  Status ReadRecordBatch(int i, std::shared_ptr<arrow::RecordBatch>* batch);
+
+ private:
+  ArrowFileReader() = default;
+
+  std::unique_ptr<SizedRandomAccessFile> tf_file_;
+  std::shared_ptr<arrow::io::RandomAccessFile> file_;
+  std::shared_ptr<arrow::ipc::RecordBatchFileReader> ipc_reader_;
+  std::shared_ptr<arrow::Schema> schema_;
+  std::vector<std::shared_ptr<arrow::RecordBatch>> batches_;
+};
+
 }  // namespace data
 }  // namespace tensorflow
 
@@ -28,6 +28,9 @@ class ArrowStreamClient : public arrow::io::InputStream {
   ~ArrowStreamClient() override;
 
   arrow::Status Connect();
+  // Shut the connection down without closing the socket, so that a read
+  // blocked on another thread returns. Close still has to be called.
+  arrow::Status Shutdown();
   arrow::Status Close() override;
   bool closed() const override;
   arrow::Result<int64_t> Tell() const override;
@@ -98,6 +98,14 @@ arrow::Status ArrowStreamClient::Connect() {
   return arrow::Status::OK();
 }
 
+arrow::Status ArrowStreamClient::Shutdown() {
+  if (shutdown(sock_, SHUT_RDWR) != 0) {
+    return arrow::Status::IOError("Failed to shut down connection");
+  }
+
+  return arrow::Status::OK();
+}
+
 arrow::Status ArrowStreamClient::Close() {
   int status = close(sock_);
   sock_ = -1;
@@ -118,6 +118,15 @@ arrow::Status ArrowStreamClient::Connect() {
   return arrow::Status::OK();
 }
 
+arrow::Status ArrowStreamClient::Shutdown() {
+  if (shutdown(sock_, SD_BOTH) == SOCKET_ERROR) {
+    return arrow::Status::IOError("Shutdown failed with error: ",
+                                  std::to_string(WSAGetLastError()));
+  }
+
+  return arrow::Status::OK();
+}
+
 arrow::Status ArrowStreamClient::Close() {
   int res = shutdown(sock_, SD_SEND);
   closesocket(sock_);
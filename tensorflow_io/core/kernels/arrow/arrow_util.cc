@@ -18,7 +18,9 @@ limitations under the License.
 #include "arrow/adapters/tensorflow/convert.h"
 #include "arrow/api.h"
 #include "arrow/ipc/api.h"
+#include "arrow/type_traits.h"
 #include "arrow/util/io_util.h"
+#include "tensorflow/core/framework/allocation_description.pb.h"
 #include "tensorflow/core/framework/tensor.h"
 #include "tensorflow/core/lib/core/errors.h"
 #include "tensorflow/core/lib/core/status.h"
@@ -282,7 +284,7 @@ class ArrowAssignTensorImpl : public arrow::ArrayVisitor {
 
   virtual arrow::Status Visit(const arrow::StringArray& array) override {
     auto shape = out_tensor_->shape();
-    auto output_flat = out_tensor_->flat<tstring>();
+    auto output_flat = out_tensor_->unaligned_flat<tstring>();
 
     for (int64 j = 0; j < shape.num_elements(); ++j) {
       output_flat(j) = array.GetString(i_ + j);
@@ -293,7 +295,7 @@ class ArrowAssignTensorImpl : public arrow::ArrayVisitor {
 
   virtual arrow::Status Visit(const arrow::BinaryArray& array) override {
     auto shape = out_tensor_->shape();
-    auto output_flat = out_tensor_->flat<tstring>();
+    auto output_flat = out_tensor_->unaligned_flat<tstring>();
 
     for (int64 j = 0; j < shape.num_elements(); ++j) {
       output_flat(j) = array.GetString(i_ + j);
@@ -314,6 +316,64 @@ Status AssignTensor(std::shared_ptr<arrow::Array> array, int64 i,
   return visitor.AssignTensor(array, i, out_tensor);
 }
 
+// TensorBuffer over the values of an Arrow Buffer, holding a reference to
+// the Arrow Buffer so that it outlives every Tensor aliasing it.
+class ArrowTensorBuffer : public TensorBuffer {
+ public:
+  ArrowTensorBuffer(std::shared_ptr<arrow::Buffer> buffer, const void* data,
+                    size_t size)
+      : TensorBuffer(const_cast<void*>(data)),
+        buffer_(std::move(buffer)),
+        size_(size) {}
+
+  size_t size() const override { return size_; }
+
+  TensorBuffer* root_buffer() override { return this; }
+
+  void FillAllocationDescription(AllocationDescription* proto) const override {
+    proto->set_requested_bytes(static_cast<int64>(size_));
+    proto->set_allocator_name("arrow");
+  }
+
+  bool OwnsMemory() const override { return false; }
+
+ private:
+  std::shared_ptr<arrow::Buffer> buffer_;
+  size_t size_;
+};
+
+Status MakeTensor(std::shared_ptr<arrow::Array> array, int64 i,
+                  ::tensorflow::DataType dtype, const TensorShape& shape,
+                  Allocator* allocator, bool allow_alias, Tensor* out_tensor) {
+  const arrow::Type::type type_id = array->type_id();
+  if (allow_alias && shape.dims() == 1 && array->null_count() == 0 &&
+      (arrow::is_integer(type_id) || arrow::is_floating(type_id)) &&
+      i + shape.dim_size(0) <= array->length()) {
+    const auto& fw_type =
+        static_cast<const arrow::FixedWidthType&>(*array->type());
+    const int64 type_width = fw_type.bit_width() / 8;
+    static const int VALUE_BUFFER = 1;
+    std::shared_ptr<arrow::Buffer> values =
+        array->data()->buffers[VALUE_BUFFER];
+    if (values != nullptr && type_width == DataTypeSize(dtype)) {
+      const uint8_t* src =
+          values->data() + (array->data()->offset + i) * type_width;
+      // Only alias values with the alignment TensorFlow kernels expect,
+      // anything else is copied.
+      if (reinterpret_cast<uintptr_t>(src) % EIGEN_MAX_ALIGN_BYTES == 0) {
+        ArrowTensorBuffer* buffer = new ArrowTensorBuffer(
+            std::move(values), src, shape.num_elements() * type_width);
+        *out_tensor = Tensor(dtype, shape, buffer);
+        buffer->Unref();
+        return Status::OK();
+      }
+    }
+  }
+
+  *out_tensor = Tensor(allocator, dtype, shape);
+  return AssignTensor(array, i, out_tensor);
+}
+
 // Check the type of an Arrow array matches expected tensor type
 class ArrowArrayTypeCheckerImpl : public arrow::TypeVisitor {
  public:
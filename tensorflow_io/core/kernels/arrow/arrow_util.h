@@ -62,6 +62,14 @@ Status AssignSpec(std::shared_ptr<arrow::Array> array, int64 i,
 Status AssignTensor(std::shared_ptr<arrow::Array> array, int64 i,
                     Tensor* out_tensor);
 
+// Make a Tensor of the given shape from elements of an Arrow Array starting
+// at index i. If allow_alias is set, a batch of a null-free integer or
+// floating point Array with aligned values shares the Arrow buffer instead of
+// being copied, otherwise the Tensor is allocated and filled by AssignTensor.
+Status MakeTensor(std::shared_ptr<arrow::Array> array, int64 i,
+                  ::tensorflow::DataType dtype, const TensorShape& shape,
+                  Allocator* allocator, bool allow_alias, Tensor* out_tensor);
+
 // Checks the Arrow Array datatype matches the expected TF datatype
 Status CheckArrayType(std::shared_ptr<arrow::DataType> type,
                       ::tensorflow::DataType expected_type);
@@ -16,6 +16,7 @@ limitations under the License.
 #include "tensorflow_io/core/kernels/audio_kernels.h"
 
 #include "speex/speex_resampler.h"
+#include "tensorflow/core/util/work_sharder.h"
 
 namespace tensorflow {
 namespace data {
@@ -217,9 +218,41 @@ class AudioReadableReadOp : public OpKernel {
   Env* env_ TF_GUARDED_BY(mu_);
 };
 
+// Interleaved speex resampling for each supported sample type
+inline int ResamplerProcess(SpeexResamplerState* state, const int16* in,
+                            uint32_t* in_len, int16* out, uint32_t* out_len) {
+  return speex_resampler_process_interleaved_int(state, in, in_len, out,
+                                                 out_len);
+}
+inline int ResamplerProcess(SpeexResamplerState* state, const float* in,
+                            uint32_t* in_len, float* out, uint32_t* out_len) {
+  return speex_resampler_process_interleaved_float(state, in, in_len, out,
+                                                   out_len);
+}
+
+Status ValidateResamplerArgs(const int64 rate_in, const int64 rate_out,
+                             const int64 quality) {
+  if (rate_in <= 0 || rate_out <= 0) {
+    return errors::InvalidArgument("rate must be positive, got: ", rate_in,
+                                   " and ", rate_out);
+  }
+  if (quality < SPEEX_RESAMPLER_QUALITY_MIN ||
+      quality > SPEEX_RESAMPLER_QUALITY_MAX) {
+    return errors::InvalidArgument(
+        "quality must be in [", SPEEX_RESAMPLER_QUALITY_MIN, ", ",
+        SPEEX_RESAMPLER_QUALITY_MAX, "], got: ", quality);
+  }
+  return Status::OK();
+}
+
+// Resamples audio of shape [samples, channels], or a batch of shape [batch,
+// samples, channels] in one invocation with the batch sharded over the CPU
+// worker threads.
 class AudioResampleOp : public OpKernel {
  public:
-  explicit AudioResampleOp(OpKernelConstruction* context) : OpKernel(context) {}
+  explicit AudioResampleOp(OpKernelConstruction* context) : OpKernel(context) {
+    OP_REQUIRES_OK(context, context->GetAttr("quality", &quality_));
+  }
 
   void Compute(OpKernelContext* context) override {
     const Tensor* input_tensor;
@@ -233,69 +266,883 @@ class AudioResampleOp : public OpKernel {
     OP_REQUIRES_OK(context, context->input("rate_out", &rate_out_tensor));
     const int64 rate_out = rate_out_tensor->scalar<int64>()();
 
-    int64 samples_in = input_tensor->shape().dim_size(0);
-    int64 channels = input_tensor->shape().dim_size(1);
+    OP_REQUIRES_OK(context, ValidateResamplerArgs(rate_in, rate_out, quality_));
+    OP_REQUIRES(context,
+                (input_tensor->dims() == 2 || input_tensor->dims() == 3),
+                errors::InvalidArgument(
+                    "input must be [samples, channels] or [batch, samples, "
+                    "channels], got: ",
+                    input_tensor->shape().DebugString()));
+
+    const bool batched = (input_tensor->dims() == 3);
+    int64 batch = batched ? input_tensor->dim_size(0) : 1;
+    int64 samples_in = input_tensor->dim_size(input_tensor->dims() - 2);
+    int64 channels = input_tensor->dim_size(input_tensor->dims() - 1);
+    int64 samples_out = samples_in * rate_out / rate_in;
+
+    TensorShape output_shape({samples_out, channels});
+    if (batched) {
+      output_shape.InsertDim(0, batch);
+    }
+    Tensor* output_tensor;
+    OP_REQUIRES_OK(context,
+                   context->allocate_output(0, output_shape, &output_tensor));
 
-    std::unique_ptr<SpeexResamplerState, void (*)(SpeexResamplerState*)> state(
-        nullptr, [](SpeexResamplerState* p) {
-          if (p != nullptr) {
-            speex_resampler_destroy(p);
+    switch (input_tensor->dtype()) {
+      case DT_INT16:
+        OP_REQUIRES_OK(
+            context,
+            Resample<int16>(context, *input_tensor, rate_in, rate_out, batch,
+                            samples_in, samples_out, channels, output_tensor));
+        break;
+      case DT_FLOAT:
+        OP_REQUIRES_OK(
+            context,
+            Resample<float>(context, *input_tensor, rate_in, rate_out, batch,
+                            samples_in, samples_out, channels, output_tensor));
+        break;
+      default:
+        OP_REQUIRES_OK(context,
+                       errors::InvalidArgument(
+                           "Data type ", DataTypeString(input_tensor->dtype()),
+                           " not supported"));
+    }
+  }
+
+ private:
+  template <typename T>
+  Status Resample(OpKernelContext* context, const Tensor& input_tensor,
+                  const int64 rate_in, const int64 rate_out, const int64 batch,
+                  const int64 samples_in, const int64 samples_out,
+                  const int64 channels, Tensor* output_tensor) {
+    if (batch == 0 || channels == 0) {
+      return Status::OK();
+    }
+    const T* input = input_tensor.flat<T>().data();
+    T* output = output_tensor->flat<T>().data();
+
+    mutex mu;
+    Status status;
+    auto work = [&](int64 start, int64 limit) {
+      for (int64 i = start; i < limit; i++) {
+        std::unique_ptr<SpeexResamplerState, void (*)(SpeexResamplerState*)>
+            state(nullptr, [](SpeexResamplerState* p) {
+              if (p != nullptr) {
+                speex_resampler_destroy(p);
+              }
+            });
+
+        int err = 0;
+        state.reset(
+            speex_resampler_init(channels, rate_in, rate_out, quality_, &err));
+        Status item_status;
+        if (state.get() == nullptr) {
+          item_status =
+              errors::InvalidArgument("unable to initialize resampler: ", err);
+        } else {
+          uint32_t processed_in = samples_in;
+          uint32_t processed_out = samples_out;
+          int returned = ResamplerProcess(
+              state.get(), input + i * samples_in * channels, &processed_in,
+              output + i * samples_out * channels, &processed_out);
+          if (returned != 0) {
+            item_status = errors::InvalidArgument("process error: ", returned);
+          } else if (processed_out != samples_out) {
+            item_status = errors::InvalidArgument(
+                "output buffer mismatch: ", processed_out, " vs. ",
+                samples_out);
           }
-        });
+        }
+        if (!item_status.ok()) {
+          mutex_lock l(mu);
+          status.Update(item_status);
+        }
+      }
+    };
+    const DeviceBase::CpuWorkerThreads& worker_threads =
+        *context->device()->tensorflow_cpu_worker_threads();
+    Shard(worker_threads.num_threads, worker_threads.workers, batch,
+          (samples_in + samples_out) * channels * (quality_ + 1) * 10, work);
+    return status;
+  }
+
+  int64 quality_;
+};
 
+// Resampler that keeps the filter state of speex across calls, so that a
+// stream resampled chunk by chunk has no artifacts at chunk boundaries.
+class AudioResamplerResource : public ResourceBase {
+ public:
+  AudioResamplerResource() : state_(nullptr, speex_resampler_destroy) {}
+  virtual ~AudioResamplerResource() {}
+
+  Status Init(const int64 rate_in, const int64 rate_out, const int64 channels,
+              const int64 quality) {
+    mutex_lock l(mu_);
+    TF_RETURN_IF_ERROR(ValidateResamplerArgs(rate_in, rate_out, quality));
+    if (channels <= 0) {
+      return errors::InvalidArgument("channels must be positive, got: ",
+                                     channels);
+    }
     int err = 0;
-    state.reset(
-        speex_resampler_init(channels, rate_in, rate_out, quality_, &err));
-    OP_REQUIRES(
-        context, (state.get() != nullptr),
-        errors::InvalidArgument("unable to initialize resampler: ", err));
+    state_.reset(
+        speex_resampler_init(channels, rate_in, rate_out, quality, &err));
+    if (state_.get() == nullptr) {
+      return errors::InvalidArgument("unable to initialize resampler: ", err);
+    }
+    // Output is aligned with the input, the last samples of the filter
+    // latency are returned with the next chunk
+    speex_resampler_skip_zeros(state_.get());
+    rate_in_ = rate_in;
+    rate_out_ = rate_out;
+    channels_ = channels;
+    return Status::OK();
+  }
+
+  template <typename T>
+  Status Process(
+      const Tensor& input_tensor,
+      std::function<Status(const TensorShape& shape, Tensor** output_tensor)>
+          allocate_func) {
+    mutex_lock l(mu_);
+    if (input_tensor.dims() != 2 || input_tensor.dim_size(1) != channels_) {
+      return errors::InvalidArgument(
+          "input must be [samples, ", channels_,
+          "], got: ", input_tensor.shape().DebugString());
+    }
+    const T* input = input_tensor.flat<T>().data();
+    uint32_t remaining = input_tensor.dim_size(0);
+
+    // Speex stops once the output is full, so process until all input is
+    // consumed
+    std::vector<T> output;
+    while (remaining > 0) {
+      const size_t offset = output.size();
+      uint32_t processed_in = remaining;
+      uint32_t processed_out =
+          static_cast<int64>(remaining) * rate_out_ / rate_in_ + 16;
+      output.resize(offset + processed_out * channels_);
+      int returned = ResamplerProcess(state_.get(), input, &processed_in,
+                                      output.data() + offset, &processed_out);
+      if (returned != 0) {
+        return errors::InvalidArgument("process error: ", returned);
+      }
+      output.resize(offset + processed_out * channels_);
+      input += processed_in * channels_;
+      remaining -= processed_in;
+    }
 
-    int64 samples_out = samples_in * rate_out / rate_in;
     Tensor* output_tensor;
-    switch (input_tensor->dtype()) {
-      case DT_INT16: {
-        OP_REQUIRES_OK(context, context->allocate_output(
-                                    0, TensorShape({samples_out, channels}),
-                                    &output_tensor));
-
-        uint32_t processed_in = samples_in;
-        uint32_t processed_out = samples_out;
-        int returned = speex_resampler_process_interleaved_int(
-            state.get(), input_tensor->flat<int16>().data(), &processed_in,
-            output_tensor->flat<int16>().data(), &processed_out);
-        OP_REQUIRES(context, (returned == 0),
-                    errors::InvalidArgument("process error: ", returned));
-        OP_REQUIRES(
-            context, (processed_out == samples_out),
-            errors::InvalidArgument("output buffer mismatch: ", processed_out,
-                                    " vs. ", samples_out));
-      } break;
-      case DT_FLOAT: {
-        OP_REQUIRES_OK(context, context->allocate_output(
-                                    0, TensorShape({samples_out, channels}),
-                                    &output_tensor));
-        uint32_t processed_in = samples_in;
-        uint32_t processed_out = samples_out;
-        int returned = speex_resampler_process_interleaved_float(
-            state.get(), input_tensor->flat<float>().data(), &processed_in,
-            output_tensor->flat<float>().data(), &processed_out);
-        OP_REQUIRES(context, (returned == 0),
-                    errors::InvalidArgument("process error: ", returned));
-        OP_REQUIRES(
-            context, (processed_out == samples_out),
-            errors::InvalidArgument("output buffer mismatch: ", processed_out,
-                                    " vs. ", samples_out));
-      } break;
+    TF_RETURN_IF_ERROR(allocate_func(
+        TensorShape({static_cast<int64>(output.size()) / channels_, channels_}),
+        &output_tensor));
+    std::copy(output.begin(), output.end(), output_tensor->flat<T>().data());
+    return Status::OK();
+  }
+
+  string DebugString() const override { return "AudioResamplerResource"; }
+
+ private:
+  mutable mutex mu_;
+  std::unique_ptr<SpeexResamplerState, void (*)(SpeexResamplerState*)> state_
+      TF_GUARDED_BY(mu_);
+  int64 rate_in_ TF_GUARDED_BY(mu_) = 0;
+  int64 rate_out_ TF_GUARDED_BY(mu_) = 0;
+  int64 channels_ TF_GUARDED_BY(mu_) = 0;
+};
+
+class AudioResamplerInitOp : public ResourceOpKernel<AudioResamplerResource> {
+ public:
+  explicit AudioResamplerInitOp(OpKernelConstruction* context)
+      : ResourceOpKernel<AudioResamplerResource>(context) {
+    OP_REQUIRES_OK(context, context->GetAttr("quality", &quality_));
+  }
+
+ private:
+  void Compute(OpKernelContext* context) override {
+    ResourceOpKernel<AudioResamplerResource>::Compute(context);
+
+    const Tensor* rate_in_tensor;
+    OP_REQUIRES_OK(context, context->input("rate_in", &rate_in_tensor));
+    const int64 rate_in = rate_in_tensor->scalar<int64>()();
+
+    const Tensor* rate_out_tensor;
+    OP_REQUIRES_OK(context, context->input("rate_out", &rate_out_tensor));
+    const int64 rate_out = rate_out_tensor->scalar<int64>()();
+
+    const Tensor* channels_tensor;
+    OP_REQUIRES_OK(context, context->input("channels", &channels_tensor));
+    const int64 channels = channels_tensor->scalar<int64>()();
+
+    OP_REQUIRES_OK(context,
+                   resource_->Init(rate_in, rate_out, channels, quality_));
+  }
+
+  Status CreateResource(AudioResamplerResource** resource)
+      TF_EXCLUSIVE_LOCKS_REQUIRED(mu_) override {
+    *resource = new AudioResamplerResource();
+    return Status::OK();
+  }
+
+  int64 quality_;
+};
+
+class AudioResamplerProcessOp : public OpKernel {
+ public:
+  explicit AudioResamplerProcessOp(OpKernelConstruction* context)
+      : OpKernel(context) {}
+
+  void Compute(OpKernelContext* context) override {
+    AudioResamplerResource* resource;
+    OP_REQUIRES_OK(context,
+                   GetResourceFromContext(context, "input", &resource));
+    core::ScopedUnref unref(resource);
+
+    const Tensor* value_tensor;
+    OP_REQUIRES_OK(context, context->input("value", &value_tensor));
+
+    auto allocate_func = [&](const TensorShape& shape,
+                             Tensor** output_tensor) -> Status {
+      return context->allocate_output(0, shape, output_tensor);
+    };
+    switch (value_tensor->dtype()) {
+      case DT_INT16:
+        OP_REQUIRES_OK(context,
+                       resource->Process<int16>(*value_tensor, allocate_func));
+        break;
+      case DT_FLOAT:
+        OP_REQUIRES_OK(context,
+                       resource->Process<float>(*value_tensor, allocate_func));
+        break;
       default:
         OP_REQUIRES_OK(context,
                        errors::InvalidArgument(
-                           "Data type ", DataTypeString(input_tensor->dtype()),
+                           "Data type ", DataTypeString(value_tensor->dtype()),
                            " not supported"));
     }
   }
+};
+
+// Converts decoded samples to float in [-1.0, 1.0)
+Status AudioSamplesToFloat(const Tensor& value, float* output) {
+  const int64 n = value.NumElements();
+  switch (value.dtype()) {
+    case DT_UINT8:
+      for (int64 i = 0; i < n; i++) {
+        output[i] =
+            (static_cast<float>(value.flat<uint8>()(i)) - 128.0f) / 128.0f;
+      }
+      break;
+    case DT_INT16:
+      for (int64 i = 0; i < n; i++) {
+        output[i] = static_cast<float>(value.flat<int16>()(i)) / 32768.0f;
+      }
+      break;
+    case DT_INT32:  // 24 stands for int24 (converts to INT32)
+      for (int64 i = 0; i < n; i++) {
+        output[i] = static_cast<float>(value.flat<int32>()(i)) / 2147483648.0f;
+      }
+      break;
+    case DT_FLOAT:
+      std::copy_n(value.flat<float>().data(), n, output);
+      break;
+    default:
+      return errors::InvalidArgument(
+          "data type ", DataTypeString(value.dtype()), " not supported");
+  }
+  return Status::OK();
+}
+
+// Decodes an audio file chunk by chunk, then mixes the channels, resamples
+// and frames the samples, so that memory is bounded by the chunk size instead
+// of the file size.
+class AudioStream {
+ public:
+  AudioStream(Env* env)
+      : source_(new AudioReadableResource(env)),
+        state_(nullptr, speex_resampler_destroy) {}
+  ~AudioStream() {}
+
+  // rate and channels of 0 keep the rate and channels of the file, window of
+  // 0 returns samples instead of frames.
+  Status Init(const string& filename, const int64 rate, const int64 channels,
+              const int64 window, const int64 hop, const int64 quality) {
+    TF_RETURN_IF_ERROR(source_->Init(filename, nullptr, 0));
+    int32 source_rate;
+    TF_RETURN_IF_ERROR(source_->Spec(&shape_, &dtype_, &source_rate));
+    rate_in_ = source_rate;
+    if (rate_in_ <= 0) {
+      return errors::InvalidArgument("invalid rate ", rate_in_, ": ", filename);
+    }
+    rate_out_ = (rate > 0) ? rate : rate_in_;
+    channels_in_ = shape_.dim_size(1);
+    channels_out_ = (channels > 0) ? channels : channels_in_;
+    if (channels_in_ != channels_out_ && channels_in_ != 1 &&
+        channels_out_ != 1) {
+      return errors::InvalidArgument("unable to mix ", channels_in_,
+                                     " channels into ", channels_out_,
+                                     " channels: ", filename);
+    }
+    length_ = (window > 0) ? window : 1;
+    step_ = (window > 0) ? hop : 1;
+    if (rate_out_ != rate_in_) {
+      TF_RETURN_IF_ERROR(ValidateResamplerArgs(rate_in_, rate_out_, quality));
+      int err = 0;
+      state_.reset(speex_resampler_init(channels_out_, rate_in_, rate_out_,
+                                        quality, &err));
+      if (state_.get() == nullptr) {
+        return errors::InvalidArgument("unable to initialize resampler: ", err);
+      }
+      speex_resampler_skip_zeros(state_.get());
+    }
+    pending_ = shape_.dim_size(0) * rate_out_ / rate_in_;
+    return Status::OK();
+  }
+
+  int64 rate() const { return rate_out_; }
+  int64 channels() const { return channels_out_; }
+
+  // Decodes until at least `frames` frames are available, or the file is
+  // exhausted
+  Status Prepare(const int64 frames) {
+    while (Frames() < frames && !flushed_) {
+      TF_RETURN_IF_ERROR(Fill());
+    }
+    return Status::OK();
+  }
+
+  int64 Frames() const {
+    const int64 available = Available();
+    return (available < length_) ? 0 : ((available - length_) / step_ + 1);
+  }
+
+  bool Done() const { return flushed_ && Frames() == 0; }
+
+  // Copies the next frame of [length, channels] into output
+  void Pop(float* output) {
+    std::copy_n(buffer_.data() + offset_ * channels_out_,
+                length_ * channels_out_, output);
+    skip_ += step_;
+    Drop();
+  }
+
+ private:
+  int64 Available() const {
+    return static_cast<int64>(buffer_.size()) / channels_out_ - offset_;
+  }
+
+  // Drops samples consumed by the hop, including samples not decoded yet
+  // when hop is larger than window
+  void Drop() {
+    const int64 n = std::min(skip_, Available());
+    offset_ += n;
+    skip_ -= n;
+  }
+
+  Status Fill() {
+    buffer_.erase(buffer_.begin(), buffer_.begin() + offset_ * channels_out_);
+    offset_ = 0;
+
+    std::vector<float> mixed;
+    const int64 samples = shape_.dim_size(0);
+    if (position_ < samples) {
+      const int64 chunk_size = 65536;
+      const int64 stop = (position_ + chunk_size < samples)
+                             ? (position_ + chunk_size)
+                             : samples;
+      Tensor chunk;
+      TF_RETURN_IF_ERROR(source_->Read(
+          position_, stop,
+          [&](const TensorShape& shape, Tensor** value) -> Status {
+            chunk = Tensor(dtype_, shape);
+            *value = &chunk;
+            return Status::OK();
+          }));
+      position_ = (chunk.dim_size(0) > 0) ? stop : samples;
+
+      std::vector<float> value(chunk.NumElements());
+      TF_RETURN_IF_ERROR(AudioSamplesToFloat(chunk, value.data()));
+      const int64 n = chunk.dim_size(0);
+      if (channels_in_ == channels_out_) {
+        mixed = std::move(value);
+      } else if (channels_out_ == 1) {
+        mixed.resize(n);
+        for (int64 i = 0; i < n; i++) {
+          float sum = 0.0f;
+          for (int64 c = 0; c < channels_in_; c++) {
+            sum += value[i * channels_in_ + c];
+          }
+          mixed[i] = sum / channels_in_;
+        }
+      } else {
+        mixed.resize(n * channels_out_);
+        for (int64 i = 0; i < n; i++) {
+          std::fill_n(mixed.begin() + i * channels_out_, channels_out_,
+                      value[i]);
+        }
+      }
+    } else {
+      flushed_ = true;
+      if (state_.get() == nullptr) {
+        return Status::OK();
+      }
+      // Push the last samples out of the filter with zeros
+      mixed.resize(
+          speex_resampler_get_input_latency(state_.get()) * channels_out_,
+          0.0f);
+    }
+
+    if (state_.get() == nullptr) {
+      buffer_.insert(buffer_.end(), mixed.begin(), mixed.end());
+    } else {
+      const size_t start = buffer_.size();
+      const float* input = mixed.data();
+      uint32_t remaining = mixed.size() / channels_out_;
+      while (remaining > 0) {
+        const size_t offset = buffer_.size();
+        uint32_t processed_in = remaining;
+        uint32_t processed_out =
+            static_cast<int64>(remaining) * rate_out_ / rate_in_ + 16;
+        buffer_.resize(offset + processed_out * channels_out_);
+        int returned = speex_resampler_process_interleaved_float(
+            state_.get(), input, &processed_in, buffer_.data() + offset,
+            &processed_out);
+        if (returned != 0) {
+          return errors::InvalidArgument("process error: ", returned);
+        }
+        buffer_.resize(offset + processed_out * channels_out_);
+        input += processed_in * channels_out_;
+        remaining -= processed_in;
+      }
+      // Output has the same length as resample of the whole file
+      const int64 produced = (buffer_.size() - start) / channels_out_;
+      if (produced > pending_) {
+        buffer_.resize(start + pending_ * channels_out_);
+      }
+      pending_ -= std::min(produced, pending_);
+    }
+    Drop();
+    return Status::OK();
+  }
+
+  std::unique_ptr<AudioReadableResource> source_;
+  std::unique_ptr<SpeexResamplerState, void (*)(SpeexResamplerState*)> state_;
+  TensorShape shape_;
+  DataType dtype_;
+  int64 rate_in_ = 0;
+  int64 rate_out_ = 0;
+  int64 channels_in_ = 0;
+  int64 channels_out_ = 0;
+  int64 length_ = 1;
+  int64 step_ = 1;
+
+  int64 position_ = 0;
+  int64 pending_ = 0;
+  bool flushed_ = false;
+  std::vector<float> buffer_;
+  int64 offset_ = 0;
+  int64 skip_ = 0;
+};
+
+// Streams frames of a list of audio files, with up to `cycle_length` files
+// decoded in parallel and their frames interleaved.
+class AudioStreamReadableResource : public ResourceBase {
+ public:
+  AudioStreamReadableResource(Env* env) : env_(env) {}
+  ~AudioStreamReadableResource() {}
+
+  Status Init(const std::vector<string>& filenames, const int64 rate,
+              const int64 channels, const int64 window, const int64 hop,
+              const int64 quality, const int64 cycle_length) {
+    mutex_lock l(mu_);
+    if (window < 0 || (window > 0 && hop <= 0)) {
+      return errors::InvalidArgument("invalid window ", window, " and hop ",
+                                     hop);
+    }
+    if (cycle_length <= 0) {
+      return errors::InvalidArgument("cycle_length must be positive, got: ",
+                                     cycle_length);
+    }
+    filenames_ = filenames;
+    rate_ = rate;
+    channels_ = channels;
+    window_ = window;
+    hop_ = hop;
+    quality_ = quality;
+    cycle_length_ = cycle_length;
+    next_ = 0;
+    streams_.clear();
+    // Rate and channels of the first file apply to all files if not provided
+    if (!filenames_.empty()) {
+      std::unique_ptr<AudioStream> stream(new AudioStream(env_));
+      TF_RETURN_IF_ERROR(stream->Init(filenames_[0], rate_, channels_, window_,
+                                      hop_, quality_));
+      rate_ = stream->rate();
+      channels_ = stream->channels();
+      next_ = 1;
+      streams_.push_back(std::move(stream));
+    }
+    return Status::OK();
+  }
+
+  Status Spec(int64* rate, int64* channels) {
+    mutex_lock l(mu_);
+    *rate = rate_;
+    *channels = channels_;
+    return Status::OK();
+  }
+
+  Status Read(const int64 capacity,
+              const DeviceBase::CpuWorkerThreads& worker_threads,
+              std::function<Status(const TensorShape& shape, Tensor** value)>
+                  allocate_func) {
+    mutex_lock l(mu_);
+    const int64 length = ((window_ > 0) ? window_ : 1) * channels_;
+
+    std::vector<float> frames;
+    int64 count = 0;
+    while (count < capacity) {
+      TF_RETURN_IF_ERROR(OpenStreams());
+      if (streams_.empty()) {
+        break;
+      }
+
+      // Decode the open files in parallel
+      const int64 required =
+          (capacity - count + streams_.size() - 1) / streams_.size();
+      std::vector<Status> statuses(streams_.size());
+      auto work = [&](int64 start, int64 limit) {
+        for (int64 i = start; i < limit; i++) {
+          statuses[i] = streams_[i]->Prepare(required);
+        }
+      };
+      Shard(worker_threads.num_threads, worker_threads.workers, streams_.size(),
+            required * length * 1000, work);
+      for (const Status& status : statuses) {
+        TF_RETURN_IF_ERROR(status);
+      }
+
+      // Take frames from the files in turn
+      bool taken = true;
+      while (count < capacity && taken) {
+        taken = false;
+        for (size_t i = 0; i < streams_.size() && count < capacity; i++) {
+          if (streams_[i]->Frames() > 0) {
+            frames.resize((count + 1) * length);
+            streams_[i]->Pop(frames.data() + count * length);
+            count++;
+            taken = true;
+          }
+        }
+      }
+      streams_.erase(
+          std::remove_if(streams_.begin(), streams_.end(),
+                         [](const std::unique_ptr<AudioStream>& stream) {
+                           return stream->Done();
+                         }),
+          streams_.end());
+    }
+
+    TensorShape shape({count, channels_});
+    if (window_ > 0) {
+      shape.InsertDim(1, window_);
+    }
+    Tensor* value;
+    TF_RETURN_IF_ERROR(allocate_func(shape, &value));
+    std::copy(frames.begin(), frames.end(), value->flat<float>().data());
+    return Status::OK();
+  }
+
+  string DebugString() const override { return "AudioStreamReadableResource"; }
+
+ private:
+  Status OpenStreams() TF_EXCLUSIVE_LOCKS_REQUIRED(mu_) {
+    while (static_cast<int64>(streams_.size()) < cycle_length_ &&
+           next_ < filenames_.size()) {
+      std::unique_ptr<AudioStream> stream(new AudioStream(env_));
+      TF_RETURN_IF_ERROR(stream->Init(filenames_[next_], rate_, channels_,
+                                      window_, hop_, quality_));
+      next_++;
+      streams_.push_back(std::move(stream));
+    }
+    return Status::OK();
+  }
+
+  mutable mutex mu_;
+  Env* env_ TF_GUARDED_BY(mu_);
+  std::vector<string> filenames_ TF_GUARDED_BY(mu_);
+  int64 rate_ TF_GUARDED_BY(mu_) = 0;
+  int64 channels_ TF_GUARDED_BY(mu_) = 0;
+  int64 window_ TF_GUARDED_BY(mu_) = 0;
+  int64 hop_ TF_GUARDED_BY(mu_) = 0;
+  int64 quality_ TF_GUARDED_BY(mu_) = 0;
+  int64 cycle_length_ TF_GUARDED_BY(mu_) = 1;
+  size_t next_ TF_GUARDED_BY(mu_) = 0;
+  std::vector<std::unique_ptr<AudioStream>> streams_ TF_GUARDED_BY(mu_);
+};
+
+class AudioStreamReadableInitOp
+    : public ResourceOpKernel<AudioStreamReadableResource> {
+ public:
+  explicit AudioStreamReadableInitOp(OpKernelConstruction* context)
+      : ResourceOpKernel<AudioStreamReadableResource>(context) {
+    env_ = context->env();
+    OP_REQUIRES_OK(context, context->GetAttr("quality", &quality_));
+  }
 
  private:
-  static const int64 quality_ = SPEEX_RESAMPLER_QUALITY_DEFAULT;
+  void Compute(OpKernelContext* context) override {
+    ResourceOpKernel<AudioStreamReadableResource>::Compute(context);
+
+    const Tensor* input_tensor;
+    OP_REQUIRES_OK(context, context->input("input", &input_tensor));
+    std::vector<string> filenames;
+    for (int64 i = 0; i < input_tensor->NumElements(); i++) {
+      filenames.push_back(input_tensor->flat<tstring>()(i));
+    }
+
+    const Tensor* rate_tensor;
+    OP_REQUIRES_OK(context, context->input("rate", &rate_tensor));
+    const int64 rate = rate_tensor->scalar<int64>()();
+
+    const Tensor* channels_tensor;
+    OP_REQUIRES_OK(context, context->input("channels", &channels_tensor));
+    const int64 channels = channels_tensor->scalar<int64>()();
+
+    const Tensor* window_tensor;
+    OP_REQUIRES_OK(context, context->input("window", &window_tensor));
+    const int64 window = window_tensor->scalar<int64>()();
+
+    const Tensor* hop_tensor;
+    OP_REQUIRES_OK(context, context->input("hop", &hop_tensor));
+    const int64 hop = hop_tensor->scalar<int64>()();
+
+    const Tensor* cycle_length_tensor;
+    OP_REQUIRES_OK(context,
+                   context->input("cycle_length", &cycle_length_tensor));
+    const int64 cycle_length = cycle_length_tensor->scalar<int64>()();
+
+    OP_REQUIRES_OK(context, resource_->Init(filenames, rate, channels, window,
+                                            hop, quality_, cycle_length));
+
+    int64 spec_rate, spec_channels;
+    OP_REQUIRES_OK(context, resource_->Spec(&spec_rate, &spec_channels));
+
+    Tensor* rate_output;
+    OP_REQUIRES_OK(context,
+                   context->allocate_output(1, TensorShape({}), &rate_output));
+    rate_output->scalar<int64>()() = spec_rate;
+
+    Tensor* channels_output;
+    OP_REQUIRES_OK(context, context->allocate_output(2, TensorShape({}),
+                                                     &channels_output));
+    channels_output->scalar<int64>()() = spec_channels;
+  }
+
+  Status CreateResource(AudioStreamReadableResource** resource)
+      TF_EXCLUSIVE_LOCKS_REQUIRED(mu_) override {
+    *resource = new AudioStreamReadableResource(env_);
+    return Status::OK();
+  }
+
+  mutable mutex mu_;
+  Env* env_ TF_GUARDED_BY(mu_);
+  int64 quality_;
+};
+
+class AudioStreamReadableReadOp : public OpKernel {
+ public:
+  explicit AudioStreamReadableReadOp(OpKernelConstruction* context)
+      : OpKernel(context) {}
+
+  void Compute(OpKernelContext* context) override {
+    AudioStreamReadableResource* resource;
+    OP_REQUIRES_OK(context,
+                   GetResourceFromContext(context, "input", &resource));
+    core::ScopedUnref unref(resource);
+
+    const Tensor* capacity_tensor;
+    OP_REQUIRES_OK(context, context->input("capacity", &capacity_tensor));
+    const int64 capacity = capacity_tensor->scalar<int64>()();
+    OP_REQUIRES(
+        context, (capacity > 0),
+        errors::InvalidArgument("capacity must be positive, got: ", capacity));
+
+    OP_REQUIRES_OK(
+        context,
+        resource->Read(capacity,
+                       *context->device()->tensorflow_cpu_worker_threads(),
+                       [&](const TensorShape& shape, Tensor** value) -> Status {
+                         return context->allocate_output(0, shape, value);
+                       }));
+  }
+};
+
+// Converts the STFT of audio into a mel spectrogram in dB. The magnitude, the
+// mel filterbank and the dB scale are applied in a single pass over each
+// frame, so no intermediate spectrogram is materialized. Filterbanks are
+// computed once for each number of frequency bins, the other parameters are
+// attributes of the kernel.
+class AudioMelSpectrogramOp : public OpKernel {
+ public:
+  explicit AudioMelSpectrogramOp(OpKernelConstruction* context)
+      : OpKernel(context) {
+    OP_REQUIRES_OK(context, context->GetAttr("rate", &rate_));
+    OP_REQUIRES_OK(context, context->GetAttr("mels", &mels_));
+    OP_REQUIRES_OK(context, context->GetAttr("fmin", &fmin_));
+    OP_REQUIRES_OK(context, context->GetAttr("fmax", &fmax_));
+    OP_REQUIRES_OK(context, context->GetAttr("top_db", &top_db_));
+    OP_REQUIRES(context, rate_ > 0,
+                errors::InvalidArgument("rate must be positive, got: ", rate_));
+    OP_REQUIRES(context, mels_ > 0,
+                errors::InvalidArgument("mels must be positive, got: ", mels_));
+    OP_REQUIRES(context, 0.0f <= fmin_ && fmin_ < fmax_,
+                errors::InvalidArgument("fmin must be in [0, fmax), got: ",
+                                        fmin_, " and fmax: ", fmax_));
+    OP_REQUIRES(context, fmax_ <= rate_ / 2.0,
+                errors::InvalidArgument("fmax must not exceed the Nyquist "
+                                        "frequency ",
+                                        rate_ / 2.0, ", got: ", fmax_));
+  }
+
+  void Compute(OpKernelContext* context) override {
+    const Tensor* input_tensor;
+    OP_REQUIRES_OK(context, context->input("input", &input_tensor));
+    OP_REQUIRES(context, input_tensor->dims() >= 2,
+                errors::InvalidArgument(
+                    "input must be at least 2-D with [frames, bins], got: ",
+                    input_tensor->shape().DebugString()));
+    const int64 bins = input_tensor->dim_size(input_tensor->dims() - 1);
+    const int64 frames = input_tensor->dim_size(input_tensor->dims() - 2);
+    OP_REQUIRES(context, bins >= 2,
+                errors::InvalidArgument(
+                    "input must have at least 2 bins, got: ", bins));
+
+    const Filterbank* filterbank = GetFilterbank(bins);
+
+    TensorShape output_shape = input_tensor->shape();
+    output_shape.set_dim(output_shape.dims() - 1, mels_);
+    Tensor* output_tensor;
+    OP_REQUIRES_OK(context,
+                   context->allocate_output(0, output_shape, &output_tensor));
+    if (output_shape.num_elements() == 0) {
+      return;
+    }
+
+    auto input = input_tensor->flat_inner_dims<complex64>();
+    auto output = output_tensor->flat_inner_dims<float>();
+    auto work = [&](int64 start, int64 limit) {
+      // Only the bins covered by the filters are needed
+      std::vector<float> magnitude(bins);
+      for (int64 row = start; row < limit; row++) {
+        const complex64* x = &input(row, 0);
+        for (int64 i = filterbank->begin; i < filterbank->end; i++) {
+          magnitude[i] = std::abs(x[i]);
+        }
+        float* y = &output(row, 0);
+        for (int64 m = 0; m < mels_; m++) {
+          const Filter& filter = filterbank->filters[m];
+          float sum = 0.0f;
+          for (size_t k = 0; k < filter.weights.size(); k++) {
+            sum += magnitude[filter.start + k] * filter.weights[k];
+          }
+          // 10 * log10 of the power, the square of the mel magnitude
+          y[m] = 20.0f * std::log10(sum);
+        }
+      }
+    };
+    const DeviceBase::CpuWorkerThreads& worker_threads =
+        *context->device()->tensorflow_cpu_worker_threads();
+    Shard(worker_threads.num_threads, worker_threads.workers,
+          input.dimension(0),
+          (filterbank->end - filterbank->begin) * 10 + filterbank->weights * 2,
+          work);
+
+    // Cut off each spectrogram at top_db below its maximum
+    if (top_db_ >= 0.0f) {
+      const int64 size = frames * mels_;
+      float* data = output_tensor->flat<float>().data();
+      for (int64 offset = 0; offset < output_tensor->NumElements();
+           offset += size) {
+        const float cutoff =
+            *std::max_element(data + offset, data + offset + size) - top_db_;
+        for (int64 i = offset; i < offset + size; i++) {
+          data[i] = std::max(data[i], cutoff);
+        }
+      }
+    }
+  }
+
+ private:
+  struct Filter {
+    int64 start = 0;
+    std::vector<float> weights;
+  };
+  struct Filterbank {
+    std::vector<Filter> filters;
+    // Range of bins covered by any filter, and the number of weights
+    int64 begin = 0;
+    int64 end = 0;
+    int64 weights = 0;
+  };
+
+  static double HertzToMel(double hertz) {
+    return 1127.0 * std::log1p(hertz / 700.0);
+  }
+
+  // Same triangular filters as tf.signal.linear_to_mel_weight_matrix, only
+  // the nonzero weights of each filter are kept
+  const Filterbank* GetFilterbank(int64 bins) {
+    mutex_lock l(mu_);
+    std::unique_ptr<Filterbank>& filterbank = filterbanks_[bins];
+    if (filterbank != nullptr) {
+      return filterbank.get();
+    }
+    filterbank.reset(new Filterbank());
+    filterbank->begin = bins;
+    const double nyquist = rate_ / 2.0;
+    const double mel_min = HertzToMel(fmin_);
+    const double mel_step = (HertzToMel(fmax_) - mel_min) / (mels_ + 1);
+    for (int64 m = 0; m < mels_; m++) {
+      const double lower = mel_min + m * mel_step;
+      const double center = lower + mel_step;
+      const double upper = center + mel_step;
+      Filter filter;
+      // The DC bin has no weight
+      for (int64 i = 1; i < bins; i++) {
+        const double mel = HertzToMel(nyquist * i / (bins - 1));
+        const double weight =
+            std::max(0.0, std::min((mel - lower) / (center - lower),
+                                   (upper - mel) / (upper - center)));
+        if (weight > 0.0) {
+          if (filter.weights.empty()) {
+            filter.start = i;
+          }
+          filter.weights.resize(i - filter.start + 1, 0.0f);
+          filter.weights[i - filter.start] = weight;
+        }
+      }
+      if (!filter.weights.empty()) {
+        filterbank->begin = std::min(filterbank->begin, filter.start);
+        filterbank->end =
+            std::max(filterbank->end,
+                     filter.start + static_cast<int64>(filter.weights.size()));
+        filterbank->weights += filter.weights.size();
+      }
+      filterbank->filters.emplace_back(std::move(filter));
+    }
+    filterbank->begin = std::min(filterbank->begin, filterbank->end);
+    return filterbank.get();
+  }
+
+  int64 rate_;
+  int64 mels_;
+  float fmin_;
+  float fmax_;
+  float top_db_;
+  mutex mu_;
+  std::unordered_map<int64, std::unique_ptr<Filterbank>> filterbanks_
+      TF_GUARDED_BY(mu_);
 };
 
 REGISTER_KERNEL_BUILDER(Name("IO>AudioReadableInit").Device(DEVICE_CPU),
@@ -305,8 +1152,18 @@ REGISTER_KERNEL_BUILDER(Name("IO>AudioReadableSpec").Device(DEVICE_CPU),
 REGISTER_KERNEL_BUILDER(Name("IO>AudioReadableRead").Device(DEVICE_CPU),
                         AudioReadableReadOp);
 
+REGISTER_KERNEL_BUILDER(Name("IO>AudioStreamReadableInit").Device(DEVICE_CPU),
+                        AudioStreamReadableInitOp);
+REGISTER_KERNEL_BUILDER(Name("IO>AudioStreamReadableRead").Device(DEVICE_CPU),
+                        AudioStreamReadableReadOp);
 REGISTER_KERNEL_BUILDER(Name("IO>AudioResample").Device(DEVICE_CPU),
                         AudioResampleOp);
+REGISTER_KERNEL_BUILDER(Name("IO>AudioResamplerInit").Device(DEVICE_CPU),
+                        AudioResamplerInitOp);
+REGISTER_KERNEL_BUILDER(Name("IO>AudioResamplerProcess").Device(DEVICE_CPU),
+                        AudioResamplerProcessOp);
+REGISTER_KERNEL_BUILDER(Name("IO>AudioMelSpectrogram").Device(DEVICE_CPU),
+                        AudioMelSpectrogramOp);
 }  // namespace
 }  // namespace data
 }  // namespace tensorflow
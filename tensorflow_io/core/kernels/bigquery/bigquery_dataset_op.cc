@@ -33,6 +33,7 @@ class BigQueryDatasetOp : public DatasetOpKernel {
     OP_REQUIRES_OK(ctx, ctx->GetAttr("output_types", &output_types_));
     OP_REQUIRES_OK(ctx, ctx->GetAttr("default_values", &default_values_));
     OP_REQUIRES_OK(ctx, ctx->GetAttr("offset", &offset_));
+    OP_REQUIRES_OK(ctx, ctx->GetAttr("batch_size", &batch_size_));
     string data_format_str;
     OP_REQUIRES_OK(ctx, ctx->GetAttr("data_format", &data_format_str));
     OP_REQUIRES_OK(ctx, GetDataFormat(data_format_str, &data_format_));
@@ -62,7 +63,11 @@ class BigQueryDatasetOp : public DatasetOpKernel {
     output_types_vector.reserve(num_outputs);
     typed_default_values_.reserve(num_outputs);
     for (uint64 i = 0; i < num_outputs; ++i) {
-      output_shapes.push_back({});
+      if (batch_size_ > 0) {
+        output_shapes.push_back(PartialTensorShape({-1}));
+      } else {
+        output_shapes.push_back({});
+      }
       output_types_vector.push_back(output_types_[i]);
       const DataType &output_type = output_types_[i];
       const string &default_value = default_values_[i];
@@ -96,10 +101,10 @@ class BigQueryDatasetOp : public DatasetOpKernel {
       }
     }
 
-    *output = new Dataset(ctx, client_resource, output_types_vector,
-                          std::move(output_shapes), std::move(stream),
-                          std::move(schema), selected_fields_, output_types_,
-                          typed_default_values_, offset_, data_format_);
+    *output = new Dataset(
+        ctx, client_resource, output_types_vector, std::move(output_shapes),
+        std::move(stream), std::move(schema), selected_fields_, output_types_,
+        typed_default_values_, offset_, batch_size_, data_format_);
   }
 
  private:
@@ -108,6 +113,7 @@ class BigQueryDatasetOp : public DatasetOpKernel {
   std::vector<string> default_values_;
   std::vector<absl::any> typed_default_values_;
   int64 offset_;
+  int64 batch_size_;
   apiv1beta1::DataFormat data_format_;
 
   class Dataset : public DatasetBase {
@@ -120,7 +126,7 @@ class BigQueryDatasetOp : public DatasetOpKernel {
                      std::vector<string> selected_fields,
                      std::vector<DataType> output_types,
                      std::vector<absl::any> typed_default_values, int64 offset_,
-                     apiv1beta1::DataFormat data_format)
+                     int64 batch_size, apiv1beta1::DataFormat data_format)
         : DatasetBase(DatasetContext(ctx)),
           client_resource_(client_resource),
           output_types_vector_(output_types_vector),
@@ -130,6 +136,7 @@ class BigQueryDatasetOp : public DatasetOpKernel {
           output_types_(output_types),
           typed_default_values_(typed_default_values),
           offset_(offset_),
+          batch_size_(batch_size),
           avro_schema_(absl::make_unique<avro::ValidSchema>()),
           data_format_(data_format) {
       client_resource_->Ref();
@@ -202,6 +209,8 @@ class BigQueryDatasetOp : public DatasetOpKernel {
 
     const int64 offset() const { return offset_; }
 
+    const int64 batch_size() const { return batch_size_; }
+
     string DebugString() const override { return "BigQueryDatasetOp::Dataset"; }
 
     Status CheckExternalState() const override { return Status::OK(); }
@@ -228,6 +237,7 @@ class BigQueryDatasetOp : public DatasetOpKernel {
     const std::vector<absl::any> typed_default_values_;
     const std::unique_ptr<avro::ValidSchema> avro_schema_;
     const int64 offset_;
+    const int64 batch_size_;
     std::shared_ptr<::arrow::Schema> arrow_schema_;
     const apiv1beta1::DataFormat data_format_;
   };
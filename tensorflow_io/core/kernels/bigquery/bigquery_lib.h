@@ -46,6 +46,7 @@ limitations under the License.
 #include "tensorflow/core/lib/core/status.h"
 #include "tensorflow/core/platform/logging.h"
 #include "tensorflow/core/public/version.h"
+#include "tensorflow/core/util/batch_util.h"
 #include "tensorflow_io/core/kernels/arrow/arrow_util.h"
 
 namespace tensorflow {
@@ -126,30 +127,58 @@ class BigQueryReaderDatasetIteratorBase : public DatasetIterator<Dataset> {
       return Status::OK();
     }
 
+    int64 num_rows = 0;
     auto status =
         ReadRecord(ctx, out_tensors, this->dataset()->selected_fields(),
                    this->dataset()->output_types(),
-                   this->dataset()->typed_default_values());
-    current_row_index_++;
+                   this->dataset()->typed_default_values(), &num_rows);
+    current_row_index_ += num_rows;
+    read_offset_ += num_rows;
     return status;
   }
 
  protected:
   explicit BigQueryReaderDatasetIteratorBase(
       const typename DatasetIterator<Dataset>::Params &params)
-      : DatasetIterator<Dataset>(params) {
+      : DatasetIterator<Dataset>(params),
+        read_offset_(this->dataset()->offset()) {
     VLOG(3) << "created BigQueryReaderDatasetIteratorBase for stream: "
             << this->dataset()->stream();
   }
 
+  // The iterator state is the position in the stream of the next row to be
+  // returned, so a restored iterator re-opens the stream at that offset
+  // instead of reading it again from the beginning.
   Status SaveInternal(SerializationContext *ctx,
                       IteratorStateWriter *writer) override {
-    return errors::Unimplemented("SaveInternal");
+    mutex_lock l(mu_);
+    TF_RETURN_IF_ERROR(writer->WriteScalar(this->full_name("stream"),
+                                           this->dataset()->stream()));
+    TF_RETURN_IF_ERROR(
+        writer->WriteScalar(this->full_name("offset"), read_offset_));
+    return Status::OK();
   }
   Status RestoreInternal(IteratorContext *ctx,
                          IteratorStateReader *reader) override {
-    return errors::Unimplemented(
-        "Iterator does not support 'RestoreInternal')");
+    mutex_lock l(mu_);
+    tstring stream;
+    TF_RETURN_IF_ERROR(reader->ReadScalar(this->full_name("stream"), &stream));
+    if (string(stream) != this->dataset()->stream()) {
+      return errors::InvalidArgument("checkpoint is for stream ", stream,
+                                     " but the iterator reads stream ",
+                                     this->dataset()->stream());
+    }
+    int64 offset;
+    TF_RETURN_IF_ERROR(reader->ReadScalar(this->full_name("offset"), &offset));
+    if (reader_) {
+      read_rows_context_->TryCancel();
+      reader_.reset();
+    }
+    response_.reset();
+    current_row_index_ = 0;
+    read_offset_ = offset;
+    VLOG(3) << "restored stream: " << stream << " offset: " << offset;
+    return Status::OK();
   }
   virtual Status EnsureReaderInitialized() TF_EXCLUSIVE_LOCKS_REQUIRED(mu_) {
     if (reader_) {
@@ -159,8 +188,7 @@ class BigQueryReaderDatasetIteratorBase : public DatasetIterator<Dataset> {
     apiv1beta1::ReadRowsRequest readRowsRequest;
     readRowsRequest.mutable_read_position()->mutable_stream()->set_name(
         this->dataset()->stream());
-    readRowsRequest.mutable_read_position()->set_offset(
-        this->dataset()->offset());
+    readRowsRequest.mutable_read_position()->set_offset(read_offset_);
 
     read_rows_context_ = absl::make_unique<::grpc::ClientContext>();
     // The deadline is for the entire ReadRows (not a single message receipt),
@@ -183,13 +211,18 @@ class BigQueryReaderDatasetIteratorBase : public DatasetIterator<Dataset> {
   }
 
   virtual Status EnsureHasRow(bool *end_of_sequence) = 0;
-  virtual Status ReadRecord(
-      IteratorContext *ctx, std::vector<Tensor> *out_tensors,
-      const std::vector<string> &columns,
-      const std::vector<DataType> &output_types,
-      const std::vector<absl::any> &typed_default_values) = 0;
+  // Reads the record at current_row_index_, or when the dataset has a
+  // batch_size, up to batch_size records of the current response stacked
+  // into [n] column tensors. The number of rows consumed is set in num_rows.
+  virtual Status ReadRecord(IteratorContext *ctx,
+                            std::vector<Tensor> *out_tensors,
+                            const std::vector<string> &columns,
+                            const std::vector<DataType> &output_types,
+                            const std::vector<absl::any> &typed_default_values,
+                            int64 *num_rows) = 0;
   int current_row_index_ = 0;
   mutex mu_;
+  int64 read_offset_ TF_GUARDED_BY(mu_);
   std::unique_ptr<::grpc::ClientContext> read_rows_context_ TF_GUARDED_BY(mu_);
   std::unique_ptr<::grpc::ClientReader<apiv1beta1::ReadRowsResponse>> reader_
       TF_GUARDED_BY(mu_);
@@ -249,7 +282,8 @@ class BigQueryReaderArrowDatasetIterator
   Status ReadRecord(IteratorContext *ctx, std::vector<Tensor> *out_tensors,
                     const std::vector<string> &columns,
                     const std::vector<DataType> &output_types,
-                    const std::vector<absl::any> &typed_default_values)
+                    const std::vector<absl::any> &typed_default_values,
+                    int64 *num_rows)
       TF_EXCLUSIVE_LOCKS_REQUIRED(this->mu_) override {
     out_tensors->clear();
     out_tensors->reserve(columns.size());
@@ -278,6 +312,18 @@ class BigQueryReaderArrowDatasetIterator
       }
     }
 
+    // In batch mode the rows left in the current record batch are emitted as
+    // [n] column tensors, which AssignTensor fills with a single memcpy for
+    // fixed width types.
+    const int64 batch_size = this->dataset()->batch_size();
+    TensorShape shape({});
+    *num_rows = 1;
+    if (batch_size > 0) {
+      *num_rows = std::min<int64>(batch_size, this->record_batch_->num_rows() -
+                                                  this->current_row_index_);
+      shape = TensorShape({*num_rows});
+    }
+
     for (size_t i = 0; i < columns.size(); ++i) {
       DataType output_type = output_types[i];
       size_t arrow_column_index = this->column_indices_[i];
@@ -285,7 +331,7 @@ class BigQueryReaderArrowDatasetIterator
           this->record_batch_->column(arrow_column_index);
 
       // Allocate a new tensor and assign Arrow data to it
-      Tensor tensor(ctx->allocator({}), output_type, {});
+      Tensor tensor(ctx->allocator({}), output_type, shape);
       TF_RETURN_IF_ERROR(
           ArrowUtil::AssignTensor(arr, this->current_row_index_, &tensor));
 
@@ -341,8 +387,46 @@ class BigQueryReaderAvroDatasetIterator
   Status ReadRecord(IteratorContext *ctx, std::vector<Tensor> *out_tensors,
                     const std::vector<string> &columns,
                     const std::vector<DataType> &output_types,
-                    const std::vector<absl::any> &typed_default_values)
+                    const std::vector<absl::any> &typed_default_values,
+                    int64 *num_rows)
       TF_EXCLUSIVE_LOCKS_REQUIRED(this->mu_) override {
+    const int64 batch_size = this->dataset()->batch_size();
+    if (batch_size <= 0) {
+      *num_rows = 1;
+      return ReadRow(ctx, out_tensors, columns, output_types,
+                     typed_default_values);
+    }
+
+    // Avro rows are decoded one at a time, so in batch mode each decoded row
+    // is copied into its slot of the [n] column tensors.
+    const int64 n =
+        std::min<int64>(batch_size, this->response_->avro_rows().row_count() -
+                                        this->current_row_index_);
+    out_tensors->clear();
+    out_tensors->reserve(columns.size());
+    for (size_t i = 0; i < columns.size(); i++) {
+      out_tensors->emplace_back(ctx->allocator({}), output_types[i],
+                                TensorShape({n}));
+    }
+    std::vector<Tensor> row;
+    for (int64 j = 0; j < n; j++) {
+      TF_RETURN_IF_ERROR(
+          ReadRow(ctx, &row, columns, output_types, typed_default_values));
+      for (size_t i = 0; i < columns.size(); i++) {
+        TF_RETURN_IF_ERROR(batch_util::CopyElementToSlice(
+            std::move(row[i]), &(*out_tensors)[i], j));
+      }
+    }
+    *num_rows = n;
+    return Status::OK();
+  }
+
+ private:
+  Status ReadRow(IteratorContext *ctx, std::vector<Tensor> *out_tensors,
+                 const std::vector<string> &columns,
+                 const std::vector<DataType> &output_types,
+                 const std::vector<absl::any> &typed_default_values)
+      TF_EXCLUSIVE_LOCKS_REQUIRED(this->mu_) {
     avro::decode(*this->decoder_, *this->datum_);
     if (this->datum_->type() != avro::AVRO_RECORD) {
       return errors::Unknown("record is not of AVRO_RECORD type");
@@ -562,7 +646,6 @@ class BigQueryReaderAvroDatasetIterator
     return Status::OK();
   }
 
- private:
   std::unique_ptr<avro::InputStream> memory_input_stream_
       TF_GUARDED_BY(this->mu_);
   std::unique_ptr<avro::GenericDatum> datum_ TF_GUARDED_BY(this->mu_);
@@ -12,7 +12,12 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 ==============================================================================*/
+#include <map>
+#include <numeric>
+
 #include "absl/memory/memory.h"
+#include "absl/strings/ascii.h"
+#include "absl/strings/str_join.h"
 #include "google/cloud/bigtable/row_set.h"
 #include "google/cloud/bigtable/table.h"
 #include "google/cloud/bigtable/table_admin.h"
@@ -147,12 +152,8 @@ class Iterator : public DatasetIterator<Dataset> {
                     const std::vector<std::string>& columns)
       : DatasetIterator<Dataset>(params),
         columns_(ColumnsToFamiliesAndQualifiers(columns)),
-        reader_(this->dataset()->CreateTable().ReadRows(
-            this->dataset()->row_set(),
-            cbt::Filter::Chain(CreateColumnsFilter(columns_),
-                               this->dataset()->filter(),
-                               cbt::Filter::Latest(1)))),
-        it_(this->reader_.begin()),
+        reader_(CreateReader(this->dataset()->row_set())),
+        it_(this->reader_->begin()),
         column_to_idx_(CreateColumnToIdxMap(columns_)) {
     VLOG(1) << "DatasetIterator ctor";
   }
@@ -161,68 +162,176 @@ class Iterator : public DatasetIterator<Dataset> {
                          bool* end_of_sequence) override {
     VLOG(1) << "GetNextInternal";
     mutex_lock l(mu_);
-    if (it_ == reader_.end()) {
+    if (it_ == reader_->end()) {
       VLOG(1) << "End of sequence";
       *end_of_sequence = true;
       return Status::OK();
     }
     *end_of_sequence = false;
 
-    VLOG(1) << "alocating tensor";
+    // Without a batch size every element holds a single row. With one, up to
+    // batch_size rows are read from the stream into the same element.
+    const int64 batch_size = this->dataset()->batch_size();
+    const int64 max_rows = batch_size > 0 ? batch_size : 1;
     const std::size_t kNumCols = column_to_idx_.size();
-    const DataType dtype = this->dataset()->output_type();
-    Tensor res(ctx->allocator({}), dtype, {(long)kNumCols});
-
-    VLOG(1) << "getting row";
-    const auto& row = *it_;
-    if (!row.ok()) {
-      LOG(ERROR) << row.status().message();
-      return GoogleCloudStatusToTfStatus(row.status());
+    const bool per_column = this->dataset()->per_column();
+    const DataTypeVector& dtypes = this->dataset()->output_dtypes();
+    const std::vector<DataType>& column_types = this->dataset()->column_types();
+
+    VLOG(1) << "alocating tensors";
+    std::vector<Tensor> res;
+    res.reserve(dtypes.size());
+    for (const DataType dtype : dtypes) {
+      TensorShape shape;
+      if (batch_size > 0) {
+        shape.AddDim(batch_size);
+      }
+      if (!per_column) {
+        shape.AddDim(kNumCols);
+      }
+      res.emplace_back(ctx->allocator({}), dtype, shape);
+      // Cells missing from a row are left as zero instead of garbage.
+      if (DataTypeCanUseMemcpy(dtype)) {
+        std::memset(const_cast<char*>(res.back().tensor_data().data()), 0,
+                    res.back().tensor_data().size());
+      }
     }
-    for (const auto& cell : row.value().cells()) {
-      std::pair<const std::string&, const std::string&> key(
-          cell.family_name(), cell.column_qualifier());
-      const auto column_idx = column_to_idx_.find(key);
-      if (column_idx != column_to_idx_.end()) {
-        VLOG(1) << "getting column:" << column_idx->second;
-        TF_RETURN_IF_ERROR(
-            io::PutCellValueInTensor(res, column_idx->second, dtype, cell));
-      } else {
-        LOG(ERROR) << "column " << cell.family_name() << ":"
-                   << cell.column_qualifier()
-                   << " was unexpectedly read from bigtable";
+
+    int64 num_rows = 0;
+    for (; num_rows < max_rows && it_ != reader_->end(); ++num_rows) {
+      VLOG(1) << "getting row";
+      const auto& row = *it_;
+      if (!row.ok()) {
+        LOG(ERROR) << row.status().message();
+        return GoogleCloudStatusToTfStatus(row.status());
+      }
+      for (const auto& cell : row.value().cells()) {
+        std::pair<const std::string&, const std::string&> key(
+            cell.family_name(), cell.column_qualifier());
+        const auto column_idx = column_to_idx_.find(key);
+        if (column_idx == column_to_idx_.end()) {
+          // The projection is part of the read filter, so this only happens
+          // if a user supplied filter widens it again.
+          VLOG(1) << "skipping column " << cell.family_name() << ":"
+                  << cell.column_qualifier();
+          continue;
+        }
+        const std::size_t col = column_idx->second;
+        if (per_column) {
+          TF_RETURN_IF_ERROR(io::PutCellValueInTensor(res[col], num_rows,
+                                                      column_types[col], cell));
+        } else {
+          TF_RETURN_IF_ERROR(io::PutCellValueInTensor(
+              res[0], num_rows * kNumCols + col, column_types[col], cell));
+        }
       }
+      last_row_key_ = row.value().row_key();
+
+      VLOG(1) << "incrementing iterator";
+      it_ = std::next(it_);
     }
-    VLOG(1) << "returning value";
-    out_tensors->emplace_back(std::move(res));
 
-    VLOG(1) << "incrementing iterator";
-    it_ = std::next(it_);
+    VLOG(1) << "returning " << num_rows << " rows";
+    for (auto& tensor : res) {
+      if (batch_size > 0 && num_rows < batch_size) {
+        out_tensors->emplace_back(tensor.Slice(0, num_rows));
+      } else {
+        out_tensors->emplace_back(std::move(tensor));
+      }
+    }
 
     return Status::OK();
   }
 
  protected:
+  // Rows are returned in key order, so the last returned row key is enough to
+  // resume the scan right after it.
   Status SaveInternal(SerializationContext* ctx,
                       IteratorStateWriter* writer) override {
-    return errors::Unimplemented("SaveInternal");
+    mutex_lock l(mu_);
+    if (!last_row_key_.empty()) {
+      TF_RETURN_IF_ERROR(
+          writer->WriteScalar(this->full_name("last_row_key"), last_row_key_));
+    }
+    return Status::OK();
   }
 
   Status RestoreInternal(IteratorContext* ctx,
                          IteratorStateReader* reader) override {
-    return errors::Unimplemented(
-        "Iterator does not support 'RestoreInternal')");
+    mutex_lock l(mu_);
+    // The key "last_row_key" is written only if a row was returned before
+    // the iterator was saved.
+    if (!reader->Contains(this->full_name("last_row_key"))) {
+      return Status::OK();
+    }
+    tstring last_row_key;
+    TF_RETURN_IF_ERROR(
+        reader->ReadScalar(this->full_name("last_row_key"), &last_row_key));
+    last_row_key_ = last_row_key;
+    VLOG(1) << "RestoreInternal resuming after row:" << last_row_key_;
+    reader_->Cancel();
+    reader_ = CreateReader(this->dataset()->row_set().Intersect(
+        cbt::RowRange::Open(last_row_key_, "")));
+    it_ = reader_->begin();
+    return Status::OK();
   }
 
  private:
+  std::unique_ptr<cbt::RowReader> CreateReader(const cbt::RowSet& row_set) {
+    return absl::make_unique<cbt::RowReader>(
+        this->dataset()->CreateTable().ReadRows(
+            row_set, cbt::Filter::Chain(CreateColumnsFilter(columns_),
+                                        this->dataset()->filter(),
+                                        cbt::Filter::Latest(1))));
+  }
+
+  // Escapes a family name or column qualifier so that it can be used as a
+  // literal in the RE2 based Bigtable regex filters.
+  static std::string QuoteRegex(const std::string& literal) {
+    std::string result;
+    result.reserve(literal.size() * 2);
+    for (const char c : literal) {
+      if (c == '\0') {
+        result += "\\x00";
+        continue;
+      }
+      if (!absl::ascii_isalnum(c) && c != '_' &&
+          static_cast<unsigned char>(c) < 0x80) {
+        result += '\\';
+      }
+      result += c;
+    }
+    return result;
+  }
+
+  // Builds the server side projection, so cells of columns that were not
+  // requested are never sent. Columns of the same family share one filter
+  // matching the family and an alternation of its qualifiers, which keeps
+  // the number of interleaved filters at the number of families.
   cbt::Filter CreateColumnsFilter(
       const std::vector<std::pair<std::string, std::string>>& columns) {
     VLOG(1) << "CreateColumnsFilter";
-    std::vector<cbt::Filter> filters;
-
+    std::map<std::string, std::vector<std::string>> family_to_qualifiers;
     for (const auto& column : columns) {
-      cbt::Filter f = cbt::Filter::ColumnName(column.first, column.second);
-      filters.push_back(std::move(f));
+      family_to_qualifiers[column.first].push_back(column.second);
+    }
+
+    std::vector<cbt::Filter> filters;
+    for (const auto& family : family_to_qualifiers) {
+      if (family.second.size() == 1) {
+        filters.push_back(
+            cbt::Filter::ColumnName(family.first, family.second[0]));
+        continue;
+      }
+      std::vector<std::string> qualifiers;
+      qualifiers.reserve(family.second.size());
+      for (const auto& qualifier : family.second) {
+        qualifiers.push_back(QuoteRegex(qualifier));
+      }
+      filters.push_back(cbt::Filter::Chain(
+          cbt::Filter::FamilyRegex("^" + QuoteRegex(family.first) + "$"),
+          cbt::Filter::ColumnRegex(
+              absl::StrCat("^(?:", absl::StrJoin(qualifiers, "|"), ")$"))));
     }
 
     return filters.size() > 1 ? cbt::Filter::InterleaveFromRange(
@@ -270,8 +379,9 @@ class Iterator : public DatasetIterator<Dataset> {
 
   mutex mu_;
   const std::vector<std::pair<std::string, std::string>> columns_;
-  cbt::RowReader reader_ GUARDED_BY(mu_);
+  std::unique_ptr<cbt::RowReader> reader_ GUARDED_BY(mu_);
   cbt::v1::internal::RowReaderIterator it_ GUARDED_BY(mu_);
+  std::string last_row_key_ GUARDED_BY(mu_);
   // we're using a map with const refs to avoid copying strings when searching
   // for a value.
   const absl::flat_hash_map<std::pair<const std::string&, const std::string&>,
@@ -284,16 +394,34 @@ class Dataset : public DatasetBase {
   Dataset(OpKernelContext* ctx,
           const std::shared_ptr<cbt::DataClient>& data_client,
           cbt::RowSet row_set, cbt::Filter filter, std::string table_id,
-          std::vector<std::string> columns, DataType output_type)
+          std::vector<std::string> columns, DataType output_type,
+          std::vector<DataType> output_types, int64 batch_size)
       : DatasetBase(DatasetContext(ctx)),
         data_client_(data_client),
         row_set_(std::move(row_set)),
         filter_(std::move(filter)),
         output_type_(std::move(output_type)),
+        per_column_(!output_types.empty()),
+        batch_size_(batch_size),
         table_id_(table_id),
         columns_(columns) {
-    dtypes_.push_back({output_type_});
-    output_shapes_.push_back({});
+    // With per column output types every column is its own component of the
+    // element, otherwise all columns share one [ncols] tensor.
+    if (per_column_) {
+      column_types_ = std::move(output_types);
+      for (const DataType dtype : column_types_) {
+        dtypes_.push_back(dtype);
+        output_shapes_.push_back(batch_size_ > 0 ? PartialTensorShape({-1})
+                                                 : PartialTensorShape({}));
+      }
+    } else {
+      column_types_.assign(columns_.size(), output_type_);
+      dtypes_.push_back(output_type_);
+      const int64 num_columns = static_cast<int64>(columns_.size());
+      output_shapes_.push_back(batch_size_ > 0
+                                   ? PartialTensorShape({-1, num_columns})
+                                   : PartialTensorShape({num_columns}));
+    }
   }
 
   std::unique_ptr<IteratorBase> MakeIteratorInternal(
@@ -313,6 +441,12 @@ class Dataset : public DatasetBase {
 
   const DataType output_type() const { return output_type_; }
 
+  const std::vector<DataType>& column_types() const { return column_types_; }
+
+  bool per_column() const { return per_column_; }
+
+  int64 batch_size() const { return batch_size_; }
+
   std::string DebugString() const override {
     return "BigtableDatasetOp::Dataset";
   }
@@ -346,6 +480,9 @@ class Dataset : public DatasetBase {
   const cbt::RowSet row_set_;
   cbt::Filter filter_;
   DataType output_type_;
+  const bool per_column_;
+  const int64 batch_size_;
+  std::vector<DataType> column_types_;
   const std::string table_id_;
   const std::vector<std::string> columns_;
   DataTypeVector dtypes_;
@@ -358,6 +495,12 @@ class BigtableDatasetOp : public DatasetOpKernel {
     OP_REQUIRES_OK(ctx, ctx->GetAttr("table_id", &table_id_));
     OP_REQUIRES_OK(ctx, ctx->GetAttr("columns", &columns_));
     OP_REQUIRES_OK(ctx, ctx->GetAttr("output_type", &output_type_));
+    OP_REQUIRES_OK(ctx, ctx->GetAttr("output_types", &output_types_));
+    OP_REQUIRES_OK(ctx, ctx->GetAttr("batch_size", &batch_size_));
+    OP_REQUIRES(
+        ctx, output_types_.empty() || output_types_.size() == columns_.size(),
+        errors::InvalidArgument(
+            "output_types must be empty or have one type per column"));
   }
 
   void MakeDataset(OpKernelContext* ctx, DatasetBase** output) override {
@@ -377,15 +520,18 @@ class BigtableDatasetOp : public DatasetOpKernel {
                    GetResourceFromContext(ctx, "filter", &filter_resource));
     core::ScopedUnref filter_resource_unref_(filter_resource);
 
-    *output = new Dataset(
-        ctx, client_resource->data_client(), row_set_resource->row_set(),
-        filter_resource->filter(), table_id_, columns_, output_type_);
+    *output = new Dataset(ctx, client_resource->data_client(),
+                          row_set_resource->row_set(),
+                          filter_resource->filter(), table_id_, columns_,
+                          output_type_, output_types_, batch_size_);
   }
 
  private:
   std::string table_id_;
   std::vector<std::string> columns_;
   DataType output_type_;
+  std::vector<DataType> output_types_;
+  int64 batch_size_;
 };
 
 REGISTER_KERNEL_BUILDER(Name("BigtableDataset").Device(DEVICE_CPU),
@@ -426,6 +572,7 @@ class BigtableSplitRowSetEvenlyOp : public OpKernel {
     VLOG(1) << "BigtableSplitRowSetEvenlyOp ctor ";
     OP_REQUIRES_OK(ctx, ctx->GetAttr("table_id", &table_id_));
     OP_REQUIRES_OK(ctx, ctx->GetAttr("num_splits", &num_splits_));
+    OP_REQUIRES_OK(ctx, ctx->GetAttr("largest_first", &largest_first_));
   }
 
   void Compute(OpKernelContext* context) override {
@@ -460,29 +607,68 @@ class BigtableSplitRowSetEvenlyOp : public OpKernel {
     auto& sample_row_keys = maybe_sample_row_keys.value();
 
     std::vector<std::pair<std::string, std::string>> tablets;
+    // Estimated size of each tablet, from the byte offsets of the samples.
+    std::vector<int64_t> tablet_bytes;
 
     std::string start_key;
+    int64_t start_offset = 0;
     for (auto& sample_row_key : sample_row_keys) {
       auto& end_key = sample_row_key.row_key;
       tablets.emplace_back(start_key, end_key);
+      tablet_bytes.push_back(sample_row_key.offset_bytes - start_offset);
       start_key = std::move(end_key);
+      start_offset = sample_row_key.offset_bytes;
     }
     if (!start_key.empty() || tablets.size() == 0) {
       tablets.emplace_back(start_key, "");
+      // The size of the trailing tablet is not sampled, assume an average one.
+      tablet_bytes.push_back(tablet_bytes.empty()
+                                 ? 0
+                                 : start_offset / (int64_t)tablet_bytes.size());
     }
-    tablets.erase(
-        std::remove_if(
-            tablets.begin(), tablets.end(),
-            [row_set_resource](std::pair<std::string, std::string> const& p) {
-              return !RowSetIntersectsRange(row_set_resource->row_set(),
-                                            p.first, p.second);
-            }),
-        tablets.end());
+    size_t num_tablets = 0;
+    for (size_t i = 0; i < tablets.size(); i++) {
+      if (RowSetIntersectsRange(row_set_resource->row_set(), tablets[i].first,
+                                tablets[i].second)) {
+        if (num_tablets != i) {
+          tablets[num_tablets] = std::move(tablets[i]);
+          tablet_bytes[num_tablets] = tablet_bytes[i];
+        }
+        num_tablets++;
+      }
+    }
+    tablets.resize(num_tablets);
+    tablet_bytes.resize(num_tablets);
 
     VLOG(1) << "got array of tablets of size:" << tablets.size();
 
     size_t output_size = std::min<std::size_t>(tablets.size(), num_splits_);
 
+    // Each split covers a contiguous run of tablets.
+    std::vector<std::pair<size_t, size_t>> splits;
+    std::vector<int64_t> split_bytes;
+    for (size_t i = 0; i < output_size; i++) {
+      size_t start_idx = GetWorkerStartIndex(tablets.size(), output_size, i);
+      size_t next_worker_start_idx =
+          GetWorkerStartIndex(tablets.size(), output_size, i + 1);
+      splits.emplace_back(start_idx, next_worker_start_idx - 1);
+      split_bytes.push_back(std::accumulate(
+          tablet_bytes.begin() + start_idx,
+          tablet_bytes.begin() + next_worker_start_idx, int64_t{0}));
+    }
+
+    // When splits are consumed from a queue by fewer workers, handing out the
+    // largest ones first keeps a big split from starting last and becoming
+    // the tail of the scan.
+    std::vector<size_t> order(output_size);
+    std::iota(order.begin(), order.end(), 0);
+    if (largest_first_) {
+      std::stable_sort(order.begin(), order.end(),
+                       [&split_bytes](size_t a, size_t b) {
+                         return split_bytes[a] > split_bytes[b];
+                       });
+    }
+
     Tensor* output_tensor = NULL;
     OP_REQUIRES_OK(context,
                    context->allocate_output(0, {static_cast<long>(output_size)},
@@ -490,12 +676,9 @@ class BigtableSplitRowSetEvenlyOp : public OpKernel {
     auto output_v = output_tensor->tensor<ResourceHandle, 1>();
 
     for (size_t i = 0; i < output_size; i++) {
-      size_t start_idx = GetWorkerStartIndex(tablets.size(), output_size, i);
-      size_t next_worker_start_idx =
-          GetWorkerStartIndex(tablets.size(), output_size, i + 1);
-      size_t end_idx = next_worker_start_idx - 1;
-      start_key = tablets.at(start_idx).first;
-      std::string end_key = tablets.at(end_idx).second;
+      const auto& split = splits[order[i]];
+      start_key = tablets.at(split.first).first;
+      std::string end_key = tablets.at(split.second).second;
       io::BigtableRowSetResource* work_chunk_row_set =
           new io::BigtableRowSetResource(row_set_resource->Intersect(
               cbt::RowRange::RightOpen(start_key, end_key)));
@@ -518,6 +701,7 @@ class BigtableSplitRowSetEvenlyOp : public OpKernel {
   mutex mu_;
   std::string table_id_ GUARDED_BY(mu_);
   int num_splits_ GUARDED_BY(mu_);
+  bool largest_first_ GUARDED_BY(mu_);
 };
 
 REGISTER_KERNEL_BUILDER(Name("BigtableSplitRowSetEvenly").Device(DEVICE_CPU),
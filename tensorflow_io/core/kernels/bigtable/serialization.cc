@@ -141,11 +141,11 @@ Status PutCellValueInTensor(Tensor& tensor, size_t index, DataType cell_type,
                             google::cloud::bigtable::Cell const& cell) {
   switch (cell_type) {
     case DT_STRING: {
-      auto tensor_data = tensor.tensor<tstring, 1>();
+      auto tensor_data = tensor.flat<tstring>();
       tensor_data(index) = std::string(cell.value());
     } break;
     case DT_BOOL: {
-      auto tensor_data = tensor.tensor<bool, 1>();
+      auto tensor_data = tensor.flat<bool>();
       auto maybe_parsed_data = BytesToBool(cell);
       if (!maybe_parsed_data.ok()) {
         return maybe_parsed_data.status();
@@ -153,7 +153,7 @@ Status PutCellValueInTensor(Tensor& tensor, size_t index, DataType cell_type,
       tensor_data(index) = maybe_parsed_data.ValueOrDie();
     } break;
     case DT_INT32: {
-      auto tensor_data = tensor.tensor<int32_t, 1>();
+      auto tensor_data = tensor.flat<int32_t>();
       auto maybe_parsed_data = BytesToInt32(cell);
       if (!maybe_parsed_data.ok()) {
         return maybe_parsed_data.status();
@@ -161,7 +161,7 @@ Status PutCellValueInTensor(Tensor& tensor, size_t index, DataType cell_type,
       tensor_data(index) = maybe_parsed_data.ValueOrDie();
     } break;
     case DT_INT64: {
-      auto tensor_data = tensor.tensor<int64_t, 1>();
+      auto tensor_data = tensor.flat<int64_t>();
       auto maybe_parsed_data = BytesToInt64(cell);
       if (!maybe_parsed_data.ok()) {
         return maybe_parsed_data.status();
@@ -169,7 +169,7 @@ Status PutCellValueInTensor(Tensor& tensor, size_t index, DataType cell_type,
       tensor_data(index) = maybe_parsed_data.ValueOrDie();
     } break;
     case DT_FLOAT: {
-      auto tensor_data = tensor.tensor<float, 1>();
+      auto tensor_data = tensor.flat<float>();
       auto maybe_parsed_data = BytesToFloat(cell);
       if (!maybe_parsed_data.ok()) {
         return maybe_parsed_data.status();
@@ -177,7 +177,7 @@ Status PutCellValueInTensor(Tensor& tensor, size_t index, DataType cell_type,
       tensor_data(index) = maybe_parsed_data.ValueOrDie();
     } break;
     case DT_DOUBLE: {
-      auto tensor_data = tensor.tensor<double, 1>();
+      auto tensor_data = tensor.flat<double>();
       auto maybe_parsed_data = BytesToDouble(cell);
       if (!maybe_parsed_data.ok()) {
         return maybe_parsed_data.status();
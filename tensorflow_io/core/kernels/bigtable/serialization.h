@@ -36,6 +36,9 @@ namespace io {
 // hybrid approach. On Windows we assume that integer endianness matches float
 // endianness and implement the deserialization ourselves and everywhere else
 // we use XDR. For that reason we provide two implementations
+//
+// `index` is an index into the flattened tensor, so the same function fills
+// [ncols] rows, [batch, ncols] batches and per column tensors.
 Status PutCellValueInTensor(Tensor& tensor, size_t index, DataType cell_type,
                             google::cloud::bigtable::Cell const& cell);
 
@@ -34,12 +34,25 @@ class ElasticsearchReadableResource : public ResourceBase {
               const std::string& healthcheck_field,
               const std::string& request_url,
               const std::vector<string>& headers,
+              const std::vector<string>& request_bodies,
               std::function<Status(const TensorShape& columns_shape,
                                    Tensor** columns, Tensor** dtypes)>
                   allocate_func) {
     // Perform healthcheck before proceeding
     Healthcheck(healthcheck_url, healthcheck_field, headers);
 
+    // Each request body corresponds to a slice of the scroll, which keeps
+    // its own scroll_id so that slices can be consumed concurrently.
+    if (request_bodies.size() < 1) {
+      return errors::InvalidArgument("At least one request body is required");
+    }
+    slices_.clear();
+    for (size_t i = 0; i < request_bodies.size(); ++i) {
+      std::unique_ptr<Slice> slice(new Slice());
+      slice->request_body = request_bodies[i];
+      slices_.emplace_back(std::move(slice));
+    }
+
     // Make the request API call and set the metadata based on a sample of
     // data returned. The request_url will have the "scroll" param set with
     // a very small value (approx. 1ms) so that the response is immediate
@@ -47,7 +60,7 @@ class ElasticsearchReadableResource : public ResourceBase {
     base_dtypes_.clear();
     base_columns_.clear();
     rapidjson::Document response_json;
-    MakeAPICall(request_url, &response_json, headers);
+    MakeAPICall(request_url, request_bodies[0], &response_json, headers);
 
     // Validate the presence of the _scroll_id in the response.
     // The _scroll_id keeps might change in subsequent calls, thus not
@@ -121,67 +134,174 @@ class ElasticsearchReadableResource : public ResourceBase {
   }
 
   Status Next(
-      const std::string& request_url, const std::string& scroll_request_url,
+      const int64 index, const std::string& request_url,
+      const std::string& scroll_request_url,
       std::function<Status(const TensorShape& tensor_shape, Tensor** items)>
           data_allocate_func) {
+    TF_RETURN_IF_ERROR(CheckIndex(index));
+    Slice* slice = slices_[index].get();
+    mutex_lock l(slice->mu);
+
     rapidjson::Document response_json;
-    if (scroll_id == "") {
-      MakeAPICall(request_url, &response_json, headers_);
-    } else {
-      MakeAPICall(scroll_request_url, &response_json, headers_);
+    TF_RETURN_IF_ERROR(
+        NextPage(slice, request_url, scroll_request_url, &response_json));
+
+    const rapidjson::Value& hits = response_json["hits"]["hits"].GetArray();
+    TensorShape tensor_shape({static_cast<int64>(hits.MemberCount())});
+    Tensor* items;
+    TF_RETURN_IF_ERROR(data_allocate_func(tensor_shape, &items));
+
+    for (size_t item_idx = 0; item_idx < hits.MemberCount(); ++item_idx) {
+      const rapidjson::Value& value = hits[item_idx]["_source"];
+      rapidjson::StringBuffer item_buffer;
+      item_buffer.Clear();
+      rapidjson::Writer<rapidjson::StringBuffer> item_writer(item_buffer);
+      value.Accept(item_writer);
+      items->flat<tstring>()(item_idx) = item_buffer.GetString();
     }
 
-    if (response_json.HasMember("_scroll_id")) {
-      scroll_id = response_json["_scroll_id"].GetString();
-    } else {
-      scroll_id = "";
+    return Status::OK();
+  }
+
+  // Writes the fields of the hits directly into one tensor per column, so
+  // that each document is only parsed once.
+  Status NextColumns(
+      const int64 index, const std::string& request_url,
+      const std::string& scroll_request_url, const std::vector<string>& columns,
+      const DataTypeVector& dtypes,
+      std::function<Status(int64 column, const TensorShape& tensor_shape,
+                           Tensor** values)>
+          data_allocate_func) {
+    TF_RETURN_IF_ERROR(CheckIndex(index));
+    Slice* slice = slices_[index].get();
+    mutex_lock l(slice->mu);
+
+    rapidjson::Document response_json;
+    TF_RETURN_IF_ERROR(
+        NextPage(slice, request_url, scroll_request_url, &response_json));
+
+    const rapidjson::Value& hits = response_json["hits"]["hits"].GetArray();
+    TensorShape tensor_shape({static_cast<int64>(hits.MemberCount())});
+    std::vector<Tensor*> values(columns.size());
+    for (size_t column = 0; column < columns.size(); ++column) {
+      TF_RETURN_IF_ERROR(
+          data_allocate_func(column, tensor_shape, &values[column]));
     }
 
-    if (response_json.HasMember("hits")) {
-      const rapidjson::Value& hits = response_json["hits"]["hits"].GetArray();
-      // LOG(INFO) << "Response has hits= " << hits.MemberCount();
-      if (hits.MemberCount() > 0) {
-        TensorShape tensor_shape({static_cast<int64>(hits.MemberCount())});
-        Tensor* items;
-        TF_RETURN_IF_ERROR(data_allocate_func(tensor_shape, &items));
-
-        for (size_t item_idx = 0; item_idx < hits.MemberCount(); ++item_idx) {
-          const rapidjson::Value& value = hits[item_idx]["_source"];
-          rapidjson::StringBuffer item_buffer;
-          item_buffer.Clear();
-          rapidjson::Writer<rapidjson::StringBuffer> item_writer(item_buffer);
-          value.Accept(item_writer);
-          items->flat<tstring>()(item_idx) = item_buffer.GetString();
+    for (size_t item_idx = 0; item_idx < hits.MemberCount(); ++item_idx) {
+      const rapidjson::Value& source = hits[item_idx]["_source"];
+      for (size_t column = 0; column < columns.size(); ++column) {
+        rapidjson::Value::ConstMemberIterator itr =
+            source.FindMember(columns[column].c_str());
+        if (itr == source.MemberEnd()) {
+          return errors::InvalidArgument("field: ", columns[column],
+                                         " not found in document");
+        }
+        const rapidjson::Value& value = itr->value;
+        Tensor* tensor = values[column];
+        bool valid = false;
+        switch (dtypes[column]) {
+          case DT_INT32:
+            if ((valid = value.IsInt())) {
+              tensor->flat<int32>()(item_idx) = value.GetInt();
+            }
+            break;
+          case DT_INT64:
+            if ((valid = value.IsInt64())) {
+              tensor->flat<int64>()(item_idx) = value.GetInt64();
+            }
+            break;
+          case DT_DOUBLE:
+            if ((valid = value.IsNumber())) {
+              tensor->flat<double>()(item_idx) = value.GetDouble();
+            }
+            break;
+          case DT_STRING:
+            if ((valid = value.IsString())) {
+              tensor->flat<tstring>()(item_idx) =
+                  tstring(value.GetString(), value.GetStringLength());
+            }
+            break;
+          case DT_BOOL:
+            if ((valid = value.IsBool())) {
+              tensor->flat<bool>()(item_idx) = value.GetBool();
+            }
+            break;
+          default:
+            return errors::InvalidArgument(
+                "field: ", columns[column],
+                " has unsupported data type: ", DataTypeString(dtypes[column]));
+        }
+        if (!valid) {
+          return errors::InvalidArgument(
+              "field: ", columns[column], " can not be converted to ",
+              DataTypeString(dtypes[column]), ", got: ", value.GetType());
         }
-
-      } else {
-        scroll_id = "";
-        TensorShape tensor_shape({static_cast<int64>(hits.MemberCount())});
-        Tensor* items;
-        TF_RETURN_IF_ERROR(data_allocate_func(tensor_shape, &items));
       }
+    }
+
+    return Status::OK();
+  }
+
+  string DebugString() const override { return "ElasticsearchBaseResource"; }
+
+ protected:
+  struct Slice {
+    mutex mu;
+    std::string request_body;
+    std::string scroll_id = "";
+  };
+
+  Status CheckIndex(const int64 index) const {
+    if (index < 0 || index >= slices_.size()) {
+      return errors::InvalidArgument(
+          "Slice index ", index, " is out of range [0, ", slices_.size(), ")");
+    }
+    return Status::OK();
+  }
+
+  // Fetches the next page of hits of the slice, starting a new scroll
+  // when the previous one has been exhausted.
+  Status NextPage(Slice* slice, const std::string& request_url,
+                  const std::string& scroll_request_url,
+                  rapidjson::Document* response_json) {
+    if (slice->scroll_id == "") {
+      TF_RETURN_IF_ERROR(MakeAPICall(request_url, slice->request_body,
+                                     response_json, headers_));
     } else {
+      std::string scroll_url =
+          scroll_request_url + "?scroll=1m&scroll_id=" + slice->scroll_id;
+      TF_RETURN_IF_ERROR(MakeAPICall(scroll_url, "", response_json, headers_));
+    }
+
+    if (response_json->HasMember("_scroll_id")) {
+      slice->scroll_id = (*response_json)["_scroll_id"].GetString();
+    } else {
+      slice->scroll_id = "";
+    }
+
+    if (!response_json->HasMember("hits")) {
       rapidjson::StringBuffer error_buffer;
       error_buffer.Clear();
       rapidjson::Writer<rapidjson::StringBuffer> error_writer(error_buffer);
-      response_json.Accept(error_writer);
+      response_json->Accept(error_writer);
       std::string error_response = error_buffer.GetString();
       return errors::FailedPrecondition("Corrupted response from the server " +
                                         error_response);
     }
 
+    if ((*response_json)["hits"]["hits"].GetArray().Size() == 0) {
+      slice->scroll_id = "";
+    }
     return Status::OK();
   }
 
-  string DebugString() const override { return "ElasticsearchBaseResource"; }
-
- protected:
   Status Healthcheck(const std::string& healthcheck_url,
                      const std::string& healthcheck_field,
                      const std::vector<string>& headers) {
     // Make the healthcheck API call and get the response json
     rapidjson::Document response_json;
-    MakeAPICall(healthcheck_url, &response_json, headers);
+    MakeAPICall(healthcheck_url, "", &response_json, headers);
 
     if (response_json.HasMember(healthcheck_field.c_str())) {
       // LOG(INFO) << "cluster health: "
@@ -192,18 +312,13 @@ class ElasticsearchReadableResource : public ResourceBase {
     return Status::OK();
   }
 
-  Status MakeAPICall(const std::string& url, rapidjson::Document* response_json,
+  Status MakeAPICall(const std::string& url, const std::string& body,
+                     rapidjson::Document* response_json,
                      const std::vector<string>& headers) {
-    HttpRequest* request = http_request_factory_.Create();
+    std::unique_ptr<HttpRequest> request(http_request_factory_.Create());
 
-    if (scroll_id != "") {
-      std::string scroll_url = url + "?scroll=1ms&scroll_id=" + scroll_id;
-      // LOG(INFO) << "Setting the url" << scroll_url;
-      request->SetUri(scroll_url);
-    } else {
-      // LOG(INFO) << "Setting the url" << url;
-      request->SetUri(url);
-    }
+    // LOG(INFO) << "Setting the url" << url;
+    request->SetUri(url);
 
     // LOG(INFO) << "Setting the headers";
     for (size_t i = 0; i < headers.size(); ++i) {
@@ -216,6 +331,12 @@ class ElasticsearchReadableResource : public ResourceBase {
       request->AddHeader(parts[0], parts[1]);
     }
 
+    // The search options (slice, size, _source) are only available through
+    // the request body, which turns the request into a POST.
+    if (!body.empty()) {
+      request->SetPostFromBuffer(body.data(), body.size());
+    }
+
     // LOG(INFO) << "Setting the response buffer";
     std::vector<char> response;
     request->SetResultBuffer(&response);
@@ -225,14 +346,8 @@ class ElasticsearchReadableResource : public ResourceBase {
 
     // LOG(INFO) << "Response code" << request->GetResponseCode();
 
-    // LOG(INFO) << "Getting the length of content";
-    string length_string = request->GetResponseHeader("content-length");
-    // LOG(INFO) << "response length: " << length_string;
-
-    std::string response_str(response.begin(), response.end());
-    // LOG(INFO) << "response " << response_str;
-
-    if (response_json->Parse(response_str.c_str()).HasParseError()) {
+    if (response_json->Parse(response.data(), response.size())
+            .HasParseError()) {
       LOG(ERROR) << "Error while parsing json at offset: "
                  << response_json->GetErrorOffset() << " : "
                  << GetParseError_En(response_json->GetParseError());
@@ -258,7 +373,7 @@ class ElasticsearchReadableResource : public ResourceBase {
 
   std::vector<DataType> base_dtypes_;
   std::vector<string> base_columns_;
-  std::string scroll_id = "";
+  std::vector<std::unique_ptr<Slice>> slices_;
   std::vector<string> headers_;
 };
 
@@ -296,17 +411,26 @@ class ElasticsearchReadableInitOp
       headers.push_back(headers_tensor->flat<tstring>()(i));
     }
 
+    const Tensor* request_bodies_tensor;
+    OP_REQUIRES_OK(context,
+                   context->input("request_bodies", &request_bodies_tensor));
+    std::vector<string> request_bodies;
+    for (int64 i = 0; i < request_bodies_tensor->NumElements(); i++) {
+      request_bodies.push_back(request_bodies_tensor->flat<tstring>()(i));
+    }
+
     OP_REQUIRES_OK(
-        context, resource_->Init(
-                     healthcheck_url, healthcheck_field, request_url, headers,
-                     [&](const TensorShape& columns_shape, Tensor** columns,
-                         Tensor** dtypes) -> Status {
-                       TF_RETURN_IF_ERROR(
-                           context->allocate_output(1, columns_shape, columns));
-                       TF_RETURN_IF_ERROR(
-                           context->allocate_output(2, columns_shape, dtypes));
-                       return Status::OK();
-                     }));
+        context,
+        resource_->Init(healthcheck_url, healthcheck_field, request_url,
+                        headers, request_bodies,
+                        [&](const TensorShape& columns_shape, Tensor** columns,
+                            Tensor** dtypes) -> Status {
+                          TF_RETURN_IF_ERROR(context->allocate_output(
+                              1, columns_shape, columns));
+                          TF_RETURN_IF_ERROR(context->allocate_output(
+                              2, columns_shape, dtypes));
+                          return Status::OK();
+                        }));
   }
 
   Status CreateResource(ElasticsearchReadableResource** resource)
@@ -333,6 +457,10 @@ class ElasticsearchReadableNextOp : public OpKernel {
                    GetResourceFromContext(context, "resource", &resource));
     core::ScopedUnref unref(resource);
 
+    const Tensor* index_tensor;
+    OP_REQUIRES_OK(context, context->input("index", &index_tensor));
+    const int64 index = index_tensor->scalar<int64>()();
+
     const Tensor* request_url_tensor;
     OP_REQUIRES_OK(context, context->input("request_url", &request_url_tensor));
     const string& request_url = request_url_tensor->scalar<tstring>()();
@@ -344,7 +472,7 @@ class ElasticsearchReadableNextOp : public OpKernel {
         scroll_request_url_tensor->scalar<tstring>()();
 
     OP_REQUIRES_OK(context,
-                   resource->Next(request_url, scroll_request_url,
+                   resource->Next(index, request_url, scroll_request_url,
                                   [&](const TensorShape& tensor_shape,
                                       Tensor** items) -> Status {
                                     TF_RETURN_IF_ERROR(context->allocate_output(
@@ -358,10 +486,70 @@ class ElasticsearchReadableNextOp : public OpKernel {
   Env* env_ TF_GUARDED_BY(mu_);
 };
 
+class ElasticsearchReadableNextColumnsOp : public OpKernel {
+ public:
+  explicit ElasticsearchReadableNextColumnsOp(OpKernelConstruction* context)
+      : OpKernel(context) {
+    env_ = context->env();
+    OP_REQUIRES_OK(context, context->GetAttr("dtypes", &dtypes_));
+  }
+
+  void Compute(OpKernelContext* context) override {
+    ElasticsearchReadableResource* resource;
+    OP_REQUIRES_OK(context,
+                   GetResourceFromContext(context, "resource", &resource));
+    core::ScopedUnref unref(resource);
+
+    const Tensor* index_tensor;
+    OP_REQUIRES_OK(context, context->input("index", &index_tensor));
+    const int64 index = index_tensor->scalar<int64>()();
+
+    const Tensor* request_url_tensor;
+    OP_REQUIRES_OK(context, context->input("request_url", &request_url_tensor));
+    const string& request_url = request_url_tensor->scalar<tstring>()();
+
+    const Tensor* scroll_request_url_tensor;
+    OP_REQUIRES_OK(context, context->input("scroll_request_url",
+                                           &scroll_request_url_tensor));
+    const string& scroll_request_url =
+        scroll_request_url_tensor->scalar<tstring>()();
+
+    const Tensor* columns_tensor;
+    OP_REQUIRES_OK(context, context->input("columns", &columns_tensor));
+    OP_REQUIRES(context, columns_tensor->NumElements() == dtypes_.size(),
+                errors::InvalidArgument("Number of columns (",
+                                        columns_tensor->NumElements(),
+                                        ") does not match number of dtypes (",
+                                        dtypes_.size(), ")"));
+    std::vector<string> columns;
+    for (int64 i = 0; i < columns_tensor->NumElements(); i++) {
+      columns.push_back(columns_tensor->flat<tstring>()(i));
+    }
+
+    OP_REQUIRES_OK(context,
+                   resource->NextColumns(
+                       index, request_url, scroll_request_url, columns, dtypes_,
+                       [&](int64 column, const TensorShape& tensor_shape,
+                           Tensor** values) -> Status {
+                         TF_RETURN_IF_ERROR(context->allocate_output(
+                             column, tensor_shape, values));
+                         return Status::OK();
+                       }));
+  }
+
+ private:
+  mutable mutex mu_;
+  Env* env_ TF_GUARDED_BY(mu_);
+  DataTypeVector dtypes_;
+};
+
 REGISTER_KERNEL_BUILDER(Name("IO>ElasticsearchReadableInit").Device(DEVICE_CPU),
                         ElasticsearchReadableInitOp);
 REGISTER_KERNEL_BUILDER(Name("IO>ElasticsearchReadableNext").Device(DEVICE_CPU),
                         ElasticsearchReadableNextOp);
+REGISTER_KERNEL_BUILDER(
+    Name("IO>ElasticsearchReadableNextColumns").Device(DEVICE_CPU),
+    ElasticsearchReadableNextColumnsOp);
 
 }  // namespace
 }  // namespace io
@@ -13,7 +13,10 @@ See the License for the specific language governing permissions and
 limitations under the License.
 ==============================================================================*/
 
+#include <algorithm>
+#include <cmath>
 #include <deque>
+#include <numeric>
 
 #include "tensorflow/core/framework/op_kernel.h"
 #include "tensorflow_io/core/kernels/io_interface.h"
@@ -598,10 +601,11 @@ class FFmpegVideoStream : public FFmpegStream {
         }) {}
   virtual ~FFmpegVideoStream() {}
 
-  Status OpenVideo(int64 index) {
+  Status OpenVideo(int64 index, int64 thread_count = FF_THREAD_SLICE,
+                   int64 thread_type = 1) {
     TF_RETURN_IF_ERROR(Open(AVMEDIA_TYPE_VIDEO, index));
     // FF_THREAD_SLICE=2, see libavcodec/avcodec.h
-    TF_RETURN_IF_ERROR(OpenCodec(FF_THREAD_SLICE, 1));
+    TF_RETURN_IF_ERROR(OpenCodec(thread_count, thread_type));
 
     dtype_ = DT_UINT8;
     height_ = codec_context_->height;
@@ -884,6 +888,348 @@ class FFmpegVideoReadableNextOp : public OpKernel {
   Env* env_ TF_GUARDED_BY(mu_);
 };
 
+// Counts the frames decoded by the pools of a dataset, one pool per iteration
+class FFmpegVideoPoolStatsResource : public ResourceBase {
+ public:
+  FFmpegVideoPoolStatsResource(Env* env)
+      : env_(env), start_micros_(env->NowMicros()) {}
+
+  // Restarts the count when a pool starts decoding
+  void Reset() {
+    mutex_lock l(mu_);
+    start_micros_ = env_->NowMicros();
+    decoded_ = 0;
+  }
+
+  void Add(const int64 frames) {
+    mutex_lock l(mu_);
+    decoded_ += frames;
+  }
+
+  Status Stats(int64* frames, double* frames_per_second) {
+    mutex_lock l(mu_);
+    const double seconds =
+        static_cast<double>(env_->NowMicros() - start_micros_) / 1000000.0;
+    *frames = decoded_;
+    *frames_per_second = (seconds > 0.0) ? (decoded_ / seconds) : 0.0;
+    return Status::OK();
+  }
+
+  string DebugString() const override { return "FFmpegVideoPoolStatsResource"; }
+
+ private:
+  mutable mutex mu_;
+  Env* env_;
+  uint64 start_micros_ TF_GUARDED_BY(mu_);
+  int64 decoded_ TF_GUARDED_BY(mu_) = 0;
+};
+
+// Decodes a list of video files with a pool of decoders. Each decoder runs
+// on its own thread with its own codec context, and the decoded frames are
+// buffered up to a bound shared by the pool.
+class FFmpegVideoPoolResource : public ResourceBase {
+ public:
+  FFmpegVideoPoolResource(Env* env) : env_(env) {}
+  virtual ~FFmpegVideoPoolResource() {
+    mutex_lock l(init_mu_);
+    Stop();
+    if (stats_ != nullptr) {
+      stats_->Unref();
+    }
+  }
+
+  // Starts decoding the files, after the decoders of a previous
+  // initialization are stopped and their frames are dropped. The decoded
+  // frames are also counted in stats.
+  Status Init(const std::vector<string>& filenames, const int64 index,
+              const int64 parallelism, const int64 thread_count,
+              const int64 thread_type, const int64 buffer_size,
+              FFmpegVideoPoolStatsResource* stats) {
+    mutex_lock init_lock(init_mu_);
+    Stop();
+
+    mutex_lock l(mu_);
+    if (parallelism <= 0) {
+      return errors::InvalidArgument("parallelism must be positive, got: ",
+                                     parallelism);
+    }
+    if (buffer_size <= 0) {
+      return errors::InvalidArgument("buffer_size must be positive, got: ",
+                                     buffer_size);
+    }
+    filenames_ = filenames;
+    index_ = index;
+    thread_count_ = thread_count;
+    thread_type_ = thread_type;
+    buffer_size_ = buffer_size;
+    if (stats_ != nullptr) {
+      stats_->Unref();
+    }
+    stats->Ref();
+    stats_ = stats;
+    stats_->Reset();
+    next_ = 0;
+    cancelled_ = false;
+    status_ = Status::OK();
+    chunks_.clear();
+    buffered_ = 0;
+
+    FFmpegInit();
+
+    active_ = std::min(parallelism, static_cast<int64>(filenames_.size()));
+    for (int64 i = 0; i < active_; i++) {
+      threads_.emplace_back(
+          env_->StartThread(ThreadOptions(), strings::StrCat("ffmpeg_pool_", i),
+                            [this]() { DecodeFiles(); }));
+    }
+    return Status::OK();
+  }
+
+  // Returns the frames decoded from one file, waiting for a decoder if none
+  // are buffered. No frames are returned once all files are decoded.
+  Status Read(int64* file, Tensor* value) {
+    mutex_lock l(mu_);
+    while (status_.ok() && chunks_.empty() && active_ > 0) {
+      cond_var_.wait(l);
+    }
+    TF_RETURN_IF_ERROR(status_);
+
+    if (chunks_.empty()) {
+      *file = -1;
+      *value = Tensor(DT_UINT8, TensorShape({0, 0, 0, 3}));
+      return Status::OK();
+    }
+    *file = chunks_.front().file;
+    *value = chunks_.front().value;
+    buffered_ -= value->dim_size(0);
+    chunks_.pop_front();
+    cond_var_.notify_all();
+    return Status::OK();
+  }
+
+  string DebugString() const override { return "FFmpegVideoPoolResource"; }
+
+ private:
+  struct Chunk {
+    int64 file;
+    Tensor value;
+  };
+
+  void Stop() TF_EXCLUSIVE_LOCKS_REQUIRED(init_mu_) {
+    {
+      mutex_lock l(mu_);
+      cancelled_ = true;
+      cond_var_.notify_all();
+    }
+    // Decoders take mu_, so they are joined without holding it
+    threads_.clear();
+  }
+
+  void DecodeFiles() {
+    Status status;
+    while (status.ok()) {
+      size_t file;
+      {
+        mutex_lock l(mu_);
+        if (cancelled_ || next_ >= filenames_.size()) {
+          break;
+        }
+        file = next_++;
+      }
+      status = DecodeFile(file);
+    }
+    mutex_lock l(mu_);
+    status_.Update(status);
+    active_--;
+    cond_var_.notify_all();
+  }
+
+  Status DecodeFile(const size_t file) {
+    // filenames_ and the decoder settings are not modified once threads start
+    const string& filename = filenames_[file];
+    uint64 file_size;
+    TF_RETURN_IF_ERROR(env_->GetFileSize(filename, &file_size));
+    SizedRandomAccessFile sized_file(env_, filename, nullptr, 0);
+    FFmpegVideoStream stream(filename, &sized_file, file_size);
+    TF_RETURN_IF_ERROR(stream.OpenVideo(
+        index_, (thread_count_ >= 0) ? thread_count_ : FF_THREAD_SLICE,
+        (thread_type_ >= 0) ? thread_type_ : 1));
+    while (true) {
+      int64 frames = 0;
+      Status status = stream.Peek(&frames);
+      if (errors::IsOutOfRange(status)) {
+        return Status::OK();
+      }
+      TF_RETURN_IF_ERROR(status);
+
+      Chunk chunk{
+          static_cast<int64>(file),
+          Tensor(DT_UINT8, TensorShape({frames, stream.height(), stream.width(),
+                                        stream.channels()}))};
+      TF_RETURN_IF_ERROR(stream.Read(&chunk.value));
+
+      mutex_lock l(mu_);
+      while (!cancelled_ && buffered_ > 0 &&
+             buffered_ + frames > buffer_size_) {
+        cond_var_.wait(l);
+      }
+      if (cancelled_) {
+        return Status::OK();
+      }
+      chunks_.push_back(std::move(chunk));
+      buffered_ += frames;
+      stats_->Add(frames);
+      cond_var_.notify_all();
+    }
+  }
+
+  // Serializes Init, which stops and restarts the decoder threads
+  mutex init_mu_;
+  mutable mutex mu_;
+  condition_variable cond_var_;
+  Env* env_;
+  std::vector<string> filenames_;
+  int64 index_ = 0;
+  int64 thread_count_ = -1;
+  int64 thread_type_ = -1;
+  int64 buffer_size_ = 0;
+  FFmpegVideoPoolStatsResource* stats_ = nullptr;
+
+  size_t next_ TF_GUARDED_BY(mu_) = 0;
+  int64 active_ TF_GUARDED_BY(mu_) = 0;
+  bool cancelled_ TF_GUARDED_BY(mu_) = false;
+  Status status_ TF_GUARDED_BY(mu_);
+  std::deque<Chunk> chunks_ TF_GUARDED_BY(mu_);
+  int64 buffered_ TF_GUARDED_BY(mu_) = 0;
+  std::vector<std::unique_ptr<Thread>> threads_ TF_GUARDED_BY(init_mu_);
+};
+
+class FFmpegVideoPoolStatsInitOp
+    : public ResourceOpKernel<FFmpegVideoPoolStatsResource> {
+ public:
+  explicit FFmpegVideoPoolStatsInitOp(OpKernelConstruction* context)
+      : ResourceOpKernel<FFmpegVideoPoolStatsResource>(context) {
+    env_ = context->env();
+  }
+
+ private:
+  Status CreateResource(FFmpegVideoPoolStatsResource** resource)
+      TF_EXCLUSIVE_LOCKS_REQUIRED(mu_) override {
+    *resource = new FFmpegVideoPoolStatsResource(env_);
+    return Status::OK();
+  }
+
+ private:
+  mutable mutex mu_;
+  Env* env_ TF_GUARDED_BY(mu_);
+};
+
+class FFmpegVideoPoolInitOp : public ResourceOpKernel<FFmpegVideoPoolResource> {
+ public:
+  explicit FFmpegVideoPoolInitOp(OpKernelConstruction* context)
+      : ResourceOpKernel<FFmpegVideoPoolResource>(context) {
+    env_ = context->env();
+  }
+
+ private:
+  void Compute(OpKernelContext* context) override {
+    ResourceOpKernel<FFmpegVideoPoolResource>::Compute(context);
+
+    const Tensor* input_tensor;
+    OP_REQUIRES_OK(context, context->input("input", &input_tensor));
+    std::vector<string> filenames;
+    for (int64 i = 0; i < input_tensor->NumElements(); i++) {
+      filenames.push_back(input_tensor->flat<tstring>()(i));
+    }
+
+    const Tensor* index_tensor;
+    OP_REQUIRES_OK(context, context->input("index", &index_tensor));
+
+    const Tensor* parallelism_tensor;
+    OP_REQUIRES_OK(context, context->input("parallelism", &parallelism_tensor));
+
+    const Tensor* thread_count_tensor;
+    OP_REQUIRES_OK(context,
+                   context->input("thread_count", &thread_count_tensor));
+
+    const Tensor* thread_type_tensor;
+    OP_REQUIRES_OK(context, context->input("thread_type", &thread_type_tensor));
+
+    const Tensor* buffer_size_tensor;
+    OP_REQUIRES_OK(context, context->input("buffer_size", &buffer_size_tensor));
+
+    FFmpegVideoPoolStatsResource* stats;
+    OP_REQUIRES_OK(context, GetResourceFromContext(context, "stats", &stats));
+    core::ScopedUnref unref(stats);
+
+    OP_REQUIRES_OK(
+        context, resource_->Init(filenames, index_tensor->scalar<int64>()(),
+                                 parallelism_tensor->scalar<int64>()(),
+                                 thread_count_tensor->scalar<int64>()(),
+                                 thread_type_tensor->scalar<int64>()(),
+                                 buffer_size_tensor->scalar<int64>()(), stats));
+  }
+  Status CreateResource(FFmpegVideoPoolResource** resource)
+      TF_EXCLUSIVE_LOCKS_REQUIRED(mu_) override {
+    *resource = new FFmpegVideoPoolResource(env_);
+    return Status::OK();
+  }
+
+ private:
+  mutable mutex mu_;
+  Env* env_ TF_GUARDED_BY(mu_);
+};
+
+class FFmpegVideoPoolNextOp : public OpKernel {
+ public:
+  explicit FFmpegVideoPoolNextOp(OpKernelConstruction* context)
+      : OpKernel(context) {}
+
+  void Compute(OpKernelContext* context) override {
+    FFmpegVideoPoolResource* resource;
+    OP_REQUIRES_OK(context,
+                   GetResourceFromContext(context, "input", &resource));
+    core::ScopedUnref unref(resource);
+
+    int64 file;
+    Tensor value;
+    OP_REQUIRES_OK(context, resource->Read(&file, &value));
+
+    Tensor* file_tensor;
+    OP_REQUIRES_OK(context,
+                   context->allocate_output(0, TensorShape({}), &file_tensor));
+    file_tensor->scalar<int64>()() = file;
+    context->set_output(1, value);
+  }
+};
+
+class FFmpegVideoPoolStatsOp : public OpKernel {
+ public:
+  explicit FFmpegVideoPoolStatsOp(OpKernelConstruction* context)
+      : OpKernel(context) {}
+
+  void Compute(OpKernelContext* context) override {
+    FFmpegVideoPoolStatsResource* resource;
+    OP_REQUIRES_OK(context,
+                   GetResourceFromContext(context, "input", &resource));
+    core::ScopedUnref unref(resource);
+
+    int64 frames;
+    double frames_per_second;
+    OP_REQUIRES_OK(context, resource->Stats(&frames, &frames_per_second));
+
+    Tensor* frames_tensor;
+    OP_REQUIRES_OK(
+        context, context->allocate_output(0, TensorShape({}), &frames_tensor));
+    frames_tensor->scalar<int64>()() = frames;
+
+    Tensor* frames_per_second_tensor;
+    OP_REQUIRES_OK(context, context->allocate_output(
+                                1, TensorShape({}), &frames_per_second_tensor));
+    frames_per_second_tensor->scalar<double>()() = frames_per_second;
+  }
+};
+
 REGISTER_KERNEL_BUILDER(Name("IO>FfmpegAudioReadableInit").Device(DEVICE_CPU),
                         FFmpegAudioReadableInitOp);
 REGISTER_KERNEL_BUILDER(Name("IO>FfmpegAudioReadableNext").Device(DEVICE_CPU),
@@ -893,6 +1239,337 @@ REGISTER_KERNEL_BUILDER(Name("IO>FfmpegVideoReadableInit").Device(DEVICE_CPU),
                         FFmpegVideoReadableInitOp);
 REGISTER_KERNEL_BUILDER(Name("IO>FfmpegVideoReadableNext").Device(DEVICE_CPU),
                         FFmpegVideoReadableNextOp);
+REGISTER_KERNEL_BUILDER(Name("IO>FfmpegVideoPoolStatsInit").Device(DEVICE_CPU),
+                        FFmpegVideoPoolStatsInitOp);
+REGISTER_KERNEL_BUILDER(Name("IO>FfmpegVideoPoolInit").Device(DEVICE_CPU),
+                        FFmpegVideoPoolInitOp);
+REGISTER_KERNEL_BUILDER(Name("IO>FfmpegVideoPoolNext").Device(DEVICE_CPU),
+                        FFmpegVideoPoolNextOp);
+REGISTER_KERNEL_BUILDER(Name("IO>FfmpegVideoPoolStats").Device(DEVICE_CPU),
+                        FFmpegVideoPoolStatsOp);
+
+// Decodes selected frames of a video stream. The packets are indexed once
+// without decoding, which gives the number of frames, the timestamp of each
+// frame in display order and the keyframes. Each selected frame is then
+// reached by seeking to the keyframe before it, so only the GOPs of the
+// selected frames are decoded, and only the selected frames are converted
+// (and scaled) to RGB.
+class FFmpegVideoSampler : public FFmpegStream {
+ public:
+  FFmpegVideoSampler(const string& filename, SizedRandomAccessFile* file,
+                     uint64 file_size)
+      : FFmpegStream(filename, file, file_size),
+        height_(-1),
+        width_(-1),
+        channels_(3),
+        frame_rate_(0.0),
+        seekable_(true),
+        flushing_(false),
+        decoded_(-1),
+        last_timestamp_(AV_NOPTS_VALUE),
+        sws_context_(nullptr, [](SwsContext* p) {
+          if (p != nullptr) {
+            sws_freeContext(p);
+          }
+        }) {}
+  virtual ~FFmpegVideoSampler() {}
+
+  // height and width of 0 keep the size of the video
+  Status OpenSampler(int64 index, int64 height, int64 width) {
+    TF_RETURN_IF_ERROR(Open(AVMEDIA_TYPE_VIDEO, index));
+    // FF_THREAD_SLICE=2, see libavcodec/avcodec.h
+    TF_RETURN_IF_ERROR(OpenCodec(FF_THREAD_SLICE, 1));
+
+    height_ = (height > 0) ? height : codec_context_->height;
+    width_ = (width > 0) ? width : codec_context_->width;
+    // Same flags as FFmpegVideoStream unless the frames are scaled
+    const int flags =
+        (height_ == codec_context_->height && width_ == codec_context_->width)
+            ? 0
+            : SWS_BILINEAR;
+    SwsContext* sws_context = sws_getContext(
+        codec_context_->width, codec_context_->height, codec_context_->pix_fmt,
+        width_, height_, AV_PIX_FMT_RGB24, flags, NULL, NULL, NULL);
+    if (!sws_context) {
+      return errors::Internal("could not allocate sws context");
+    }
+    sws_context_.reset(sws_context);
+
+    AVStream* stream = format_context_->streams[stream_index_];
+    AVRational frame_rate = stream->avg_frame_rate;
+    if (frame_rate.num <= 0 || frame_rate.den <= 0) {
+      frame_rate = stream->r_frame_rate;
+    }
+    if (frame_rate.num > 0 && frame_rate.den > 0) {
+      frame_rate_ = av_q2d(frame_rate);
+    }
+
+    // Index the packets of the stream without decoding
+    av_init_packet(&packet_);
+    packet_.data = NULL;
+    packet_.size = 0;
+    packet_scope_.reset(&packet_);
+    while (av_read_frame(format_context_.get(), &packet_) >= 0) {
+      if (packet_.stream_index == stream_index_) {
+        int64 timestamp =
+            (packet_.pts != AV_NOPTS_VALUE) ? packet_.pts : packet_.dts;
+        if (timestamp == AV_NOPTS_VALUE) {
+          seekable_ = false;
+        }
+        timestamps_.push_back(timestamp);
+        if (packet_.flags & AV_PKT_FLAG_KEY) {
+          keyframes_.push_back(timestamp);
+        }
+      }
+      av_packet_unref(&packet_);
+    }
+    // Frames are decoded in display order
+    std::sort(timestamps_.begin(), timestamps_.end());
+    std::sort(keyframes_.begin(), keyframes_.end());
+    if (keyframes_.size() == 0) {
+      seekable_ = false;
+    }
+    return Rewind();
+  }
+
+  int64 frames() const { return timestamps_.size(); }
+  double frame_rate() const { return frame_rate_; }
+  int64 height() const { return height_; }
+  int64 width() const { return width_; }
+  int64 channels() const { return channels_; }
+
+  // Decodes the frames at indices (in display order) into value
+  Status Sample(const std::vector<int64>& indices, Tensor* value) {
+    const int64 datasize = height_ * width_ * channels_;
+    uint8* base = value->flat<uint8>().data();
+
+    // Visit the frames in order so that frames of the same GOP are decoded
+    // once, then place them at their requested position
+    std::vector<int64> order(indices.size());
+    std::iota(order.begin(), order.end(), 0);
+    std::stable_sort(order.begin(), order.end(),
+                     [&](int64 a, int64 b) { return indices[a] < indices[b]; });
+
+    std::unique_ptr<AVFrame, void (*)(AVFrame*)> frame(av_frame_alloc(),
+                                                       [](AVFrame* p) {
+                                                         if (p != nullptr) {
+                                                           av_frame_free(&p);
+                                                         }
+                                                       });
+    int64 previous = -1;
+    for (size_t i = 0; i < order.size(); i++) {
+      const int64 target = indices[order[i]];
+      uint8* output = base + order[i] * datasize;
+      if (i > 0 && target == indices[previous]) {
+        memcpy(output, base + previous * datasize, datasize);
+        continue;
+      }
+      previous = order[i];
+
+      if (seekable_) {
+        const int64 timestamp = timestamps_[target];
+        auto keyframe =
+            std::upper_bound(keyframes_.begin(), keyframes_.end(), timestamp);
+        if (keyframe != keyframes_.begin()) {
+          keyframe--;
+        }
+        // Seek unless the frame is ahead within the GOP being decoded
+        if (last_timestamp_ == AV_NOPTS_VALUE || last_timestamp_ >= timestamp ||
+            *keyframe > last_timestamp_) {
+          TF_RETURN_IF_ERROR(SeekTimestamp(*keyframe));
+        }
+        do {
+          TF_RETURN_IF_ERROR(DecodeFrame(frame.get()));
+        } while (last_timestamp_ < timestamp);
+      } else {
+        if (decoded_ >= target) {
+          TF_RETURN_IF_ERROR(Rewind());
+        }
+        while (decoded_ < target) {
+          TF_RETURN_IF_ERROR(DecodeFrame(frame.get()));
+        }
+      }
+
+      uint8_t* data[4];
+      int linesize[4];
+      av_image_fill_arrays(data, linesize, output, AV_PIX_FMT_RGB24, width_,
+                           height_, 1);
+      sws_scale(sws_context_.get(), frame->data, frame->linesize, 0,
+                codec_context_->height, data, linesize);
+    }
+    return Status::OK();
+  }
+
+ private:
+  Status Rewind() { return SeekTimestamp(seekable_ ? keyframes_.front() : 0); }
+
+  Status SeekTimestamp(int64 timestamp) {
+    int ret = av_seek_frame(format_context_.get(), stream_index_, timestamp,
+                            AVSEEK_FLAG_BACKWARD);
+    if (ret < 0) {
+      char error_message[AV_ERROR_MAX_STRING_SIZE];
+      av_strerror(ret, error_message, sizeof(error_message));
+      return errors::InvalidArgument("unable to seek to ", timestamp, ": ",
+                                     error_message);
+    }
+    avcodec_flush_buffers(codec_context_);
+    av_packet_unref(&packet_);
+    packet_.data = NULL;
+    packet_.size = 0;
+    flushing_ = false;
+    decoded_ = -1;
+    last_timestamp_ = AV_NOPTS_VALUE;
+    return Status::OK();
+  }
+
+  // Decodes the next frame in display order, without conversion
+  Status DecodeFrame(AVFrame* frame) {
+    int got_frame = 0;
+    while (!got_frame) {
+      if (!flushing_ && packet_.size <= 0) {
+        av_packet_unref(&packet_);
+        int ret;
+        do {
+          ret = av_read_frame(format_context_.get(), &packet_);
+          if (ret >= 0 && packet_.stream_index != stream_index_) {
+            av_packet_unref(&packet_);
+          }
+        } while (ret >= 0 && packet_.stream_index != stream_index_);
+        if (ret < 0) {
+          // Drain the frames cached in the decoder
+          flushing_ = true;
+          packet_.data = NULL;
+          packet_.size = 0;
+        }
+      }
+      int decoded =
+          avcodec_decode_video2(codec_context_, frame, &got_frame, &packet_);
+      if (decoded < 0) {
+        return errors::InvalidArgument("error decoding video frame (", decoded,
+                                       ")");
+      }
+      if (flushing_) {
+        if (!got_frame) {
+          return errors::OutOfRange("EOF reached");
+        }
+      } else {
+        decoded = FFMIN(decoded, packet_.size);
+        packet_.data += decoded;
+        packet_.size -= decoded;
+      }
+    }
+    decoded_++;
+    last_timestamp_ = (frame->best_effort_timestamp != AV_NOPTS_VALUE)
+                          ? frame->best_effort_timestamp
+                          : frame->pkt_dts;
+    return Status::OK();
+  }
+
+  int64 height_;
+  int64 width_;
+  int64 channels_;
+  double frame_rate_;
+  std::vector<int64> timestamps_;
+  std::vector<int64> keyframes_;
+  bool seekable_;
+  bool flushing_;
+  int64 decoded_;
+  int64 last_timestamp_;
+  std::unique_ptr<SwsContext, void (*)(SwsContext*)> sws_context_;
+};
+
+class FFmpegDecodeVideoSampleOp : public OpKernel {
+ public:
+  explicit FFmpegDecodeVideoSampleOp(OpKernelConstruction* context)
+      : OpKernel(context) {
+    env_ = context->env();
+  }
+
+  void Compute(OpKernelContext* context) override {
+    const Tensor* input_tensor;
+    OP_REQUIRES_OK(context, context->input("input", &input_tensor));
+
+    const Tensor* index_tensor;
+    OP_REQUIRES_OK(context, context->input("index", &index_tensor));
+
+    const Tensor* frame_indices_tensor;
+    OP_REQUIRES_OK(context,
+                   context->input("frame_indices", &frame_indices_tensor));
+
+    const Tensor* fps_tensor;
+    OP_REQUIRES_OK(context, context->input("fps", &fps_tensor));
+    const float fps = fps_tensor->scalar<float>()();
+
+    const Tensor* clip_duration_tensor;
+    OP_REQUIRES_OK(context,
+                   context->input("clip_duration", &clip_duration_tensor));
+    const float clip_duration = clip_duration_tensor->scalar<float>()();
+
+    const Tensor* size_tensor;
+    OP_REQUIRES_OK(context, context->input("size", &size_tensor));
+    OP_REQUIRES(context, (size_tensor->NumElements() == 2),
+                errors::InvalidArgument("size must be [height, width], got: ",
+                                        size_tensor->shape().DebugString()));
+
+    string input = input_tensor->scalar<tstring>()();
+    SizedRandomAccessFile file(env_, "memory", input.data(), input.size());
+
+    FFmpegInit();
+
+    FFmpegVideoSampler sampler("memory", &file, input.size());
+    OP_REQUIRES_OK(context, sampler.OpenSampler(index_tensor->scalar<int64>()(),
+                                                size_tensor->flat<int64>()(0),
+                                                size_tensor->flat<int64>()(1)));
+
+    const int64 frames = sampler.frames();
+    std::vector<int64> indices;
+    if (frame_indices_tensor->NumElements() > 0) {
+      for (int64 i = 0; i < frame_indices_tensor->NumElements(); i++) {
+        const int64 frame_index = frame_indices_tensor->flat<int64>()(i);
+        OP_REQUIRES(context, (frame_index >= 0 && frame_index < frames),
+                    errors::InvalidArgument("frame index ", frame_index,
+                                            " out of range [0, ", frames, ")"));
+        indices.push_back(frame_index);
+      }
+    } else {
+      // Frames within clip_duration seconds, at fps frames per second
+      const double frame_rate = sampler.frame_rate();
+      OP_REQUIRES(context,
+                  (frame_rate > 0.0 || (fps <= 0.0 && clip_duration <= 0.0)),
+                  errors::InvalidArgument(
+                      "unable to sample by time, unknown frame rate"));
+      int64 limit = frames;
+      if (clip_duration > 0.0) {
+        limit = std::min(
+            frames, static_cast<int64>(std::ceil(clip_duration * frame_rate)));
+      }
+      const double step = (fps > 0.0) ? (frame_rate / fps) : 1.0;
+      for (int64 k = 0;; k++) {
+        const int64 frame_index = static_cast<int64>(k * step);
+        if (frame_index >= limit) {
+          break;
+        }
+        indices.push_back(frame_index);
+      }
+    }
+
+    Tensor* video_tensor = nullptr;
+    OP_REQUIRES_OK(context, context->allocate_output(
+                                0,
+                                TensorShape({static_cast<int64>(indices.size()),
+                                             sampler.height(), sampler.width(),
+                                             sampler.channels()}),
+                                &video_tensor));
+    OP_REQUIRES_OK(context, sampler.Sample(indices, video_tensor));
+  }
+
+ private:
+  mutable mutex mu_;
+  Env* env_ TF_GUARDED_BY(mu_);
+};
+
+REGISTER_KERNEL_BUILDER(Name("IO>FfmpegDecodeVideoSample").Device(DEVICE_CPU),
+                        FFmpegDecodeVideoSampleOp);
 
 class FFmpegDecodeVideoOp : public OpKernel {
  public:
@@ -28,40 +28,88 @@ class GRPCReadableResource : public ResourceBase {
   GRPCReadableResource(Env* env) : env_(env) {}
   ~GRPCReadableResource() {}
 
-  Status Init(const string& input) {
+  Status Init(const string& input, const int64 channels) {
     mutex_lock l(mu_);
     endpoint_ = input;
-    stub_ = GRPCEndpoint::NewStub(
-        grpc::CreateChannel(endpoint_, grpc::InsecureChannelCredentials()));
+    if (channels <= 0) {
+      return errors::InvalidArgument("channels must be positive, got ",
+                                     channels);
+    }
+    // A local subchannel pool makes sure each channel owns its connection,
+    // so that concurrent reads are spread over several connections.
+    grpc::ChannelArguments args;
+    args.SetMaxReceiveMessageSize(-1);
+    args.SetInt(GRPC_ARG_USE_LOCAL_SUBCHANNEL_POOL, 1);
+    stubs_.clear();
+    for (int64 i = 0; i < channels; i++) {
+      stubs_.emplace_back(GRPCEndpoint::NewStub(grpc::CreateCustomChannel(
+          endpoint_, grpc::InsecureChannelCredentials(), args)));
+    }
     return Status::OK();
   }
-  Status Read(const int64 start, const TensorShape& shape,
+  Status Read(const int64 start, const TensorShape& shape, const int64 chunk,
+              const bool raw,
               std::function<Status(const TensorShape& shape, Tensor** value)>
                   allocate_func) {
-    mutex_lock l(mu_);
-
     Tensor* value;
     TF_RETURN_IF_ERROR(allocate_func(shape, &value));
     if (shape.dim_size(0) == 0) {
       return Status::OK();
     }
+    if (raw && !DataTypeCanUseMemcpy(value->dtype())) {
+      return errors::InvalidArgument("raw encoding is not supported for ",
+                                     DataTypeString(value->dtype()));
+    }
+
+    // Stubs are thread safe, the lock only protects picking the channel.
+    GRPCEndpoint::Stub* stub;
+    {
+      mutex_lock l(mu_);
+      stub = stubs_[next_stub_].get();
+      next_stub_ = (next_stub_ + 1) % stubs_.size();
+    }
 
     Request request;
     request.set_offset(start);
     request.set_length(shape.dim_size(0));
-    Response response;
+    request.set_chunk(chunk);
+    request.set_raw(raw);
     grpc::ClientContext context;
-    grpc::Status status = stub_->ReadRecord(&context, request, &response);
+    if (chunk <= 0) {
+      Response response;
+      grpc::Status status = stub->ReadRecord(&context, request, &response);
+      if (!status.ok()) {
+        return errors::InvalidArgument("unable to fetch data from grpc (",
+                                       status.error_code(),
+                                       "): ", status.error_message());
+      }
+      return CopyRecords(response, raw, 0, shape.dim_size(0), value);
+    }
+
+    // The server pushes the records in chunks of `chunk` records over a
+    // single stream, instead of one round trip per chunk.
+    std::unique_ptr<grpc::ClientReader<Response>> reader(
+        stub->StreamRecord(&context, request));
+    Response response;
+    int64 offset = 0;
+    while (reader->Read(&response)) {
+      const int64 length = std::min(chunk, shape.dim_size(0) - offset);
+      if (length <= 0) {
+        context.TryCancel();
+        return errors::InvalidArgument("grpc stream returned too many records");
+      }
+      TF_RETURN_IF_ERROR(CopyRecords(response, raw, offset, length, value));
+      offset += length;
+    }
+    grpc::Status status = reader->Finish();
     if (!status.ok()) {
       return errors::InvalidArgument("unable to fetch data from grpc (",
                                      status.error_code(),
                                      "): ", status.error_message());
     }
-    TensorProto record;
-    response.record().UnpackTo(&record);
-
-    if (!value->FromProto(record)) {
-      return errors::InvalidArgument("unable to fill tensor");
+    if (offset != shape.dim_size(0)) {
+      return errors::InvalidArgument("grpc stream returned ", offset,
+                                     " records, expected ", shape.dim_size(0));
     }
 
     return Status::OK();
@@ -72,10 +120,44 @@ class GRPCReadableResource : public ResourceBase {
   }
 
  protected:
+  Status CopyRecords(const Response& response, const bool raw,
+                     const int64 offset, const int64 length, Tensor* value) {
+    Tensor slice = value->Slice(offset, offset + length);
+    if (raw) {
+      if (response.content().size() != slice.TotalBytes()) {
+        return errors::InvalidArgument("unable to fill tensor: expected ",
+                                       slice.TotalBytes(), " bytes, got ",
+                                       response.content().size());
+      }
+      memcpy(const_cast<char*>(slice.tensor_data().data()),
+             response.content().data(), response.content().size());
+      return Status::OK();
+    }
+
+    TensorProto proto;
+    response.record().UnpackTo(&proto);
+    Tensor record;
+    if (!record.FromProto(proto) || record.dtype() != slice.dtype() ||
+        record.shape() != slice.shape()) {
+      return errors::InvalidArgument("unable to fill tensor");
+    }
+    if (DataTypeCanUseMemcpy(record.dtype())) {
+      memcpy(const_cast<char*>(slice.tensor_data().data()),
+             record.tensor_data().data(), record.TotalBytes());
+    } else if (record.dtype() == DT_STRING) {
+      slice.unaligned_flat<tstring>() = record.flat<tstring>();
+    } else {
+      return errors::InvalidArgument("unable to fill tensor of ",
+                                     DataTypeString(record.dtype()));
+    }
+    return Status::OK();
+  }
+
   mutable mutex mu_;
   Env* env_ TF_GUARDED_BY(mu_);
   string endpoint_ TF_GUARDED_BY(mu_);
-  std::unique_ptr<GRPCEndpoint::Stub> stub_ TF_GUARDED_BY(mu_);
+  std::vector<std::unique_ptr<GRPCEndpoint::Stub>> stubs_ TF_GUARDED_BY(mu_);
+  size_t next_stub_ TF_GUARDED_BY(mu_) = 0;
 };
 
 class GRPCReadableInitOp : public ResourceOpKernel<GRPCReadableResource> {
@@ -93,7 +175,11 @@ class GRPCReadableInitOp : public ResourceOpKernel<GRPCReadableResource> {
     OP_REQUIRES_OK(context, context->input("input", &input_tensor));
     string input = input_tensor->scalar<tstring>()();
 
-    OP_REQUIRES_OK(context, resource_->Init(input));
+    const Tensor* channels_tensor;
+    OP_REQUIRES_OK(context, context->input("channels", &channels_tensor));
+    const int64 channels = channels_tensor->scalar<int64>()();
+
+    OP_REQUIRES_OK(context, resource_->Init(input, channels));
   }
   Status CreateResource(GRPCReadableResource** resource)
       TF_EXCLUSIVE_LOCKS_REQUIRED(mu_) override {
@@ -127,9 +213,17 @@ class GRPCReadableReadOp : public OpKernel {
     OP_REQUIRES_OK(context, context->input("shape", &shape_tensor));
     TensorShape shape(shape_tensor->flat<int64>());
 
+    const Tensor* chunk_tensor;
+    OP_REQUIRES_OK(context, context->input("chunk", &chunk_tensor));
+    const int64 chunk = chunk_tensor->scalar<int64>()();
+
+    const Tensor* raw_tensor;
+    OP_REQUIRES_OK(context, context->input("raw", &raw_tensor));
+    const bool raw = raw_tensor->scalar<bool>()();
+
     OP_REQUIRES_OK(
         context,
-        resource->Read(start, shape,
+        resource->Read(start, shape, chunk, raw,
                        [&](const TensorShape& shape, Tensor** value) -> Status {
                          TF_RETURN_IF_ERROR(
                              context->allocate_output(0, shape, value));
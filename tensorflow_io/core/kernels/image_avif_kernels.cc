@@ -15,9 +15,62 @@ limitations under the License.
 
 #include "avif/avif.h"
 #include "tensorflow/core/framework/op_kernel.h"
+#include "tensorflow_io/core/kernels/image_kernels.h"
 
 namespace tensorflow {
 namespace io {
+
+Status DecodeAVIFImage(const tstring& contents,
+                       const ImageAllocateFunc& allocate_func) {
+  avifROData raw;
+  raw.data = (const uint8_t*)&contents[0];
+  raw.size = contents.size();
+
+  std::unique_ptr<avifImage, void (*)(avifImage*)> image(
+      avifImageCreateEmpty(), [](avifImage* p) {
+        if (p != nullptr) {
+          avifImageDestroy(p);
+        }
+      });
+  std::unique_ptr<avifDecoder, void (*)(avifDecoder*)> decoder(
+      avifDecoderCreate(), [](avifDecoder* p) {
+        if (p != nullptr) {
+          avifDecoderDestroy(p);
+        }
+      });
+
+  avifResult decodeResult = avifDecoderRead(decoder.get(), image.get(), &raw);
+  if (decodeResult != AVIF_RESULT_OK) {
+    return errors::InvalidArgument("unable to decode avif: ",
+                                   avifResultToString(decodeResult));
+  }
+
+  if (image->depth != 8) {
+    return errors::InvalidArgument("only 8-bit avif images are supported");
+  }
+
+  int64 channels = 3;
+
+  Tensor* output_tensor = nullptr;
+  TF_RETURN_IF_ERROR(allocate_func(
+      DT_UINT8, TensorShape({image->height, image->width, channels}),
+      &output_tensor));
+  avifRGBImage rgb;
+  avifRGBImageSetDefaults(&rgb, image.get());
+
+  rgb.format = AVIF_RGB_FORMAT_RGB;
+  rgb.depth = image->depth;
+
+  rgb.pixels = output_tensor->flat<uint8>().data();
+  rgb.rowBytes = (image->width * channels);
+  avifResult rgbResult = avifImageYUVToRGB(image.get(), &rgb);
+  if (rgbResult != AVIF_RESULT_OK) {
+    return errors::InvalidArgument("unable to convert avif to rgb: ",
+                                   avifResultToString(rgbResult));
+  }
+  return Status::OK();
+}
+
 namespace {
 
 class DecodeAVIFOp : public OpKernel {
@@ -31,51 +84,12 @@ class DecodeAVIFOp : public OpKernel {
                                         contents_tensor.shape().DebugString()));
     auto contents = contents_tensor.scalar<tstring>()();
 
-    avifROData raw;
-    raw.data = (const uint8_t*)&contents[0];
-    raw.size = contents.size();
-
-    std::unique_ptr<avifImage, void (*)(avifImage*)> image(
-        avifImageCreateEmpty(), [](avifImage* p) {
-          if (p != nullptr) {
-            avifImageDestroy(p);
-          }
-        });
-    std::unique_ptr<avifDecoder, void (*)(avifDecoder*)> decoder(
-        avifDecoderCreate(), [](avifDecoder* p) {
-          if (p != nullptr) {
-            avifDecoderDestroy(p);
-          }
-        });
-
-    avifResult decodeResult = avifDecoderRead(decoder.get(), image.get(), &raw);
-    OP_REQUIRES(context, (decodeResult == AVIF_RESULT_OK),
-                errors::InvalidArgument("unable to decode avif: ",
-                                        avifResultToString(decodeResult)));
-
-    OP_REQUIRES(
-        context, (image->depth == 8),
-        errors::InvalidArgument("only 8-bit avif images are supported"));
-
-    int64 channels = 3;
-
-    Tensor* output_tensor = nullptr;
-    OP_REQUIRES_OK(context,
-                   context->allocate_output(
-                       0, TensorShape({image->height, image->width, channels}),
-                       &output_tensor));
-    avifRGBImage rgb;
-    avifRGBImageSetDefaults(&rgb, image.get());
-
-    rgb.format = AVIF_RGB_FORMAT_RGB;
-    rgb.depth = image->depth;
-
-    rgb.pixels = output_tensor->flat<uint8>().data();
-    rgb.rowBytes = (image->width * channels);
-    avifResult rgbResult = avifImageYUVToRGB(image.get(), &rgb);
-    OP_REQUIRES(context, (rgbResult == AVIF_RESULT_OK),
-                errors::InvalidArgument("unable to convert avif to rgb: ",
-                                        avifResultToString(rgbResult)));
+    OP_REQUIRES_OK(
+        context,
+        DecodeAVIFImage(contents, [&](DataType dtype, const TensorShape& shape,
+                                      Tensor** tensor) {
+          return context->allocate_output(0, shape, tensor);
+        }));
   }
 };
 REGISTER_KERNEL_BUILDER(Name("IO>DecodeAVIF").Device(DEVICE_CPU), DecodeAVIFOp);
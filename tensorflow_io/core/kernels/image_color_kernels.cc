@@ -0,0 +1,621 @@
+/* Copyright 2021 The TensorFlow Authors. All Rights Reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+==============================================================================*/
+
+#include <algorithm>
+#include <cmath>
+#include <limits>
+#include <type_traits>
+
+#include "libyuv/convert_argb.h"
+#include "libyuv/convert_from_argb.h"
+#include "tensorflow/core/framework/op_kernel.h"
+#include "tensorflow/core/framework/register_types.h"
+#include "tensorflow/core/util/work_sharder.h"
+
+namespace tensorflow {
+namespace io {
+namespace {
+
+// Color conversions go through non-linear RGB in [0, 1], and are applied on
+// planar blocks of pixels small enough to stay in cache. The per-channel
+// loops have no branches other than the piecewise transfer functions, so
+// that the compiler is able to vectorize them.
+constexpr int64 kColorBlockSize = 1024;
+
+enum ColorSpace { kRGB, kYCbCr, kYPbPr, kYDbDr, kXYZ, kLAB };
+
+Status ParseColorSpace(const string& name, ColorSpace* space) {
+  if (name == "rgb") {
+    *space = kRGB;
+  } else if (name == "ycbcr") {
+    *space = kYCbCr;
+  } else if (name == "ypbpr") {
+    *space = kYPbPr;
+  } else if (name == "ydbdr") {
+    *space = kYDbDr;
+  } else if (name == "xyz") {
+    *space = kXYZ;
+  } else if (name == "lab") {
+    *space = kLAB;
+  } else {
+    return errors::InvalidArgument("unsupported color space: ", name);
+  }
+  return Status::OK();
+}
+
+// RGB is stored as uint8 in [0, 255] or as float in [0, 1], YCbCr as uint8
+// in the ranges of ITU-R BT.601, and the other color spaces as float.
+Status ValidateColorSpaceType(const string& name, ColorSpace space,
+                              DataType dtype) {
+  bool valid = false;
+  switch (space) {
+    case kRGB:
+      valid = (dtype == DT_UINT8 || dtype == DT_HALF || dtype == DT_FLOAT ||
+               dtype == DT_DOUBLE);
+      break;
+    case kYCbCr:
+      valid = (dtype == DT_UINT8);
+      break;
+    default:
+      valid = (dtype == DT_HALF || dtype == DT_FLOAT || dtype == DT_DOUBLE);
+      break;
+  }
+  if (!valid) {
+    return errors::InvalidArgument(
+        "color space ", name, " does not support type ", DataTypeString(dtype));
+  }
+  return Status::OK();
+}
+
+Status GetIlluminant(const string& illuminant, const string& observer,
+                     double coords[3]) {
+  static const struct {
+    const char* illuminant;
+    double coords_2[3];
+    double coords_10[3];
+  } illuminants[] = {
+      {"A",
+       {1.098466069456375, 1, 0.3558228003436005},
+       {1.111420406956693, 1, 0.3519978321919493}},
+      {"D50",
+       {0.9642119944211994, 1, 0.8251882845188288},
+       {0.9672062750333777, 1, 0.8142801513128616}},
+      {"D55",
+       {0.956797052643698, 1, 0.9214805860173273},
+       {0.9579665682254781, 1, 0.9092525159847462}},
+      {"D65",
+       {0.95047, 1.0, 1.08883},
+       {0.94809667673716, 1, 1.0730513595166162}},
+      {"D75",
+       {0.9497220898840717, 1, 1.226393520724154},
+       {0.9441713925645873, 1, 1.2064272211720228}},
+      {"E", {1.0, 1.0, 1.0}, {1.0, 1.0, 1.0}},
+  };
+  if (observer != "2" && observer != "10") {
+    return errors::InvalidArgument("unsupported observer: ", observer);
+  }
+  for (const auto& entry : illuminants) {
+    if (illuminant == entry.illuminant) {
+      const double* values =
+          (observer == "2") ? entry.coords_2 : entry.coords_10;
+      std::copy(values, values + 3, coords);
+      return Status::OK();
+    }
+  }
+  return errors::InvalidArgument("unsupported illuminant: ", illuminant);
+}
+
+// Same coefficients as tfio.experimental.color.
+constexpr double kRGBToYPbPr[3][3] = {{0.299, 0.587, 0.114},
+                                      {-0.168736, -0.331264, 0.5},
+                                      {0.5, -0.418688, -0.081312}};
+constexpr double kYPbPrToRGB[3][3] = {
+    {1.00000000e00, -1.21889419e-06, 1.40199959e00},
+    {1.00000000e00, -3.44135678e-01, -7.14136156e-01},
+    {1.00000000e00, 1.77200007e00, 4.06298063e-07}};
+constexpr double kRGBToYDbDr[3][3] = {
+    {0.299, 0.587, 0.114}, {-0.45, -0.883, 1.333}, {-1.333, 1.116, 0.217}};
+constexpr double kYDbDrToRGB[3][3] = {
+    {1.00000000e00, 9.23037161e-05, -5.25912631e-01},
+    {1.00000000e00, -1.29132899e-01, 2.67899328e-01},
+    {1.00000000e00, 6.64679060e-01, -7.92025435e-05}};
+constexpr double kRGBToXYZ[3][3] = {{0.412453, 0.357580, 0.180423},
+                                    {0.212671, 0.715160, 0.072169},
+                                    {0.019334, 0.119193, 0.950227}};
+constexpr double kXYZToRGB[3][3] = {{3.24048134, -1.53715152, -0.49853633},
+                                    {-0.96925495, 1.87599, 0.04155593},
+                                    {0.05564664, -0.20404134, 1.05731107}};
+constexpr double kYCbCrOffset[3] = {16, 128, 128};
+constexpr double kYCbCrScale[3] = {219, 224, 224};
+
+template <typename Real>
+void ApplyColorMatrix(const double (&m)[3][3], int64 n, Real* c0, Real* c1,
+                      Real* c2) {
+  const Real m00 = m[0][0], m01 = m[0][1], m02 = m[0][2];
+  const Real m10 = m[1][0], m11 = m[1][1], m12 = m[1][2];
+  const Real m20 = m[2][0], m21 = m[2][1], m22 = m[2][2];
+  for (int64 i = 0; i < n; i++) {
+    const Real x = c0[i], y = c1[i], z = c2[i];
+    c0[i] = m00 * x + m01 * y + m02 * z;
+    c1[i] = m10 * x + m11 * y + m12 * z;
+    c2[i] = m20 * x + m21 * y + m22 * z;
+  }
+}
+
+// Non-linear (sRGB) to linear RGB, and the inverse.
+template <typename Real>
+void LinearizeRGB(int64 n, Real* c) {
+  for (int64 i = 0; i < n; i++) {
+    const Real v = c[i];
+    c[i] = (v > Real(0.04045))
+               ? std::pow((v + Real(0.055)) / Real(1.055), Real(2.4))
+               : v / Real(12.92);
+  }
+}
+
+template <typename Real>
+void DelinearizeRGB(int64 n, Real* c) {
+  for (int64 i = 0; i < n; i++) {
+    const Real v = c[i];
+    const Real e =
+        (v > Real(0.0031308))
+            ? std::pow(v, Real(1.0 / 2.4)) * Real(1.055) - Real(0.055)
+            : v * Real(12.92);
+    c[i] = std::min(std::max(e, Real(0)), Real(1));
+  }
+}
+
+// Converts n pixels, held as planar channels c0, c1 and c2, in place from
+// src to dst.
+class ColorConverter {
+ public:
+  ColorConverter() {}
+
+  Status Initialize(const string& src, const string& dst,
+                    const string& illuminant, const string& observer) {
+    TF_RETURN_IF_ERROR(ParseColorSpace(src, &src_));
+    TF_RETURN_IF_ERROR(ParseColorSpace(dst, &dst_));
+    return GetIlluminant(illuminant, observer, coords_);
+  }
+
+  ColorSpace src() const { return src_; }
+  ColorSpace dst() const { return dst_; }
+
+  template <typename Real>
+  void Convert(int64 n, Real* c0, Real* c1, Real* c2) const {
+    if (src_ == dst_) {
+      return;
+    }
+    ToRGB(n, c0, c1, c2);
+    FromRGB(n, c0, c1, c2);
+  }
+
+ private:
+  template <typename Real>
+  void ToRGB(int64 n, Real* c0, Real* c1, Real* c2) const {
+    switch (src_) {
+      case kRGB:
+        return;
+      case kYCbCr: {
+        Real* c[3] = {c0, c1, c2};
+        for (int k = 0; k < 3; k++) {
+          const Real offset = kYCbCrOffset[k], scale = kYCbCrScale[k];
+          Real* p = c[k];
+          for (int64 i = 0; i < n; i++) {
+            p[i] = (p[i] - offset) / scale;
+          }
+        }
+        ApplyColorMatrix(kYPbPrToRGB, n, c0, c1, c2);
+        return;
+      }
+      case kYPbPr:
+        ApplyColorMatrix(kYPbPrToRGB, n, c0, c1, c2);
+        return;
+      case kYDbDr:
+        ApplyColorMatrix(kYDbDrToRGB, n, c0, c1, c2);
+        return;
+      case kLAB: {
+        const Real x_n = coords_[0], y_n = coords_[1], z_n = coords_[2];
+        for (int64 i = 0; i < n; i++) {
+          const Real y = (c0[i] + Real(16)) / Real(116);
+          const Real x = c1[i] / Real(500) + y;
+          const Real z = std::max(y - c2[i] / Real(200), Real(0));
+          c0[i] = x;
+          c1[i] = y;
+          c2[i] = z;
+        }
+        Real* c[3] = {c0, c1, c2};
+        const Real scale[3] = {x_n, y_n, z_n};
+        for (int k = 0; k < 3; k++) {
+          Real* p = c[k];
+          const Real s = scale[k];
+          for (int64 i = 0; i < n; i++) {
+            const Real v = p[i];
+            p[i] = ((v > Real(0.2068966))
+                        ? v * v * v
+                        : (v - Real(16.0 / 116.0)) / Real(7.787)) *
+                   s;
+          }
+        }
+      }
+        TF_FALLTHROUGH_INTENDED;
+      case kXYZ:
+        ApplyColorMatrix(kXYZToRGB, n, c0, c1, c2);
+        DelinearizeRGB(n, c0);
+        DelinearizeRGB(n, c1);
+        DelinearizeRGB(n, c2);
+        return;
+    }
+  }
+
+  template <typename Real>
+  void FromRGB(int64 n, Real* c0, Real* c1, Real* c2) const {
+    switch (dst_) {
+      case kRGB:
+        return;
+      case kYCbCr: {
+        ApplyColorMatrix(kRGBToYPbPr, n, c0, c1, c2);
+        Real* c[3] = {c0, c1, c2};
+        for (int k = 0; k < 3; k++) {
+          const Real offset = kYCbCrOffset[k], scale = kYCbCrScale[k];
+          Real* p = c[k];
+          for (int64 i = 0; i < n; i++) {
+            p[i] = p[i] * scale + offset;
+          }
+        }
+        return;
+      }
+      case kYPbPr:
+        ApplyColorMatrix(kRGBToYPbPr, n, c0, c1, c2);
+        return;
+      case kYDbDr:
+        ApplyColorMatrix(kRGBToYDbDr, n, c0, c1, c2);
+        return;
+      case kXYZ:
+      case kLAB:
+        LinearizeRGB(n, c0);
+        LinearizeRGB(n, c1);
+        LinearizeRGB(n, c2);
+        ApplyColorMatrix(kRGBToXYZ, n, c0, c1, c2);
+        if (dst_ == kXYZ) {
+          return;
+        }
+        Real* c[3] = {c0, c1, c2};
+        for (int k = 0; k < 3; k++) {
+          Real* p = c[k];
+          const Real s = coords_[k];
+          for (int64 i = 0; i < n; i++) {
+            const Real v = p[i] / s;
+            p[i] = (v > Real(0.008856)) ? std::cbrt(v)
+                                        : v * Real(7.787) + Real(16.0 / 116.0);
+          }
+        }
+        for (int64 i = 0; i < n; i++) {
+          const Real x = c0[i], y = c1[i], z = c2[i];
+          c0[i] = y * Real(116) - Real(16);
+          c1[i] = (x - y) * Real(500);
+          c2[i] = (y - z) * Real(200);
+        }
+        return;
+    }
+  }
+
+  ColorSpace src_ = kRGB;
+  ColorSpace dst_ = kRGB;
+  double coords_[3];
+};
+
+// Loads n interleaved pixels into planar channels, dividing by divisor.
+template <typename T, typename Real>
+void LoadColorPixels(const T* data, int64 stride, const int (&order)[3],
+                     int64 n, Real divisor, Real* c0, Real* c1, Real* c2) {
+  for (int64 i = 0; i < n; i++) {
+    const T* pixel = data + i * stride;
+    c0[i] = static_cast<Real>(static_cast<float>(pixel[order[0]])) / divisor;
+    c1[i] = static_cast<Real>(static_cast<float>(pixel[order[1]])) / divisor;
+    c2[i] = static_cast<Real>(static_cast<float>(pixel[order[2]])) / divisor;
+  }
+}
+template <typename Real>
+void LoadColorPixels(const double* data, int64 stride, const int (&order)[3],
+                     int64 n, Real divisor, Real* c0, Real* c1, Real* c2) {
+  for (int64 i = 0; i < n; i++) {
+    const double* pixel = data + i * stride;
+    c0[i] = static_cast<Real>(pixel[order[0]]) / divisor;
+    c1[i] = static_cast<Real>(pixel[order[1]]) / divisor;
+    c2[i] = static_cast<Real>(pixel[order[2]]) / divisor;
+  }
+}
+
+// Integer samples are saturated, then truncated like tf.cast.
+template <typename T, typename Real>
+typename std::enable_if<std::is_integral<T>::value, T>::type ColorSample(
+    Real v) {
+  return static_cast<T>(
+      std::min(std::max(v, Real(std::numeric_limits<T>::lowest())),
+               Real(std::numeric_limits<T>::max())));
+}
+template <typename T, typename Real>
+typename std::enable_if<!std::is_integral<T>::value, T>::type ColorSample(
+    Real v) {
+  return static_cast<T>(v);
+}
+
+// Stores n planar pixels as interleaved channels, multiplying by scale.
+template <typename T, typename Real>
+void StoreColorPixels(const Real* c0, const Real* c1, const Real* c2, int64 n,
+                      Real scale, T* data) {
+  for (int64 i = 0; i < n; i++) {
+    data[i * 3 + 0] = ColorSample<T, Real>(c0[i] * scale);
+    data[i * 3 + 1] = ColorSample<T, Real>(c1[i] * scale);
+    data[i * 3 + 2] = ColorSample<T, Real>(c2[i] * scale);
+  }
+}
+
+template <typename Real>
+void LoadColorTensor(const Tensor& tensor, int64 offset, int64 n, Real divisor,
+                     Real* c0, Real* c1, Real* c2) {
+  static constexpr int order[3] = {0, 1, 2};
+  switch (tensor.dtype()) {
+#define LOAD_COLOR_TENSOR(T)                                           \
+  case DataTypeToEnum<T>::value:                                       \
+    LoadColorPixels(tensor.flat<T>().data() + offset * 3, 3, order, n, \
+                    divisor, c0, c1, c2);                              \
+    break;
+    TF_CALL_uint8(LOAD_COLOR_TENSOR);
+    TF_CALL_half(LOAD_COLOR_TENSOR);
+    TF_CALL_float(LOAD_COLOR_TENSOR);
+    TF_CALL_double(LOAD_COLOR_TENSOR);
+#undef LOAD_COLOR_TENSOR
+    default:
+      break;
+  }
+}
+
+template <typename Real>
+void StoreColorTensor(const Real* c0, const Real* c1, const Real* c2,
+                      int64 offset, int64 n, Real scale, Tensor* tensor) {
+  switch (tensor->dtype()) {
+#define STORE_COLOR_TENSOR(T)                                \
+  case DataTypeToEnum<T>::value:                             \
+    StoreColorPixels(c0, c1, c2, n, scale,                   \
+                     tensor->flat<T>().data() + offset * 3); \
+    break;
+    TF_CALL_uint8(STORE_COLOR_TENSOR);
+    TF_CALL_half(STORE_COLOR_TENSOR);
+    TF_CALL_float(STORE_COLOR_TENSOR);
+    TF_CALL_double(STORE_COLOR_TENSOR);
+#undef STORE_COLOR_TENSOR
+    default:
+      break;
+  }
+}
+
+// Common attributes of the color conversion kernels.
+class ColorConvertOpBase : public OpKernel {
+ public:
+  explicit ColorConvertOpBase(OpKernelConstruction* context)
+      : OpKernel(context) {
+    OP_REQUIRES_OK(context, context->GetAttr("dst", &dst_));
+    OP_REQUIRES_OK(context, context->GetAttr("illuminant", &illuminant_));
+    OP_REQUIRES_OK(context, context->GetAttr("observer", &observer_));
+    OP_REQUIRES_OK(context, context->GetAttr("dtype", &dtype_));
+  }
+
+ protected:
+  Status InitializeConverter(const string& src) {
+    TF_RETURN_IF_ERROR(
+        converter_.Initialize(src, dst_, illuminant_, observer_));
+    return ValidateColorSpaceType(dst_, converter_.dst(), dtype_);
+  }
+
+  // Output samples of RGB in uint8 are scaled to [0, 255].
+  template <typename Real>
+  Real output_scale() const {
+    return (converter_.dst() == kRGB && dtype_ == DT_UINT8) ? Real(255)
+                                                            : Real(1);
+  }
+
+  ColorConverter converter_;
+  DataType dtype_;
+
+ private:
+  string dst_;
+  string illuminant_;
+  string observer_;
+};
+
+class ColorConvertOp : public ColorConvertOpBase {
+ public:
+  explicit ColorConvertOp(OpKernelConstruction* context)
+      : ColorConvertOpBase(context) {
+    OP_REQUIRES_OK(context, context->GetAttr("src", &src_));
+    OP_REQUIRES_OK(context, context->GetAttr("T", &input_dtype_));
+    OP_REQUIRES_OK(context, InitializeConverter(src_));
+    OP_REQUIRES_OK(
+        context, ValidateColorSpaceType(src_, converter_.src(), input_dtype_));
+  }
+
+  void Compute(OpKernelContext* context) override {
+    const Tensor* input_tensor;
+    OP_REQUIRES_OK(context, context->input("input", &input_tensor));
+    OP_REQUIRES(context,
+                (input_tensor->dims() >= 1 &&
+                 input_tensor->dim_size(input_tensor->dims() - 1) == 3),
+                errors::InvalidArgument(
+                    "input must have 3 channels in the last dimension, got ",
+                    input_tensor->shape().DebugString()));
+
+    Tensor* output_tensor = nullptr;
+    OP_REQUIRES_OK(context, context->allocate_output(0, input_tensor->shape(),
+                                                     &output_tensor));
+
+    if (input_dtype_ == DT_DOUBLE || dtype_ == DT_DOUBLE) {
+      Convert<double>(context, *input_tensor, output_tensor);
+    } else {
+      Convert<float>(context, *input_tensor, output_tensor);
+    }
+  }
+
+ private:
+  template <typename Real>
+  void Convert(OpKernelContext* context, const Tensor& input_tensor,
+               Tensor* output_tensor) {
+    const int64 pixels = input_tensor.NumElements() / 3;
+    const int64 blocks = (pixels + kColorBlockSize - 1) / kColorBlockSize;
+    const Real divisor = (converter_.src() == kRGB && input_dtype_ == DT_UINT8)
+                             ? Real(255)
+                             : Real(1);
+    const Real scale = output_scale<Real>();
+
+    auto worker_threads = *(context->device()->tensorflow_cpu_worker_threads());
+    Shard(worker_threads.num_threads, worker_threads.workers, blocks,
+          kColorBlockSize * 100, [&](int64 start, int64 limit) {
+            std::vector<Real> buffer(kColorBlockSize * 3);
+            Real* c0 = buffer.data();
+            Real* c1 = c0 + kColorBlockSize;
+            Real* c2 = c1 + kColorBlockSize;
+            for (int64 block = start; block < limit; block++) {
+              const int64 offset = block * kColorBlockSize;
+              const int64 n = std::min(kColorBlockSize, pixels - offset);
+              LoadColorTensor(input_tensor, offset, n, divisor, c0, c1, c2);
+              converter_.Convert(n, c0, c1, c2);
+              StoreColorTensor(c0, c1, c2, offset, n, scale, output_tensor);
+            }
+          });
+  }
+
+  string src_;
+  DataType input_dtype_;
+};
+
+// Decodes NV12 or YUY2 images and converts them to dst without a full size
+// intermediate RGB image: each pair of rows is converted to RGB with libyuv
+// and then converted in place.
+class DecodeYUVColorOp : public ColorConvertOpBase {
+ public:
+  explicit DecodeYUVColorOp(OpKernelConstruction* context)
+      : ColorConvertOpBase(context) {
+    OP_REQUIRES_OK(context, context->GetAttr("format", &format_));
+    OP_REQUIRES_OK(context, InitializeConverter("rgb"));
+  }
+
+  void Compute(OpKernelContext* context) override {
+    const Tensor* input_tensor;
+    OP_REQUIRES_OK(context, context->input("input", &input_tensor));
+
+    const Tensor* size_tensor;
+    OP_REQUIRES_OK(context, context->input("size", &size_tensor));
+    OP_REQUIRES(context, (size_tensor->NumElements() == 2),
+                errors::InvalidArgument("size must have 2 elements, got ",
+                                        size_tensor->NumElements()));
+
+    const tstring& input = input_tensor->scalar<tstring>()();
+
+    const int64 height = size_tensor->flat<int32>()(0);
+    const int64 width = size_tensor->flat<int32>()(1);
+    OP_REQUIRES(
+        context, (height >= 0 && width >= 0),
+        errors::InvalidArgument("invalid size: [", height, ", ", width, "]"));
+    const int64 expected = (format_ == "nv12")
+                               ? width * height + width * ((height + 1) / 2)
+                               : width * 2 * height;
+    OP_REQUIRES(context, (static_cast<int64>(input.size()) >= expected),
+                errors::InvalidArgument("not enough data for ", format_,
+                                        " image of size [", height, ", ", width,
+                                        "]: ", input.size(), " < ", expected));
+
+    Tensor* image_tensor = nullptr;
+    OP_REQUIRES_OK(context,
+                   context->allocate_output(0, TensorShape({height, width, 3}),
+                                            &image_tensor));
+    if (height == 0 || width == 0) {
+      return;
+    }
+
+    std::vector<Status> status((height + 1) / 2);
+    if (dtype_ == DT_DOUBLE) {
+      Decode<double>(context, input, height, width, image_tensor, &status);
+    } else {
+      Decode<float>(context, input, height, width, image_tensor, &status);
+    }
+    for (const auto& s : status) {
+      OP_REQUIRES_OK(context, s);
+    }
+  }
+
+ private:
+  template <typename Real>
+  void Decode(OpKernelContext* context, const tstring& input, int64 height,
+              int64 width, Tensor* image_tensor, std::vector<Status>* status) {
+    const uint8* data = reinterpret_cast<const uint8*>(input.data());
+    const Real scale = output_scale<Real>();
+    const bool nv12 = (format_ == "nv12");
+
+    auto worker_threads = *(context->device()->tensorflow_cpu_worker_threads());
+    Shard(worker_threads.num_threads, worker_threads.workers, (height + 1) / 2,
+          width * 2 * 100, [&](int64 start, int64 limit) {
+            // libyuv RAW is R, G, B and ARGB is B, G, R, A in memory.
+            static constexpr int raw_order[3] = {0, 1, 2};
+            static constexpr int argb_order[3] = {2, 1, 0};
+            std::vector<uint8> pixels(width * 2 * 4);
+            std::vector<Real> buffer(width * 2 * 3);
+            Real* c0 = buffer.data();
+            Real* c1 = c0 + width * 2;
+            Real* c2 = c1 + width * 2;
+            for (int64 pair = start; pair < limit; pair++) {
+              const int64 row = pair * 2;
+              const int64 rows = std::min<int64>(2, height - row);
+              int ret;
+              if (nv12) {
+                const uint8* y = data + row * width;
+                const uint8* uv = data + width * height + pair * width;
+                ret = libyuv::NV12ToRAW(y, width, uv, width, pixels.data(),
+                                        width * 3, width, rows);
+              } else {
+                const uint8* yuy2 = data + row * width * 2;
+                ret = libyuv::YUY2ToARGB(yuy2, width * 2, pixels.data(),
+                                         width * 4, width, rows);
+              }
+              if (ret != 0) {
+                (*status)[pair] = errors::InvalidArgument(
+                    "unable to convert ", format_, " to rgb: ", ret);
+                continue;
+              }
+              const int64 n = width * rows;
+              if (nv12) {
+                LoadColorPixels(pixels.data(), 3, raw_order, n, Real(255), c0,
+                                c1, c2);
+              } else {
+                LoadColorPixels(pixels.data(), 4, argb_order, n, Real(255), c0,
+                                c1, c2);
+              }
+              converter_.Convert(n, c0, c1, c2);
+              StoreColorTensor(c0, c1, c2, row * width, n, scale, image_tensor);
+            }
+          });
+  }
+
+  string format_;
+};
+
+REGISTER_KERNEL_BUILDER(Name("IO>ColorConvert").Device(DEVICE_CPU),
+                        ColorConvertOp);
+REGISTER_KERNEL_BUILDER(Name("IO>DecodeYUVColor").Device(DEVICE_CPU),
+                        DecodeYUVColorOp);
+
+}  // namespace
+}  // namespace io
+}  // namespace tensorflow
@@ -41,12 +41,17 @@ limitations under the License.
 
 #include "fmjpeg2k/djdecode.h" // for fmjpeg2koj decoders
 
+#include <algorithm>
+#include <cmath>
 #include <cstdint>
 #include <exception>
+#include <memory>
+#include <type_traits>
 #include "tensorflow/core/framework/op.h"
 #include "tensorflow/core/framework/op_kernel.h"
 #include "tensorflow/core/framework/shape_inference.h"
 #include "tensorflow/core/framework/types.h"
+#include "tensorflow/core/util/work_sharder.h"
 #include "absl/strings/str_split.h"
 #include "absl/strings/numbers.h"
 
@@ -64,7 +69,6 @@ namespace {
 class DecoderRegistration {
  public:
   static void registerCodecs() { instance().registration(); }
-  static void cleanup() {}
 
  private:
   explicit DecoderRegistration() : initialized_(false) {}
@@ -116,8 +120,6 @@ class DecodeDICOMImageOp : public OpKernel {
     DecoderRegistration::registerCodecs();
   }
 
-  ~DecodeDICOMImageOp() { DecoderRegistration::cleanup(); }
-
   void Compute(OpKernelContext *context) override {
     // Grab the input file content tensor
     const Tensor &in_contents = context->input(0);
@@ -302,6 +304,162 @@ class DecodeDICOMImageOp : public OpKernel {
   bool color_dim_;
 };
 
+// Reads a DICOM file from memory. With metadata_only the pixel data is not
+// read, which is enough to access all the tags that precede it.
+Status ReadDICOMFile(const tstring &content, bool metadata_only,
+                     DcmFileFormat *dicom_file) {
+  DcmInputBufferStream data_buf;
+  data_buf.setBuffer(content.data(), content.length());
+  data_buf.setEos();
+
+  dicom_file->transferInit();
+  OFCondition cond = metadata_only ? dicom_file->readUntilTag(
+                                         data_buf, EXS_Unknown, EGL_noChange,
+                                         DCM_MaxReadLength, DCM_PixelData)
+                                   : dicom_file->read(data_buf);
+  dicom_file->transferEnd();
+  if (cond.bad() && !(metadata_only && cond == EC_StreamNotifyClient)) {
+    return errors::InvalidArgument("unable to read DICOM file: ", cond.text());
+  }
+  return Status::OK();
+}
+
+// A tag to look up in a DICOM file, nested in the sequence items given by
+// pairs of sequence tag and item number.
+struct DICOMTagPath {
+  std::vector<std::pair<DcmTag, uint32>> sequence;
+  DcmTag tag;
+};
+
+Status ParseDICOMTag(const uint32 tag_value, DcmTag *tag) {
+  uint16 tag_group_number = (uint16)((tag_value & 0xFFFF0000) >> 16);
+  uint16 tag_element_number = (uint16)((tag_value & 0x0000FFFF) >> 0);
+  *tag = DcmTag(tag_group_number, tag_element_number);
+  return Status::OK();
+}
+
+Status ParseDICOMTag(const absl::string_view tag_value, DcmTag *tag) {
+  std::vector<absl::string_view> number_views = absl::StrSplit(tag_value, ',');
+  if (number_views.size() != 2) {
+    return errors::InvalidArgument(
+        "sequence should consist of group and "
+        "element numbers, received ",
+        tag_value);
+  }
+  uint32 number = 0;
+  if (!absl::numbers_internal::safe_strtou32_base(number_views[0], &number,
+                                                  0)) {
+    return errors::InvalidArgument(
+        "group number should be an integer, received ", number_views[0]);
+  }
+  if (number > std::numeric_limits<short>::max()) {
+    return errors::InvalidArgument("group number should be uint16, received ",
+                                   number_views[0]);
+  }
+  uint16 tag_group_number = number;
+
+  if (!absl::numbers_internal::safe_strtou32_base(number_views[1], &number,
+                                                  0)) {
+    return errors::InvalidArgument(
+        "element number should be an integer, received ", number_views[1]);
+  }
+  if (number > std::numeric_limits<short>::max()) {
+    return errors::InvalidArgument("element number should be uint16, received ",
+                                   number_views[1]);
+  }
+  uint16 tag_element_number = number;
+
+  *tag = DcmTag(tag_group_number, tag_element_number);
+  return Status::OK();
+}
+
+Status ParseDICOMTagPath(const uint32 tag_value, DICOMTagPath *path) {
+  return ParseDICOMTag(tag_value, &path->tag);
+}
+
+Status ParseDICOMTagPath(const tstring &tag_sequence, DICOMTagPath *path) {
+  std::vector<absl::string_view> tag_sequence_views;
+  if (tag_sequence.size() >= 2 && tag_sequence[0] == '[' &&
+      tag_sequence[tag_sequence.size() - 1] == ']') {
+    tag_sequence_views = absl::StrSplit(
+        absl::string_view(tag_sequence.data() + 1, tag_sequence.size() - 2),
+        "][");
+  } else {
+    tag_sequence_views.push_back(
+        absl::string_view(tag_sequence.data(), tag_sequence.size()));
+  }
+  if (tag_sequence_views.size() % 2 != 1) {
+    return errors::InvalidArgument(
+        "tag sequences should have 2xn + 1 elements, received: ",
+        tag_sequence_views.size());
+  }
+
+  // Walk through before the last element of value
+  for (size_t i = 0; i < tag_sequence_views.size() - 1; i += 2) {
+    DcmTag tag;
+    TF_RETURN_IF_ERROR(ParseDICOMTag(tag_sequence_views[i], &tag));
+    uint32 number = 0;
+    if (!absl::numbers_internal::safe_strtou32_base(tag_sequence_views[i + 1],
+                                                    &number, 0)) {
+      return errors::InvalidArgument("number should be an integer, received ",
+                                     tag_sequence_views[i + 1]);
+    }
+    path->sequence.emplace_back(tag, number);
+  }
+
+  // The last element of value
+  return ParseDICOMTag(tag_sequence_views.back(), &path->tag);
+}
+
+Status ParseDICOMTagPaths(const Tensor &tags,
+                          std::vector<DICOMTagPath> *paths) {
+  paths->resize(tags.NumElements());
+  for (int64 i = 0; i < tags.NumElements(); i++) {
+    if (tags.dtype() == DT_STRING) {
+      TF_RETURN_IF_ERROR(
+          ParseDICOMTagPath(tags.flat<tstring>()(i), &(*paths)[i]));
+    } else {
+      TF_RETURN_IF_ERROR(
+          ParseDICOMTagPath(tags.flat<uint32>()(i), &(*paths)[i]));
+    }
+  }
+  return Status::OK();
+}
+
+// Looks up the value of a tag in the dataset, then in the meta header. The
+// value is empty if the tag does not exist.
+Status GetDICOMTagValue(DcmFileFormat *dicom_file, const DICOMTagPath &path,
+                        OFString *val) {
+  DcmItem *item = static_cast<DcmItem *>(dicom_file->getDataset());
+  DcmMetaInfo *meta = dicom_file->getMetaInfo();
+  for (const auto &entry : path.sequence) {
+    DcmItem *lookup;
+    OFCondition condition =
+        item->findAndGetSequenceItem(entry.first, lookup, entry.second);
+    if (condition.bad()) {
+      return errors::InvalidArgument("item findAndGetSequenceItem: ",
+                                     condition.text());
+    }
+    item = lookup;
+  }
+  if (item->tagExists(path.tag)) {
+    OFCondition condition = item->findAndGetOFStringArray(path.tag, *val);
+    if (condition.bad()) {
+      return errors::InvalidArgument("item findAndGetOFStringArray: ",
+                                     condition.text());
+    }
+  } else if (meta->tagExists(path.tag)) {
+    OFCondition condition = meta->findAndGetOFStringArray(path.tag, *val);
+    if (condition.bad()) {
+      return errors::InvalidArgument("meta findAndGetOFStringArray: ",
+                                     condition.text());
+    }
+  } else {
+    *val = OFString("");
+  }
+  return Status::OK();
+}
+
 class DecodeDICOMDataOp : public OpKernel {
  public:
   explicit DecodeDICOMDataOp(OpKernelConstruction *context)
@@ -322,6 +480,9 @@ class DecodeDICOMDataOp : public OpKernel {
     const Tensor *in_tags;
     OP_REQUIRES_OK(context, context->input("tags", &in_tags));
 
+    std::vector<DICOMTagPath> paths;
+    OP_REQUIRES_OK(context, ParseDICOMTagPaths(*in_tags, &paths));
+
     // Create an output tensor
     Tensor *out_tag_values = NULL;
     OP_REQUIRES_OK(context, context->allocate_output(0, in_tags->shape(),
@@ -329,137 +490,473 @@ class DecodeDICOMDataOp : public OpKernel {
 
     auto out_tag_values_flat = out_tag_values->flat<tstring>();
 
-    DcmInputBufferStream dataBuf;
-    dataBuf.setBuffer(in_contents_scalar.data(), in_contents_scalar.length());
-    dataBuf.setEos();
-
     DcmFileFormat dfile;
-    dfile.transferInit();
-    OFCondition cond = dfile.read(dataBuf);
-    dfile.transferEnd();
-
-    DcmItem *item = static_cast<DcmItem *>(dfile.getDataset());
-    DcmMetaInfo *meta = dfile.getMetaInfo();
+    ReadDICOMFile(in_contents_scalar, false, &dfile).IgnoreError();
 
     for (int64 tag_i = 0; tag_i < in_tags->NumElements(); ++tag_i) {
-      DcmTag tag;
-      if (in_tags->dtype() == DT_STRING) {
-        uint16 tag_group_number, tag_element_number;
-        const auto &in_tags_flat = in_tags->flat<tstring>();
-        const tstring &tag_sequence = in_tags_flat(tag_i);
-        std::vector<absl::string_view> tag_sequence_views;
-        if (tag_sequence[0] == '[' &&
-            tag_sequence[tag_sequence.size() - 1] == ']') {
-          tag_sequence_views =
-              absl::StrSplit(absl::string_view(tag_sequence.data() + 1,
-                                               tag_sequence.size() - 2),
-                             "][");
-        } else {
-          tag_sequence_views.push_back(
-              absl::string_view(tag_sequence.data(), tag_sequence.size()));
-        }
+      OFString val;
+      OP_REQUIRES_OK(context, GetDICOMTagValue(&dfile, paths[tag_i], &val));
+      out_tag_values_flat(tag_i) = val.c_str();
+    }
+  }
+};
 
-        OP_REQUIRES(
-            context, (tag_sequence_views.size() % 2 == 1),
-            errors::InvalidArgument(
-                "tag sequences should have 2xn + 1 elements, received: ",
-                tag_sequence_views.size()));
-
-        // Walk through before the last element of value
-        for (size_t i = 0; i < tag_sequence_views.size() - 1; i += 2) {
-          absl::string_view tag_value(tag_sequence_views[i].data(),
-                                      tag_sequence_views[i].size());
-          OP_REQUIRES_OK(context, GetDcmTag(tag_value, &tag));
-
-          absl::string_view number_value(tag_sequence_views[i + 1].data(),
-                                         tag_sequence_views[i + 1].size());
-          uint32 number = 0;
-          OP_REQUIRES(
-              context,
-              absl::numbers_internal::safe_strtou32_base(number_value, &number,
-                                                         0),
-              errors::InvalidArgument("number should be an integer, received ",
-                                      number_value));
-
-          DcmItem *lookup;
-          OFCondition condition =
-              item->findAndGetSequenceItem(tag, lookup, number);
-          OP_REQUIRES(context, condition.good(),
-                      errors::InvalidArgument("item findAndGetSequenceItem: ",
-                                              condition.text()));
-          item = lookup;
-        }
+// Looks up tags in a batch of DICOM files in parallel, into [batch, tags].
+// Unless a tag at or after the pixel data is requested, the files are only
+// read up to the pixel data.
+class DecodeDICOMDataBatchOp : public OpKernel {
+ public:
+  explicit DecodeDICOMDataBatchOp(OpKernelConstruction *context)
+      : OpKernel(context) {}
 
-        // The last element of value
-        absl::string_view tag_value(tag_sequence_views.back().data(),
-                                    tag_sequence_views.back().size());
-        OP_REQUIRES_OK(context, GetDcmTag(tag_value, &tag));
-      } else {
-        const auto &in_tags_flat = in_tags->flat<uint32>();
-        uint32 tag_value = in_tags_flat(tag_i);
-        OP_REQUIRES_OK(context, GetDcmTag(tag_value, &tag));
+  void Compute(OpKernelContext *context) override {
+    const Tensor &contents_tensor = context->input(0);
+    OP_REQUIRES(
+        context, TensorShapeUtils::IsVector(contents_tensor.shape()),
+        errors::InvalidArgument("contents must be a vector, but had shape: ",
+                                contents_tensor.shape().DebugString()));
+    const Tensor &tags_tensor = context->input(1);
+
+    std::vector<DICOMTagPath> paths;
+    OP_REQUIRES_OK(context, ParseDICOMTagPaths(tags_tensor, &paths));
+    bool metadata_only = true;
+    for (const DICOMTagPath &path : paths) {
+      const DcmTagKey &key =
+          path.sequence.size() != 0 ? path.sequence.front().first : path.tag;
+      if (key >= DCM_PixelData) {
+        metadata_only = false;
       }
+    }
 
-      OFString val;
-      if (item->tagExists(tag)) {
-        OFCondition condition = item->findAndGetOFStringArray(tag, val);
-        OP_REQUIRES(context, condition.good(),
-                    errors::InvalidArgument("item findAndGetOFStringArray: ",
-                                            condition.text()));
-      } else if (meta->tagExists(tag)) {
-        OFCondition condition = meta->findAndGetOFStringArray(tag, val);
-        OP_REQUIRES(context, condition.good(),
-                    errors::InvalidArgument("meta findAndGetOFStringArray: ",
-                                            condition.text()));
-      } else {
-        val = OFString("");
+    const int64 batch = contents_tensor.NumElements();
+    const int64 count = paths.size();
+    Tensor *output_tensor = nullptr;
+    OP_REQUIRES_OK(context,
+                   context->allocate_output(0, TensorShape({batch, count}),
+                                            &output_tensor));
+    auto output = output_tensor->matrix<tstring>();
+
+    std::vector<Status> statuses(batch);
+    auto work = [&](int64 start, int64 limit) {
+      for (int64 i = start; i < limit; i++) {
+        DcmFileFormat dicom_file;
+        ReadDICOMFile(contents_tensor.flat<tstring>()(i), metadata_only,
+                      &dicom_file)
+            .IgnoreError();
+        for (int64 j = 0; j < count && statuses[i].ok(); j++) {
+          OFString val;
+          statuses[i] = GetDICOMTagValue(&dicom_file, paths[j], &val);
+          output(i, j) = val.c_str();
+        }
       }
-      out_tag_values_flat(tag_i) = val.c_str();
+    };
+    const DeviceBase::CpuWorkerThreads &worker_threads =
+        *context->device()->tensorflow_cpu_worker_threads();
+    Shard(worker_threads.num_threads, worker_threads.workers, batch,
+          metadata_only ? 100000 : 10000000, work);
+    for (int64 i = 0; i < batch; i++) {
+      OP_REQUIRES_OK(context, statuses[i]);
     }
   }
+};
 
- private:
-  Status GetDcmTag(const uint32 tag_value, DcmTag *tag) {
-    uint16 tag_group_number = (uint16)((tag_value & 0xFFFF0000) >> 16);
-    uint16 tag_element_number = (uint16)((tag_value & 0x0000FFFF) >> 0);
-    *tag = DcmTag(tag_group_number, tag_element_number);
-    return Status::OK();
+// Converts a pixel value of n_bits to dtype. With auto_scale the full range
+// of n_bits is stretched to the range of dtype ([0, 1] for floating point),
+// otherwise the value is kept and clipped to the range of dtype.
+template <typename dtype>
+typename std::enable_if<std::is_integral<dtype>::value, dtype>::type
+ScaleDICOMPixel(uint64 value, unsigned int n_bits, bool auto_scale) {
+  if (auto_scale) {
+    const int digits = std::numeric_limits<dtype>::digits;
+    return static_cast<dtype>((value << (64 - n_bits)) >> (64 - digits));
   }
-  Status GetDcmTag(const absl::string_view tag_value, DcmTag *tag) {
-    std::vector<absl::string_view> number_views =
-        absl::StrSplit(tag_value, ',');
-    if (number_views.size() != 2) {
-      return errors::InvalidArgument(
-          "sequence should consist of group and "
-          "element numbers, received ",
-          tag_value);
+  const uint64 limit = static_cast<uint64>(std::numeric_limits<dtype>::max());
+  return static_cast<dtype>(value >= limit ? limit : value);
+}
+
+template <typename dtype>
+typename std::enable_if<!std::is_integral<dtype>::value, dtype>::type
+ScaleDICOMPixel(uint64 value, unsigned int n_bits, bool auto_scale) {
+  if (auto_scale) {
+    return static_cast<dtype>(static_cast<double>(value) /
+                              static_cast<double>((1ULL << n_bits) - 1));
+  }
+  return static_cast<dtype>(static_cast<double>(value));
+}
+
+// Converts a modality value (e.g., Hounsfield units) to dtype, clipped to
+// [lower, upper] and to the range of dtype.
+template <typename dtype>
+typename std::enable_if<std::is_integral<dtype>::value, dtype>::type
+ClipDICOMValue(double value, double lower, double upper) {
+  value = std::round(std::min(std::max(value, lower), upper));
+  value = std::min(
+      std::max(value, static_cast<double>(std::numeric_limits<dtype>::min())),
+      static_cast<double>(std::numeric_limits<dtype>::max()));
+  return static_cast<dtype>(value);
+}
+
+template <typename dtype>
+typename std::enable_if<!std::is_integral<dtype>::value, dtype>::type
+ClipDICOMValue(double value, double lower, double upper) {
+  return static_cast<dtype>(std::min(std::max(value, lower), upper));
+}
+
+template <typename T, typename dtype>
+void ConvertDICOMOutput(const void *data, int64 count, unsigned int n_bits,
+                        bool auto_scale, dtype *output) {
+  const T *p = static_cast<const T *>(data);
+  for (int64 i = 0; i < count; i++) {
+    output[i] = ScaleDICOMPixel<dtype>(p[i], n_bits, auto_scale);
+  }
+}
+
+template <typename T, typename dtype>
+void ConvertDICOMModality(const void *data, int64 count, double lower,
+                          double upper, dtype *output) {
+  const T *p = static_cast<const T *>(data);
+  for (int64 i = 0; i < count; i++) {
+    output[i] = ClipDICOMValue<dtype>(static_cast<double>(p[i]), lower, upper);
+  }
+}
+
+// Decodes a batch of DICOM files into [batch, frames, height, width,
+// channels], in parallel on the intra-op thread pool. Only the range of
+// frames spanned by `frames` is decoded (all frames if `frames` is empty).
+// The optional `window` ([center, width]) is a VOI window applied before
+// scaling to dtype, or the clipping range of modality values with
+// scale='modality', which outputs rescaled values (e.g., Hounsfield units).
+template <typename dtype>
+class DecodeDICOMImageBatchOp : public OpKernel {
+ public:
+  explicit DecodeDICOMImageBatchOp(OpKernelConstruction *context)
+      : OpKernel(context) {
+    OP_REQUIRES_OK(context, context->GetAttr("on_error", &on_error_));
+    OP_REQUIRES_OK(context, context->GetAttr("scale", &scale_));
+
+    DecoderRegistration::registerCodecs();
+  }
+
+  void Compute(OpKernelContext *context) override {
+    const Tensor &contents_tensor = context->input(0);
+    OP_REQUIRES(
+        context, TensorShapeUtils::IsVector(contents_tensor.shape()),
+        errors::InvalidArgument("contents must be a vector, but had shape: ",
+                                contents_tensor.shape().DebugString()));
+    const Tensor &frames_tensor = context->input(1);
+    OP_REQUIRES(
+        context, TensorShapeUtils::IsVector(frames_tensor.shape()),
+        errors::InvalidArgument("frames must be a vector, but had shape: ",
+                                frames_tensor.shape().DebugString()));
+    const Tensor &window_tensor = context->input(2);
+    OP_REQUIRES(
+        context,
+        (window_tensor.NumElements() == 0 || window_tensor.NumElements() == 2),
+        errors::InvalidArgument("window must be empty or [center, width], "
+                                "but had shape: ",
+                                window_tensor.shape().DebugString()));
+
+    const int64 batch = contents_tensor.NumElements();
+    std::vector<int64> frames(
+        frames_tensor.flat<int64>().data(),
+        frames_tensor.flat<int64>().data() + frames_tensor.NumElements());
+    for (int64 frame : frames) {
+      OP_REQUIRES(context, frame >= 0,
+                  errors::InvalidArgument("invalid frame index: ", frame));
     }
-    uint32 number = 0;
-    if (!absl::numbers_internal::safe_strtou32_base(number_views[0], &number,
-                                                    0)) {
-      return errors::InvalidArgument(
-          "group number should be an integer, received ", number_views[0]);
+    const bool windowed = (window_tensor.NumElements() == 2);
+    const double window_center =
+        windowed ? window_tensor.flat<double>()(0) : 0.0;
+    const double window_width =
+        windowed ? window_tensor.flat<double>()(1) : 0.0;
+    OP_REQUIRES(context, !windowed || window_width >= 1.0,
+                errors::InvalidArgument("window width must be >= 1, got ",
+                                        window_width));
+
+    // Decode in parallel, keeping the decoded images until the output shape
+    // is known.
+    std::vector<std::unique_ptr<DicomImage>> images(batch);
+    std::vector<unsigned long> starts(batch, 0);
+    std::vector<Status> statuses(batch);
+    auto decode = [&](int64 start, int64 limit) {
+      for (int64 i = start; i < limit; i++) {
+        statuses[i] =
+            DecodeImage(contents_tensor.flat<tstring>()(i), frames, windowed,
+                        window_center, window_width, &images[i], &starts[i]);
+      }
+    };
+    const DeviceBase::CpuWorkerThreads &worker_threads =
+        *context->device()->tensorflow_cpu_worker_threads();
+    Shard(worker_threads.num_threads, worker_threads.workers, batch, 100000000,
+          decode);
+
+    // The first decoded image determines the shape of the batch.
+    int64 frame_count = -1, height = 0, width = 0, channels = 0;
+    for (int64 i = 0; i < batch; i++) {
+      if (!statuses[i].ok()) {
+        continue;
+      }
+      const DicomImage &image = *images[i];
+      const int64 count = frames.size() != 0
+                              ? static_cast<int64>(frames.size())
+                              : static_cast<int64>(image.getFrameCount());
+      const int64 c = image.isMonochrome() ? 1 : 3;
+      if (frame_count < 0) {
+        frame_count = count;
+        height = image.getHeight();
+        width = image.getWidth();
+        channels = c;
+      } else if (count != frame_count || image.getHeight() != height ||
+                 image.getWidth() != width || c != channels) {
+        statuses[i] = errors::InvalidArgument(
+            "shape of image ", i, " [", count, ", ", image.getHeight(), ", ",
+            image.getWidth(), ", ", c, "] does not match [", frame_count, ", ",
+            height, ", ", width, ", ", channels, "]");
+      }
     }
-    if (number > std::numeric_limits<short>::max()) {
-      return errors::InvalidArgument("group number should be uint16, received ",
-                                     number_views[0]);
+    for (int64 i = 0; i < batch; i++) {
+      OP_REQUIRES(context, on_error_ != "strict" || statuses[i].ok(),
+                  errors::InvalidArgument("unable to decode image ", i, ": ",
+                                          statuses[i].error_message()));
+    }
+    if (frame_count < 0) {
+      frame_count = frames.size();
     }
-    uint16 tag_group_number = number;
 
-    if (!absl::numbers_internal::safe_strtou32_base(number_views[1], &number,
-                                                    0)) {
+    Tensor *output_tensor = nullptr;
+    OP_REQUIRES_OK(
+        context,
+        context->allocate_output(
+            0, TensorShape({batch, frame_count, height, width, channels}),
+            &output_tensor));
+    const int64 frame_size = height * width * channels;
+    const int64 image_size = frame_count * frame_size;
+    dtype *output = output_tensor->flat<dtype>().data();
+
+    std::vector<Status> render_statuses(batch);
+    auto render = [&](int64 start, int64 limit) {
+      for (int64 i = start; i < limit; i++) {
+        dtype *image_output = output + i * image_size;
+        if (statuses[i].ok()) {
+          render_statuses[i] = RenderImage(
+              images[i].get(), frames, starts[i], windowed, window_center,
+              window_width, frame_count, frame_size, image_output);
+        }
+        if (!statuses[i].ok() || !render_statuses[i].ok()) {
+          std::fill_n(image_output, image_size, dtype(0));
+        }
+        images[i].reset();
+      }
+    };
+    Shard(worker_threads.num_threads, worker_threads.workers, batch,
+          image_size * 20, render);
+    for (int64 i = 0; i < batch; i++) {
+      OP_REQUIRES(context, on_error_ != "strict" || render_statuses[i].ok(),
+                  errors::InvalidArgument("unable to decode image ", i, ": ",
+                                          render_statuses[i].error_message()));
+    }
+  }
+
+ private:
+  Status DecodeImage(const tstring &content, const std::vector<int64> &frames,
+                     bool windowed, double window_center, double window_width,
+                     std::unique_ptr<DicomImage> *image, unsigned long *start) {
+    // The decoded image outlives this call and may access the pixel data
+    // later on, so it takes over the file.
+    std::unique_ptr<DcmFileFormat> dicom_file(new DcmFileFormat());
+    TF_RETURN_IF_ERROR(ReadDICOMFile(content, false, dicom_file.get()));
+
+    // Only decode the range of frames that are selected
+    unsigned long flags = CIF_DecompressCompletePixelData;
+    unsigned long count = 0;
+    if (frames.size() != 0) {
+      Sint32 number_of_frames = 1;
+      dicom_file->getDataset()->findAndGetSint32(DCM_NumberOfFrames,
+                                                 number_of_frames);
+      const int64 first = *std::min_element(frames.begin(), frames.end());
+      const int64 last = *std::max_element(frames.begin(), frames.end());
+      if (last >= number_of_frames) {
+        return errors::InvalidArgument(
+            "frame index ", last,
+            " is out of range, number of frames: ", number_of_frames);
+      }
+      flags = CIF_UsePartialAccessToPixelData;
+      *start = first;
+      count = last - first + 1;
+    }
+    try {
+      image->reset(new DicomImage(dicom_file.get(), EXS_Unknown,
+                                  flags | CIF_TakeOverExternalDataset, *start,
+                                  count));
+      dicom_file.release();
+    } catch (...) {
+      image->reset();
+    }
+    if (*image == nullptr || (*image)->getStatus() != EIS_Normal) {
       return errors::InvalidArgument(
-          "element number should be an integer, received ", number_views[1]);
+          "error loading image: ",
+          *image == nullptr ? "out of memory"
+                            : DicomImage::getString((*image)->getStatus()));
     }
-    if (number > std::numeric_limits<short>::max()) {
+    if (windowed && scale_ != "modality" && (*image)->isMonochrome()) {
+      (*image)->setWindow(window_center, window_width);
+    }
+    if (scale_ == "modality" && !(*image)->isMonochrome()) {
       return errors::InvalidArgument(
-          "element number should be uint16, received ", number_views[1]);
+          "scale 'modality' requires monochrome images");
+    }
+    return Status::OK();
+  }
+
+  Status RenderImage(DicomImage *image, const std::vector<int64> &frames,
+                     unsigned long start, bool windowed, double window_center,
+                     double window_width, int64 frame_count, int64 frame_size,
+                     dtype *output) {
+    if (scale_ == "modality") {
+      const DiPixel *pixel = image->getInterData();
+      if (pixel == nullptr || pixel->getData() == nullptr) {
+        return errors::InvalidArgument("no modality data available");
+      }
+      const double lower =
+          windowed ? window_center - 0.5 - (window_width - 1.0) / 2.0
+                   : -std::numeric_limits<double>::infinity();
+      const double upper =
+          windowed ? window_center - 0.5 + (window_width - 1.0) / 2.0
+                   : std::numeric_limits<double>::infinity();
+      for (int64 f = 0; f < frame_count; f++) {
+        const int64 frame = frames.size() != 0 ? frames[f] - start : f;
+        const void *data = pixel->getData();
+        dtype *frame_output = output + f * frame_size;
+        switch (pixel->getRepresentation()) {
+#define DICOM_MODALITY_CASE(representation, T)                                \
+  case representation:                                                        \
+    ConvertDICOMModality<T, dtype>(                                           \
+        static_cast<const T *>(data) + frame * frame_size, frame_size, lower, \
+        upper, frame_output);                                                 \
+    break;
+          DICOM_MODALITY_CASE(EPR_Uint8, Uint8)
+          DICOM_MODALITY_CASE(EPR_Sint8, Sint8)
+          DICOM_MODALITY_CASE(EPR_Uint16, Uint16)
+          DICOM_MODALITY_CASE(EPR_Sint16, Sint16)
+          DICOM_MODALITY_CASE(EPR_Uint32, Uint32)
+          DICOM_MODALITY_CASE(EPR_Sint32, Sint32)
+#undef DICOM_MODALITY_CASE
+          default:
+            return errors::InvalidArgument(
+                "unsupported modality data representation: ",
+                pixel->getRepresentation());
+        }
+      }
+      return Status::OK();
     }
-    uint16 tag_element_number = number;
 
-    *tag = DcmTag(tag_group_number, tag_element_number);
+    const bool auto_scale = (scale_ == "auto");
+    const unsigned int n_bits = image->getDepth();
+    for (int64 f = 0; f < frame_count; f++) {
+      const int64 frame = frames.size() != 0 ? frames[f] - start : f;
+      const void *data = image->getOutputData(n_bits, frame);
+      if (data == nullptr) {
+        return errors::InvalidArgument("unable to render frame ", frame);
+      }
+      dtype *frame_output = output + f * frame_size;
+      if (n_bits <= 8) {
+        ConvertDICOMOutput<Uint8, dtype>(data, frame_size, n_bits, auto_scale,
+                                         frame_output);
+      } else if (n_bits <= 16) {
+        ConvertDICOMOutput<Uint16, dtype>(data, frame_size, n_bits, auto_scale,
+                                          frame_output);
+      } else {
+        ConvertDICOMOutput<Uint32, dtype>(data, frame_size, n_bits, auto_scale,
+                                          frame_output);
+      }
+    }
     return Status::OK();
   }
+
+  string on_error_;
+  string scale_;
+};
+
+// Extracts the geometry and value transforms of a batch of DICOM files,
+// without reading or decoding the pixel data.
+class DecodeDICOMInfoOp : public OpKernel {
+ public:
+  explicit DecodeDICOMInfoOp(OpKernelConstruction *context)
+      : OpKernel(context) {}
+
+  void Compute(OpKernelContext *context) override {
+    const Tensor &contents_tensor = context->input(0);
+    OP_REQUIRES(
+        context, TensorShapeUtils::IsVector(contents_tensor.shape()),
+        errors::InvalidArgument("contents must be a vector, but had shape: ",
+                                contents_tensor.shape().DebugString()));
+    const int64 batch = contents_tensor.NumElements();
+
+    Tensor *shape_tensor = nullptr;
+    OP_REQUIRES_OK(context, context->allocate_output(0, TensorShape({batch, 4}),
+                                                     &shape_tensor));
+    Tensor *bits_tensor = nullptr;
+    OP_REQUIRES_OK(context, context->allocate_output(1, TensorShape({batch}),
+                                                     &bits_tensor));
+    Tensor *rescale_tensor = nullptr;
+    OP_REQUIRES_OK(context, context->allocate_output(2, TensorShape({batch, 2}),
+                                                     &rescale_tensor));
+    Tensor *window_tensor = nullptr;
+    OP_REQUIRES_OK(context, context->allocate_output(3, TensorShape({batch, 2}),
+                                                     &window_tensor));
+    auto shape = shape_tensor->matrix<int64>();
+    auto bits = bits_tensor->vec<int64>();
+    auto rescale = rescale_tensor->matrix<double>();
+    auto window = window_tensor->matrix<double>();
+
+    std::vector<Status> statuses(batch);
+    auto work = [&](int64 start, int64 limit) {
+      for (int64 i = start; i < limit; i++) {
+        DcmFileFormat dicom_file;
+        statuses[i] = ReadDICOMFile(contents_tensor.flat<tstring>()(i), true,
+                                    &dicom_file);
+        if (!statuses[i].ok()) {
+          continue;
+        }
+        DcmDataset *dataset = dicom_file.getDataset();
+        Sint32 number_of_frames = 1;
+        Uint16 rows = 0, columns = 0, samples_per_pixel = 1, bits_stored = 0;
+        Float64 slope = 1.0, intercept = 0.0, center = 0.0, width = 0.0;
+        dataset->findAndGetSint32(DCM_NumberOfFrames, number_of_frames);
+        dataset->findAndGetUint16(DCM_Rows, rows);
+        dataset->findAndGetUint16(DCM_Columns, columns);
+        dataset->findAndGetUint16(DCM_SamplesPerPixel, samples_per_pixel);
+        dataset->findAndGetUint16(DCM_BitsStored, bits_stored);
+        dataset->findAndGetFloat64(DCM_RescaleSlope, slope);
+        dataset->findAndGetFloat64(DCM_RescaleIntercept, intercept);
+        dataset->findAndGetFloat64(DCM_WindowCenter, center);
+        dataset->findAndGetFloat64(DCM_WindowWidth, width);
+
+        OFString photometric;
+        dataset->findAndGetOFString(DCM_PhotometricInterpretation, photometric);
+        // Palette color images are decoded to RGB
+        const int64 channels =
+            (photometric == "PALETTE COLOR") ? 3 : samples_per_pixel;
+
+        shape(i, 0) = number_of_frames;
+        shape(i, 1) = rows;
+        shape(i, 2) = columns;
+        shape(i, 3) = channels;
+        bits(i) = bits_stored;
+        rescale(i, 0) = slope;
+        rescale(i, 1) = intercept;
+        window(i, 0) = center;
+        window(i, 1) = width;
+      }
+    };
+    const DeviceBase::CpuWorkerThreads &worker_threads =
+        *context->device()->tensorflow_cpu_worker_threads();
+    Shard(worker_threads.num_threads, worker_threads.workers, batch, 100000,
+          work);
+    for (int64 i = 0; i < batch; i++) {
+      OP_REQUIRES_OK(context, statuses[i]);
+    }
+  }
 };
 
 // Register the CPU kernels.
@@ -479,8 +976,29 @@ REGISTER_DECODE_DICOM_IMAGE_CPU(double);
 
 #undef REGISTER_DECODE_DICOM_IMAGE_CPU
 
+#define REGISTER_DECODE_DICOM_IMAGE_BATCH_CPU(dtype)           \
+  REGISTER_KERNEL_BUILDER(Name("IO>DecodeDICOMImageBatch")     \
+                              .Device(DEVICE_CPU)              \
+                              .TypeConstraint<dtype>("dtype"), \
+                          DecodeDICOMImageBatchOp<dtype>);
+
+REGISTER_DECODE_DICOM_IMAGE_BATCH_CPU(uint8);
+REGISTER_DECODE_DICOM_IMAGE_BATCH_CPU(uint16);
+REGISTER_DECODE_DICOM_IMAGE_BATCH_CPU(uint32);
+REGISTER_DECODE_DICOM_IMAGE_BATCH_CPU(int16);
+REGISTER_DECODE_DICOM_IMAGE_BATCH_CPU(int32);
+REGISTER_DECODE_DICOM_IMAGE_BATCH_CPU(float);
+REGISTER_DECODE_DICOM_IMAGE_BATCH_CPU(Eigen::half);
+REGISTER_DECODE_DICOM_IMAGE_BATCH_CPU(double);
+
+#undef REGISTER_DECODE_DICOM_IMAGE_BATCH_CPU
+
 REGISTER_KERNEL_BUILDER(Name("IO>DecodeDICOMData").Device(DEVICE_CPU),
                         DecodeDICOMDataOp);
+REGISTER_KERNEL_BUILDER(Name("IO>DecodeDICOMDataBatch").Device(DEVICE_CPU),
+                        DecodeDICOMDataBatchOp);
+REGISTER_KERNEL_BUILDER(Name("IO>DecodeDICOMInfo").Device(DEVICE_CPU),
+                        DecodeDICOMInfoOp);
 
 }  // namespace
 }  // namespace io
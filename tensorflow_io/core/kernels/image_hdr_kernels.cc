@@ -15,12 +15,83 @@ limitations under the License.
 
 #include "tensorflow/core/framework/op_kernel.h"
 #include "tensorflow/core/lib/io/buffered_inputstream.h"
+#include "tensorflow_io/core/kernels/image_kernels.h"
 #include "tensorflow_io/core/kernels/io_stream.h"
 #define STB_IMAGE_IMPLEMENTATION
 #include "stb_image.h"
 
 namespace tensorflow {
 namespace io {
+
+Status DecodeHDRImage(const tstring& input,
+                      const ImageAllocateFunc& allocate_func) {
+  if (!stbi_is_hdr_from_memory((const unsigned char*)input.data(),
+                               input.size())) {
+    return errors::InvalidArgument("not a hdr file");
+  }
+
+  std::unique_ptr<float, void (*)(float*)> data(nullptr, [](float* p) {
+    if (p != nullptr) {
+      stbi_image_free(p);
+    }
+  });
+
+  int desired_channels = 3;
+  int x, y, channels_in_file;
+  data.reset(stbi_loadf_from_memory((const unsigned char*)input.data(),
+                                    input.size(), &x, &y, &channels_in_file,
+                                    desired_channels));
+
+  if (data.get() == nullptr) {
+    return errors::InvalidArgument("unable to open as a hdr file");
+  }
+  if (x == 0 || y == 0 || channels_in_file != 3) {
+    return errors::InvalidArgument("invalid shape: (", x, ", ", y, ", ",
+                                   channels_in_file, ")");
+  }
+
+  int64 channels = static_cast<int64>(channels_in_file);
+  int64 height = static_cast<int64>(y);
+  int64 width = static_cast<int64>(x);
+
+  Tensor* image_tensor = nullptr;
+  TF_RETURN_IF_ERROR(allocate_func(
+      DT_FLOAT, TensorShape({height, width, channels}), &image_tensor));
+
+  // Check padding?
+  memcpy(image_tensor->flat<float>().data(), data.get(),
+         height * width * channels * sizeof(float));
+  return Status::OK();
+}
+
+Status DecodeSTBImage(const tstring& input,
+                      const ImageAllocateFunc& allocate_func) {
+  std::unique_ptr<stbi_uc, void (*)(stbi_uc*)> data(nullptr, [](stbi_uc* p) {
+    if (p != nullptr) {
+      stbi_image_free(p);
+    }
+  });
+
+  int x, y, channels_in_file;
+  data.reset(stbi_load_from_memory((const unsigned char*)input.data(),
+                                   input.size(), &x, &y, &channels_in_file, 0));
+  if (data.get() == nullptr) {
+    return errors::InvalidArgument("unable to decode image: ",
+                                   stbi_failure_reason());
+  }
+
+  int64 channels = static_cast<int64>(channels_in_file);
+  int64 height = static_cast<int64>(y);
+  int64 width = static_cast<int64>(x);
+
+  Tensor* image_tensor = nullptr;
+  TF_RETURN_IF_ERROR(allocate_func(
+      DT_UINT8, TensorShape({height, width, channels}), &image_tensor));
+  memcpy(image_tensor->flat<uint8>().data(), data.get(),
+         height * width * channels);
+  return Status::OK();
+}
+
 namespace {
 
 class DecodeHDROp : public OpKernel {
@@ -33,43 +104,13 @@ class DecodeHDROp : public OpKernel {
     const Tensor* input_tensor;
     OP_REQUIRES_OK(context, context->input("input", &input_tensor));
 
-    string input = input_tensor->scalar<tstring>()();
-    OP_REQUIRES(context,
-                stbi_is_hdr_from_memory((const unsigned char*)input.data(),
-                                        input.size()),
-                errors::InvalidArgument("not a hdr file"));
-
-    std::unique_ptr<float, void (*)(float*)> data(nullptr, [](float* p) {
-      if (p != nullptr) {
-        stbi_image_free(p);
-      }
-    });
-
-    int desired_channels = 3;
-    int x, y, channels_in_file;
-    data.reset(stbi_loadf_from_memory((const unsigned char*)input.data(),
-                                      input.size(), &x, &y, &channels_in_file,
-                                      desired_channels));
-
-    OP_REQUIRES(context, (data.get() != nullptr),
-                errors::InvalidArgument("unable to open as a hdr file"));
-    OP_REQUIRES(context, (x != 0 && y != 0 && channels_in_file == 3),
-                errors::InvalidArgument("invalid shape: (", x, ", ", y, ", ",
-                                        channels_in_file, ")"));
-
-    int64 channels = static_cast<int64>(channels_in_file);
-    int64 height = static_cast<int64>(y);
-    int64 width = static_cast<int64>(x);
-
-    Tensor* image_tensor = nullptr;
     OP_REQUIRES_OK(
-        context, context->allocate_output(
-                     0, TensorShape({height, width, channels}), &image_tensor));
-    auto image = image_tensor->shaped<float, 3>({height, width, channels});
-
-    // Check padding?
-    memcpy(image_tensor->flat<float>().data(), data.get(),
-           height * width * channels * sizeof(float));
+        context,
+        DecodeHDRImage(
+            input_tensor->scalar<tstring>()(),
+            [&](DataType dtype, const TensorShape& shape, Tensor** tensor) {
+              return context->allocate_output(0, shape, tensor);
+            }));
   }
 
  private:
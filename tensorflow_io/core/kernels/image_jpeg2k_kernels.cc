@@ -15,6 +15,7 @@ limitations under the License.
 
 #include "openjpeg.h"
 #include "tensorflow/core/framework/op_kernel.h"
+#include "tensorflow_io/core/kernels/image_kernels.h"
 
 namespace tensorflow {
 namespace io {
@@ -57,7 +58,7 @@ class OpjStreamCallback {
                                 ? (p_nb_bytes)
                                 : (p->length_ - p->offset_);
     if (l_nb_bytes > 0) {
-      memcpy(p_buffer, p->buffer_, l_nb_bytes);
+      memcpy(p_buffer, static_cast<char*>(p->buffer_) + p->offset_, l_nb_bytes);
     }
     p->offset_ += l_nb_bytes;
 
@@ -87,178 +88,193 @@ class OpjStreamCallback {
   static void OpjStreamFreeUserDataFn(void* p_user_data) {}
 };
 
-class DecodeJPEG2K : public OpKernel {
- public:
-  explicit DecodeJPEG2K(OpKernelConstruction* context) : OpKernel(context) {}
-
-  void Compute(OpKernelContext* context) override {
-    const Tensor& contents_tensor = context->input(0);
-    OP_REQUIRES(context, TensorShapeUtils::IsScalar(contents_tensor.shape()),
-                errors::InvalidArgument("contents must be scalar, got shape ",
-                                        contents_tensor.shape().DebugString()));
-    auto contents = contents_tensor.scalar<tstring>()();
-
-    OPJ_CODEC_FORMAT format = OPJ_CODEC_JP2;
-
-    std::unique_ptr<opj_image_t, void (*)(opj_image_t*)> l_image(
-        nullptr, [](opj_image_t* p) {
-          if (p != nullptr) {
-            opj_image_destroy(p);
-          }
-        });
-    std::unique_ptr<opj_codec_t, void (*)(opj_codec_t*)> l_codec(
-        opj_create_decompress(format), [](opj_codec_t* p) {
-          if (p != nullptr) {
-            opj_destroy_codec(p);
-          }
-        });
-
-    OpjMsgCallback msg;
-    opj_set_info_handler(l_codec.get(), OpjMsgCallback::InfoCallback, &msg);
-    opj_set_warning_handler(l_codec.get(), OpjMsgCallback::WarningCallback,
-                            &msg);
-    opj_set_error_handler(l_codec.get(), OpjMsgCallback::ErrorCallback, &msg);
-
-    std::unique_ptr<opj_stream_t, void (*)(opj_stream_t*)> l_stream(
-        opj_stream_default_create(OPJ_TRUE), [](opj_stream_t* p) {
-          if (p != nullptr) {
-            opj_stream_destroy(p);
-          }
-        });
-    OP_REQUIRES(context, (l_stream.get() != nullptr),
-                errors::InvalidArgument("unable to create stream"));
-
-    OpjStreamCallback data(contents.data(), contents.size());
-
-    opj_stream_set_user_data(l_stream.get(), &data,
-                             OpjStreamCallback::OpjStreamFreeUserDataFn);
-    opj_stream_set_user_data_length(l_stream.get(), contents.size());
-    opj_stream_set_read_function(l_stream.get(), OpjStreamCallback::ReadFn);
-    opj_stream_set_skip_function(l_stream.get(), OpjStreamCallback::SkipFn);
-    opj_stream_set_seek_function(l_stream.get(), OpjStreamCallback::SeekFn);
-
-    opj_dparameters_t l_param;
-    opj_set_default_decoder_parameters(&l_param);
-
-    // TODO: adjust additional parameter with:
-    // do not use layer decoding limitations
-    // l_param.cp_layer = 0;
-    // do not use resolutions reductions
-    // l_param.cp_reduce = 0;
-
-    OPJ_BOOL status;
-    status = opj_setup_decoder(l_codec.get(), &l_param);
-    OP_REQUIRES(
-        context, (status),
-        errors::InvalidArgument("unable to setup decoder: ", msg.error_));
-
-    opj_image_t* p_image = nullptr;
-    status = opj_read_header(l_stream.get(), l_codec.get(), &p_image);
-    OP_REQUIRES(context, (status),
-                errors::InvalidArgument("unable to read header: ", msg.error_));
-    l_image.reset(p_image);
-
-    OP_REQUIRES(context, ((p_image->numcomps * p_image->x1 * p_image->y1) != 0),
-                errors::InvalidArgument("invalid raw image parameters"));
-
-    int prec = 0;
-    for (int i = 0; i < p_image->numcomps; i++) {
-      if (prec == 0) {
-        prec = p_image->comps[i].prec;
-      }
-      OP_REQUIRES(
-          context, (prec == p_image->comps[i].prec),
-          errors::InvalidArgument("precision mismatch for component ", i, ": ",
-                                  prec, " vs. ", p_image->comps[i].prec));
-
-      switch (prec) {
-        case 8:
-        case 16:
-          break;
-        default:
-          OP_REQUIRES(
-              context, false,
-              errors::InvalidArgument(
-                  "only 8 and 16 bit images supported, received component ", i,
-                  " = ", prec));
+template <typename T>
+void FillJPEG2KTensor(Tensor* image_tensor, opj_image_t* p_image, int64 height,
+                      int64 width, int64 channels, long* signed_offsets) {
+  auto image = image_tensor->shaped<T, 3>({height, width, channels});
+
+  for (int64 i = 0; i < height; i++) {
+    for (int64 j = 0; j < width; j++) {
+      for (int64 k = 0; k < channels; k++) {
+        T value = p_image->comps[k].data[i * width + j];
+        value += signed_offsets[k];
+        image(i, j, k) = value;
       }
     }
+  }
+}
 
-    switch (p_image->numcomps) {
-      case 1:
-      case 3:
-      case 4:
-        break;
-      default:
-        OP_REQUIRES(
-            context, false,
-            errors::InvalidArgument("only images with 3 or 4 channels are "
-                                    "currently supported, received ",
-                                    p_image->numcomps));
-    }
+}  // namespace
+
+Status DecodeJPEG2KImage(const tstring& contents,
+                         const ImageAllocateFunc& allocate_func) {
+  OPJ_CODEC_FORMAT format = OPJ_CODEC_JP2;
+
+  std::unique_ptr<opj_image_t, void (*)(opj_image_t*)> l_image(
+      nullptr, [](opj_image_t* p) {
+        if (p != nullptr) {
+          opj_image_destroy(p);
+        }
+      });
+  std::unique_ptr<opj_codec_t, void (*)(opj_codec_t*)> l_codec(
+      opj_create_decompress(format), [](opj_codec_t* p) {
+        if (p != nullptr) {
+          opj_destroy_codec(p);
+        }
+      });
+
+  OpjMsgCallback msg;
+  opj_set_info_handler(l_codec.get(), OpjMsgCallback::InfoCallback, &msg);
+  opj_set_warning_handler(l_codec.get(), OpjMsgCallback::WarningCallback, &msg);
+  opj_set_error_handler(l_codec.get(), OpjMsgCallback::ErrorCallback, &msg);
+
+  std::unique_ptr<opj_stream_t, void (*)(opj_stream_t*)> l_stream(
+      opj_stream_default_create(OPJ_TRUE), [](opj_stream_t* p) {
+        if (p != nullptr) {
+          opj_stream_destroy(p);
+        }
+      });
+  if (l_stream.get() == nullptr) {
+    return errors::InvalidArgument("unable to create stream");
+  }
+
+  OpjStreamCallback data(const_cast<char*>(contents.data()), contents.size());
+
+  opj_stream_set_user_data(l_stream.get(), &data,
+                           OpjStreamCallback::OpjStreamFreeUserDataFn);
+  opj_stream_set_user_data_length(l_stream.get(), contents.size());
+  opj_stream_set_read_function(l_stream.get(), OpjStreamCallback::ReadFn);
+  opj_stream_set_skip_function(l_stream.get(), OpjStreamCallback::SkipFn);
+  opj_stream_set_seek_function(l_stream.get(), OpjStreamCallback::SeekFn);
+
+  opj_dparameters_t l_param;
+  opj_set_default_decoder_parameters(&l_param);
+
+  // TODO: adjust additional parameter with:
+  // do not use layer decoding limitations
+  // l_param.cp_layer = 0;
+  // do not use resolutions reductions
+  // l_param.cp_reduce = 0;
+
+  OPJ_BOOL status;
+  status = opj_setup_decoder(l_codec.get(), &l_param);
+  if (!status) {
+    return errors::InvalidArgument("unable to setup decoder: ", msg.error_);
+  }
+
+  opj_image_t* p_image = nullptr;
+  status = opj_read_header(l_stream.get(), l_codec.get(), &p_image);
+  if (!status) {
+    return errors::InvalidArgument("unable to read header: ", msg.error_);
+  }
+  l_image.reset(p_image);
 
-    OP_REQUIRES(context, (p_image->x1 != 0 && p_image->y1 != 0),
-                errors::InvalidArgument(
-                    "image grid (x1, y1) cannot be zero, received (",
-                    p_image->x1, ", ", p_image->y1, ")"));
-
-    for (int i = 0; i < p_image->numcomps; i++) {
-      OP_REQUIRES(
-          context,
-          (p_image->comps[i].w == p_image->x1) &&
-              (p_image->comps[i].h == p_image->y1),
-          errors::InvalidArgument("channel (", i, ") does not match image: ",
-                                  p_image->comps[i].h, "x", p_image->comps[i].w,
-                                  " vs. ", p_image->y1, "x", p_image->x1));
+  if ((p_image->numcomps * p_image->x1 * p_image->y1) == 0) {
+    return errors::InvalidArgument("invalid raw image parameters");
+  }
+
+  int prec = 0;
+  for (int i = 0; i < p_image->numcomps; i++) {
+    if (prec == 0) {
+      prec = p_image->comps[i].prec;
     }
-    int64 width = p_image->x1;
-    int64 height = p_image->y1;
-    int64 channels = p_image->numcomps;
-
-    long signed_offsets[4] = {0, 0, 0, 0};
-    for (int i = 0; i < p_image->numcomps; i++) {
-      if (p_image->comps[i].sgnd) {
-        signed_offsets[i] = 1 << (p_image->comps[i].prec - 1);
-      }
+    if (prec != p_image->comps[i].prec) {
+      return errors::InvalidArgument("precision mismatch for component ", i,
+                                     ": ", prec, " vs. ",
+                                     p_image->comps[i].prec);
     }
 
-    status = opj_decode(l_codec.get(), l_stream.get(), p_image);
-    OP_REQUIRES(
-        context, (status),
-        errors::InvalidArgument("unable to decode_image: ", msg.error_));
-
-    Tensor* image_tensor = nullptr;
-    OP_REQUIRES_OK(
-        context, context->allocate_output(
-                     0, TensorShape({height, width, channels}), &image_tensor));
     switch (prec) {
       case 8:
-        FillTensor<uint8>(image_tensor, p_image, height, width, channels,
-                          signed_offsets);
-        break;
       case 16:
-        FillTensor<uint16>(image_tensor, p_image, height, width, channels,
-                           signed_offsets);
         break;
+      default:
+        return errors::InvalidArgument(
+            "only 8 and 16 bit images supported, received component ", i, " = ",
+            prec);
     }
   }
 
- private:
-  template <typename T>
-  void FillTensor(Tensor* image_tensor, opj_image_t* p_image, int64 height,
-                  int64 width, int64 channels, long* signed_offsets) {
-    auto image = image_tensor->shaped<T, 3>({height, width, channels});
-
-    for (int64 i = 0; i < height; i++) {
-      for (int64 j = 0; j < width; j++) {
-        for (int64 k = 0; k < channels; k++) {
-          T value = p_image->comps[k].data[i * width + j];
-          value += signed_offsets[k];
-          image(i, j, k) = value;
-        }
-      }
+  switch (p_image->numcomps) {
+    case 1:
+    case 3:
+    case 4:
+      break;
+    default:
+      return errors::InvalidArgument(
+          "only images with 3 or 4 channels are currently supported, "
+          "received ",
+          p_image->numcomps);
+  }
+
+  for (int i = 0; i < p_image->numcomps; i++) {
+    if ((p_image->comps[i].w != p_image->x1) ||
+        (p_image->comps[i].h != p_image->y1)) {
+      return errors::InvalidArgument(
+          "channel (", i, ") does not match image: ", p_image->comps[i].h, "x",
+          p_image->comps[i].w, " vs. ", p_image->y1, "x", p_image->x1);
+    }
+  }
+  int64 width = p_image->x1;
+  int64 height = p_image->y1;
+  int64 channels = p_image->numcomps;
+
+  long signed_offsets[4] = {0, 0, 0, 0};
+  for (int i = 0; i < p_image->numcomps; i++) {
+    if (p_image->comps[i].sgnd) {
+      signed_offsets[i] = 1 << (p_image->comps[i].prec - 1);
     }
   }
+
+  status = opj_decode(l_codec.get(), l_stream.get(), p_image);
+  if (!status) {
+    return errors::InvalidArgument("unable to decode_image: ", msg.error_);
+  }
+
+  Tensor* image_tensor = nullptr;
+  TF_RETURN_IF_ERROR(allocate_func(prec == 8 ? DT_UINT8 : DT_UINT16,
+                                   TensorShape({height, width, channels}),
+                                   &image_tensor));
+  switch (prec) {
+    case 8:
+      FillJPEG2KTensor<uint8>(image_tensor, p_image, height, width, channels,
+                              signed_offsets);
+      break;
+    case 16:
+      FillJPEG2KTensor<uint16>(image_tensor, p_image, height, width, channels,
+                               signed_offsets);
+      break;
+  }
+  return Status::OK();
+}
+
+namespace {
+
+class DecodeJPEG2K : public OpKernel {
+ public:
+  explicit DecodeJPEG2K(OpKernelConstruction* context) : OpKernel(context) {}
+
+  void Compute(OpKernelContext* context) override {
+    const Tensor& contents_tensor = context->input(0);
+    OP_REQUIRES(context, TensorShapeUtils::IsScalar(contents_tensor.shape()),
+                errors::InvalidArgument("contents must be scalar, got shape ",
+                                        contents_tensor.shape().DebugString()));
+    auto contents = contents_tensor.scalar<tstring>()();
+
+    OP_REQUIRES_OK(
+        context, DecodeJPEG2KImage(
+                     contents,
+                     [&](DataType dtype, const TensorShape& shape,
+                         Tensor** tensor) -> Status {
+                       if (dtype != context->expected_output_dtype(0)) {
+                         return errors::InvalidArgument(
+                             "image of ", DataTypeString(dtype),
+                             " can not be decoded as ",
+                             DataTypeString(context->expected_output_dtype(0)));
+                       }
+                       return context->allocate_output(0, shape, tensor);
+                     }));
+  }
 };
 REGISTER_KERNEL_BUILDER(Name("IO>DecodeJPEG2K").Device(DEVICE_CPU),
                         DecodeJPEG2K);
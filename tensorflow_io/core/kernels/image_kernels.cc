@@ -0,0 +1,326 @@
+/* Copyright 2021 The TensorFlow Authors. All Rights Reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+==============================================================================*/
+
+#include "tensorflow_io/core/kernels/image_kernels.h"
+
+#include <algorithm>
+#include <cctype>
+#include <cmath>
+
+#include "tensorflow/core/util/work_sharder.h"
+
+namespace tensorflow {
+namespace io {
+namespace {
+
+// Sniffs the format of an encoded image from its leading bytes, and decodes
+// it with the decoder of the format.
+Status DecodeImage(const tstring& contents,
+                   const ImageAllocateFunc& allocate_func) {
+  absl::string_view data(contents.data(), contents.size());
+  auto match = [&](size_t offset, absl::string_view magic) {
+    return data.size() >= offset + magic.size() &&
+           data.substr(offset, magic.size()) == magic;
+  };
+  if (match(0, "RIFF") && match(8, "WEBP")) {
+    return DecodeWebPImage(contents, allocate_func);
+  }
+  if (match(4, "ftyp") && (match(8, "avif") || match(8, "avis"))) {
+    return DecodeAVIFImage(contents, allocate_func);
+  }
+  if (match(0, absl::string_view("\x00\x00\x00\x0CjP  \r\n\x87\n", 12))) {
+    return DecodeJPEG2KImage(contents, allocate_func);
+  }
+  if (match(0, "#?RADIANCE") || match(0, "#?RGBE")) {
+    return DecodeHDRImage(contents, allocate_func);
+  }
+  if (match(0, "\x76\x2F\x31\x01")) {
+    return DecodeEXRImage(contents, allocate_func);
+  }
+  if (match(0, absl::string_view("II*\0", 4)) ||
+      match(0, absl::string_view("MM\0*", 4))) {
+    return DecodeTIFFImage(contents, 0, allocate_func);
+  }
+  if (data.size() >= 3 && data[0] == 'P' &&
+      (data[1] == '2' || data[1] == '3' || data[1] == '5' || data[1] == '6') &&
+      isspace(data[2])) {
+    return DecodePNMImage(contents, DT_INVALID, allocate_func);
+  }
+  if (match(0, "\x89PNG") || match(0, "\xFF\xD8\xFF") || match(0, "GIF8") ||
+      match(0, "BM")) {
+    return DecodeSTBImage(contents, allocate_func);
+  }
+  return errors::InvalidArgument("unknown image format");
+}
+
+inline float ImageSampleToFloat(uint8 value) { return value / 255.0f; }
+inline float ImageSampleToFloat(uint16 value) { return value / 65535.0f; }
+inline float ImageSampleToFloat(float value) { return value; }
+
+template <typename dtype>
+dtype ImageSampleFromFloat(float value);
+template <>
+uint8 ImageSampleFromFloat<uint8>(float value) {
+  return static_cast<uint8>(
+      std::round(std::min(std::max(value, 0.0f), 1.0f) * 255.0f));
+}
+template <>
+uint16 ImageSampleFromFloat<uint16>(float value) {
+  return static_cast<uint16>(
+      std::round(std::min(std::max(value, 0.0f), 1.0f) * 65535.0f));
+}
+template <>
+float ImageSampleFromFloat<float>(float value) {
+  return value;
+}
+
+// Converts a decoded [height, width, channels_in] image to interleaved float
+// samples with `channels` channels: gray (luma of RGB), RGB or RGBA.
+template <typename T>
+void ConvertImageChannels(const Tensor& image, int64 channels,
+                          std::vector<float>* output) {
+  const int64 channels_in = image.dim_size(2);
+  const int64 pixels = image.dim_size(0) * image.dim_size(1);
+  const T* data = image.flat<T>().data();
+  output->resize(pixels * channels);
+  for (int64 i = 0; i < pixels; i++) {
+    const T* p = data + i * channels_in;
+    float r, g, b, a = 1.0f;
+    if (channels_in <= 2) {
+      r = g = b = ImageSampleToFloat(p[0]);
+      if (channels_in == 2) {
+        a = ImageSampleToFloat(p[1]);
+      }
+    } else {
+      r = ImageSampleToFloat(p[0]);
+      g = ImageSampleToFloat(p[1]);
+      b = ImageSampleToFloat(p[2]);
+      if (channels_in == 4) {
+        a = ImageSampleToFloat(p[3]);
+      }
+    }
+    float* q = output->data() + i * channels;
+    if (channels == 1) {
+      q[0] = 0.2989f * r + 0.5870f * g + 0.1140f * b;
+    } else {
+      q[0] = r;
+      q[1] = g;
+      q[2] = b;
+      if (channels == 4) {
+        q[3] = a;
+      }
+    }
+  }
+}
+
+// Bilinear sampling positions along one dimension, with half pixel centers
+// as in tf.image.resize.
+void ComputeResizeWeights(int64 in_size, int64 out_size,
+                          std::vector<int64>* lower, std::vector<int64>* upper,
+                          std::vector<float>* weight) {
+  const float scale = static_cast<float>(in_size) / out_size;
+  lower->resize(out_size);
+  upper->resize(out_size);
+  weight->resize(out_size);
+  for (int64 i = 0; i < out_size; i++) {
+    const float position = std::min(std::max((i + 0.5f) * scale - 0.5f, 0.0f),
+                                    static_cast<float>(in_size - 1));
+    (*lower)[i] = static_cast<int64>(std::floor(position));
+    (*upper)[i] = std::min((*lower)[i] + 1, in_size - 1);
+    (*weight)[i] = position - (*lower)[i];
+  }
+}
+
+// Decodes a batch of encoded images of mixed formats in parallel into a
+// dense [batch, height, width, channels] tensor. Images are resized to `size`
+// if provided, otherwise all images must have the shape of the first decoded
+// image. Images that can not be decoded (or do not match the shape) are
+// zeros, with a false status.
+template <typename dtype>
+class DecodeImageBatchOp : public OpKernel {
+ public:
+  explicit DecodeImageBatchOp(OpKernelConstruction* context)
+      : OpKernel(context) {
+    OP_REQUIRES_OK(context, context->GetAttr("channels", &channels_));
+    OP_REQUIRES(
+        context, (channels_ == 1 || channels_ == 3 || channels_ == 4),
+        errors::InvalidArgument("channels must be 1, 3 or 4, got ", channels_));
+  }
+
+  void Compute(OpKernelContext* context) override {
+    const Tensor& contents_tensor = context->input(0);
+    OP_REQUIRES(
+        context, TensorShapeUtils::IsVector(contents_tensor.shape()),
+        errors::InvalidArgument("contents must be a vector, but had shape: ",
+                                contents_tensor.shape().DebugString()));
+    const Tensor& size_tensor = context->input(1);
+    OP_REQUIRES(
+        context,
+        (size_tensor.NumElements() == 0 || size_tensor.NumElements() == 2),
+        errors::InvalidArgument("size must be empty or [height, width], "
+                                "but had shape: ",
+                                size_tensor.shape().DebugString()));
+    const bool resize = (size_tensor.NumElements() == 2);
+    if (resize) {
+      OP_REQUIRES(context,
+                  (size_tensor.flat<int64>()(0) > 0 &&
+                   size_tensor.flat<int64>()(1) > 0),
+                  errors::InvalidArgument("size must be positive"));
+    }
+
+    const int64 batch = contents_tensor.NumElements();
+    std::vector<Tensor> images(batch);
+    std::vector<Status> statuses(batch);
+    auto decode = [&](int64 start, int64 limit) {
+      for (int64 i = start; i < limit; i++) {
+        statuses[i] = DecodeImage(
+            contents_tensor.flat<tstring>()(i),
+            [&](DataType dtype, const TensorShape& shape, Tensor** tensor) {
+              images[i] = Tensor(dtype, shape);
+              *tensor = &images[i];
+              return Status::OK();
+            });
+      }
+    };
+    const DeviceBase::CpuWorkerThreads& worker_threads =
+        *context->device()->tensorflow_cpu_worker_threads();
+    Shard(worker_threads.num_threads, worker_threads.workers, batch, 10000000,
+          decode);
+
+    int64 height = 0, width = 0;
+    if (resize) {
+      height = size_tensor.flat<int64>()(0);
+      width = size_tensor.flat<int64>()(1);
+    } else {
+      // The first decoded image determines the shape of the batch.
+      bool found = false;
+      for (int64 i = 0; i < batch; i++) {
+        if (!statuses[i].ok()) {
+          continue;
+        }
+        if (!found) {
+          height = images[i].dim_size(0);
+          width = images[i].dim_size(1);
+          found = true;
+        } else if (images[i].dim_size(0) != height ||
+                   images[i].dim_size(1) != width) {
+          statuses[i] = errors::InvalidArgument("image shape mismatch");
+        }
+      }
+    }
+
+    Tensor* image_tensor = nullptr;
+    OP_REQUIRES_OK(
+        context,
+        context->allocate_output(
+            0, TensorShape({batch, height, width, channels_}), &image_tensor));
+    Tensor* status_tensor = nullptr;
+    OP_REQUIRES_OK(context, context->allocate_output(1, TensorShape({batch}),
+                                                     &status_tensor));
+    const int64 image_size = height * width * channels_;
+    dtype* output = image_tensor->flat<dtype>().data();
+
+    auto convert = [&](int64 start, int64 limit) {
+      for (int64 i = start; i < limit; i++) {
+        dtype* image_output = output + i * image_size;
+        if (statuses[i].ok()) {
+          statuses[i] = ConvertImage(images[i], height, width, image_output);
+        }
+        if (!statuses[i].ok()) {
+          VLOG(1) << "unable to decode image " << i << ": " << statuses[i];
+          std::fill_n(image_output, image_size, dtype(0));
+        }
+        status_tensor->flat<bool>()(i) = statuses[i].ok();
+        images[i] = Tensor();
+      }
+    };
+    Shard(worker_threads.num_threads, worker_threads.workers, batch,
+          image_size * 20, convert);
+  }
+
+ private:
+  Status ConvertImage(const Tensor& image, int64 height, int64 width,
+                      dtype* output) {
+    std::vector<float> samples;
+    switch (image.dtype()) {
+      case DT_UINT8:
+        ConvertImageChannels<uint8>(image, channels_, &samples);
+        break;
+      case DT_UINT16:
+        ConvertImageChannels<uint16>(image, channels_, &samples);
+        break;
+      case DT_FLOAT:
+        ConvertImageChannels<float>(image, channels_, &samples);
+        break;
+      default:
+        return errors::InvalidArgument("unsupported image data type: ",
+                                       DataTypeString(image.dtype()));
+    }
+
+    const int64 in_height = image.dim_size(0);
+    const int64 in_width = image.dim_size(1);
+    if (in_height == height && in_width == width) {
+      for (size_t i = 0; i < samples.size(); i++) {
+        output[i] = ImageSampleFromFloat<dtype>(samples[i]);
+      }
+      return Status::OK();
+    }
+    if (in_height == 0 || in_width == 0) {
+      return errors::InvalidArgument("empty image");
+    }
+
+    std::vector<int64> y0, y1, x0, x1;
+    std::vector<float> wy, wx;
+    ComputeResizeWeights(in_height, height, &y0, &y1, &wy);
+    ComputeResizeWeights(in_width, width, &x0, &x1, &wx);
+    const int64 channels = channels_;
+    for (int64 y = 0; y < height; y++) {
+      const float* top = samples.data() + y0[y] * in_width * channels;
+      const float* bottom = samples.data() + y1[y] * in_width * channels;
+      for (int64 x = 0; x < width; x++) {
+        for (int64 c = 0; c < channels; c++) {
+          const float t =
+              top[x0[x] * channels + c] +
+              (top[x1[x] * channels + c] - top[x0[x] * channels + c]) * wx[x];
+          const float b =
+              bottom[x0[x] * channels + c] +
+              (bottom[x1[x] * channels + c] - bottom[x0[x] * channels + c]) *
+                  wx[x];
+          output[(y * width + x) * channels + c] =
+              ImageSampleFromFloat<dtype>(t + (b - t) * wy[y]);
+        }
+      }
+    }
+    return Status::OK();
+  }
+
+  int64 channels_;
+};
+
+#define REGISTER_DECODE_IMAGE_BATCH_CPU(dtype)                 \
+  REGISTER_KERNEL_BUILDER(Name("IO>DecodeImageBatch")          \
+                              .Device(DEVICE_CPU)              \
+                              .TypeConstraint<dtype>("dtype"), \
+                          DecodeImageBatchOp<dtype>);
+
+REGISTER_DECODE_IMAGE_BATCH_CPU(uint8);
+REGISTER_DECODE_IMAGE_BATCH_CPU(uint16);
+REGISTER_DECODE_IMAGE_BATCH_CPU(float);
+
+#undef REGISTER_DECODE_IMAGE_BATCH_CPU
+
+}  // namespace
+}  // namespace io
+}  // namespace tensorflow
@@ -0,0 +1,63 @@
+/* Copyright 2021 The TensorFlow Authors. All Rights Reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+==============================================================================*/
+
+#ifndef TENSORFLOW_IO_CORE_KERNELS_IMAGE_KERNELS_H_
+#define TENSORFLOW_IO_CORE_KERNELS_IMAGE_KERNELS_H_
+
+#include "tensorflow/core/framework/op_kernel.h"
+
+namespace tensorflow {
+namespace io {
+
+// Allocates the [height, width, channels] tensor of a decoded image. The
+// dtype is the native type of the image as decoded.
+typedef std::function<Status(DataType dtype, const TensorShape& shape,
+                             Tensor** tensor)>
+    ImageAllocateFunc;
+
+// Format specific decoders, shared by the per-format decode ops and the
+// batched decode op. Each decodes an image from memory into a tensor
+// allocated through allocate_func.
+
+// RGBA, uint8.
+Status DecodeWebPImage(const tstring& contents,
+                       const ImageAllocateFunc& allocate_func);
+// RGB, uint8.
+Status DecodeAVIFImage(const tstring& contents,
+                       const ImageAllocateFunc& allocate_func);
+// 1, 3 or 4 channels, uint8 or uint16 depending on the precision.
+Status DecodeJPEG2KImage(const tstring& contents,
+                         const ImageAllocateFunc& allocate_func);
+// 1 or 3 channels, in dtype (uint8 or uint16), or in the native type of the
+// file if dtype is DT_INVALID.
+Status DecodePNMImage(const tstring& contents, DataType dtype,
+                      const ImageAllocateFunc& allocate_func);
+// RGB, float.
+Status DecodeHDRImage(const tstring& contents,
+                      const ImageAllocateFunc& allocate_func);
+// PNG, JPEG, GIF (first frame) and BMP, with the channels of the file, uint8.
+Status DecodeSTBImage(const tstring& contents,
+                      const ImageAllocateFunc& allocate_func);
+// The Y or R, G, B (and A) channels of the first part, float.
+Status DecodeEXRImage(const tstring& contents,
+                      const ImageAllocateFunc& allocate_func);
+// The directory index as RGBA, uint8.
+Status DecodeTIFFImage(const tstring& contents, int64 index,
+                       const ImageAllocateFunc& allocate_func);
+
+}  // namespace io
+}  // namespace tensorflow
+
+#endif  // TENSORFLOW_IO_CORE_KERNELS_IMAGE_KERNELS_H_
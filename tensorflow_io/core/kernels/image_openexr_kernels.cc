@@ -18,6 +18,7 @@ limitations under the License.
 #include <ImfMultiPartInputFile.h>
 
 #include "tensorflow/core/framework/op_kernel.h"
+#include "tensorflow_io/core/kernels/image_kernels.h"
 #include "tensorflow_io/core/kernels/io_stream.h"
 
 namespace tensorflow {
@@ -264,4 +265,64 @@ REGISTER_KERNEL_BUILDER(Name("IO>DecodeExr").Device(DEVICE_CPU), DecodeEXROp);
 
 }  // namespace
 }  // namespace data
+
+namespace io {
+
+Status DecodeEXRImage(const tstring& contents,
+                      const ImageAllocateFunc& allocate_func) {
+  const string filename = "memory";
+  std::unique_ptr<data::SizedRandomAccessFile> file(
+      new data::SizedRandomAccessFile(Env::Default(), filename, contents.data(),
+                                      contents.size()));
+  uint64 size;
+  TF_RETURN_IF_ERROR(file->GetFileSize(&size));
+
+  try {
+    data::OpenEXRIStream stream(filename, file.get(), size);
+    Imf::MultiPartInputFile input_file(stream);
+    Imf::InputPart input_part(input_file, 0);
+
+    const Imf::ChannelList& channel_list = input_part.header().channels();
+    std::vector<string> channels;
+    if (channel_list.findChannel("R") != nullptr &&
+        channel_list.findChannel("G") != nullptr &&
+        channel_list.findChannel("B") != nullptr) {
+      channels = {"R", "G", "B"};
+      if (channel_list.findChannel("A") != nullptr) {
+        channels.push_back("A");
+      }
+    } else if (channel_list.findChannel("Y") != nullptr) {
+      channels = {"Y"};
+    } else {
+      return errors::InvalidArgument("no RGB or Y channels in EXR image");
+    }
+
+    Imath::Box2i dw = input_part.header().dataWindow();
+    int64 height = dw.max.y - dw.min.y + 1;
+    int64 width = dw.max.x - dw.min.x + 1;
+    int64 count = channels.size();
+
+    Tensor* image_tensor = nullptr;
+    TF_RETURN_IF_ERROR(allocate_func(
+        DT_FLOAT, TensorShape({height, width, count}), &image_tensor));
+
+    // Interleave the channels, converted to float, directly into the tensor
+    float* data = image_tensor->flat<float>().data();
+    Imf::FrameBuffer frame_buffer;
+    for (int64 i = 0; i < count; i++) {
+      char* base = reinterpret_cast<char*>(
+          data + i - (dw.min.y * width + dw.min.x) * count);
+      frame_buffer.insert(channels[i],
+                          Imf::Slice(Imf::FLOAT, base, sizeof(float) * count,
+                                     sizeof(float) * count * width));
+    }
+    input_part.setFrameBuffer(frame_buffer);
+    input_part.readPixels(dw.min.y, dw.max.y);
+  } catch (const std::exception& e) {
+    return errors::InvalidArgument("unable to decode EXR image: ", e.what());
+  }
+  return Status::OK();
+}
+
+}  // namespace io
 }  // namespace tensorflow
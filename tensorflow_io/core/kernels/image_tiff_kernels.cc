@@ -16,10 +16,15 @@ limitations under the License.
 #include <tiffio.h>
 #include <xtiffio.h>
 
+#include <list>
 #include <tiffio.hxx>
+#include <unordered_map>
 
 #include "geotiff.h"
 #include "tensorflow/core/framework/op_kernel.h"
+#include "tensorflow_io/core/kernels/image_kernels.h"
+#include "tensorflow_io/core/kernels/io_interface.h"
+#include "tensorflow_io/core/kernels/io_stream.h"
 
 // Repackge XTIFFStreamOpen from TIFFStreamOpen in libtiff/tif_stream.cxx
 extern "C" {
@@ -278,6 +283,52 @@ TIFF* XTIFFStreamOpen(const char* name, std::istream* is) {
 }
 }
 namespace tensorflow {
+namespace io {
+
+Status DecodeTIFFImage(const tstring& contents, int64 index,
+                       const ImageAllocateFunc& allocate_func) {
+  // TODO (yongtang): Set channels = 4 for now.
+  const int64 channels = 4;
+
+  std::istringstream input_stream(contents,
+                                  std::ios_base::in | std::ios_base::binary);
+
+  std::unique_ptr<TIFF, void (*)(TIFF*)> tiff(
+      XTIFFStreamOpen("memory", &input_stream), [](TIFF* p) {
+        if (p != nullptr) {
+          XTIFFClose(p);
+        }
+      });
+  if (tiff.get() == nullptr) {
+    return errors::InvalidArgument("unable to open TIFF from memory");
+  }
+
+  int status = TIFFSetDirectory(tiff.get(), index);
+  if (!status) {
+    return errors::InvalidArgument("unable to set TIFF directory to ", index);
+  }
+  unsigned int height, width;
+  TIFFGetField(tiff.get(), TIFFTAG_IMAGELENGTH, &height);
+  TIFFGetField(tiff.get(), TIFFTAG_IMAGEWIDTH, &width);
+
+  Tensor* image_tensor = nullptr;
+  TF_RETURN_IF_ERROR(
+      allocate_func(DT_UINT8,
+                    TensorShape({static_cast<int64>(height),
+                                 static_cast<int64>(width), channels}),
+                    &image_tensor));
+
+  uint32* raster =
+      reinterpret_cast<uint32*>(image_tensor->flat<uint8>().data());
+  if (!TIFFReadRGBAImageOriented(tiff.get(), width, height, raster,
+                                 ORIENTATION_TOPLEFT, 0)) {
+    return errors::InvalidArgument("unable to read directory: ", index);
+  }
+  return Status::OK();
+}
+
+}  // namespace io
+
 namespace data {
 namespace {
 
@@ -403,50 +454,591 @@ class DecodeTIFFOp : public OpKernel {
     const Tensor* index_tensor;
     OP_REQUIRES_OK(context, context->input("index", &index_tensor));
 
-    std::istringstream input_stream(input_tensor->scalar<tstring>()(),
-                                    std::ios_base::in | std::ios_base::binary);
+    OP_REQUIRES_OK(
+        context,
+        io::DecodeTIFFImage(
+            input_tensor->scalar<tstring>()(), index_tensor->scalar<int64>()(),
+            [&](DataType dtype, const TensorShape& shape, Tensor** tensor) {
+              return context->allocate_output(0, shape, tensor);
+            }));
+  }
+};
 
-    std::unique_ptr<TIFF, void (*)(TIFF*)> tiff(
-        XTIFFStreamOpen("memory", &input_stream), [](TIFF* p) {
-          if (p != nullptr) {
-            XTIFFClose(p);
+// Client procs to read TIFF through SizedRandomAccessFile, so that a file is
+// read on demand instead of being loaded into memory.
+struct TIFFFileHandle {
+  SizedRandomAccessFile* file;
+  toff_t size;
+  toff_t offset;
+};
+
+tmsize_t TIFFFileReadProc(thandle_t fd, void* buf, tmsize_t size) {
+  TIFFFileHandle* handle = reinterpret_cast<TIFFFileHandle*>(fd);
+  StringPiece result;
+  Status status = handle->file->Read(handle->offset, size, &result,
+                                     reinterpret_cast<char*>(buf));
+  if (!(status.ok() || errors::IsOutOfRange(status))) {
+    return static_cast<tmsize_t>(-1);
+  }
+  if (result.data() != buf) {
+    memcpy(buf, result.data(), result.size());
+  }
+  handle->offset += result.size();
+  return static_cast<tmsize_t>(result.size());
+}
+
+tmsize_t TIFFFileWriteProc(thandle_t, void*, tmsize_t) { return 0; }
+
+toff_t TIFFFileSeekProc(thandle_t fd, toff_t off, int whence) {
+  TIFFFileHandle* handle = reinterpret_cast<TIFFFileHandle*>(fd);
+  switch (whence) {
+    case SEEK_SET:
+      handle->offset = off;
+      break;
+    case SEEK_CUR:
+      handle->offset += off;
+      break;
+    case SEEK_END:
+      handle->offset = handle->size + off;
+      break;
+  }
+  return handle->offset;
+}
+
+int TIFFFileCloseProc(thandle_t) { return 0; }
+
+toff_t TIFFFileSizeProc(thandle_t fd) {
+  return reinterpret_cast<TIFFFileHandle*>(fd)->size;
+}
+
+int TIFFFileMapProc(thandle_t, void** base, toff_t* size) { return 0; }
+
+void TIFFFileUnmapProc(thandle_t, void* base, toff_t size) {}
+
+// Reads regions of the pages (directories) of a TIFF in the native data type
+// of the samples. Only the tiles or strips that intersect a region are
+// decoded, and decoded tiles are kept in an LRU cache of `cache_size` tiles.
+class TIFFRegionReader {
+ public:
+  TIFFRegionReader(Env* env, const string& input, const int64 cache_size)
+      : tiff_(nullptr,
+              [](TIFF* p) {
+                if (p != nullptr) {
+                  XTIFFClose(p);
+                }
+              }),
+        cache_size_(cache_size) {
+    // The input is either the content of a TIFF, or a filename
+    if (input.size() >= 4 && (memcmp(input.data(), "II*\0", 4) == 0 ||
+                              memcmp(input.data(), "MM\0*", 4) == 0 ||
+                              memcmp(input.data(), "II+\0", 4) == 0 ||
+                              memcmp(input.data(), "MM\0+", 4) == 0)) {
+      content_ = input;
+      file_.reset(new SizedRandomAccessFile(env, "memory", content_.data(),
+                                            content_.size()));
+    } else {
+      filename_ = input;
+      file_.reset(new SizedRandomAccessFile(env, filename_, nullptr, 0));
+    }
+  }
+
+  Status Open() {
+    uint64 size;
+    TF_RETURN_IF_ERROR(file_->GetFileSize(&size));
+    handle_.file = file_.get();
+    handle_.size = size;
+    handle_.offset = 0;
+    tiff_.reset(
+        XTIFFClientOpen(filename_.empty() ? "memory" : filename_.c_str(), "rm",
+                        reinterpret_cast<thandle_t>(&handle_), TIFFFileReadProc,
+                        TIFFFileWriteProc, TIFFFileSeekProc, TIFFFileCloseProc,
+                        TIFFFileSizeProc, TIFFFileMapProc, TIFFFileUnmapProc));
+    if (tiff_.get() == nullptr) {
+      return errors::InvalidArgument("unable to open TIFF: ", filename_);
+    }
+    do {
+      Page page;
+      TF_RETURN_IF_ERROR(ReadPage(&page));
+      pages_.push_back(page);
+    } while (TIFFReadDirectory(tiff_.get()));
+
+    // Pyramid levels are the tiled pages, as thumbnails and labels of whole
+    // slide images are stripped, or all pages if none is tiled
+    for (size_t i = 0; i < pages_.size(); i++) {
+      if (pages_[i].tiled) {
+        levels_.push_back(i);
+      }
+    }
+    if (levels_.empty()) {
+      for (size_t i = 0; i < pages_.size(); i++) {
+        levels_.push_back(i);
+      }
+    }
+    return Status::OK();
+  }
+
+  int64 pages() const { return pages_.size(); }
+  const std::vector<int64>& levels() const { return levels_; }
+  TensorShape shape(int64 page) const {
+    return TensorShape(
+        {pages_[page].height, pages_[page].width, pages_[page].channels});
+  }
+  DataType dtype(int64 page) const { return pages_[page].dtype; }
+
+  Status Level(const int64 level, int64* page) const {
+    if (level < 0 || level >= static_cast<int64>(levels_.size())) {
+      return errors::InvalidArgument("level ", level, " out of range [0, ",
+                                     levels_.size(), ")");
+    }
+    *page = levels_[level];
+    return Status::OK();
+  }
+
+  Status Read(const int64 page, const int64 x, const int64 y, const int64 width,
+              const int64 height,
+              std::function<Status(const TensorShape& shape, Tensor** value)>
+                  allocate_func) {
+    if (page < 0 || page >= static_cast<int64>(pages_.size())) {
+      return errors::InvalidArgument("page ", page, " out of range [0, ",
+                                     pages_.size(), ")");
+    }
+    const Page& info = pages_[page];
+    if (info.dtype == DT_INVALID) {
+      return errors::InvalidArgument("unsupported format ", info.format,
+                                     " with bits ", info.bits, " of page ",
+                                     page);
+    }
+    if (x < 0 || y < 0 || width < 0 || height < 0 || x + width > info.width ||
+        y + height > info.height) {
+      return errors::InvalidArgument("region [", x, ", ", y, ", ", width, ", ",
+                                     height, "] out of page of width ",
+                                     info.width, " and height ", info.height);
+    }
+    TF_RETURN_IF_ERROR(SetPage(page));
+
+    Tensor* value;
+    TF_RETURN_IF_ERROR(
+        allocate_func(TensorShape({height, width, info.channels}), &value));
+    if (value->dtype() != info.dtype) {
+      return errors::InvalidArgument("expected dtype ",
+                                     DataTypeString(info.dtype), ", got ",
+                                     DataTypeString(value->dtype()));
+    }
+    char* output = const_cast<char*>(value->tensor_data().data());
+
+    // Strips are blocks as wide as the page
+    const int64 block_height = info.tiled ? info.tile_height : info.rows;
+    const int64 block_width = info.tiled ? info.tile_width : info.width;
+    const int64 bytes = info.bits / 8;
+    const int64 planes = info.separate ? info.channels : 1;
+    const int64 samples = info.separate ? 1 : info.channels;
+
+    for (int64 by = (y / block_height) * block_height; by < y + height;
+         by += block_height) {
+      for (int64 bx = (x / block_width) * block_width; bx < x + width;
+           bx += block_width) {
+        for (int64 plane = 0; plane < planes; plane++) {
+          const uint8* block;
+          TF_RETURN_IF_ERROR(ReadBlock(page, bx, by, plane, &block));
+
+          const int64 x0 = std::max(x, bx);
+          const int64 x1 = std::min(x + width, bx + block_width);
+          const int64 y0 = std::max(y, by);
+          const int64 y1 = std::min(y + height, by + block_height);
+          for (int64 row = y0; row < y1; row++) {
+            const uint8* src = block + ((row - by) * block_width + (x0 - bx)) *
+                                           samples * bytes;
+            char* dst =
+                output + ((row - y) * width + (x0 - x)) * info.channels * bytes;
+            if (!info.separate) {
+              memcpy(dst, src, (x1 - x0) * info.channels * bytes);
+            } else {
+              for (int64 col = 0; col < x1 - x0; col++) {
+                memcpy(dst + (col * info.channels + plane) * bytes,
+                       src + col * bytes, bytes);
+              }
+            }
           }
-        });
-    OP_REQUIRES(context, (tiff.get() != nullptr),
-                errors::InvalidArgument("unable to open TIFF from memory"));
+        }
+      }
+    }
+    return Status::OK();
+  }
 
-    int status = TIFFSetDirectory(tiff.get(), index_tensor->scalar<int64>()());
-    OP_REQUIRES(context, (status),
-                errors::InvalidArgument("unable to set TIFF directory to ",
-                                        index_tensor->scalar<int64>()()));
-    unsigned int height, width;
-    TIFFGetField(tiff.get(), TIFFTAG_IMAGELENGTH, &height);
-    TIFFGetField(tiff.get(), TIFFTAG_IMAGEWIDTH, &width);
+ private:
+  struct Page {
+    int64 height = 0;
+    int64 width = 0;
+    int64 channels = 0;
+    int64 format = 0;
+    int64 bits = 0;
+    DataType dtype = DT_INVALID;
+    bool tiled = false;
+    int64 tile_height = 0;
+    int64 tile_width = 0;
+    int64 rows = 0;
+    bool separate = false;
+    bool jpeg_ycbcr = false;
+  };
+
+  Status ReadPage(Page* page) {
+    uint32 height = 0, width = 0;
+    TIFFGetField(tiff_.get(), TIFFTAG_IMAGELENGTH, &height);
+    TIFFGetField(tiff_.get(), TIFFTAG_IMAGEWIDTH, &width);
+    page->height = height;
+    page->width = width;
+
+    uint16 channels = 1, format, bits = 1, planar = PLANARCONFIG_CONTIG;
+    TIFFGetFieldDefaulted(tiff_.get(), TIFFTAG_SAMPLESPERPIXEL, &channels);
+    if (!TIFFGetField(tiff_.get(), TIFFTAG_SAMPLEFORMAT, &format)) {
+      // If format is not defined, then we assume format is SAMPLEFORMAT_UINT
+      format = SAMPLEFORMAT_UINT;
+    }
+    TIFFGetFieldDefaulted(tiff_.get(), TIFFTAG_BITSPERSAMPLE, &bits);
+    TIFFGetFieldDefaulted(tiff_.get(), TIFFTAG_PLANARCONFIG, &planar);
+    page->channels = channels;
+    page->format = format;
+    page->bits = bits;
+    page->separate = (planar == PLANARCONFIG_SEPARATE && channels > 1);
+
+    static const struct {
+      uint16 format;
+      uint16 bits;
+      DataType dtype;
+    } dtypes[] = {
+        {SAMPLEFORMAT_UINT, 8, DT_UINT8},
+        {SAMPLEFORMAT_UINT, 16, DT_UINT16},
+        {SAMPLEFORMAT_UINT, 32, DT_UINT32},
+        {SAMPLEFORMAT_INT, 8, DT_INT8},
+        {SAMPLEFORMAT_INT, 16, DT_INT16},
+        {SAMPLEFORMAT_INT, 32, DT_INT32},
+        {SAMPLEFORMAT_IEEEFP, 16, DT_HALF},
+        {SAMPLEFORMAT_IEEEFP, 32, DT_FLOAT},
+        {SAMPLEFORMAT_IEEEFP, 64, DT_DOUBLE},
+    };
+    for (size_t i = 0; i < sizeof(dtypes) / sizeof(dtypes[0]); i++) {
+      if (dtypes[i].format == format && dtypes[i].bits == bits) {
+        page->dtype = dtypes[i].dtype;
+      }
+    }
+
+    uint16 compression = COMPRESSION_NONE, photometric = PHOTOMETRIC_RGB;
+    TIFFGetFieldDefaulted(tiff_.get(), TIFFTAG_COMPRESSION, &compression);
+    TIFFGetField(tiff_.get(), TIFFTAG_PHOTOMETRIC, &photometric);
+    page->jpeg_ycbcr =
+        (compression == COMPRESSION_JPEG && photometric == PHOTOMETRIC_YCBCR);
+
+    page->tiled = TIFFIsTiled(tiff_.get());
+    if (page->tiled) {
+      uint32 tile_height = 0, tile_width = 0;
+      TIFFGetField(tiff_.get(), TIFFTAG_TILELENGTH, &tile_height);
+      TIFFGetField(tiff_.get(), TIFFTAG_TILEWIDTH, &tile_width);
+      page->tile_height = tile_height;
+      page->tile_width = tile_width;
+    } else {
+      uint32 rows = height;
+      TIFFGetFieldDefaulted(tiff_.get(), TIFFTAG_ROWSPERSTRIP, &rows);
+      page->rows = std::min(static_cast<int64>(rows), page->height);
+    }
+    return Status::OK();
+  }
+
+  Status SetPage(const int64 page) {
+    if (page_ == page) {
+      return Status::OK();
+    }
+    if (!TIFFSetDirectory(tiff_.get(), page)) {
+      return errors::InvalidArgument("unable to set TIFF directory to ", page);
+    }
+    // Let libjpeg convert YCbCr to RGB, as is common in whole slide images
+    if (pages_[page].jpeg_ycbcr) {
+      TIFFSetField(tiff_.get(), TIFFTAG_JPEGCOLORMODE, JPEGCOLORMODE_RGB);
+    }
+    page_ = page;
+    return Status::OK();
+  }
+
+  // Decodes the tile or strip at (x, y) of the plane, through the cache
+  Status ReadBlock(const int64 page, const int64 x, const int64 y,
+                   const int64 plane, const uint8** block) {
+    const Page& info = pages_[page];
+    const int64 index = info.tiled
+                            ? TIFFComputeTile(tiff_.get(), x, y, 0, plane)
+                            : TIFFComputeStrip(tiff_.get(), y, plane);
+    const std::pair<int64, int64> key(page, index);
+    auto lookup = cache_index_.find(key);
+    if (lookup != cache_index_.end()) {
+      cache_.splice(cache_.begin(), cache_, lookup->second);
+      *block = cache_.front().second.data();
+      return Status::OK();
+    }
+
+    const int64 size =
+        info.tiled ? TIFFTileSize(tiff_.get()) : TIFFStripSize(tiff_.get());
+    std::vector<uint8> buffer(size);
+    tmsize_t returned =
+        info.tiled
+            ? TIFFReadEncodedTile(tiff_.get(), index, buffer.data(), size)
+            : TIFFReadEncodedStrip(tiff_.get(), index, buffer.data(), size);
+    if (returned < 0) {
+      return errors::InvalidArgument("unable to read ",
+                                     info.tiled ? "tile " : "strip ", index,
+                                     " of page ", page);
+    }
+
+    cache_.emplace_front(key, std::move(buffer));
+    cache_index_[key] = cache_.begin();
+    // The block just read is kept even without cache, until the next read
+    while (static_cast<int64>(cache_.size()) >
+           std::max(cache_size_, static_cast<int64>(1))) {
+      cache_index_.erase(cache_.back().first);
+      cache_.pop_back();
+    }
+    *block = cache_.front().second.data();
+    return Status::OK();
+  }
+
+  struct KeyHash {
+    size_t operator()(const std::pair<int64, int64>& key) const {
+      return std::hash<int64>()(key.first * 1000003 + key.second);
+    }
+  };
+
+  string content_;
+  string filename_;
+  std::unique_ptr<SizedRandomAccessFile> file_;
+  TIFFFileHandle handle_;
+  std::unique_ptr<TIFF, void (*)(TIFF*)> tiff_;
+  std::vector<Page> pages_;
+  std::vector<int64> levels_;
+  int64 page_ = -1;
+
+  int64 cache_size_;
+  std::list<std::pair<std::pair<int64, int64>, std::vector<uint8>>> cache_;
+  std::unordered_map<std::pair<int64, int64>,
+                     std::list<std::pair<std::pair<int64, int64>,
+                                         std::vector<uint8>>>::iterator,
+                     KeyHash>
+      cache_index_;
+};
+
+class DecodeTIFFRegionOp : public OpKernel {
+ public:
+  explicit DecodeTIFFRegionOp(OpKernelConstruction* context)
+      : OpKernel(context) {
+    env_ = context->env();
+  }
+
+  void Compute(OpKernelContext* context) override {
+    const Tensor* input_tensor;
+    OP_REQUIRES_OK(context, context->input("input", &input_tensor));
+
+    const Tensor* page_tensor;
+    OP_REQUIRES_OK(context, context->input("page", &page_tensor));
+    int64 page = page_tensor->scalar<int64>()();
+
+    const Tensor* level_tensor;
+    OP_REQUIRES_OK(context, context->input("level", &level_tensor));
+    const int64 level = level_tensor->scalar<int64>()();
+
+    const Tensor* x_tensor;
+    OP_REQUIRES_OK(context, context->input("x", &x_tensor));
+
+    const Tensor* y_tensor;
+    OP_REQUIRES_OK(context, context->input("y", &y_tensor));
+
+    const Tensor* width_tensor;
+    OP_REQUIRES_OK(context, context->input("width", &width_tensor));
+
+    const Tensor* height_tensor;
+    OP_REQUIRES_OK(context, context->input("height", &height_tensor));
+
+    TIFFRegionReader reader(env_, input_tensor->scalar<tstring>()(), 0);
+    OP_REQUIRES_OK(context, reader.Open());
+    if (level >= 0) {
+      OP_REQUIRES_OK(context, reader.Level(level, &page));
+    }
+    OP_REQUIRES_OK(
+        context,
+        reader.Read(
+            page, x_tensor->scalar<int64>()(), y_tensor->scalar<int64>()(),
+            width_tensor->scalar<int64>()(), height_tensor->scalar<int64>()(),
+            [&](const TensorShape& shape, Tensor** value) -> Status {
+              return context->allocate_output(0, shape, value);
+            }));
+  }
+
+ private:
+  mutable mutex mu_;
+  Env* env_ TF_GUARDED_BY(mu_);
+};
+
+// Keeps a TIFF open with a tile cache, to read many regions of the same file
+class TIFFRegionReadableResource : public ResourceBase {
+ public:
+  TIFFRegionReadableResource(Env* env) : env_(env) {}
+  virtual ~TIFFRegionReadableResource() {}
+
+  Status Init(const string& input, const int64 cache_size) {
+    mutex_lock l(mu_);
+    reader_.reset(new TIFFRegionReader(env_, input, cache_size));
+    return reader_->Open();
+  }
+
+  Status Spec(std::vector<TensorShape>* shapes, std::vector<DataType>* dtypes,
+              std::vector<int64>* levels) {
+    mutex_lock l(mu_);
+    for (int64 i = 0; i < reader_->pages(); i++) {
+      shapes->push_back(reader_->shape(i));
+      dtypes->push_back(reader_->dtype(i));
+    }
+    *levels = reader_->levels();
+    return Status::OK();
+  }
+
+  Status Read(const int64 page, const int64 x, const int64 y, const int64 width,
+              const int64 height,
+              std::function<Status(const TensorShape& shape, Tensor** value)>
+                  allocate_func) {
+    mutex_lock l(mu_);
+    return reader_->Read(page, x, y, width, height, allocate_func);
+  }
+
+  string DebugString() const override { return "TIFFRegionReadableResource"; }
+
+ private:
+  mutable mutex mu_;
+  Env* env_ TF_GUARDED_BY(mu_);
+  std::unique_ptr<TIFFRegionReader> reader_ TF_GUARDED_BY(mu_);
+};
+
+class TIFFRegionReadableInitOp
+    : public ResourceOpKernel<TIFFRegionReadableResource> {
+ public:
+  explicit TIFFRegionReadableInitOp(OpKernelConstruction* context)
+      : ResourceOpKernel<TIFFRegionReadableResource>(context) {
+    env_ = context->env();
+  }
+
+ private:
+  void Compute(OpKernelContext* context) override {
+    ResourceOpKernel<TIFFRegionReadableResource>::Compute(context);
+
+    const Tensor* input_tensor;
+    OP_REQUIRES_OK(context, context->input("input", &input_tensor));
+
+    const Tensor* cache_size_tensor;
+    OP_REQUIRES_OK(context, context->input("cache_size", &cache_size_tensor));
 
-    Tensor* image_tensor = nullptr;
     OP_REQUIRES_OK(context,
-                   context->allocate_output(
-                       0,
-                       TensorShape({static_cast<int64>(height),
-                                    static_cast<int64>(width), channels_}),
-                       &image_tensor));
-
-    uint32* raster =
-        reinterpret_cast<uint32*>(image_tensor->flat<uint8>().data());
-    OP_REQUIRES(context,
-                (TIFFReadRGBAImageOriented(tiff.get(), width, height, raster,
-                                           ORIENTATION_TOPLEFT, 0)),
-                errors::InvalidArgument("unable to read directory: ",
-                                        index_tensor->scalar<int64>()()));
+                   resource_->Init(input_tensor->scalar<tstring>()(),
+                                   cache_size_tensor->scalar<int64>()()));
+  }
+  Status CreateResource(TIFFRegionReadableResource** resource)
+      TF_EXCLUSIVE_LOCKS_REQUIRED(mu_) override {
+    *resource = new TIFFRegionReadableResource(env_);
+    return Status::OK();
   }
 
  private:
-  // TODO (yongtang): Set channels_ = 4 for now.
-  static const int channels_ = 4;
+  mutable mutex mu_;
+  Env* env_ TF_GUARDED_BY(mu_);
+};
+
+class TIFFRegionReadableSpecOp : public OpKernel {
+ public:
+  explicit TIFFRegionReadableSpecOp(OpKernelConstruction* context)
+      : OpKernel(context) {}
+
+  void Compute(OpKernelContext* context) override {
+    TIFFRegionReadableResource* resource;
+    OP_REQUIRES_OK(context,
+                   GetResourceFromContext(context, "input", &resource));
+    core::ScopedUnref unref(resource);
+
+    std::vector<TensorShape> shapes;
+    std::vector<DataType> dtypes;
+    std::vector<int64> levels;
+    OP_REQUIRES_OK(context, resource->Spec(&shapes, &dtypes, &levels));
+
+    Tensor* shape_tensor = nullptr;
+    OP_REQUIRES_OK(context,
+                   context->allocate_output(
+                       0, TensorShape({static_cast<int64>(shapes.size()), 3}),
+                       &shape_tensor));
+    for (size_t i = 0; i < shapes.size(); i++) {
+      shape_tensor->flat<int64>()(i * 3) = shapes[i].dim_size(0);
+      shape_tensor->flat<int64>()(i * 3 + 1) = shapes[i].dim_size(1);
+      shape_tensor->flat<int64>()(i * 3 + 2) = shapes[i].dim_size(2);
+    }
+    Tensor* dtype_tensor = nullptr;
+    OP_REQUIRES_OK(context,
+                   context->allocate_output(
+                       1, TensorShape({static_cast<int64>(dtypes.size())}),
+                       &dtype_tensor));
+    for (size_t i = 0; i < dtypes.size(); i++) {
+      dtype_tensor->flat<int64>()(i) = dtypes[i];
+    }
+    Tensor* levels_tensor = nullptr;
+    OP_REQUIRES_OK(context,
+                   context->allocate_output(
+                       2, TensorShape({static_cast<int64>(levels.size())}),
+                       &levels_tensor));
+    for (size_t i = 0; i < levels.size(); i++) {
+      levels_tensor->flat<int64>()(i) = levels[i];
+    }
+  }
 };
+
+class TIFFRegionReadableReadOp : public OpKernel {
+ public:
+  explicit TIFFRegionReadableReadOp(OpKernelConstruction* context)
+      : OpKernel(context) {}
+
+  void Compute(OpKernelContext* context) override {
+    TIFFRegionReadableResource* resource;
+    OP_REQUIRES_OK(context,
+                   GetResourceFromContext(context, "input", &resource));
+    core::ScopedUnref unref(resource);
+
+    const Tensor* page_tensor;
+    OP_REQUIRES_OK(context, context->input("page", &page_tensor));
+
+    const Tensor* x_tensor;
+    OP_REQUIRES_OK(context, context->input("x", &x_tensor));
+
+    const Tensor* y_tensor;
+    OP_REQUIRES_OK(context, context->input("y", &y_tensor));
+
+    const Tensor* width_tensor;
+    OP_REQUIRES_OK(context, context->input("width", &width_tensor));
+
+    const Tensor* height_tensor;
+    OP_REQUIRES_OK(context, context->input("height", &height_tensor));
+
+    OP_REQUIRES_OK(
+        context,
+        resource->Read(page_tensor->scalar<int64>()(),
+                       x_tensor->scalar<int64>()(), y_tensor->scalar<int64>()(),
+                       width_tensor->scalar<int64>()(),
+                       height_tensor->scalar<int64>()(),
+                       [&](const TensorShape& shape, Tensor** value) -> Status {
+                         return context->allocate_output(0, shape, value);
+                       }));
+  }
+};
+
 REGISTER_KERNEL_BUILDER(Name("IO>DecodeTiffInfo").Device(DEVICE_CPU),
                         DecodeTIFFInfoOp);
 REGISTER_KERNEL_BUILDER(Name("IO>DecodeTiff").Device(DEVICE_CPU), DecodeTIFFOp);
+REGISTER_KERNEL_BUILDER(Name("IO>DecodeTiffRegion").Device(DEVICE_CPU),
+                        DecodeTIFFRegionOp);
+REGISTER_KERNEL_BUILDER(Name("IO>TiffRegionReadableInit").Device(DEVICE_CPU),
+                        TIFFRegionReadableInitOp);
+REGISTER_KERNEL_BUILDER(Name("IO>TiffRegionReadableSpec").Device(DEVICE_CPU),
+                        TIFFRegionReadableSpecOp);
+REGISTER_KERNEL_BUILDER(Name("IO>TiffRegionReadableRead").Device(DEVICE_CPU),
+                        TIFFRegionReadableReadOp);
 
 }  // namespace
 }  // namespace data
@@ -18,10 +18,49 @@ limitations under the License.
 #include "tensorflow/core/framework/dataset.h"
 #include "tensorflow/core/lib/io/random_inputstream.h"
 #include "tensorflow/core/platform/file_system.h"
+#include "tensorflow_io/core/kernels/image_kernels.h"
 #include "webp/encode.h"
 
 namespace tensorflow {
 namespace io {
+
+Status DecodeWebPImage(const tstring& contents,
+                       const ImageAllocateFunc& allocate_func) {
+  // TODO (yongtang): Set channels = 4 for now.
+  const int channels = 4;
+
+  WebPDecoderConfig config;
+  WebPInitDecoderConfig(&config);
+  int returned =
+      WebPGetFeatures(reinterpret_cast<const uint8_t*>(contents.data()),
+                      contents.size(), &config.input);
+  if (returned != VP8_STATUS_OK) {
+    return errors::InvalidArgument("contents could not be decoded as WebP: ",
+                                   returned);
+  }
+
+  int height = config.input.height;
+  int width = config.input.width;
+
+  Tensor* output_tensor = nullptr;
+  TF_RETURN_IF_ERROR(allocate_func(
+      DT_UINT8, TensorShape({height, width, channels}), &output_tensor));
+
+  config.output.colorspace = MODE_RGBA;
+  config.output.u.RGBA.rgba = output_tensor->flat<uint8_t>().data();
+  config.output.u.RGBA.stride = width * channels;
+  config.output.u.RGBA.size = height * width * channels;
+  config.output.is_external_memory = 1;
+
+  returned = DecodeWebP(reinterpret_cast<const uint8_t*>(contents.data()),
+                        contents.size(), &config);
+  if (returned != 0) {
+    return errors::InvalidArgument("contents could not be decoded as WebP: ",
+                                   returned);
+  }
+  return Status::OK();
+}
+
 namespace {
 
 class DecodeWebPOp : public OpKernel {
@@ -35,39 +74,13 @@ class DecodeWebPOp : public OpKernel {
                                         contents_tensor.shape().DebugString()));
     auto contents = contents_tensor.scalar<tstring>()();
 
-    WebPDecoderConfig config;
-    WebPInitDecoderConfig(&config);
-    int returned =
-        WebPGetFeatures(reinterpret_cast<const uint8_t*>(contents.data()),
-                        contents.size(), &config.input);
-    OP_REQUIRES(context, returned == VP8_STATUS_OK,
-                errors::InvalidArgument(
-                    "contents could not be decoded as WebP: ", returned));
-
-    int height = config.input.height;
-    int width = config.input.width;
-
-    Tensor* output_tensor = nullptr;
-    OP_REQUIRES_OK(context, context->allocate_output(
-                                0, TensorShape({height, width, channels_}),
-                                &output_tensor));
-
-    config.output.colorspace = MODE_RGBA;
-    config.output.u.RGBA.rgba = output_tensor->flat<uint8_t>().data();
-    config.output.u.RGBA.stride = width * channels_;
-    config.output.u.RGBA.size = height * width * channels_;
-    config.output.is_external_memory = 1;
-
-    returned = DecodeWebP(reinterpret_cast<const uint8_t*>(contents.data()),
-                          contents.size(), &config);
-    OP_REQUIRES(context, returned == 0,
-                errors::InvalidArgument(
-                    "contents could not be decoded as WebP: ", returned));
+    OP_REQUIRES_OK(
+        context,
+        DecodeWebPImage(contents, [&](DataType dtype, const TensorShape& shape,
+                                      Tensor** tensor) {
+          return context->allocate_output(0, shape, tensor);
+        }));
   }
-
- private:
-  // TODO (yongtang): Set channels_ = 4 for now.
-  static const int channels_ = 4;
 };
 REGISTER_KERNEL_BUILDER(Name("IO>DecodeWebP").Device(DEVICE_CPU), DecodeWebPOp);
 
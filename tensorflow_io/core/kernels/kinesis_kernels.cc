@@ -21,16 +21,21 @@ limitations under the License.
 #include <aws/core/utils/crypto/Hash.h>
 #include <aws/core/utils/crypto/HashResult.h>
 #include <aws/kinesis/KinesisClient.h>
-#include <aws/kinesis/model/DescribeStreamRequest.h>
+#include <aws/kinesis/KinesisErrors.h>
 #include <aws/kinesis/model/GetRecordsRequest.h>
 #include <aws/kinesis/model/GetShardIteratorRequest.h>
+#include <aws/kinesis/model/ListShardsRequest.h>
 #include <aws/kinesis/model/PutRecordsRequest.h>
 #include <aws/kinesis/model/ShardIteratorType.h>
 #include <openssl/hmac.h>
 #include <openssl/sha.h>
 
+#include <deque>
+
 #include "tensorflow/core/framework/resource_mgr.h"
 #include "tensorflow/core/framework/resource_op_kernel.h"
+#include "tensorflow/core/platform/env.h"
+#include "tensorflow/core/platform/mutex.h"
 
 namespace tensorflow {
 namespace data {
@@ -253,17 +258,35 @@ void ShutdownClient(Aws::Kinesis::KinesisClient* client) {
   }
 }
 
+// Reads all shards of a stream, or a single shard if given, with one polling
+// thread per shard. Records are queued in a bounded buffer shared by the
+// shards, so a slow consumer stops the polling instead of growing memory.
+// Records of a shard keep their order, and a child shard created by
+// resharding is only read once its parent shards are read to the end.
 class KinesisReadableResource : public ResourceBase {
  public:
   KinesisReadableResource(Env* env)
-      : env_(env), client_(nullptr, ShutdownClient), interval_(100000) {}
-  virtual ~KinesisReadableResource() {}
+      : env_(env),
+        client_(nullptr, ShutdownClient),
+        interval_(100000),
+        max_interval_(10000000),
+        capacity_(10000) {}
+  virtual ~KinesisReadableResource() {
+    {
+      mutex_lock l(mu_);
+      cancelled_ = true;
+      cond_var_.notify_all();
+    }
+    // Join shard threads before the client is shutdown
+    threads_.clear();
+  }
 
   Status Init(const string& input, const std::vector<string>& metadata) {
     mutex_lock l(mu_);
 
     stream_ = input;
     shard_ = "";
+    std::unordered_map<string, string> checkpoint;
     for (size_t i = 0; i < metadata.size(); i++) {
       if (metadata[i].find("shard=") == 0) {
         std::vector<string> parts = str_util::Split(metadata[i], "=");
@@ -272,65 +295,77 @@ class KinesisReadableResource : public ResourceBase {
                                          metadata[i]);
         }
         shard_ = parts[1];
+      } else if (metadata[i].find("checkpoint=") == 0) {
+        // checkpoint=<shard>:<sequence> resumes after the sequence number
+        std::vector<string> parts =
+            str_util::Split(metadata[i].substr(11), ":");
+        if (parts.size() != 2) {
+          return errors::InvalidArgument("invalid configuration: ",
+                                         metadata[i]);
+        }
+        checkpoint[parts[0]] = parts[1];
+      } else if (metadata[i].find("buffer_size=") == 0) {
+        int64 capacity;
+        if (!strings::safe_strto64(metadata[i].substr(12), &capacity) ||
+            capacity <= 0) {
+          return errors::InvalidArgument("invalid configuration: ",
+                                         metadata[i]);
+        }
+        capacity_ = capacity;
       }
     }
 
     AwsInitAPI();
     client_.reset(new Aws::Kinesis::KinesisClient(GetDefaultClientConfig()));
 
-    Aws::Kinesis::Model::DescribeStreamRequest request;
-    auto outcome =
-        client_->DescribeStream(request.WithStreamName(stream_.c_str()));
-    if (!outcome.IsSuccess()) {
-      return errors::Unknown(outcome.GetError().GetExceptionName(), ": ",
-                             outcome.GetError().GetMessage());
-    }
-    Aws::String shard;
-    Aws::String sequence;
-    if (shard_ == "") {
-      if (outcome.GetResult().GetStreamDescription().GetShards().size() != 1) {
-        return errors::InvalidArgument(
-            "shard has to be provided unless the stream only have one "
-            "shard, there are ",
-            outcome.GetResult().GetStreamDescription().GetShards().size(),
-            " shards in stream ", stream_);
+    Aws::Kinesis::Model::ListShardsRequest request;
+    request.SetStreamName(stream_.c_str());
+    do {
+      auto outcome = client_->ListShards(request);
+      if (!outcome.IsSuccess()) {
+        return errors::Unknown(outcome.GetError().GetExceptionName(), ": ",
+                               outcome.GetError().GetMessage());
       }
-      shard = outcome.GetResult()
-                  .GetStreamDescription()
-                  .GetShards()[0]
-                  .GetShardId();
-      sequence = outcome.GetResult()
-                     .GetStreamDescription()
-                     .GetShards()[0]
-                     .GetSequenceNumberRange()
-                     .GetStartingSequenceNumber();
-    } else {
-      for (const auto& entry :
-           outcome.GetResult().GetStreamDescription().GetShards()) {
-        if (entry.GetShardId() == shard_.c_str()) {
-          shard = entry.GetShardId();
-          sequence = entry.GetSequenceNumberRange().GetStartingSequenceNumber();
-          break;
+      for (const auto& entry : outcome.GetResult().GetShards()) {
+        string id(entry.GetShardId().c_str(), entry.GetShardId().size());
+        if (shard_ != "" && id != shard_) {
+          continue;
+        }
+        Shard shard;
+        shard.id = id;
+        shard.parents.push_back(entry.GetParentShardId().c_str());
+        shard.parents.push_back(entry.GetAdjacentParentShardId().c_str());
+        shard.position =
+            entry.GetSequenceNumberRange().GetStartingSequenceNumber().c_str();
+        if (checkpoint.find(id) != checkpoint.end()) {
+          shard.position = checkpoint[id];
+          shard.sequence = checkpoint[id];
+          shard.after = true;
         }
+        shards_.push_back(shard);
+      }
+      const Aws::String& token = outcome.GetResult().GetNextToken();
+      if (token.empty()) {
+        break;
       }
-      if (shard == "") {
+      // Subsequent pages are requested by token alone
+      request = Aws::Kinesis::Model::ListShardsRequest();
+      request.SetNextToken(token);
+    } while (true);
+    if (shards_.size() == 0) {
+      if (shard_ != "") {
         return errors::InvalidArgument("no shard ", shard_, " in stream ",
                                        stream_);
       }
+      return errors::InvalidArgument("no shard in stream ", stream_);
     }
 
-    Aws::Kinesis::Model::GetShardIteratorRequest iterator_request;
-    auto iterator_outcome = client_->GetShardIterator(
-        iterator_request.WithStreamName(stream_.c_str())
-            .WithShardId(shard)
-            .WithShardIteratorType(
-                Aws::Kinesis::Model::ShardIteratorType::AT_SEQUENCE_NUMBER)
-            .WithStartingSequenceNumber(sequence));
-    if (!iterator_outcome.IsSuccess()) {
-      return errors::Unknown(iterator_outcome.GetError().GetExceptionName(),
-                             ": ", iterator_outcome.GetError().GetMessage());
+    active_ = shards_.size();
+    for (size_t i = 0; i < shards_.size(); i++) {
+      threads_.emplace_back(env_->StartThread(
+          ThreadOptions(), strings::StrCat("kinesis_", shards_[i].id),
+          [this, i]() { ReadShard(i); }));
     }
-    iterator_ = iterator_outcome.GetResult().GetShardIterator();
     return Status::OK();
   }
   Status Read(
@@ -339,53 +374,67 @@ class KinesisReadableResource : public ResourceBase {
                            Tensor** sequence_tensor)>
           allocate_func) {
     mutex_lock l(mu_);
-    do {
-      Aws::Kinesis::Model::GetRecordsRequest request;
-      auto outcome = client_->GetRecords(
-          request.WithShardIterator(iterator_).WithLimit(1));
-      if (!outcome.IsSuccess()) {
-        return errors::Unknown(outcome.GetError().GetExceptionName(), ": ",
-                               outcome.GetError().GetMessage());
-      }
-      if (outcome.GetResult().GetRecords().size() == 0) {
-        // TODO: break if option provided, as no records were returned then
-        // nothing is available at the moment.
+    while (records_.empty() && active_ > 0 && status_.ok()) {
+      cond_var_.wait(l);
+    }
+    if (records_.empty() && !status_.ok()) {
+      return status_;
+    }
 
-        // Otherwise continue the loop after a period of time.
-        env_->SleepForMicroseconds(interval_);
-        continue;
-      }
-      if (outcome.GetResult().GetRecords().size() != 1) {
-        return errors::Unknown("invalid number of records ",
-                               outcome.GetResult().GetRecords().size(),
-                               " returned");
+    // Return all buffered records, an empty result once every shard is
+    // closed and read to the end
+    int64 count = records_.size();
+    Tensor* timestamp_tensor;
+    Tensor* data_tensor;
+    Tensor* partition_tensor;
+    Tensor* sequence_tensor;
+    TF_RETURN_IF_ERROR(allocate_func(TensorShape({count}), &timestamp_tensor,
+                                     &data_tensor, &partition_tensor,
+                                     &sequence_tensor));
+    for (int64 i = 0; i < count; i++) {
+      Record& record = records_.front();
+      timestamp_tensor->flat<int64>()(i) = record.timestamp;
+      data_tensor->flat<tstring>()(i) = std::move(record.data);
+      partition_tensor->flat<tstring>()(i) = std::move(record.partition);
+      sequence_tensor->flat<tstring>()(i) = record.sequence;
+      returned_.emplace_back(record.shard, std::move(record.sequence));
+      records_.pop_front();
+    }
+    cond_var_.notify_all();
+    return Status::OK();
+  }
+  Status Commit() {
+    mutex_lock l(mu_);
+    // Records are consumed in the order they are returned by Read
+    if (returned_.empty()) {
+      return errors::FailedPrecondition("no record to commit");
+    }
+    shards_[returned_.front().first].sequence =
+        std::move(returned_.front().second);
+    returned_.pop_front();
+    return Status::OK();
+  }
+  Status Checkpoint(
+      std::function<Status(const TensorShape& shape, Tensor** shard_tensor,
+                           Tensor** sequence_tensor)>
+          allocate_func) {
+    mutex_lock l(mu_);
+    // Sequence number of the last record consumed for each shard
+    std::vector<size_t> indices;
+    for (size_t i = 0; i < shards_.size(); i++) {
+      if (shards_[i].sequence != "") {
+        indices.push_back(i);
       }
-      iterator_ = outcome.GetResult().GetNextShardIterator();
-
-      Tensor* timestamp_tensor;
-      Tensor* data_tensor;
-      Tensor* partition_tensor;
-      Tensor* sequence_tensor;
-      TF_RETURN_IF_ERROR(allocate_func(TensorShape({1}), &timestamp_tensor,
-                                       &data_tensor, &partition_tensor,
-                                       &sequence_tensor));
-      const auto& timestamp =
-          outcome.GetResult().GetRecords()[0].GetApproximateArrivalTimestamp();
-      const auto& data = outcome.GetResult().GetRecords()[0].GetData();
-      const auto& partition =
-          outcome.GetResult().GetRecords()[0].GetPartitionKey();
-      const auto& sequence =
-          outcome.GetResult().GetRecords()[0].GetSequenceNumber();
-      timestamp_tensor->flat<int64>()(0) = timestamp.Millis();
-      data_tensor->flat<tstring>()(0) =
-          string(reinterpret_cast<const char*>(data.GetUnderlyingData()),
-                 data.GetLength());
-      partition_tensor->flat<tstring>()(0) =
-          string(partition.c_str(), partition.size());
-      sequence_tensor->flat<tstring>()(0) =
-          string(sequence.c_str(), sequence.size());
-      return Status::OK();
-    } while (true);
+    }
+    Tensor* shard_tensor;
+    Tensor* sequence_tensor;
+    TF_RETURN_IF_ERROR(
+        allocate_func(TensorShape({static_cast<int64>(indices.size())}),
+                      &shard_tensor, &sequence_tensor));
+    for (size_t i = 0; i < indices.size(); i++) {
+      shard_tensor->flat<tstring>()(i) = shards_[indices[i]].id;
+      sequence_tensor->flat<tstring>()(i) = shards_[indices[i]].sequence;
+    }
     return Status::OK();
   }
   string DebugString() const override {
@@ -394,14 +443,174 @@ class KinesisReadableResource : public ResourceBase {
   }
 
  protected:
+  struct Shard {
+    string id;
+    std::vector<string> parents;
+    // Position to get a shard iterator at, or after if a record at that
+    // position was already queued
+    string position;
+    bool after = false;
+    // Sequence number of the last record committed as consumed
+    string sequence;
+    bool done = false;
+  };
+  struct Record {
+    size_t shard;
+    int64 timestamp;
+    string data;
+    string partition;
+    string sequence;
+  };
+
+  void ReadShard(size_t index) {
+    bool cancelled;
+    {
+      mutex_lock l(mu_);
+      while (!cancelled_ && !ParentsDoneLocked(index)) {
+        cond_var_.wait(l);
+      }
+      cancelled = cancelled_;
+    }
+    Status status = cancelled ? Status::OK() : PollShard(index);
+
+    mutex_lock l(mu_);
+    if (!status.ok() && status_.ok()) {
+      status_ = status;
+    }
+    shards_[index].done = true;
+    active_--;
+    cond_var_.notify_all();
+  }
+
+  bool ParentsDoneLocked(size_t index) TF_EXCLUSIVE_LOCKS_REQUIRED(mu_) {
+    for (const string& parent : shards_[index].parents) {
+      for (const Shard& shard : shards_) {
+        if (parent != "" && shard.id == parent && !shard.done) {
+          return false;
+        }
+      }
+    }
+    return true;
+  }
+
+  Status PollShard(size_t index) {
+    Aws::String iterator;
+    TF_RETURN_IF_ERROR(GetShardIterator(index, &iterator));
+    int64 backoff = 0;
+    // A closed shard has no next iterator once it is read to the end
+    while (!iterator.empty()) {
+      if (backoff > 0 && !WaitFor(backoff)) {
+        return Status::OK();
+      }
+      Aws::Kinesis::Model::GetRecordsRequest request;
+      auto outcome = client_->GetRecords(request.WithShardIterator(iterator));
+      if (!outcome.IsSuccess()) {
+        const auto& error = outcome.GetError();
+        if (error.GetErrorType() ==
+            Aws::Kinesis::KinesisErrors::EXPIRED_ITERATOR) {
+          TF_RETURN_IF_ERROR(GetShardIterator(index, &iterator));
+          continue;
+        }
+        if (error.GetErrorType() ==
+                Aws::Kinesis::KinesisErrors::PROVISIONED_THROUGHPUT_EXCEEDED ||
+            error.ShouldRetry()) {
+          // Throttled, double the delay between requests to the shard
+          backoff = std::min(std::max(backoff * 2, interval_), max_interval_);
+          continue;
+        }
+        return errors::Unknown(error.GetExceptionName(), ": ",
+                               error.GetMessage());
+      }
+      // Decrease the delay as long as requests succeed
+      backoff /= 2;
+
+      const auto& records = outcome.GetResult().GetRecords();
+      for (const auto& entry : records) {
+        Record record;
+        record.shard = index;
+        record.timestamp = entry.GetApproximateArrivalTimestamp().Millis();
+        record.data = string(
+            reinterpret_cast<const char*>(entry.GetData().GetUnderlyingData()),
+            entry.GetData().GetLength());
+        record.partition = entry.GetPartitionKey().c_str();
+        record.sequence = entry.GetSequenceNumber().c_str();
+
+        mutex_lock l(mu_);
+        while (!cancelled_ && records_.size() >= capacity_) {
+          cond_var_.wait(l);
+        }
+        if (cancelled_) {
+          return Status::OK();
+        }
+        shards_[index].position = record.sequence;
+        shards_[index].after = true;
+        records_.emplace_back(std::move(record));
+        cond_var_.notify_all();
+      }
+      iterator = outcome.GetResult().GetNextShardIterator();
+
+      // Nothing is available at the moment, so wait before polling again
+      if (records.size() == 0 && backoff < interval_ && !WaitFor(interval_)) {
+        return Status::OK();
+      }
+    }
+    return Status::OK();
+  }
+
+  Status GetShardIterator(size_t index, Aws::String* iterator) {
+    Aws::Kinesis::Model::GetShardIteratorRequest request;
+    {
+      mutex_lock l(mu_);
+      request.WithStreamName(stream_.c_str())
+          .WithShardId(shards_[index].id.c_str())
+          .WithShardIteratorType(
+              shards_[index].after
+                  ? Aws::Kinesis::Model::ShardIteratorType::
+                        AFTER_SEQUENCE_NUMBER
+                  : Aws::Kinesis::Model::ShardIteratorType::AT_SEQUENCE_NUMBER)
+          .WithStartingSequenceNumber(shards_[index].position.c_str());
+    }
+    auto outcome = client_->GetShardIterator(request);
+    if (!outcome.IsSuccess()) {
+      return errors::Unknown(outcome.GetError().GetExceptionName(), ": ",
+                             outcome.GetError().GetMessage());
+    }
+    *iterator = outcome.GetResult().GetShardIterator();
+    return Status::OK();
+  }
+
+  // Waits for the given microseconds, returns false if cancelled
+  bool WaitFor(int64 micros) {
+    mutex_lock l(mu_);
+    const uint64 deadline = env_->NowMicros() + micros;
+    while (!cancelled_) {
+      const uint64 now = env_->NowMicros();
+      if (now >= deadline) {
+        return true;
+      }
+      WaitForMilliseconds(&l, &cond_var_, (deadline - now + 999) / 1000);
+    }
+    return false;
+  }
+
   mutable mutex mu_;
-  Env* env_ TF_GUARDED_BY(mu_);
+  condition_variable cond_var_;
+  Env* env_;
   string stream_ TF_GUARDED_BY(mu_);
   string shard_ TF_GUARDED_BY(mu_);
-  Aws::String iterator_ TF_GUARDED_BY(mu_);
   std::unique_ptr<Aws::Kinesis::KinesisClient, decltype(&ShutdownClient)>
-      client_ TF_GUARDED_BY(mu_);
-  int64 interval_ TF_GUARDED_BY(mu_);
+      client_;
+  const int64 interval_;
+  const int64 max_interval_;
+  size_t capacity_ TF_GUARDED_BY(mu_);
+  std::vector<Shard> shards_ TF_GUARDED_BY(mu_);
+  std::deque<Record> records_ TF_GUARDED_BY(mu_);
+  // Shard and sequence number of records returned but not yet consumed
+  std::deque<std::pair<size_t, string>> returned_ TF_GUARDED_BY(mu_);
+  size_t active_ TF_GUARDED_BY(mu_) = 0;
+  bool cancelled_ TF_GUARDED_BY(mu_) = false;
+  Status status_ TF_GUARDED_BY(mu_);
+  std::vector<std::unique_ptr<Thread>> threads_;
 };
 
 class KinesisReadableInitOp : public ResourceOpKernel<KinesisReadableResource> {
@@ -472,10 +681,50 @@ class KinesisReadableReadOp : public OpKernel {
   mutable mutex mu_;
   Env* env_ TF_GUARDED_BY(mu_);
 };
+class KinesisReadableCheckpointOp : public OpKernel {
+ public:
+  explicit KinesisReadableCheckpointOp(OpKernelConstruction* context)
+      : OpKernel(context) {}
+
+  void Compute(OpKernelContext* context) override {
+    KinesisReadableResource* resource;
+    OP_REQUIRES_OK(context,
+                   GetResourceFromContext(context, "input", &resource));
+    core::ScopedUnref unref(resource);
+
+    OP_REQUIRES_OK(
+        context, resource->Checkpoint([&](const TensorShape& shape,
+                                          Tensor** shard_tensor,
+                                          Tensor** sequence_tensor) -> Status {
+          TF_RETURN_IF_ERROR(context->allocate_output(0, shape, shard_tensor));
+          TF_RETURN_IF_ERROR(
+              context->allocate_output(1, shape, sequence_tensor));
+          return Status::OK();
+        }));
+  }
+};
+class KinesisReadableCommitOp : public OpKernel {
+ public:
+  explicit KinesisReadableCommitOp(OpKernelConstruction* context)
+      : OpKernel(context) {}
+
+  void Compute(OpKernelContext* context) override {
+    KinesisReadableResource* resource;
+    OP_REQUIRES_OK(context,
+                   GetResourceFromContext(context, "input", &resource));
+    core::ScopedUnref unref(resource);
+
+    OP_REQUIRES_OK(context, resource->Commit());
+  }
+};
 REGISTER_KERNEL_BUILDER(Name("IO>KinesisReadableInit").Device(DEVICE_CPU),
                         KinesisReadableInitOp);
 REGISTER_KERNEL_BUILDER(Name("IO>KinesisReadableRead").Device(DEVICE_CPU),
                         KinesisReadableReadOp);
+REGISTER_KERNEL_BUILDER(Name("IO>KinesisReadableCheckpoint").Device(DEVICE_CPU),
+                        KinesisReadableCheckpointOp);
+REGISTER_KERNEL_BUILDER(Name("IO>KinesisReadableCommit").Device(DEVICE_CPU),
+                        KinesisReadableCommitOp);
 
 }  // namespace
 }  // namespace data
@@ -18,6 +18,7 @@ limitations under the License.
 
 #include "tensorflow/core/framework/resource_mgr.h"
 #include "tensorflow/core/framework/resource_op_kernel.h"
+#include "tensorflow/core/lib/gtl/cleanup.h"
 
 namespace tensorflow {
 namespace io {
@@ -27,18 +28,51 @@ class MongoDBReadableResource : public ResourceBase {
  public:
   MongoDBReadableResource(Env* env) : env_(env) {}
   ~MongoDBReadableResource() {
-    mongoc_collection_destroy(collection_obj_);
-    mongoc_database_destroy(database_obj_);
+    for (auto& split : splits_) {
+      if (split->cursor_obj != nullptr) {
+        mongoc_cursor_destroy(split->cursor_obj);
+      }
+      if (split->collection_obj != nullptr) {
+        mongoc_collection_destroy(split->collection_obj);
+      }
+      if (split->client_obj != nullptr) {
+        mongoc_client_pool_push(pool_obj_, split->client_obj);
+      }
+      if (split->filter != nullptr) {
+        bson_destroy(split->filter);
+      }
+    }
+    splits_.clear();
+    if (filter_ != nullptr) {
+      bson_destroy(filter_);
+    }
+    if (opts_ != nullptr) {
+      bson_destroy(opts_);
+    }
+    if (pool_obj_ != nullptr) {
+      mongoc_client_pool_destroy(pool_obj_);
+    }
     mongoc_uri_destroy(uri_obj_);
-    mongoc_client_destroy(client_obj_);
     mongoc_cleanup();
   }
 
   Status Init(const std::string& uri, const std::string& database,
-              const std::string& collection) {
+              const std::string& collection, const std::string& filter,
+              const std::string& projection, const int64 batch_size,
+              const int64 num_splits) {
     //   Required to initialize libmongoc's internals
     mongoc_init();
 
+    if (batch_size <= 0) {
+      return errors::InvalidArgument("batch_size must be positive, got: ",
+                                     batch_size);
+    }
+    batch_size_ = batch_size;
+    if (num_splits <= 0 || num_splits > kint32max) {
+      return errors::InvalidArgument("num_splits must be in [1, ", kint32max,
+                                     "], got: ", num_splits);
+    }
+
     // Create a MongoDB URI object from the given string
 
     uri_obj_ = mongoc_uri_new_with_error(uri.c_str(), &error_);
@@ -47,62 +81,103 @@ class MongoDBReadableResource : public ResourceBase {
                                         "due to: ", error_.message);
     }
 
-    // Initialize the MongoDB client
+    // A pool is used so that each split owns a client, as mongoc_client_t
+    // is not thread safe and splits are scanned concurrently. Splits keep
+    // their clients, so the pool is sized to hold one client per split plus
+    // one for the healthcheck and the split computation, otherwise popping
+    // a client beyond the default maximum of 100 would block forever.
 
-    client_obj_ = mongoc_client_new_from_uri(uri_obj_);
-    if (!client_obj_) {
-      return errors::FailedPrecondition("Failed to initialize the client");
+    pool_obj_ = mongoc_client_pool_new(uri_obj_);
+    if (!pool_obj_) {
+      return errors::FailedPrecondition("Failed to initialize the client pool");
     }
+    mongoc_client_pool_max_size(pool_obj_, static_cast<uint32>(num_splits + 1));
 
-    //  Get a handle on the database "db_name" and collection "coll_name"
+    database_ = database;
+    collection_ = collection;
 
-    database_obj_ = mongoc_client_get_database(client_obj_, database.c_str());
-    collection_obj_ = mongoc_client_get_collection(
-        client_obj_, database.c_str(), collection.c_str());
+    filter_ = bson_new_from_json(
+        reinterpret_cast<const uint8_t*>(filter.c_str()), -1, &error_);
+    if (!filter_) {
+      return errors::InvalidArgument("Failed to parse filter: ", filter,
+                                     " due to: ", error_.message);
+    }
 
-    cursor_obj_ =
-        mongoc_collection_find_with_opts(collection_obj_, query_, NULL, NULL);
+    // The projection and batchSize are passed to the server so that
+    // unrequested fields are never transferred and each round trip
+    // returns a full batch of documents.
+
+    bson_t* projection_obj = bson_new_from_json(
+        reinterpret_cast<const uint8_t*>(projection.c_str()), -1, &error_);
+    if (!projection_obj) {
+      return errors::InvalidArgument("Failed to parse projection: ", projection,
+                                     " due to: ", error_.message);
+    }
+    opts_ = bson_new();
+    if (!bson_empty(projection_obj)) {
+      BSON_APPEND_DOCUMENT(opts_, "projection", projection_obj);
+    }
+    BSON_APPEND_INT64(opts_, "batchSize", batch_size_);
+    bson_destroy(projection_obj);
 
     // Perform healthcheck before proceeding
-    Healthcheck();
+    TF_RETURN_IF_ERROR(Healthcheck());
+
+    std::vector<bson_t*> filters;
+    if (num_splits > 1) {
+      TF_RETURN_IF_ERROR(SplitFilter(num_splits, &filters));
+    } else {
+      filters.push_back(bson_copy(filter_));
+    }
+
+    for (size_t i = 0; i < filters.size(); i++) {
+      std::unique_ptr<Split> split(new Split());
+      split->filter = filters[i];
+      split->client_obj = mongoc_client_pool_pop(pool_obj_);
+      split->collection_obj = mongoc_client_get_collection(
+          split->client_obj, database_.c_str(), collection_.c_str());
+      split->cursor_obj = mongoc_collection_find_with_opts(
+          split->collection_obj, split->filter, opts_, NULL);
+      splits_.emplace_back(std::move(split));
+    }
     return Status::OK();
   }
 
-  Status Next(std::function<Status(const TensorShape& shape, Tensor** record)>
+  int64 Splits() const { return splits_.size(); }
+
+  Status Next(const int64 index,
+              std::function<Status(const TensorShape& shape, Tensor** record)>
                   allocate_func) {
-    mutex_lock l(mu_);
+    TF_RETURN_IF_ERROR(CheckIndex(index));
+    Split* split = splits_[index].get();
+    mutex_lock l(split->mu);
 
-    constexpr size_t max_num_records = 1024;
     std::vector<std::string> records;
-    records.reserve(max_num_records);
+    records.reserve(batch_size_);
 
     const bson_t* doc;
 
-    int num_records = 0;
-    while (num_records < max_num_records) {
-      if (mongoc_cursor_next(cursor_obj_, &doc)) {
+    while (records.size() < batch_size_) {
+      if (mongoc_cursor_next(split->cursor_obj, &doc)) {
         // Reference for BSON to JSON conversion:
         // https://github.com/mongodb/specifications/blob/master/source/extended-json.rst#conversion-table
         char* record = bson_as_relaxed_extended_json(doc, NULL);
         records.emplace_back(record);
-        num_records++;
         bson_free(record);
       } else {
         break;
       }
     }
+    TF_RETURN_IF_ERROR(CheckCursor(split));
 
     if (records.size() == 0) {
       // resetting the cursor after reaching the end of the collection.
-      cursor_obj_ =
-          mongoc_collection_find_with_opts(collection_obj_, query_, NULL, NULL);
+      ResetCursor(split);
     }
-    TensorShape shape({static_cast<int32>(records.size())});
+    TensorShape shape({static_cast<int64>(records.size())});
     Tensor* records_tensor;
     TF_RETURN_IF_ERROR(allocate_func(shape, &records_tensor));
 
-    // If no messages were received when timeout exceeded, we treat it as a
-    // failure and don't continue receiving messages.
     for (size_t i = 0; i < records.size(); i++) {
       records_tensor->flat<tstring>()(i) = records[i];
     }
@@ -110,18 +185,86 @@ class MongoDBReadableResource : public ResourceBase {
     return Status::OK();
   }
 
+  Status NextColumns(
+      const int64 index, const std::vector<std::string>& columns,
+      const DataTypeVector& dtypes,
+      std::function<Status(int64 column, const TensorShape& shape,
+                           Tensor** value)>
+          allocate_func) {
+    TF_RETURN_IF_ERROR(CheckIndex(index));
+    Split* split = splits_[index].get();
+    mutex_lock l(split->mu);
+
+    // Documents are collected first as the number of documents left on
+    // the cursor is not known until it has been drained.
+    std::vector<bson_t*> docs;
+    docs.reserve(batch_size_);
+    auto cleanup = gtl::MakeCleanup([&docs] {
+      for (bson_t* doc : docs) {
+        bson_destroy(doc);
+      }
+    });
+
+    const bson_t* doc;
+    while (docs.size() < batch_size_) {
+      if (mongoc_cursor_next(split->cursor_obj, &doc)) {
+        docs.push_back(bson_copy(doc));
+      } else {
+        break;
+      }
+    }
+    TF_RETURN_IF_ERROR(CheckCursor(split));
+
+    if (docs.size() == 0) {
+      // resetting the cursor after reaching the end of the collection.
+      ResetCursor(split);
+    }
+
+    TensorShape shape({static_cast<int64>(docs.size())});
+    for (size_t column = 0; column < columns.size(); column++) {
+      Tensor* value;
+      TF_RETURN_IF_ERROR(allocate_func(column, shape, &value));
+      for (size_t i = 0; i < docs.size(); i++) {
+        bson_iter_t iter, field;
+        if (!bson_iter_init(&iter, docs[i]) ||
+            !bson_iter_find_descendant(&iter, columns[column].c_str(),
+                                       &field)) {
+          return errors::InvalidArgument("Field ", columns[column],
+                                         " not found in document");
+        }
+        TF_RETURN_IF_ERROR(
+            AssignValue(columns[column], dtypes[column], &field, value, i));
+      }
+    }
+
+    return Status::OK();
+  }
+
   string DebugString() const override { return "MongoDBReadableResource"; }
 
  protected:
+  struct Split {
+    mutex mu;
+    bson_t* filter = nullptr;
+    mongoc_client_t* client_obj = nullptr;
+    mongoc_collection_t* collection_obj = nullptr;
+    mongoc_cursor_t* cursor_obj = nullptr;
+  };
+
   Status Healthcheck() {
     // Ping the server to check connectivity
 
-    cmd_ = BCON_NEW("ping", BCON_INT32(1));
+    mongoc_client_t* client_obj = mongoc_client_pool_pop(pool_obj_);
+    bson_t* cmd = BCON_NEW("ping", BCON_INT32(1));
+    bson_t reply;
 
-    retval_ = mongoc_client_command_simple(client_obj_, "admin", cmd_, NULL,
-                                           &reply_, &error_);
+    bool retval = mongoc_client_command_simple(client_obj, "admin", cmd, NULL,
+                                               &reply, &error_);
+    bson_destroy(&reply);
+    bson_destroy(cmd);
+    mongoc_client_pool_push(pool_obj_, client_obj);
 
-    if (!retval_) {
+    if (!retval) {
       return errors::FailedPrecondition(
           "Failed to ping the mongo cluster due to: ", error_.message);
     }
@@ -130,18 +273,162 @@ class MongoDBReadableResource : public ResourceBase {
     return Status::OK();
   }
 
+  // Splits the filter into ranges of `_id` of roughly equal size, using the
+  // boundaries computed by the server with $bucketAuto. The last range is
+  // closed so that the maximum `_id` is also covered.
+  Status SplitFilter(const int64 num_splits, std::vector<bson_t*>* filters) {
+    mongoc_client_t* client_obj = mongoc_client_pool_pop(pool_obj_);
+    mongoc_collection_t* collection_obj = mongoc_client_get_collection(
+        client_obj, database_.c_str(), collection_.c_str());
+    bson_t* pipeline = BCON_NEW(
+        "pipeline", "[", "{", "$match", BCON_DOCUMENT(filter_), "}", "{",
+        "$bucketAuto", "{", "groupBy", BCON_UTF8("$_id"), "buckets",
+        BCON_INT32(static_cast<int32>(num_splits)), "}", "}", "]");
+    mongoc_cursor_t* cursor_obj = mongoc_collection_aggregate(
+        collection_obj, MONGOC_QUERY_NONE, pipeline, NULL, NULL);
+
+    std::vector<std::pair<bson_value_t, bson_value_t>> boundaries;
+    const bson_t* doc;
+    while (mongoc_cursor_next(cursor_obj, &doc)) {
+      bson_iter_t iter, min_iter, max_iter;
+      if (bson_iter_init(&iter, doc) &&
+          bson_iter_find_descendant(&iter, "_id.min", &min_iter) &&
+          bson_iter_init(&iter, doc) &&
+          bson_iter_find_descendant(&iter, "_id.max", &max_iter)) {
+        bson_value_t min_value, max_value;
+        bson_value_copy(bson_iter_value(&min_iter), &min_value);
+        bson_value_copy(bson_iter_value(&max_iter), &max_value);
+        boundaries.emplace_back(min_value, max_value);
+      }
+    }
+    bool failed = mongoc_cursor_error(cursor_obj, &error_);
+
+    mongoc_cursor_destroy(cursor_obj);
+    bson_destroy(pipeline);
+    mongoc_collection_destroy(collection_obj);
+    mongoc_client_pool_push(pool_obj_, client_obj);
+
+    if (failed) {
+      for (auto& boundary : boundaries) {
+        bson_value_destroy(&boundary.first);
+        bson_value_destroy(&boundary.second);
+      }
+      return errors::FailedPrecondition("Failed to split the collection: ",
+                                        error_.message);
+    }
+
+    // An empty result means there is nothing to split, a single
+    // unrestricted scan is still needed to preserve the filter semantics.
+    if (boundaries.size() == 0) {
+      filters->push_back(bson_copy(filter_));
+      return Status::OK();
+    }
+
+    for (size_t i = 0; i < boundaries.size(); i++) {
+      bson_t* split = bson_new();
+      bson_t conditions, range, id;
+      BSON_APPEND_ARRAY_BEGIN(split, "$and", &conditions);
+      BSON_APPEND_DOCUMENT(&conditions, "0", filter_);
+      BSON_APPEND_DOCUMENT_BEGIN(&conditions, "1", &range);
+      BSON_APPEND_DOCUMENT_BEGIN(&range, "_id", &id);
+      BSON_APPEND_VALUE(&id, "$gte", &boundaries[i].first);
+      BSON_APPEND_VALUE(&id, (i + 1 == boundaries.size()) ? "$lte" : "$lt",
+                        &boundaries[i].second);
+      bson_append_document_end(&range, &id);
+      bson_append_document_end(&conditions, &range);
+      bson_append_array_end(split, &conditions);
+      filters->push_back(split);
+
+      bson_value_destroy(&boundaries[i].first);
+      bson_value_destroy(&boundaries[i].second);
+    }
+    return Status::OK();
+  }
+
+  Status CheckIndex(const int64 index) const {
+    if (index < 0 || index >= splits_.size()) {
+      return errors::InvalidArgument(
+          "Split index ", index, " is out of range [0, ", splits_.size(), ")");
+    }
+    return Status::OK();
+  }
+
+  Status CheckCursor(Split* split) {
+    bson_error_t error;
+    if (mongoc_cursor_error(split->cursor_obj, &error)) {
+      return errors::FailedPrecondition("Failed to read documents due to: ",
+                                        error.message);
+    }
+    return Status::OK();
+  }
+
+  void ResetCursor(Split* split) {
+    mongoc_cursor_destroy(split->cursor_obj);
+    split->cursor_obj = mongoc_collection_find_with_opts(
+        split->collection_obj, split->filter, opts_, NULL);
+  }
+
+  static Status AssignValue(const std::string& column, const DataType dtype,
+                            bson_iter_t* field, Tensor* value, int64 i) {
+    const bson_type_t type = bson_iter_type(field);
+    const bool numeric = (type == BSON_TYPE_INT32 || type == BSON_TYPE_INT64 ||
+                          type == BSON_TYPE_DOUBLE || type == BSON_TYPE_BOOL);
+    switch (dtype) {
+      case DT_INT32:
+        if (!numeric) break;
+        value->flat<int32>()(i) = static_cast<int32>(bson_iter_as_int64(field));
+        return Status::OK();
+      case DT_INT64:
+        if (!numeric) break;
+        value->flat<int64>()(i) = bson_iter_as_int64(field);
+        return Status::OK();
+      case DT_FLOAT:
+        if (!numeric) break;
+        value->flat<float>()(i) =
+            static_cast<float>(bson_iter_as_double(field));
+        return Status::OK();
+      case DT_DOUBLE:
+        if (!numeric) break;
+        value->flat<double>()(i) = bson_iter_as_double(field);
+        return Status::OK();
+      case DT_BOOL:
+        if (!numeric) break;
+        value->flat<bool>()(i) = bson_iter_as_bool(field);
+        return Status::OK();
+      case DT_STRING:
+        if (type == BSON_TYPE_UTF8) {
+          uint32_t length;
+          const char* str = bson_iter_utf8(field, &length);
+          value->flat<tstring>()(i) = tstring(str, length);
+          return Status::OK();
+        }
+        if (type == BSON_TYPE_OID) {
+          char str[25];
+          bson_oid_to_string(bson_iter_oid(field), str);
+          value->flat<tstring>()(i) = str;
+          return Status::OK();
+        }
+        break;
+      default:
+        return errors::InvalidArgument(
+            "Unsupported dtype ", DataTypeString(dtype), " for field ", column);
+    }
+    return errors::InvalidArgument("Unable to convert field ", column,
+                                   " of bson type ", type, " to ",
+                                   DataTypeString(dtype));
+  }
+
   mutable mutex mu_;
   Env* env_ TF_GUARDED_BY(mu_);
-  mongoc_uri_t* uri_obj_;
-  mongoc_client_t* client_obj_;
-  mongoc_database_t* database_obj_;
-  mongoc_collection_t* collection_obj_;
-  mongoc_cursor_t* cursor_obj_;
-  bson_t* query_ = bson_new();
-  bson_t *cmd_, reply_;
+  mongoc_uri_t* uri_obj_ = nullptr;
+  mongoc_client_pool_t* pool_obj_ = nullptr;
+  std::string database_;
+  std::string collection_;
+  bson_t* filter_ = nullptr;
+  bson_t* opts_ = nullptr;
+  int64 batch_size_ = 1024;
+  std::vector<std::unique_ptr<Split>> splits_;
   bson_error_t error_;
-  char* str;
-  bool retval_;
 };
 
 class MongoDBReadableInitOp : public ResourceOpKernel<MongoDBReadableResource> {
@@ -167,7 +454,30 @@ class MongoDBReadableInitOp : public ResourceOpKernel<MongoDBReadableResource> {
     OP_REQUIRES_OK(context, context->input("collection", &collection_tensor));
     const string& collection = collection_tensor->scalar<tstring>()();
 
-    OP_REQUIRES_OK(context, resource_->Init(uri, database, collection));
+    const Tensor* filter_tensor;
+    OP_REQUIRES_OK(context, context->input("filter", &filter_tensor));
+    const string& filter = filter_tensor->scalar<tstring>()();
+
+    const Tensor* projection_tensor;
+    OP_REQUIRES_OK(context, context->input("projection", &projection_tensor));
+    const string& projection = projection_tensor->scalar<tstring>()();
+
+    const Tensor* batch_size_tensor;
+    OP_REQUIRES_OK(context, context->input("batch_size", &batch_size_tensor));
+    const int64 batch_size = batch_size_tensor->scalar<int64>()();
+
+    const Tensor* num_splits_tensor;
+    OP_REQUIRES_OK(context, context->input("num_splits", &num_splits_tensor));
+    const int64 num_splits = num_splits_tensor->scalar<int64>()();
+
+    OP_REQUIRES_OK(
+        context, resource_->Init(uri, database, collection, filter, projection,
+                                 batch_size, num_splits));
+
+    Tensor* splits_tensor;
+    OP_REQUIRES_OK(
+        context, context->allocate_output(1, TensorShape({}), &splits_tensor));
+    splits_tensor->scalar<int64>()() = resource_->Splits();
   }
 
   Status CreateResource(MongoDBReadableResource** resource)
@@ -192,15 +502,65 @@ class MongoDBReadableNextOp : public OpKernel {
                    GetResourceFromContext(context, "resource", &resource));
     core::ScopedUnref unref(resource);
 
-    OP_REQUIRES_OK(context, resource->Next([&](const TensorShape& shape,
-                                               Tensor** record) -> Status {
-      TF_RETURN_IF_ERROR(context->allocate_output(0, shape, record));
-      return Status::OK();
-    }));
+    const Tensor* index_tensor;
+    OP_REQUIRES_OK(context, context->input("index", &index_tensor));
+    const int64 index = index_tensor->scalar<int64>()();
+
+    OP_REQUIRES_OK(
+        context,
+        resource->Next(
+            index, [&](const TensorShape& shape, Tensor** record) -> Status {
+              TF_RETURN_IF_ERROR(context->allocate_output(0, shape, record));
+              return Status::OK();
+            }));
+  }
+
+ private:
+  mutable mutex mu_;
+};
+
+class MongoDBReadableNextColumnsOp : public OpKernel {
+ public:
+  explicit MongoDBReadableNextColumnsOp(OpKernelConstruction* context)
+      : OpKernel(context) {
+    OP_REQUIRES_OK(context, context->GetAttr("dtypes", &dtypes_));
+  }
+
+  void Compute(OpKernelContext* context) override {
+    MongoDBReadableResource* resource;
+    OP_REQUIRES_OK(context,
+                   GetResourceFromContext(context, "resource", &resource));
+    core::ScopedUnref unref(resource);
+
+    const Tensor* index_tensor;
+    OP_REQUIRES_OK(context, context->input("index", &index_tensor));
+    const int64 index = index_tensor->scalar<int64>()();
+
+    const Tensor* columns_tensor;
+    OP_REQUIRES_OK(context, context->input("columns", &columns_tensor));
+    OP_REQUIRES(context, columns_tensor->NumElements() == dtypes_.size(),
+                errors::InvalidArgument("Number of columns (",
+                                        columns_tensor->NumElements(),
+                                        ") does not match number of dtypes (",
+                                        dtypes_.size(), ")"));
+    std::vector<std::string> columns;
+    for (int64 i = 0; i < columns_tensor->NumElements(); i++) {
+      columns.push_back(columns_tensor->flat<tstring>()(i));
+    }
+
+    OP_REQUIRES_OK(context, resource->NextColumns(
+                                index, columns, dtypes_,
+                                [&](int64 column, const TensorShape& shape,
+                                    Tensor** value) -> Status {
+                                  TF_RETURN_IF_ERROR(context->allocate_output(
+                                      column, shape, value));
+                                  return Status::OK();
+                                }));
   }
 
  private:
   mutable mutex mu_;
+  DataTypeVector dtypes_;
 };
 
 class MongoDBWritableResource : public ResourceBase {
@@ -404,6 +764,9 @@ REGISTER_KERNEL_BUILDER(Name("IO>MongoDBReadableInit").Device(DEVICE_CPU),
                         MongoDBReadableInitOp);
 REGISTER_KERNEL_BUILDER(Name("IO>MongoDBReadableNext").Device(DEVICE_CPU),
                         MongoDBReadableNextOp);
+REGISTER_KERNEL_BUILDER(
+    Name("IO>MongoDBReadableNextColumns").Device(DEVICE_CPU),
+    MongoDBReadableNextColumnsOp);
 REGISTER_KERNEL_BUILDER(Name("IO>MongoDBWritableInit").Device(DEVICE_CPU),
                         MongoDBWritableInitOp);
 REGISTER_KERNEL_BUILDER(Name("IO>MongoDBWritableWrite").Device(DEVICE_CPU),
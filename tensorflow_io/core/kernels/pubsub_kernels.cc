@@ -21,6 +21,8 @@ limitations under the License.
 #include <Windows.h>
 #undef OPTIONAL
 #endif
+#include <deque>
+
 #include "absl/time/clock.h"
 #include "google/pubsub/v1/pubsub.grpc.pb.h"
 #include "tensorflow/core/framework/resource_mgr.h"
@@ -33,13 +35,33 @@ namespace {
 using google::pubsub::v1::AcknowledgeRequest;
 using google::pubsub::v1::PullRequest;
 using google::pubsub::v1::PullResponse;
+using google::pubsub::v1::StreamingPullRequest;
+using google::pubsub::v1::StreamingPullResponse;
 using google::pubsub::v1::Subscriber;
 using grpc::ClientContext;
 
+// The ack deadline of the messages received through a streaming pull, which
+// is extended for as long as the messages are buffered or waiting to be
+// acknowledged.
+constexpr int kStreamAckDeadlineSeconds = 60;
+
 class PubSubReadableResource : public ResourceBase {
  public:
   PubSubReadableResource(Env* env) : env_(env) {}
-  ~PubSubReadableResource() {}
+  ~PubSubReadableResource() {
+    if (receive_thread_ != nullptr) {
+      FlushAcknowledge();
+      {
+        mutex_lock l(buffer_mu_);
+        shutdown_ = true;
+        buffer_cv_.notify_all();
+      }
+      stream_context_->TryCancel();
+      // Joins the receive and lease threads.
+      receive_thread_.reset(nullptr);
+      lease_thread_.reset(nullptr);
+    }
+  }
 
   Status Init(const string& input, const std::vector<string>& metadata) {
     mutex_lock l(mu_);
@@ -47,6 +69,9 @@ class PubSubReadableResource : public ResourceBase {
     endpoint_ = "";
     subscription_ = input;
     timeout_ = 10 * 1000;
+    streaming_ = false;
+    max_outstanding_ = 1000;
+    batch_ = 0;
     for (size_t i = 0; i < metadata.size(); i++) {
       if (metadata[i].find("endpoint=") == 0) {
         std::vector<string> parts = str_util::Split(metadata[i], "=");
@@ -61,8 +86,35 @@ class PubSubReadableResource : public ResourceBase {
           return errors::InvalidArgument("invalid configuration: ",
                                          metadata[i]);
         }
+      } else if (metadata[i].find("streaming=") == 0) {
+        std::vector<string> parts = str_util::Split(metadata[i], "=");
+        if (parts.size() != 2 ||
+            !strings::SafeStringToNumeric<bool>(parts[1], &streaming_)) {
+          return errors::InvalidArgument("invalid configuration: ",
+                                         metadata[i]);
+        }
+      } else if (metadata[i].find("max_outstanding=") == 0) {
+        std::vector<string> parts = str_util::Split(metadata[i], "=");
+        if (parts.size() != 2 ||
+            !strings::safe_strto64(parts[1], &max_outstanding_) ||
+            max_outstanding_ <= 0) {
+          return errors::InvalidArgument("invalid configuration: ",
+                                         metadata[i]);
+        }
+      } else if (metadata[i].find("batch=") == 0) {
+        std::vector<string> parts = str_util::Split(metadata[i], "=");
+        if (parts.size() != 2 || !strings::safe_strto64(parts[1], &batch_) ||
+            batch_ <= 0) {
+          return errors::InvalidArgument("invalid configuration: ",
+                                         metadata[i]);
+        }
       }
     }
+    if (batch_ == 0) {
+      // Keep the single message pull by default, while a streaming pull
+      // returns whatever has been buffered.
+      batch_ = streaming_ ? max_outstanding_ : 1;
+    }
     string endpoint = endpoint_;
     auto creds = grpc::GoogleDefaultCredentials();
     if (endpoint_.find("http://") == 0) {
@@ -74,11 +126,34 @@ class PubSubReadableResource : public ResourceBase {
     }
     stub_ = Subscriber::NewStub(grpc::CreateChannel(endpoint, creds));
 
+    if (streaming_) {
+      // The messages are received by a background thread into a bounded
+      // buffer, and the server stops sending once max_outstanding
+      // messages are left unacknowledged.
+      stream_context_.reset(new ClientContext());
+      stream_ = stub_->StreamingPull(stream_context_.get());
+      StreamingPullRequest request;
+      request.set_subscription(subscription_);
+      request.set_stream_ack_deadline_seconds(kStreamAckDeadlineSeconds);
+      request.set_max_outstanding_messages(max_outstanding_);
+      if (!stream_->Write(request)) {
+        return errors::Internal("Failed to start streaming pull: ",
+                                stream_->Finish().error_message());
+      }
+      receive_thread_.reset(env_->StartThread(ThreadOptions(), "pubsub_receive",
+                                              [this]() { ReceiveLoop(); }));
+      lease_thread_.reset(env_->StartThread(ThreadOptions(), "pubsub_lease",
+                                            [this]() { LeaseLoop(); }));
+    }
+
     return Status::OK();
   }
   Status Read(std::function<Status(const TensorShape& shape, Tensor** id_tensor,
                                    Tensor** data_tensor, Tensor** time_tensor)>
                   allocate_func) {
+    if (streaming_) {
+      return ReadStreaming(allocate_func);
+    }
     mutex_lock l(mu_);
     if (stub_.get() == nullptr) {
       return errors::OutOfRange("EOF reached");
@@ -96,7 +171,7 @@ class PubSubReadableResource : public ResourceBase {
     while (true) {
       PullRequest request;
       request.set_subscription(subscription_);
-      request.set_max_messages(1);
+      request.set_max_messages(batch_);
       PullResponse response;
       auto status = stub_->Pull(&context, request, &response);
       if (!status.ok()) {
@@ -111,22 +186,20 @@ class PubSubReadableResource : public ResourceBase {
         return Status::OK();
       }
       if (response.received_messages().size() != 0) {
-        TF_RETURN_IF_ERROR(allocate_func(TensorShape({1}), &id_tensor,
+        const int64 count = response.received_messages().size();
+        TF_RETURN_IF_ERROR(allocate_func(TensorShape({count}), &id_tensor,
                                          &data_tensor, &time_tensor));
-        id_tensor->scalar<tstring>()() =
-            std::string((response.received_messages(0).message().message_id()));
-        data_tensor->scalar<tstring>()() =
-            std::string((response.received_messages(0).message().data()));
-        time_tensor->scalar<int64>()() =
-            response.received_messages(0).message().publish_time().seconds() *
-                1000 +
-            response.received_messages(0).message().publish_time().nanos() /
-                1000000;
-
-        // Acknowledge
+        // Acknowledge all the messages of the batch at once
         AcknowledgeRequest acknowledge;
-        acknowledge.add_ack_ids(response.received_messages(0).ack_id());
         acknowledge.set_subscription(subscription_);
+        for (int64 i = 0; i < count; i++) {
+          const auto& received = response.received_messages(i);
+          id_tensor->flat<tstring>()(i) = received.message().message_id();
+          data_tensor->flat<tstring>()(i) = received.message().data();
+          time_tensor->flat<int64>()(i) = PublishTime(received.message());
+          acknowledge.add_ack_ids(received.ack_id());
+        }
+
         google::protobuf::Empty empty;
         ClientContext ack_context;
         status = stub_->Acknowledge(&ack_context, acknowledge, &empty);
@@ -142,15 +215,210 @@ class PubSubReadableResource : public ResourceBase {
   }
 
  protected:
+  struct Message {
+    string id;
+    string data;
+    int64 time;
+    string ack_id;
+  };
+
+  static int64 PublishTime(const google::pubsub::v1::PubsubMessage& message) {
+    return message.publish_time().seconds() * 1000 +
+           message.publish_time().nanos() / 1000000;
+  }
+
+  void ReceiveLoop() {
+    StreamingPullResponse response;
+    while (stream_->Read(&response)) {
+      mutex_lock l(buffer_mu_);
+      for (const auto& received : response.received_messages()) {
+        buffer_.push_back(
+            Message{received.message().message_id(), received.message().data(),
+                    PublishTime(received.message()), received.ack_id()});
+      }
+      buffer_cv_.notify_all();
+      // Flow control on the server side is best effort, so the buffer is
+      // bounded here as well.
+      while (!shutdown_ && buffer_.size() >= max_outstanding_) {
+        buffer_cv_.wait(l);
+      }
+      if (shutdown_) {
+        break;
+      }
+    }
+    grpc::Status status;
+    {
+      // Finish must not overlap with the writes of acknowledgements and
+      // deadline extensions.
+      mutex_lock l(ack_mu_);
+      stream_closed_ = true;
+      status = stream_->Finish();
+    }
+    mutex_lock l(buffer_mu_);
+    if (!status.ok() && !shutdown_) {
+      // gRPC status codes are the same as the TensorFlow ones.
+      stream_status_ = Status(static_cast<error::Code>(status.error_code()),
+                              strings::StrCat("Failed to receive message: ",
+                                              status.error_message()));
+    }
+    receive_done_ = true;
+    buffer_cv_.notify_all();
+  }
+
+  // Extends the ack deadline of the messages that are buffered, or consumed
+  // but not acknowledged yet, so that they are not redelivered while they
+  // wait.
+  void LeaseLoop() {
+    const absl::Duration interval =
+        absl::Seconds(kStreamAckDeadlineSeconds) / 2;
+    while (true) {
+      StreamingPullRequest request;
+      {
+        mutex_lock l(buffer_mu_);
+        const absl::Time until = absl::Now() + interval;
+        while (!shutdown_ && !receive_done_ && absl::Now() < until) {
+          WaitForMilliseconds(
+              &l, &buffer_cv_,
+              absl::ToInt64Milliseconds(until - absl::Now()) + 1);
+        }
+        if (shutdown_ || receive_done_) {
+          return;
+        }
+        for (const auto& message : buffer_) {
+          request.add_modify_deadline_ack_ids(message.ack_id);
+        }
+      }
+      mutex_lock l(ack_mu_);
+      for (const auto& ack_id : pending_acks_) {
+        request.add_modify_deadline_ack_ids(ack_id);
+      }
+      if (stream_closed_ || request.modify_deadline_ack_ids_size() == 0) {
+        continue;
+      }
+      for (int i = 0; i < request.modify_deadline_ack_ids_size(); i++) {
+        request.add_modify_deadline_seconds(kStreamAckDeadlineSeconds);
+      }
+      if (!stream_->Write(request)) {
+        LOG(WARNING) << "Failed to extend the ack deadline of "
+                     << request.modify_deadline_ack_ids_size()
+                     << " messages, they may be redelivered";
+      }
+    }
+  }
+
+  Status ReadStreaming(
+      std::function<Status(const TensorShape& shape, Tensor** id_tensor,
+                           Tensor** data_tensor, Tensor** time_tensor)>
+          allocate_func) {
+    Tensor* id_tensor;
+    Tensor* data_tensor;
+    Tensor* time_tensor;
+    std::vector<Message> messages;
+    bool empty;
+    {
+      mutex_lock l(buffer_mu_);
+      empty = buffer_.empty();
+    }
+    if (empty) {
+      // Nothing is buffered, so acknowledge what has been consumed to let
+      // the server send more messages before waiting.
+      FlushAcknowledge();
+    }
+    {
+      mutex_lock l(buffer_mu_);
+      while (buffer_.empty() && !receive_done_ && !eof_) {
+        if (timeout_ <= 0) {
+          buffer_cv_.wait(l);
+        } else if (WaitForMilliseconds(&l, &buffer_cv_, timeout_) ==
+                   kCond_Timeout) {
+          break;
+        }
+      }
+      if (buffer_.empty()) {
+        // A stream that failed is reported once the buffer is drained,
+        // rather than ending the dataset as if there was no more message.
+        TF_RETURN_IF_ERROR(stream_status_);
+        // break subscription if there is a timeout, and no message.
+        eof_ = true;
+        return allocate_func(TensorShape({0}), &id_tensor, &data_tensor,
+                             &time_tensor);
+      }
+      const size_t count = std::min<size_t>(batch_, buffer_.size());
+      messages.reserve(count);
+      for (size_t i = 0; i < count; i++) {
+        messages.emplace_back(std::move(buffer_.front()));
+        buffer_.pop_front();
+      }
+      buffer_cv_.notify_all();
+    }
+
+    TF_RETURN_IF_ERROR(
+        allocate_func(TensorShape({static_cast<int64>(messages.size())}),
+                      &id_tensor, &data_tensor, &time_tensor));
+    bool flush = false;
+    {
+      mutex_lock l(ack_mu_);
+      for (size_t i = 0; i < messages.size(); i++) {
+        id_tensor->flat<tstring>()(i) = messages[i].id;
+        data_tensor->flat<tstring>()(i) = messages[i].data;
+        time_tensor->flat<int64>()(i) = messages[i].time;
+        pending_acks_.emplace_back(std::move(messages[i].ack_id));
+      }
+      // Acknowledgements are deferred and sent in batches over the stream.
+      flush =
+          (pending_acks_.size() >= std::max<int64>(max_outstanding_ / 2, 1));
+    }
+    if (flush) {
+      FlushAcknowledge();
+    }
+    return Status::OK();
+  }
+
+  void FlushAcknowledge() {
+    mutex_lock l(ack_mu_);
+    if (pending_acks_.empty()) {
+      return;
+    }
+    StreamingPullRequest request;
+    for (auto& ack_id : pending_acks_) {
+      request.add_ack_ids(std::move(ack_id));
+    }
+    pending_acks_.clear();
+    if (stream_closed_ || !stream_->Write(request)) {
+      LOG(WARNING) << "Failed to acknowledge " << request.ack_ids_size()
+                   << " messages, they will be redelivered";
+    }
+  }
+
   mutable mutex mu_;
   Env* env_ TF_GUARDED_BY(mu_);
   string subscription_ TF_GUARDED_BY(mu_);
   string endpoint_ TF_GUARDED_BY(mu_);
   int64 timeout_ TF_GUARDED_BY(mu_);
+  // Set once in Init.
+  int64 batch_;
+  int64 max_outstanding_;
+  bool streaming_;
   std::unique_ptr<Subscriber::Stub> stub_ TF_GUARDED_BY(mu_);
-  string message_id_ TF_GUARDED_BY(mu_);
-  string message_data_ TF_GUARDED_BY(mu_);
-  int64 message_time_ TF_GUARDED_BY(mu_);
+
+  // Streaming pull state, the stream is read by the receive thread and
+  // written (acknowledgements and deadline extensions) under ack_mu_.
+  std::unique_ptr<ClientContext> stream_context_;
+  std::unique_ptr<
+      grpc::ClientReaderWriter<StreamingPullRequest, StreamingPullResponse>>
+      stream_;
+  std::unique_ptr<Thread> receive_thread_;
+  std::unique_ptr<Thread> lease_thread_;
+  mutex buffer_mu_;
+  condition_variable buffer_cv_;
+  std::deque<Message> buffer_ TF_GUARDED_BY(buffer_mu_);
+  bool receive_done_ TF_GUARDED_BY(buffer_mu_) = false;
+  bool shutdown_ TF_GUARDED_BY(buffer_mu_) = false;
+  bool eof_ TF_GUARDED_BY(buffer_mu_) = false;
+  Status stream_status_ TF_GUARDED_BY(buffer_mu_);
+  mutex ack_mu_;
+  std::vector<string> pending_acks_ TF_GUARDED_BY(ack_mu_);
+  bool stream_closed_ TF_GUARDED_BY(ack_mu_) = false;
 };
 
 class PubSubReadableInitOp : public ResourceOpKernel<PubSubReadableResource> {
@@ -16,6 +16,7 @@ limitations under the License.
 #include "pulsar/Client.h"
 #include "tensorflow/core/framework/resource_mgr.h"
 #include "tensorflow/core/framework/resource_op_kernel.h"
+#include "tensorflow/core/platform/env.h"
 
 namespace tensorflow {
 namespace io {
@@ -60,46 +61,76 @@ class PulsarReadableResource final : public PulsarResourceBase {
                               " error: ", pulsar::strResult(result));
     }
 
+    // A batch is acknowledged with a single cumulative ack of its last
+    // message, which is not supported by consumers of partitioned topics
+    std::vector<std::string> partitions;
+    result = client_->getPartitionsForTopic(topic, partitions);
+    if (result != pulsar::ResultOk) {
+      return errors::Internal("failed to get partitions of topic: ", topic,
+                              " error: ", pulsar::strResult(result));
+    }
+    cumulative_ack_ = (partitions.size() <= 1);
+
     LOG(INFO) << "Subscribing to the pulsar topic: " << topic
               << " with subscription: " << subscription;
     return Status::OK();
   }
 
   Status Next(const int32 timeout, const int32 poll_timeout,
+              const int64 max_messages, const int64 max_bytes,
+              const int32 batch_timeout,
               std::function<Status(const TensorShape& shape, Tensor** message,
                                    Tensor** key, Tensor** continue_fetch)>
                   allocate_func) {
     mutex_lock l(mu_);
 
-    constexpr size_t max_num_messages = 1024;
     std::vector<std::string> values;
     std::vector<std::string> keys;
-    values.reserve(max_num_messages);
-    keys.reserve(max_num_messages);
-
+    std::vector<pulsar::MessageId> ids;
+    const size_t reserved = std::min<int64>(max_messages, 1024);
+    values.reserve(reserved);
+    keys.reserve(reserved);
+    ids.reserve(reserved);
+
+    // The batch is returned once it has max_messages or max_bytes, once
+    // batch_timeout elapsed since its first message, or once no message
+    // was received for timeout
     int32 elapsed_time = 0;
-    int num_messages = 0;
-    while (elapsed_time < timeout && num_messages < max_num_messages) {
+    int64 num_bytes = 0;
+    uint64 deadline = 0;
+    while (elapsed_time < timeout &&
+           static_cast<int64>(values.size()) < max_messages &&
+           (max_bytes < 0 || num_bytes < max_bytes)) {
+      int32 receive_timeout = poll_timeout;
+      if (!values.empty() && batch_timeout >= 0) {
+        const uint64 now = Env::Default()->NowMicros();
+        if (now >= deadline) {
+          break;
+        }
+        receive_timeout = std::min<int64>(
+            receive_timeout, std::max<int64>((deadline - now) / 1000, 1));
+      }
       pulsar::Message message;
-      auto result = consumer_.receive(message, poll_timeout);
+      auto result = consumer_.receive(message, receive_timeout);
       if (result == pulsar::ResultOk) {
+        if (values.empty() && batch_timeout >= 0) {
+          deadline = Env::Default()->NowMicros() +
+                     static_cast<uint64>(batch_timeout) * 1000;
+        }
         keys.emplace_back(message.hasPartitionKey() ? message.getPartitionKey()
                                                     : "");
         values.emplace_back(message.getDataAsString());
-        num_messages++;
+        ids.emplace_back(message.getMessageId());
+        num_bytes += message.getLength();
         elapsed_time = 0;  // reset the current timeout
-        consumer_.acknowledgeAsync(message, [&](pulsar::Result result) {
-          if (result != pulsar::ResultOk) {
-            LOG(ERROR) << "Failed to acknowledge " << message.getMessageId();
-          }
-        });
       } else if (result == pulsar::ResultTimeout) {
-        elapsed_time += poll_timeout;
+        elapsed_time += receive_timeout;
       } else {
         return errors::Internal("failed to receive messages, error: ",
                                 pulsar::strResult(result));
       }
     }
+    Acknowledge(ids);
 
     TensorShape shape({static_cast<int32>(values.size())});
     Tensor* value_tensor;
@@ -112,8 +143,8 @@ class PulsarReadableResource final : public PulsarResourceBase {
     // failure and don't continue receiving messages.
     continue_fetch_tensor->scalar<int64>()() = (values.empty() ? 0 : 1);
     for (size_t i = 0; i < values.size(); i++) {
-      value_tensor->flat<tstring>()(i) = values[i];
-      key_tensor->flat<tstring>()(i) = keys[i];
+      value_tensor->flat<tstring>()(i) = std::move(values[i]);
+      key_tensor->flat<tstring>()(i) = std::move(keys[i]);
     }
 
     return Status::OK();
@@ -122,7 +153,28 @@ class PulsarReadableResource final : public PulsarResourceBase {
   std::string DebugString() const override { return "PulsarReadableResource"; }
 
  private:
+  void Acknowledge(const std::vector<pulsar::MessageId>& ids)
+      TF_EXCLUSIVE_LOCKS_REQUIRED(mu_) {
+    if (ids.empty()) {
+      return;
+    }
+    auto callback = [](pulsar::Result result) {
+      if (result != pulsar::ResultOk) {
+        LOG(ERROR) << "Failed to acknowledge messages: "
+                   << pulsar::strResult(result);
+      }
+    };
+    if (cumulative_ack_) {
+      consumer_.acknowledgeCumulativeAsync(ids.back(), callback);
+      return;
+    }
+    for (const pulsar::MessageId& id : ids) {
+      consumer_.acknowledgeAsync(id, callback);
+    }
+  }
+
   pulsar::Consumer consumer_;
+  bool cumulative_ack_ = true;
 };
 
 class PulsarReadableInitOp : public ResourceOpKernel<PulsarReadableResource> {
@@ -180,17 +232,34 @@ class PulsarReadableNextOp : public OpKernel {
 
     const Tensor* timeout_tensor;
     OP_REQUIRES_OK(context, context->input("timeout", &timeout_tensor));
-    const int64 timeout = timeout_tensor->scalar<int64>()();
+    const int32 timeout = timeout_tensor->scalar<int32>()();
 
     const Tensor* poll_timeout_tensor;
     OP_REQUIRES_OK(context,
                    context->input("poll_timeout", &poll_timeout_tensor));
-    const int64 poll_timeout = poll_timeout_tensor->scalar<int64>()();
+    const int32 poll_timeout = poll_timeout_tensor->scalar<int32>()();
+
+    const Tensor* max_messages_tensor;
+    OP_REQUIRES_OK(context,
+                   context->input("max_messages", &max_messages_tensor));
+    const int64 max_messages = max_messages_tensor->scalar<int64>()();
+    OP_REQUIRES(context, max_messages > 0,
+                errors::InvalidArgument("max_messages must be positive, got: ",
+                                        max_messages));
+
+    const Tensor* max_bytes_tensor;
+    OP_REQUIRES_OK(context, context->input("max_bytes", &max_bytes_tensor));
+    const int64 max_bytes = max_bytes_tensor->scalar<int64>()();
+
+    const Tensor* batch_timeout_tensor;
+    OP_REQUIRES_OK(context,
+                   context->input("batch_timeout", &batch_timeout_tensor));
+    const int32 batch_timeout = batch_timeout_tensor->scalar<int32>()();
 
     OP_REQUIRES_OK(
         context,
         resource->Next(
-            timeout, poll_timeout,
+            timeout, poll_timeout, max_messages, max_bytes, batch_timeout,
             [&](const TensorShape& shape, Tensor** message, Tensor** key,
                 Tensor** continue_fetch) -> Status {
               TF_RETURN_IF_ERROR(context->allocate_output(0, shape, message));
@@ -211,10 +280,15 @@ class PulsarWritableResource final : public PulsarResourceBase {
     mutex_lock l(mu_);
     PulsarResourceBase::Init(service_url);
     index_ = 0;
+    state_ = std::make_shared<SendState>();
 
+    // Messages are batched by the producer and a full queue blocks the
+    // writer instead of failing the send
     pulsar::ProducerConfiguration conf;
     conf.setPartitionsRoutingMode(
         pulsar::ProducerConfiguration::RoundRobinDistribution);
+    conf.setBatchingEnabled(true);
+    conf.setBlockIfQueueFull(true);
 
     auto result = client_->createProducer(topic, conf, producer_);
     if (result != pulsar::ResultOk) {
@@ -226,29 +300,36 @@ class PulsarWritableResource final : public PulsarResourceBase {
     return Status::OK();
   }
 
-  Status WriteAsync(const std::string& value, const std::string& key) {
+  Status WriteAsync(const Tensor& values, const Tensor& keys) {
     mutex_lock l(mu_);
-    pulsar::MessageBuilder builder;
-    if (!key.empty()) {
-      builder.setPartitionKey(key);
-    }
-    auto send_async_result = pulsar::ResultOk;
-    producer_.sendAsync(
-        builder.setContent(value).build(),
-        [index = index_, &send_async_result](pulsar::Result result,
-                                             const pulsar::MessageId& id) {
-          if (result != pulsar::ResultOk) {
-            LOG(ERROR) << "failed to send message-" << index << ": " << result;
-          }
-          send_async_result = result;
-        });
-    // sendAsync may fail immediately caused by queue is full
-    if (send_async_result != pulsar::ResultOk) {
-      return errors::Internal("sendAsync failed for index: ", index_,
-                              " error: ", pulsar::strResult(send_async_result));
+    const int64 num_values = values.NumElements();
+    const int64 num_keys = keys.NumElements();
+    for (int64 i = 0; i < num_values; i++) {
+      const tstring& value = values.flat<tstring>()(i);
+      const tstring& key = keys.flat<tstring>()(num_keys == 1 ? 0 : i);
+      pulsar::MessageBuilder builder;
+      if (!key.empty()) {
+        builder.setPartitionKey(std::string(key));
+      }
+      std::shared_ptr<SendState> state = state_;
+      producer_.sendAsync(
+          builder.setContent(value.data(), value.size()).build(),
+          [index = index_, state](pulsar::Result result,
+                                  const pulsar::MessageId& id) {
+            if (result != pulsar::ResultOk) {
+              LOG(ERROR) << "failed to send message-" << index << ": "
+                         << result;
+              mutex_lock l(state->mu);
+              if (state->result == pulsar::ResultOk) {
+                state->result = result;
+                state->index = index;
+              }
+            }
+          });
+      index_++;
     }
-    index_++;
-    return Status::OK();
+    // sendAsync may fail immediately, other failures are reported by Flush
+    return CheckSendResultLocked();
   }
 
   Status Flush() {
@@ -257,14 +338,35 @@ class PulsarWritableResource final : public PulsarResourceBase {
     if (result != pulsar::ResultOk) {
       return errors::Internal("failed to flush: ", pulsar::strResult(result));
     }
-    return Status::OK();
+    return CheckSendResultLocked();
   }
 
   std::string DebugString() const override { return "PulsarWritableResource"; }
 
  private:
+  // First failure of the sends since it was last reported, shared with the
+  // send callbacks that may run after the resource is destroyed
+  struct SendState {
+    mutex mu;
+    pulsar::Result result TF_GUARDED_BY(mu) = pulsar::ResultOk;
+    unsigned long index TF_GUARDED_BY(mu) = 0;
+  };
+
+  Status CheckSendResultLocked() TF_EXCLUSIVE_LOCKS_REQUIRED(mu_) {
+    mutex_lock l(state_->mu);
+    if (state_->result != pulsar::ResultOk) {
+      Status status =
+          errors::Internal("sendAsync failed for index: ", state_->index,
+                           " error: ", pulsar::strResult(state_->result));
+      state_->result = pulsar::ResultOk;
+      return status;
+    }
+    return Status::OK();
+  }
+
   pulsar::Producer producer_;
   unsigned long index_;
+  std::shared_ptr<SendState> state_;
 };
 
 class PulsarWritableInitOp : public ResourceOpKernel<PulsarWritableResource> {
@@ -312,13 +414,18 @@ class PulsarWritableWriteOp : public OpKernel {
 
     const Tensor* value_tensor;
     OP_REQUIRES_OK(context, context->input("value", &value_tensor));
-    const std::string value = value_tensor->flat<tstring>()(0);
 
     const Tensor* key_tensor;
     OP_REQUIRES_OK(context, context->input("key", &key_tensor));
-    const std::string key = key_tensor->flat<tstring>()(0);
-
-    OP_REQUIRES_OK(context, resource->WriteAsync(value, key));
+    OP_REQUIRES(context,
+                key_tensor->NumElements() == 1 ||
+                    key_tensor->NumElements() == value_tensor->NumElements(),
+                errors::InvalidArgument(
+                    "key must be a single key or have a key for each of the ",
+                    value_tensor->NumElements(),
+                    " values, got: ", key_tensor->NumElements()));
+
+    OP_REQUIRES_OK(context, resource->WriteAsync(*value_tensor, *key_tensor));
   }
 };
 
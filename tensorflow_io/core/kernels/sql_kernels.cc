@@ -37,20 +37,20 @@ DataType SqlDataType(int oid) {
   return DT_INVALID;
 };
 
-Status SqlDataCopy(int oid, char* data, Tensor* value) {
+Status SqlDataCopy(int oid, const char* data, Tensor* value, int64 index) {
   bool result = false;
   switch (oid) {
     case INT4OID:
-      result = absl::SimpleAtoi<int32>(data, &value->flat<int32>()(0));
+      result = absl::SimpleAtoi<int32>(data, &value->flat<int32>()(index));
       break;
     case INT8OID:
-      result = absl::SimpleAtoi<int64>(data, &value->flat<int64>()(0));
+      result = absl::SimpleAtoi<int64>(data, &value->flat<int64>()(index));
       break;
     case FLOAT4OID:
-      result = absl::SimpleAtof(data, &value->flat<float>()(0));
+      result = absl::SimpleAtof(data, &value->flat<float>()(index));
       break;
     case FLOAT8OID:
-      result = absl::SimpleAtod(data, &value->flat<double>()(0));
+      result = absl::SimpleAtod(data, &value->flat<double>()(index));
       break;
     default:
       return errors::InvalidArgument("sql data type ", oid, " not supported");
@@ -78,8 +78,9 @@ class SqlIterableResource : public ResourceBase {
         }) {}
   ~SqlIterableResource() {}
 
-  Status Init(const string& query, const string& endpoint, int64* count,
-              std::vector<string>* fields, std::vector<DataType>* dtypes) {
+  Status Init(const string& query, const string& endpoint, const int64 batch,
+              int64* count, std::vector<string>* fields,
+              std::vector<DataType>* dtypes) {
     mutex_lock l(mu_);
     conn_.reset(PQconnectdb(endpoint.c_str()));
     if (PQstatus(conn_.get()) != CONNECTION_OK) {
@@ -88,16 +89,37 @@ class SqlIterableResource : public ResourceBase {
     }
     LOG(INFO) << "Connection to database succeed.";
 
-    result_.reset(PQexec(conn_.get(), query.c_str()));
-    if (PQresultStatus(result_.get()) != PGRES_TUPLES_OK) {
-      return errors::InvalidArgument("Exec of query failed: ",
-                                     PQerrorMessage(conn_.get()));
+    batch_ = batch;
+    if (batch_ > 0) {
+      // With a positive batch the query is streamed through a server-side
+      // cursor, so that only `batch` rows are held in memory at a time.
+      // The number of rows is unknown in this mode.
+      query_ = query;
+      size_t end = query_.find_last_not_of(" \t\r\n;");
+      query_ = (end == string::npos) ? "" : query_.substr(0, end + 1);
+
+      TF_RETURN_IF_ERROR(Exec("BEGIN", PGRES_COMMAND_OK));
+      TF_RETURN_IF_ERROR(DeclareCursor());
+      result_.reset(PQdescribePortal(conn_.get(), kCursorName));
+      if (PQresultStatus(result_.get()) != PGRES_COMMAND_OK) {
+        return errors::InvalidArgument("Describe of cursor failed: ",
+                                       PQerrorMessage(conn_.get()));
+      }
+      count_ = -1;
+    } else {
+      result_.reset(PQexec(conn_.get(), query.c_str()));
+      if (PQresultStatus(result_.get()) != PGRES_TUPLES_OK) {
+        return errors::InvalidArgument("Exec of query failed: ",
+                                       PQerrorMessage(conn_.get()));
+      }
+      count_ = PQntuples(result_.get());
     }
     LOG(INFO) << "Exec of query succeed.";
 
-    count_ = PQntuples(result_.get());
     fields_.clear();
     dtypes_.clear();
+    field_numbers_.clear();
+    field_types_.clear();
     int field_count = PQnfields(result_.get());
     for (int i = 0; i < field_count; i++) {
       const char* field = PQfname(result_.get(), i);
@@ -109,6 +131,10 @@ class SqlIterableResource : public ResourceBase {
       }
       fields_.push_back(field);
       dtypes_.push_back(dtype);
+      // Field numbers and types are resolved once here, instead of for
+      // every field of every row.
+      field_numbers_.emplace(field, i);
+      field_types_.push_back(oid);
     }
 
     *count = count_;
@@ -129,27 +155,119 @@ class SqlIterableResource : public ResourceBase {
               std::function<Status(const int64 field_index, Tensor** value)>
                   allocate_func) {
     mutex_lock l(mu_);
+    if (batch_ > 0) {
+      return errors::FailedPrecondition(
+          "random access read is not supported with a server-side cursor");
+    }
+    std::vector<int> field_numbers;
+    TF_RETURN_IF_ERROR(LookupFields(field_tensor, &field_numbers));
     for (int64 i = 0; i < field_tensor->NumElements(); i++) {
       Tensor* value;
       TF_RETURN_IF_ERROR(allocate_func(i, &value));
-      char* field_name = (char*)(field_tensor->flat<tstring>()(i).c_str());
-      int field_number = PQfnumber(result_.get(), field_name);
-      int field_type = PQftype(result_.get(), field_number);
-      char* data = PQgetvalue(result_.get(), index, field_number);
-      TF_RETURN_IF_ERROR(SqlDataCopy(field_type, data, value));
+      const char* data = PQgetvalue(result_.get(), index, field_numbers[i]);
+      TF_RETURN_IF_ERROR(
+          SqlDataCopy(field_types_[field_numbers[i]], data, value, 0));
+    }
+    return Status::OK();
+  }
+  Status Fetch(const Tensor* field_tensor,
+               std::function<Status(const int64 field_index, const int64 rows,
+                                    Tensor** value)>
+                   allocate_func) {
+    mutex_lock l(mu_);
+    if (batch_ <= 0) {
+      return errors::FailedPrecondition(
+          "fetch is only supported with a server-side cursor");
+    }
+    std::vector<int> field_numbers;
+    TF_RETURN_IF_ERROR(LookupFields(field_tensor, &field_numbers));
+
+    std::unique_ptr<PGresult, void (*)(PGresult*)> batch_result(
+        PQexec(conn_.get(),
+               strings::StrCat("FETCH FORWARD ", batch_, " FROM ", kCursorName)
+                   .c_str()),
+        [](PGresult* p) {
+          if (p != nullptr) {
+            PQclear(p);
+          }
+        });
+    if (PQresultStatus(batch_result.get()) != PGRES_TUPLES_OK) {
+      return errors::InvalidArgument("Fetch of cursor failed: ",
+                                     PQerrorMessage(conn_.get()));
+    }
+
+    const int64 rows = PQntuples(batch_result.get());
+    for (int64 i = 0; i < field_tensor->NumElements(); i++) {
+      Tensor* value;
+      TF_RETURN_IF_ERROR(allocate_func(i, rows, &value));
+      const int field_number = field_numbers[i];
+      const int field_type = field_types_[field_number];
+      for (int64 row = 0; row < rows; row++) {
+        const char* data = PQgetvalue(batch_result.get(), row, field_number);
+        TF_RETURN_IF_ERROR(SqlDataCopy(field_type, data, value, row));
+      }
+    }
+
+    if (rows == 0) {
+      // Reopen the cursor after reaching the end so that the dataset
+      // could be iterated again.
+      TF_RETURN_IF_ERROR(
+          Exec(strings::StrCat("CLOSE ", kCursorName), PGRES_COMMAND_OK));
+      TF_RETURN_IF_ERROR(DeclareCursor());
     }
     return Status::OK();
   }
   string DebugString() const override { return "SqlIterableResource"; }
 
  private:
+  static constexpr const char* kCursorName = "tfio_sql_cursor";
+
+  Status Exec(const string& command, ExecStatusType expected)
+      TF_EXCLUSIVE_LOCKS_REQUIRED(mu_) {
+    std::unique_ptr<PGresult, void (*)(PGresult*)> result(
+        PQexec(conn_.get(), command.c_str()), [](PGresult* p) {
+          if (p != nullptr) {
+            PQclear(p);
+          }
+        });
+    if (PQresultStatus(result.get()) != expected) {
+      return errors::InvalidArgument("Exec of ", command,
+                                     " failed: ", PQerrorMessage(conn_.get()));
+    }
+    return Status::OK();
+  }
+  Status DeclareCursor() TF_EXCLUSIVE_LOCKS_REQUIRED(mu_) {
+    return Exec(strings::StrCat("DECLARE ", kCursorName,
+                                " NO SCROLL CURSOR FOR ", query_),
+                PGRES_COMMAND_OK);
+  }
+  Status LookupFields(const Tensor* field_tensor,
+                      std::vector<int>* field_numbers)
+      TF_EXCLUSIVE_LOCKS_REQUIRED(mu_) {
+    field_numbers->clear();
+    field_numbers->reserve(field_tensor->NumElements());
+    for (int64 i = 0; i < field_tensor->NumElements(); i++) {
+      const string field = field_tensor->flat<tstring>()(i);
+      auto lookup = field_numbers_.find(field);
+      if (lookup == field_numbers_.end()) {
+        return errors::InvalidArgument("field ", field, " not found");
+      }
+      field_numbers->push_back(lookup->second);
+    }
+    return Status::OK();
+  }
+
   mutable mutex mu_;
   Env* env_ TF_GUARDED_BY(mu_);
   std::unique_ptr<PGconn, void (*)(PGconn*)> conn_ TF_GUARDED_BY(mu_);
   std::unique_ptr<PGresult, void (*)(PGresult*)> result_ TF_GUARDED_BY(mu_);
   int64 count_ TF_GUARDED_BY(mu_);
+  int64 batch_ TF_GUARDED_BY(mu_) = 0;
+  string query_ TF_GUARDED_BY(mu_);
   std::vector<string> fields_ TF_GUARDED_BY(mu_);
   std::vector<DataType> dtypes_ TF_GUARDED_BY(mu_);
+  std::unordered_map<string, int> field_numbers_ TF_GUARDED_BY(mu_);
+  std::vector<int> field_types_ TF_GUARDED_BY(mu_);
 };
 
 class SqlIterableInitOp : public ResourceOpKernel<SqlIterableResource> {
@@ -171,11 +289,15 @@ class SqlIterableInitOp : public ResourceOpKernel<SqlIterableResource> {
     OP_REQUIRES_OK(context, context->input("endpoint", &endpoint_tensor));
     const string& endpoint = endpoint_tensor->scalar<tstring>()();
 
+    const Tensor* batch_tensor;
+    OP_REQUIRES_OK(context, context->input("batch", &batch_tensor));
+    const int64 batch = batch_tensor->scalar<int64>()();
+
     int64 count;
     std::vector<string> fields;
     std::vector<DataType> dtypes;
-    OP_REQUIRES_OK(context,
-                   resource_->Init(input, endpoint, &count, &fields, &dtypes));
+    OP_REQUIRES_OK(context, resource_->Init(input, endpoint, batch, &count,
+                                            &fields, &dtypes));
 
     Tensor* count_tensor;
     OP_REQUIRES_OK(context,
@@ -245,10 +367,43 @@ class SqlIterableReadOp : public OpKernel {
   Env* env_ TF_GUARDED_BY(mu_);
 };
 
+class SqlIterableFetchOp : public OpKernel {
+ public:
+  explicit SqlIterableFetchOp(OpKernelConstruction* context)
+      : OpKernel(context) {
+    env_ = context->env();
+  }
+
+  void Compute(OpKernelContext* context) override {
+    SqlIterableResource* resource;
+    OP_REQUIRES_OK(context,
+                   GetResourceFromContext(context, "input", &resource));
+    core::ScopedUnref unref(resource);
+
+    const Tensor* field_tensor;
+    OP_REQUIRES_OK(context, context->input("field", &field_tensor));
+
+    OP_REQUIRES_OK(context, resource->Fetch(
+                                field_tensor,
+                                [&](const int64 field_index, const int64 rows,
+                                    Tensor** value) -> Status {
+                                  TF_RETURN_IF_ERROR(context->allocate_output(
+                                      field_index, TensorShape({rows}), value));
+                                  return Status::OK();
+                                }));
+  }
+
+ private:
+  mutable mutex mu_;
+  Env* env_ TF_GUARDED_BY(mu_);
+};
+
 REGISTER_KERNEL_BUILDER(Name("IO>SqlIterableInit").Device(DEVICE_CPU),
                         SqlIterableInitOp);
 REGISTER_KERNEL_BUILDER(Name("IO>SqlIterableRead").Device(DEVICE_CPU),
                         SqlIterableReadOp);
+REGISTER_KERNEL_BUILDER(Name("IO>SqlIterableFetch").Device(DEVICE_CPU),
+                        SqlIterableFetchOp);
 }  // namespace
 }  // namespace io
 }  // namespace tensorflow
@@ -56,6 +56,8 @@ serialized_batches: Serialized Arrow RecordBatches.
 
 REGISTER_OP("IO>ArrowFeatherDataset")
     .Input("filenames: string")
+    .Input("num_shards: int64")
+    .Input("shard_index: int64")
     .Input("columns: int32")
     .Input("batch_size: int64")
     .Input("batch_mode: string")
@@ -68,10 +70,14 @@ REGISTER_OP("IO>ArrowFeatherDataset")
 Creates a dataset that reads files in Arrow Feather format.
 
 filenames: One or more file paths.
+num_shards: Number of shards that the record batches of each file are split
+  into.
+shard_index: Index of the shard of record batches to read from each file.
 )doc");
 
 REGISTER_OP("IO>ArrowStreamDataset")
     .Input("endpoints: string")
+    .Input("num_parallel_reads: int64")
     .Input("columns: int32")
     .Input("batch_size: int64")
     .Input("batch_mode: string")
@@ -84,6 +90,29 @@ REGISTER_OP("IO>ArrowStreamDataset")
 Creates a dataset that connects to a host serving Arrow RecordBatches in stream format.
 
 endpoints: One or more host addresses that are serving an Arrow stream.
+num_parallel_reads: Number of endpoints to read and decode concurrently.
+)doc");
+
+REGISTER_OP("IO>ArrowFlightDataset")
+    .Input("location: string")
+    .Input("descriptor_type: string")
+    .Input("descriptor: string")
+    .Input("num_parallel_reads: int64")
+    .Input("columns: int32")
+    .Input("batch_size: int64")
+    .Input("batch_mode: string")
+    .Output("handle: variant")
+    .Attr("output_types: list(type) >= 1")
+    .Attr("output_shapes: list(shape) >= 1")
+    .SetIsStateful()
+    .SetShapeFn(shape_inference::ScalarShape)
+    .Doc(R"doc(
+Creates a dataset that reads Arrow RecordBatches from an Arrow Flight service.
+
+location: URI of the Flight service, e.g. "grpc://localhost:8815".
+descriptor_type: "cmd" for a command descriptor or "path" for a path descriptor.
+descriptor: The command, or the components of the path, of the flight.
+num_parallel_reads: Number of flight endpoints to fetch concurrently.
 )doc");
 
 REGISTER_OP("IO>ListFeatherColumns")
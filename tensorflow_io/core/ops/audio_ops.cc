@@ -54,14 +54,100 @@ REGISTER_OP("IO>AudioReadableRead")
       return Status::OK();
     });
 
+REGISTER_OP("IO>AudioStreamReadableInit")
+    .Input("input: string")
+    .Input("rate: int64")
+    .Input("channels: int64")
+    .Input("window: int64")
+    .Input("hop: int64")
+    .Input("cycle_length: int64")
+    .Output("resource: resource")
+    .Output("rate_out: int64")
+    .Output("channels_out: int64")
+    .Attr("quality: int = 4")
+    .Attr("container: string = ''")
+    .Attr("shared_name: string = ''")
+    .SetIsStateful()
+    .SetShapeFn([](shape_inference::InferenceContext* c) {
+      c->set_output(0, c->Scalar());
+      c->set_output(1, c->Scalar());
+      c->set_output(2, c->Scalar());
+      return Status::OK();
+    });
+
+REGISTER_OP("IO>AudioStreamReadableRead")
+    .Input("input: resource")
+    .Input("capacity: int64")
+    .Output("value: float")
+    .SetIsStateful()
+    .SetShapeFn([](shape_inference::InferenceContext* c) {
+      c->set_output(0, c->UnknownShape());
+      return Status::OK();
+    });
+
 REGISTER_OP("IO>AudioResample")
     .Input("input: T")
     .Input("rate_in: int64")
     .Input("rate_out: int64")
     .Output("output: T")
     .Attr("T: type")
+    .Attr("quality: int = 4")
     .SetShapeFn([](shape_inference::InferenceContext* c) {
-      c->set_output(0, c->MakeShape({c->UnknownDim(), c->UnknownDim()}));
+      // [samples, channels] or [batch, samples, channels]
+      shape_inference::ShapeHandle input = c->input(0);
+      if (!c->RankKnown(input)) {
+        c->set_output(0, c->UnknownShape());
+        return Status::OK();
+      }
+      shape_inference::ShapeHandle output;
+      TF_RETURN_IF_ERROR(c->ReplaceDim(input, -2, c->UnknownDim(), &output));
+      c->set_output(0, output);
+      return Status::OK();
+    });
+
+REGISTER_OP("IO>AudioResamplerInit")
+    .Input("rate_in: int64")
+    .Input("rate_out: int64")
+    .Input("channels: int64")
+    .Output("resource: resource")
+    .Attr("quality: int = 4")
+    .Attr("container: string = ''")
+    .Attr("shared_name: string = ''")
+    .SetIsStateful()
+    .SetShapeFn([](shape_inference::InferenceContext* c) {
+      c->set_output(0, c->Scalar());
+      return Status::OK();
+    });
+
+REGISTER_OP("IO>AudioResamplerProcess")
+    .Input("input: resource")
+    .Input("value: T")
+    .Output("output: T")
+    .Attr("T: type")
+    .SetIsStateful()
+    .SetShapeFn([](shape_inference::InferenceContext* c) {
+      shape_inference::ShapeHandle value;
+      TF_RETURN_IF_ERROR(c->WithRank(c->input(1), 2, &value));
+      c->set_output(0, c->MakeShape({c->UnknownDim(), c->Dim(value, 1)}));
+      return Status::OK();
+    });
+
+REGISTER_OP("IO>AudioMelSpectrogram")
+    .Input("input: complex64")
+    .Output("output: float")
+    .Attr("rate: int")
+    .Attr("mels: int")
+    .Attr("fmin: float")
+    .Attr("fmax: float")
+    .Attr("top_db: float = -1.0")
+    .SetShapeFn([](shape_inference::InferenceContext* c) {
+      shape_inference::ShapeHandle input;
+      TF_RETURN_IF_ERROR(c->WithRankAtLeast(c->input(0), 2, &input));
+      int64 mels;
+      TF_RETURN_IF_ERROR(c->GetAttr("mels", &mels));
+      shape_inference::ShapeHandle output;
+      TF_RETURN_IF_ERROR(c->ReplaceDim(input, -1, c->MakeDim(mels), &output));
+      c->set_output(0, output);
       return Status::OK();
     });
 
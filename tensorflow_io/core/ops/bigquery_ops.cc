@@ -51,6 +51,7 @@ REGISTER_OP("IO>BigQueryDataset")
     .Input("stream: string")
     .Input("schema: string")
     .Attr("offset: int")
+    .Attr("batch_size: int = 0")
     .Attr("data_format: string")
     .Attr("selected_fields: list(string) >= 1")
     .Attr("output_types: list(type) >= 1")
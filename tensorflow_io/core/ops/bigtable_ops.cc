@@ -35,6 +35,8 @@ REGISTER_OP("BigtableDataset")
     .Attr("table_id: string")
     .Attr("columns: list(string) >= 1")
     .Attr("output_type: type")
+    .Attr("output_types: list(type) >= 0 = []")
+    .Attr("batch_size: int = 0")
     .Output("handle: variant")
     .SetIsStateful()
     .SetShapeFn(shape_inference::ScalarShape)
@@ -47,6 +49,10 @@ retrieve.
 table_id: ID of the table user wants to read from.
 columns: List of names of the columns user wants to retrieve in format 
 'column_family:column_name'
+output_type: Type of all columns when output_types is empty.
+output_types: Optional type of each column. If set, every column is a separate
+component of the element instead of one tensor of `output_type`.
+batch_size: If positive, each element holds up to batch_size rows.
 )doc");
 
 REGISTER_OP("BigtableEmptyRowSet")
@@ -158,6 +164,7 @@ REGISTER_OP("BigtableSplitRowSetEvenly")
     .Input("row_set: resource")
     .Attr("table_id: string")
     .Attr("num_splits: int")
+    .Attr("largest_first: bool = false")
     .Output("samples: resource")
     .SetIsStateful()
     .SetShapeFn([](tensorflow::shape_inference::InferenceContext* c) {
@@ -173,6 +180,8 @@ client: BigtableClientResource.
 row_set: BigtableRowSetResource representing the RowSet specified by the user.
 table_id: ID of the table user intends to read from.
 num_splits: number of workers between who we split the work.
+largest_first: if true, the chunks are ordered by their estimated size, largest
+first, so that consumers taking them in order start with the biggest ones.
 samples: Tensor of RowSets representing chunks of work.
 )doc");
 
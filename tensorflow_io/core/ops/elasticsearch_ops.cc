@@ -26,6 +26,7 @@ REGISTER_OP("IO>ElasticsearchReadableInit")
     .Input("healthcheck_field: string")
     .Input("request_url: string")
     .Input("headers: string")
+    .Input("request_bodies: string")
     .Output("resource: resource")
     .Output("columns: string")
     .Output("dtypes: string")
@@ -39,6 +40,7 @@ REGISTER_OP("IO>ElasticsearchReadableInit")
 
 REGISTER_OP("IO>ElasticsearchReadableNext")
     .Input("resource: resource")
+    .Input("index: int64")
     .Input("request_url: string")
     .Input("scroll_request_url: string")
     .Output("items: string")
@@ -47,6 +49,21 @@ REGISTER_OP("IO>ElasticsearchReadableNext")
       return Status::OK();
     });
 
+REGISTER_OP("IO>ElasticsearchReadableNextColumns")
+    .Input("resource: resource")
+    .Input("index: int64")
+    .Input("request_url: string")
+    .Input("scroll_request_url: string")
+    .Input("columns: string")
+    .Output("values: dtypes")
+    .Attr("dtypes: list(type) >= 1")
+    .SetShapeFn([](shape_inference::InferenceContext* c) {
+      for (int64 i = 0; i < c->num_outputs(); i++) {
+        c->set_output(i, c->MakeShape({c->UnknownDim()}));
+      }
+      return Status::OK();
+    });
+
 }  // namespace
 }  // namespace io
 }  // namespace tensorflow
@@ -71,6 +71,22 @@ REGISTER_OP("IO>FfmpegDecodeVideo")
       return Status::OK();
     });
 
+REGISTER_OP("IO>FfmpegDecodeVideoSample")
+    .Input("input: string")
+    .Input("index: int64")
+    .Input("frame_indices: int64")
+    .Input("fps: float")
+    .Input("clip_duration: float")
+    .Input("size: int64")
+    .Output("value: uint8")
+    .SetShapeFn([](shape_inference::InferenceContext* c) {
+      shape_inference::ShapeHandle frame_indices;
+      TF_RETURN_IF_ERROR(c->WithRank(c->input(2), 1, &frame_indices));
+      c->set_output(0, c->MakeShape({c->UnknownDim(), c->UnknownDim(),
+                                     c->UnknownDim(), 3}));
+      return Status::OK();
+    });
+
 REGISTER_OP("IO>FfmpegAudioReadableInit")
     .Input("input: string")
     .Input("index: int64")
@@ -114,4 +130,54 @@ REGISTER_OP("IO>FfmpegVideoReadableNext")
       return Status::OK();
     });
 
+REGISTER_OP("IO>FfmpegVideoPoolStatsInit")
+    .Output("resource: resource")
+    .Attr("container: string = ''")
+    .Attr("shared_name: string = ''")
+    .SetIsStateful()
+    .SetShapeFn([](shape_inference::InferenceContext* c) {
+      c->set_output(0, c->Scalar());
+      return Status::OK();
+    });
+
+REGISTER_OP("IO>FfmpegVideoPoolInit")
+    .Input("input: string")
+    .Input("index: int64")
+    .Input("parallelism: int64")
+    .Input("thread_count: int64")
+    .Input("thread_type: int64")
+    .Input("buffer_size: int64")
+    .Input("stats: resource")
+    .Output("resource: resource")
+    .Attr("container: string = ''")
+    .Attr("shared_name: string = ''")
+    .SetIsStateful()
+    .SetShapeFn([](shape_inference::InferenceContext* c) {
+      c->set_output(0, c->Scalar());
+      return Status::OK();
+    });
+
+REGISTER_OP("IO>FfmpegVideoPoolNext")
+    .Input("input: resource")
+    .Output("file: int64")
+    .Output("value: uint8")
+    .SetIsStateful()
+    .SetShapeFn([](shape_inference::InferenceContext* c) {
+      c->set_output(0, c->Scalar());
+      c->set_output(1, c->MakeShape({c->UnknownDim(), c->UnknownDim(),
+                                     c->UnknownDim(), 3}));
+      return Status::OK();
+    });
+
+REGISTER_OP("IO>FfmpegVideoPoolStats")
+    .Input("input: resource")
+    .Output("frames: int64")
+    .Output("frames_per_second: double")
+    .SetIsStateful()
+    .SetShapeFn([](shape_inference::InferenceContext* c) {
+      c->set_output(0, c->Scalar());
+      c->set_output(1, c->Scalar());
+      return Status::OK();
+    });
+
 }  // namespace tensorflow
@@ -24,6 +24,7 @@ namespace {
 REGISTER_OP("IO>GRPCReadableInit")
     .SetIsStateful()
     .Input("input: string")
+    .Input("channels: int64")
     .Output("resource: resource")
     .Attr("container: string = ''")
     .Attr("shared_name: string = ''")
@@ -37,6 +38,8 @@ REGISTER_OP("IO>GRPCReadableRead")
     .Input("input: resource")
     .Input("start: int64")
     .Input("shape: int64")
+    .Input("chunk: int64")
+    .Input("raw: bool")
     .Output("value: dtype")
     .Attr("dtype: type")
     .SetShapeFn([](shape_inference::InferenceContext* c) {
@@ -46,6 +46,66 @@ REGISTER_OP("IO>DecodeTiff")
       return Status::OK();
     });
 
+REGISTER_OP("IO>DecodeTiffRegion")
+    .Input("input: string")
+    .Input("page: int64")
+    .Input("level: int64")
+    .Input("x: int64")
+    .Input("y: int64")
+    .Input("width: int64")
+    .Input("height: int64")
+    .Output("image: dtype")
+    .Attr("dtype: type")
+    .SetShapeFn([](shape_inference::InferenceContext* c) {
+      shape_inference::ShapeHandle unused;
+      TF_RETURN_IF_ERROR(c->WithRank(c->input(0), 0, &unused));
+      shape_inference::DimensionHandle width, height;
+      TF_RETURN_IF_ERROR(c->MakeDimForScalarInput(5, &width));
+      TF_RETURN_IF_ERROR(c->MakeDimForScalarInput(6, &height));
+      c->set_output(0, c->MakeShape({height, width, c->UnknownDim()}));
+      return Status::OK();
+    });
+
+REGISTER_OP("IO>TiffRegionReadableInit")
+    .Input("input: string")
+    .Input("cache_size: int64")
+    .Output("resource: resource")
+    .Attr("container: string = ''")
+    .Attr("shared_name: string = ''")
+    .SetShapeFn([](shape_inference::InferenceContext* c) {
+      c->set_output(0, c->Scalar());
+      return Status::OK();
+    });
+
+REGISTER_OP("IO>TiffRegionReadableSpec")
+    .Input("input: resource")
+    .Output("shape: int64")
+    .Output("dtype: int64")
+    .Output("levels: int64")
+    .SetShapeFn([](shape_inference::InferenceContext* c) {
+      c->set_output(0, c->MakeShape({c->UnknownDim(), 3}));
+      c->set_output(1, c->MakeShape({c->UnknownDim()}));
+      c->set_output(2, c->MakeShape({c->UnknownDim()}));
+      return Status::OK();
+    });
+
+REGISTER_OP("IO>TiffRegionReadableRead")
+    .Input("input: resource")
+    .Input("page: int64")
+    .Input("x: int64")
+    .Input("y: int64")
+    .Input("width: int64")
+    .Input("height: int64")
+    .Output("value: dtype")
+    .Attr("dtype: type")
+    .SetShapeFn([](shape_inference::InferenceContext* c) {
+      shape_inference::DimensionHandle width, height;
+      TF_RETURN_IF_ERROR(c->MakeDimForScalarInput(4, &width));
+      TF_RETURN_IF_ERROR(c->MakeDimForScalarInput(5, &height));
+      c->set_output(0, c->MakeShape({height, width, c->UnknownDim()}));
+      return Status::OK();
+    });
+
 REGISTER_OP("IO>EncodeBmp")
     .Input("input: uint8")
     .Output("output: string")
@@ -142,6 +202,32 @@ REGISTER_OP("IO>DecodeHdr")
       return Status::OK();
     });
 
+REGISTER_OP("IO>DecodeImageBatch")
+    .Input("contents: string")
+    .Input("size: int64")
+    .Output("image: dtype")
+    .Output("status: bool")
+    .Attr("channels: int = 3")
+    .Attr("dtype: {uint8, uint16, float} = DT_UINT8")
+    .SetShapeFn([](shape_inference::InferenceContext* c) {
+      shape_inference::ShapeHandle contents, size;
+      TF_RETURN_IF_ERROR(c->WithRank(c->input(0), 1, &contents));
+      TF_RETURN_IF_ERROR(c->WithRank(c->input(1), 1, &size));
+      int64 channels;
+      TF_RETURN_IF_ERROR(c->GetAttr("channels", &channels));
+      shape_inference::DimensionHandle height = c->UnknownDim();
+      shape_inference::DimensionHandle width = c->UnknownDim();
+      const Tensor* size_tensor = c->input_tensor(1);
+      if (size_tensor != nullptr && size_tensor->NumElements() == 2) {
+        height = c->MakeDim(size_tensor->flat<int64>()(0));
+        width = c->MakeDim(size_tensor->flat<int64>()(1));
+      }
+      c->set_output(
+          0, c->MakeShape({c->Dim(contents, 0), height, width, channels}));
+      c->set_output(1, c->MakeShape({c->Dim(contents, 0)}));
+      return Status::OK();
+    });
+
 REGISTER_OP("IO>DecodeDICOMImage")
     .Input("contents: string")
     .Output("output: dtype")
@@ -160,6 +246,53 @@ REGISTER_OP("IO>DecodeDICOMImage")
 loads a dicom image file and returns its pixel information in the specified output format
 )doc");
 
+REGISTER_OP("IO>DecodeDICOMImageBatch")
+    .Input("contents: string")
+    .Input("frames: int64")
+    .Input("window: double")
+    .Output("output: dtype")
+    .Attr(
+        "dtype: {uint8, uint16, uint32, int16, int32, float16, float, double} "
+        "= DT_FLOAT")
+    .Attr("on_error: {'strict', 'skip'} = 'strict'")
+    .Attr("scale: {'auto', 'preserve', 'modality'} = 'auto'")
+    .SetShapeFn([](shape_inference::InferenceContext* c) {
+      shape_inference::ShapeHandle contents, frames;
+      TF_RETURN_IF_ERROR(c->WithRank(c->input(0), 1, &contents));
+      TF_RETURN_IF_ERROR(c->WithRank(c->input(1), 1, &frames));
+      shape_inference::DimensionHandle frame_count = c->Dim(frames, 0);
+      if (c->ValueKnown(frame_count) && c->Value(frame_count) == 0) {
+        frame_count = c->UnknownDim();
+      }
+      c->set_output(
+          0, c->MakeShape({c->Dim(contents, 0), frame_count, c->UnknownDim(),
+                           c->UnknownDim(), c->UnknownDim()}));
+      return Status::OK();
+    })
+    .Doc(R"doc(
+decodes a batch of dicom image files in parallel, optionally selecting frames
+and applying a window, and returns [batch, frames, height, width, channels]
+)doc");
+
+REGISTER_OP("IO>DecodeDICOMInfo")
+    .Input("contents: string")
+    .Output("shape: int64")
+    .Output("bits: int64")
+    .Output("rescale: double")
+    .Output("window: double")
+    .SetShapeFn([](shape_inference::InferenceContext* c) {
+      shape_inference::ShapeHandle contents;
+      TF_RETURN_IF_ERROR(c->WithRank(c->input(0), 1, &contents));
+      c->set_output(0, c->MakeShape({c->Dim(contents, 0), 4}));
+      c->set_output(1, c->MakeShape({c->Dim(contents, 0)}));
+      c->set_output(2, c->MakeShape({c->Dim(contents, 0), 2}));
+      c->set_output(3, c->MakeShape({c->Dim(contents, 0), 2}));
+      return Status::OK();
+    })
+    .Doc(R"doc(
+reads the image information of a batch of dicom files without the pixel data
+)doc");
+
 REGISTER_OP("IO>DecodeDICOMData")
     .Input("contents: string")
     .Input("tags: dtype")
@@ -173,6 +306,23 @@ REGISTER_OP("IO>DecodeDICOMData")
 loads a dicom file and returns the specified tags values as string.
 )doc");
 
+REGISTER_OP("IO>DecodeDICOMDataBatch")
+    .Input("contents: string")
+    .Input("tags: dtype")
+    .Attr("dtype: {uint32,string}")
+    .Output("tag_values: string")
+    .SetShapeFn([](shape_inference::InferenceContext* c) {
+      shape_inference::ShapeHandle contents, tags;
+      TF_RETURN_IF_ERROR(c->WithRank(c->input(0), 1, &contents));
+      TF_RETURN_IF_ERROR(c->WithRank(c->input(1), 1, &tags));
+      c->set_output(0, c->MakeShape({c->Dim(contents, 0), c->Dim(tags, 0)}));
+      return Status::OK();
+    })
+    .Doc(R"doc(
+loads a batch of dicom files and returns the specified tags values of each file
+as string.
+)doc");
+
 REGISTER_OP("IO>DecodeNV12")
     .Input("input: string")
     .Input("size: int32")
@@ -195,6 +345,40 @@ REGISTER_OP("IO>DecodeYUY2")
       return Status::OK();
     });
 
+REGISTER_OP("IO>DecodeYUVColor")
+    .Input("input: string")
+    .Input("size: int32")
+    .Output("image: dtype")
+    .Attr("format: {'nv12', 'yuy2'}")
+    .Attr("dst: {'rgb', 'ycbcr', 'ypbpr', 'ydbdr', 'xyz', 'lab'}")
+    .Attr("illuminant: {'A', 'D50', 'D55', 'D65', 'D75', 'E'} = 'D65'")
+    .Attr("observer: {'2', '10'} = '2'")
+    .Attr("dtype: {uint8, half, float, double}")
+    .SetShapeFn([](shape_inference::InferenceContext* c) {
+      shape_inference::ShapeHandle unused;
+      TF_RETURN_IF_ERROR(c->WithRank(c->input(0), 0, &unused));
+      c->set_output(0, c->MakeShape({c->UnknownDim(), c->UnknownDim(), 3}));
+      return Status::OK();
+    });
+
+REGISTER_OP("IO>ColorConvert")
+    .Input("input: T")
+    .Output("output: dtype")
+    .Attr("src: {'rgb', 'ycbcr', 'ypbpr', 'ydbdr', 'xyz', 'lab'}")
+    .Attr("dst: {'rgb', 'ycbcr', 'ypbpr', 'ydbdr', 'xyz', 'lab'}")
+    .Attr("illuminant: {'A', 'D50', 'D55', 'D65', 'D75', 'E'} = 'D65'")
+    .Attr("observer: {'2', '10'} = '2'")
+    .Attr("T: {uint8, half, float, double}")
+    .Attr("dtype: {uint8, half, float, double}")
+    .SetShapeFn([](shape_inference::InferenceContext* c) {
+      shape_inference::ShapeHandle input;
+      TF_RETURN_IF_ERROR(c->WithRankAtLeast(c->input(0), 1, &input));
+      shape_inference::DimensionHandle unused;
+      TF_RETURN_IF_ERROR(c->WithValue(c->Dim(input, -1), 3, &unused));
+      c->set_output(0, input);
+      return Status::OK();
+    });
+
 REGISTER_OP("IO>DecodeAVIF")
     .Input("contents: string")
     .Output("image: uint8")
@@ -48,6 +48,22 @@ REGISTER_OP("IO>KinesisReadableRead")
       return Status::OK();
     });
 
+REGISTER_OP("IO>KinesisReadableCheckpoint")
+    .SetIsStateful()
+    .Input("input: resource")
+    .Output("shard: string")
+    .Output("sequence: string")
+    .SetShapeFn([](shape_inference::InferenceContext* c) {
+      c->set_output(0, c->MakeShape({c->UnknownDim()}));
+      c->set_output(1, c->MakeShape({c->UnknownDim()}));
+      return Status::OK();
+    });
+
+REGISTER_OP("IO>KinesisReadableCommit")
+    .SetIsStateful()
+    .Input("input: resource")
+    .SetShapeFn(shape_inference::ScalarShape);
+
 }  // namespace
 }  // namespace io
 }  // namespace tensorflow
@@ -25,18 +25,42 @@ REGISTER_OP("IO>MongoDBReadableInit")
     .Input("uri: string")
     .Input("database: string")
     .Input("collection: string")
+    .Input("filter: string")
+    .Input("projection: string")
+    .Input("batch_size: int64")
+    .Input("num_splits: int64")
     .Output("resource: resource")
+    .Output("splits: int64")
     .Attr("container: string = ''")
-    .Attr("shared_name: string = ''");
+    .Attr("shared_name: string = ''")
+    .SetShapeFn([](shape_inference::InferenceContext* c) {
+      c->set_output(0, c->Scalar());
+      c->set_output(1, c->Scalar());
+      return Status::OK();
+    });
 
 REGISTER_OP("IO>MongoDBReadableNext")
     .Input("resource: resource")
+    .Input("index: int64")
     .Output("record: string")
     .SetShapeFn([](shape_inference::InferenceContext* c) {
       c->set_output(0, c->MakeShape({c->UnknownDim()}));
       return Status::OK();
     });
 
+REGISTER_OP("IO>MongoDBReadableNextColumns")
+    .Input("resource: resource")
+    .Input("index: int64")
+    .Input("columns: string")
+    .Output("values: dtypes")
+    .Attr("dtypes: list(type) >= 1")
+    .SetShapeFn([](shape_inference::InferenceContext* c) {
+      for (int64 i = 0; i < c->num_outputs(); i++) {
+        c->set_output(i, c->MakeShape({c->UnknownDim()}));
+      }
+      return Status::OK();
+    });
+
 REGISTER_OP("IO>MongoDBWritableInit")
     .Input("uri: string")
     .Input("database: string")
@@ -38,6 +38,9 @@ REGISTER_OP("IO>PulsarReadableNext")
     .Input("input: resource")
     .Input("timeout: int32")
     .Input("poll_timeout: int32")
+    .Input("max_messages: int64")
+    .Input("max_bytes: int64")
+    .Input("batch_timeout: int32")
     .Output("message: string")
     .Output("key: string")
     .Output("continue_fetch: int64")
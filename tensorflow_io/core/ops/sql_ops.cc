@@ -25,6 +25,7 @@ REGISTER_OP("IO>SqlIterableInit")
     .SetIsStateful()
     .Input("input: string")
     .Input("endpoint: string")
+    .Input("batch: int64")
     .Output("resource: resource")
     .Output("count: int64")
     .Output("field: string")
@@ -53,6 +54,19 @@ REGISTER_OP("IO>SqlIterableRead")
       return Status::OK();
     });
 
+REGISTER_OP("IO>SqlIterableFetch")
+    .SetIsStateful()
+    .Input("input: resource")
+    .Input("field: string")
+    .Output("value: dtypes")
+    .Attr("dtypes: list(type)")
+    .SetShapeFn([](shape_inference::InferenceContext* c) {
+      for (int64 i = 0; i < c->num_outputs(); ++i) {
+        c->set_output(i, c->MakeShape({c->UnknownDim()}));
+      }
+      return Status::OK();
+    });
+
 }  // namespace
 }  // namespace io
 }  // namespace tensorflow
@@ -19,6 +19,7 @@ from tensorflow_io.python.ops.audio_ops import (  # pylint: disable=unused-impor
     inverse_spectrogram,
     melscale,
     dbscale,
+    mel_spectrogram,
     remix,
     split,
     trim,
@@ -26,6 +27,7 @@ from tensorflow_io.python.ops.audio_ops import (  # pylint: disable=unused-impor
     time_mask,
     fade,
     resample,
+    AudioResampler,
     decode_wav,
     encode_wav,
     decode_flac,
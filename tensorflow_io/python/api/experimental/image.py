@@ -19,6 +19,7 @@ from tensorflow_io.python.experimental.image_ops import (  # pylint: disable=unu
     decode_jpeg_exif,
     decode_tiff_info,
     decode_tiff,
+    decode_tiff_region,
     decode_exr_info,
     decode_exr,
     decode_pnm,
@@ -27,5 +28,6 @@ from tensorflow_io.python.experimental.image_ops import (  # pylint: disable=unu
     decode_yuy2,
     decode_avif,
     decode_jp2,
+    decode_image_batch,
     decode_obj,
 )
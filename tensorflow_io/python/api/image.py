@@ -22,5 +22,7 @@ from tensorflow_io.python.ops.image_ops import (  # pylint: disable=unused-impor
 from tensorflow_io.python.ops.dicom_ops import (  # pylint: disable=unused-import
     decode_dicom_data,
     decode_dicom_image,
+    decode_dicom_image_batch,
+    decode_dicom_info,
     dicom_tags,
 )
@@ -16,6 +16,312 @@
 
 import tensorflow as tf
 
+from tensorflow_io.python.ops import core_ops
+
+
+_ILLUMINANTS = {
+    "A": {
+        "2": (1.098466069456375, 1, 0.3558228003436005),
+        "10": (1.111420406956693, 1, 0.3519978321919493),
+    },
+    "D50": {
+        "2": (0.9642119944211994, 1, 0.8251882845188288),
+        "10": (0.9672062750333777, 1, 0.8142801513128616),
+    },
+    "D55": {
+        "2": (0.956797052643698, 1, 0.9214805860173273),
+        "10": (0.9579665682254781, 1, 0.9092525159847462),
+    },
+    "D65": {
+        "2": (0.95047, 1.0, 1.08883),
+        "10": (0.94809667673716, 1, 1.0730513595166162),
+    },
+    "D75": {
+        "2": (0.9497220898840717, 1, 1.226393520724154),
+        "10": (0.9441713925645873, 1, 1.2064272211720228),
+    },
+    "E": {"2": (1.0, 1.0, 1.0), "10": (1.0, 1.0, 1.0)},
+}
+
+_YPBPR = [
+    [0.299, 0.587, 0.114],
+    [-0.168736, -0.331264, 0.5],
+    [0.5, -0.418688, -0.081312],
+]
+
+# inv of _YPBPR
+_YPBPR_INV = [
+    [1.00000000e00, -1.21889419e-06, 1.40199959e00],
+    [1.00000000e00, -3.44135678e-01, -7.14136156e-01],
+    [1.00000000e00, 1.77200007e00, 4.06298063e-07],
+]
+
+_YDBDR = [[0.299, 0.587, 0.114], [-0.45, -0.883, 1.333], [-1.333, 1.116, 0.217]]
+
+# inv of _YDBDR
+_YDBDR_INV = [
+    [1.00000000e00, 9.23037161e-05, -5.25912631e-01],
+    [1.00000000e00, -1.29132899e-01, 2.67899328e-01],
+    [1.00000000e00, 6.64679060e-01, -7.92025435e-05],
+]
+
+_XYZ = [
+    [0.412453, 0.357580, 0.180423],
+    [0.212671, 0.715160, 0.072169],
+    [0.019334, 0.119193, 0.950227],
+]
+
+# inv of _XYZ
+_XYZ_INV = [
+    [3.24048134, -1.53715152, -0.49853633],
+    [-0.96925495, 1.87599, 0.04155593],
+    [0.05564664, -0.20404134, 1.05731107],
+]
+
+
+def _transform(input, kernel):
+    kernel = tf.constant(kernel, input.dtype)
+    return tf.tensordot(input, tf.transpose(kernel), axes=((-1,), (0,)))
+
+
+def _graph_rgb_to_ycbcr(input):
+    value = tf.cast(input, tf.float32)
+    value = value / 255.0
+    value = _transform(value, _YPBPR)
+    value = value * tf.constant([219, 224, 224], value.dtype)
+    value = value + tf.constant([16, 128, 128], value.dtype)
+    return tf.saturate_cast(value, input.dtype)
+
+
+def _graph_ycbcr_to_rgb(input):
+    value = tf.cast(input, tf.float32)
+    value = value - tf.constant([16, 128, 128], value.dtype)
+    value = value / tf.constant([219, 224, 224], value.dtype)
+    value = _transform(value, _YPBPR_INV)
+    value = value * 255.0
+    return tf.saturate_cast(value, input.dtype)
+
+
+def _graph_rgb_to_xyz(input):
+    value = tf.where(
+        tf.math.greater(input, 0.04045),
+        tf.math.pow((input + 0.055) / 1.055, 2.4),
+        input / 12.92,
+    )
+    return _transform(value, _XYZ)
+
+
+def _graph_xyz_to_rgb(input):
+    value = _transform(input, _XYZ_INV)
+    value = tf.where(
+        tf.math.greater(value, 0.0031308),
+        tf.math.pow(value, 1.0 / 2.4) * 1.055 - 0.055,
+        value * 12.92,
+    )
+    return tf.clip_by_value(value, 0, 1)
+
+
+def _graph_rgb_to_lab(input, illuminant, observer):
+    coords = tf.constant(_ILLUMINANTS[illuminant][observer], input.dtype)
+
+    xyz = _graph_rgb_to_xyz(input)
+
+    xyz = xyz / coords
+
+    xyz = tf.where(
+        tf.math.greater(xyz, 0.008856),
+        tf.math.pow(xyz, 1.0 / 3.0),
+        xyz * 7.787 + 16.0 / 116.0,
+    )
+
+    xyz = tf.unstack(xyz, axis=-1)
+    x, y, z = xyz[0], xyz[1], xyz[2]
+
+    # Vector scaling
+    l = (y * 116.0) - 16.0
+    a = (x - y) * 500.0
+    b = (y - z) * 200.0
+
+    return tf.stack([l, a, b], axis=-1)
+
+
+def _lab_to_xyz(input, illuminant, observer):
+    """Returns the XYZ of a LAB image, and the values before the inverse of
+    the LAB transfer function and z before it is clipped."""
+    lab = tf.unstack(input, axis=-1)
+    l, a, b = lab[0], lab[1], lab[2]
+
+    y = (l + 16.0) / 116.0
+    x = (a / 500.0) + y
+    z = y - (b / 200.0)
+
+    value = tf.stack([x, y, tf.math.maximum(z, 0)], axis=-1)
+
+    xyz = tf.where(
+        tf.math.greater(value, 0.2068966),
+        tf.math.pow(value, 3.0),
+        (value - 16.0 / 116.0) / 7.787,
+    )
+
+    coords = tf.constant(_ILLUMINANTS[illuminant][observer], input.dtype)
+
+    return xyz * coords, value, z
+
+
+def _graph_lab_to_rgb(input, illuminant, observer):
+    xyz, _, _ = _lab_to_xyz(input, illuminant, observer)
+    return _graph_xyz_to_rgb(xyz)
+
+
+def _graph_color_convert(input, src, dst, illuminant, observer):
+    """Convert an image from src to dst with a composition of TF ops."""
+    if src == "lab":
+        return _graph_lab_to_rgb(input, illuminant, observer)
+    if dst == "lab":
+        return _graph_rgb_to_lab(input, illuminant, observer)
+    functions = {
+        ("rgb", "ycbcr"): _graph_rgb_to_ycbcr,
+        ("ycbcr", "rgb"): _graph_ycbcr_to_rgb,
+        ("rgb", "ypbpr"): lambda e: _transform(e, _YPBPR),
+        ("ypbpr", "rgb"): lambda e: _transform(e, _YPBPR_INV),
+        ("rgb", "ydbdr"): lambda e: _transform(e, _YDBDR),
+        ("ydbdr", "rgb"): lambda e: _transform(e, _YDBDR_INV),
+        ("rgb", "xyz"): _graph_rgb_to_xyz,
+        ("xyz", "rgb"): _graph_xyz_to_rgb,
+    }
+    return functions[(src, dst)](input)
+
+
+def _grad_transform(grad, kernel):
+    # The gradient of x . kernel^T is grad . kernel
+    kernel = tf.constant(kernel, grad.dtype)
+    return tf.tensordot(grad, kernel, axes=((-1,), (0,)))
+
+
+def _grad_rgb_to_xyz(input, grad):
+    derivative = tf.where(
+        tf.math.greater(input, 0.04045),
+        tf.math.pow((input + 0.055) / 1.055, 1.4) * (2.4 / 1.055),
+        tf.ones_like(input) / 12.92,
+    )
+    return _grad_transform(grad, _XYZ) * derivative
+
+
+def _grad_xyz_to_rgb(input, grad):
+    value = _transform(input, _XYZ_INV)
+    output = tf.where(
+        tf.math.greater(value, 0.0031308),
+        tf.math.pow(value, 1.0 / 2.4) * 1.055 - 0.055,
+        value * 12.92,
+    )
+    # No gradient flows through the clipped values
+    grad = tf.where(
+        tf.math.logical_and(
+            tf.math.greater_equal(output, 0), tf.math.less_equal(output, 1)
+        ),
+        grad,
+        tf.zeros_like(grad),
+    )
+    derivative = tf.where(
+        tf.math.greater(value, 0.0031308),
+        tf.math.pow(value, 1.0 / 2.4 - 1.0) * (1.055 / 2.4),
+        tf.ones_like(value) * 12.92,
+    )
+    return _grad_transform(grad * derivative, _XYZ_INV)
+
+
+def _grad_rgb_to_lab(input, grad, illuminant, observer):
+    coords = tf.constant(_ILLUMINANTS[illuminant][observer], input.dtype)
+    xyz = _graph_rgb_to_xyz(input) / coords
+
+    grad = tf.unstack(grad, axis=-1)
+    l, a, b = grad[0], grad[1], grad[2]
+    grad = tf.stack([a * 500.0, l * 116.0 - a * 500.0 + b * 200.0, -b * 200.0], -1)
+
+    derivative = tf.where(
+        tf.math.greater(xyz, 0.008856),
+        tf.math.pow(xyz, -2.0 / 3.0) / 3.0,
+        tf.ones_like(xyz) * 7.787,
+    )
+    return _grad_rgb_to_xyz(input, grad * derivative / coords)
+
+
+def _grad_lab_to_rgb(input, grad, illuminant, observer):
+    coords = tf.constant(_ILLUMINANTS[illuminant][observer], input.dtype)
+    xyz, value, z = _lab_to_xyz(input, illuminant, observer)
+
+    grad = _grad_xyz_to_rgb(xyz, grad) * coords
+    grad = grad * tf.where(
+        tf.math.greater(value, 0.2068966),
+        tf.math.square(value) * 3.0,
+        tf.ones_like(value) / 7.787,
+    )
+
+    grad = tf.unstack(grad, axis=-1)
+    # No gradient flows to z where it is clipped to 0
+    x, y = grad[0], grad[1]
+    z = tf.where(tf.math.greater_equal(z, 0), grad[2], tf.zeros_like(grad[2]))
+    return tf.stack([(x + y + z) / 116.0, x / 500.0, -z / 200.0], axis=-1)
+
+
+@tf.RegisterGradient("IO>ColorConvert")
+def _color_convert_grad(op, grad):
+    """The gradient of the native color conversion."""
+    input = op.inputs[0]
+    if not input.dtype.is_floating:
+        return [None]
+    src = tf.compat.as_str(op.get_attr("src"))
+    dst = tf.compat.as_str(op.get_attr("dst"))
+    illuminant = tf.compat.as_str(op.get_attr("illuminant"))
+    observer = tf.compat.as_str(op.get_attr("observer"))
+
+    if src == "lab":
+        return [_grad_lab_to_rgb(input, grad, illuminant, observer)]
+    if dst == "lab":
+        return [_grad_rgb_to_lab(input, grad, illuminant, observer)]
+    functions = {
+        ("rgb", "ypbpr"): lambda e, g: _grad_transform(g, _YPBPR),
+        ("ypbpr", "rgb"): lambda e, g: _grad_transform(g, _YPBPR_INV),
+        ("rgb", "ydbdr"): lambda e, g: _grad_transform(g, _YDBDR),
+        ("ydbdr", "rgb"): lambda e, g: _grad_transform(g, _YDBDR_INV),
+        ("rgb", "xyz"): _grad_rgb_to_xyz,
+        ("xyz", "rgb"): _grad_xyz_to_rgb,
+    }
+    return [functions[(src, dst)](input, grad)]
+
+
+def _on_accelerator(input):
+    """Returns True if the input is known to be placed on a device other than
+    CPU. Tensors in graphs, e.g., inside `tf.data`, have no known placement."""
+    device = tf.DeviceSpec.from_string(input.device or "")
+    return device.device_type is not None and device.device_type != "CPU"
+
+
+def _color_convert(input, src, dst, illuminant="D65", observer="2", name=None):
+    """Convert an image from src to dst with the native color conversion kernel.
+
+    The uint8 images (RGB in `[0, 255]` and YCbCr) keep their type, and the
+    float images are converted in their own type.
+
+    The native kernel only runs on CPU, so images that are already on another
+    device are converted with the equivalent composition of TF ops instead of
+    being copied to the host.
+    """
+    input = tf.convert_to_tensor(input)
+    illuminant = illuminant.upper()
+    if _on_accelerator(input):
+        with tf.name_scope(name or "ColorConvert"):
+            return _graph_color_convert(input, src, dst, illuminant, observer)
+    return core_ops.io_color_convert(
+        input,
+        src=src,
+        dst=dst,
+        illuminant=illuminant,
+        observer=observer,
+        dtype=input.dtype,
+        name=name,
+    )
+
 
 def rgb_to_bgr(input, name=None):
     """
@@ -96,12 +402,7 @@ def rgb_to_ycbcr(input, name=None):
     input = tf.convert_to_tensor(input)
 
     assert input.dtype == tf.uint8
-    value = tf.cast(input, tf.float32)
-    value = value / 255.0
-    value = rgb_to_ypbpr(value)
-    value = value * tf.constant([219, 224, 224], value.dtype)
-    value = value + tf.constant([16, 128, 128], value.dtype)
-    return tf.cast(value, input.dtype)
+    return _color_convert(input, "rgb", "ycbcr", name=name)
 
 
 def ycbcr_to_rgb(input, name=None):
@@ -118,12 +419,7 @@ def ycbcr_to_rgb(input, name=None):
     input = tf.convert_to_tensor(input)
 
     assert input.dtype == tf.uint8
-    value = tf.cast(input, tf.float32)
-    value = value - tf.constant([16, 128, 128], value.dtype)
-    value = value / tf.constant([219, 224, 224], value.dtype)
-    value = ypbpr_to_rgb(value)
-    value = value * 255.0
-    return tf.cast(value, input.dtype)
+    return _color_convert(input, "ycbcr", "rgb", name=name)
 
 
 def rgb_to_ypbpr(input, name=None):
@@ -140,16 +436,7 @@ def rgb_to_ypbpr(input, name=None):
     input = tf.convert_to_tensor(input)
     assert input.dtype in (tf.float16, tf.float32, tf.float64)
 
-    kernel = tf.constant(
-        [
-            [0.299, 0.587, 0.114],
-            [-0.168736, -0.331264, 0.5],
-            [0.5, -0.418688, -0.081312],
-        ],
-        input.dtype,
-    )
-
-    return tf.tensordot(input, tf.transpose(kernel), axes=((-1,), (0,)))
+    return _color_convert(input, "rgb", "ypbpr", name=name)
 
 
 def ypbpr_to_rgb(input, name=None):
@@ -166,20 +453,7 @@ def ypbpr_to_rgb(input, name=None):
     input = tf.convert_to_tensor(input)
     assert input.dtype in (tf.float16, tf.float32, tf.float64)
 
-    # inv of:
-    # [[ 0.299   , 0.587   , 0.114   ],
-    #  [-0.168736,-0.331264, 0.5     ],
-    #  [ 0.5     ,-0.418688,-0.081312]]
-    kernel = tf.constant(
-        [
-            [1.00000000e00, -1.21889419e-06, 1.40199959e00],
-            [1.00000000e00, -3.44135678e-01, -7.14136156e-01],
-            [1.00000000e00, 1.77200007e00, 4.06298063e-07],
-        ],
-        input.dtype,
-    )
-
-    return tf.tensordot(input, tf.transpose(kernel), axes=((-1,), (0,)))
+    return _color_convert(input, "ypbpr", "rgb", name=name)
 
 
 def rgb_to_ydbdr(input, name=None):
@@ -196,12 +470,7 @@ def rgb_to_ydbdr(input, name=None):
     input = tf.convert_to_tensor(input)
     assert input.dtype in (tf.float16, tf.float32, tf.float64)
 
-    kernel = tf.constant(
-        [[0.299, 0.587, 0.114], [-0.45, -0.883, 1.333], [-1.333, 1.116, 0.217]],
-        input.dtype,
-    )
-
-    return tf.tensordot(input, tf.transpose(kernel), axes=((-1,), (0,)))
+    return _color_convert(input, "rgb", "ydbdr", name=name)
 
 
 def ydbdr_to_rgb(input, name=None):
@@ -218,20 +487,7 @@ def ydbdr_to_rgb(input, name=None):
     input = tf.convert_to_tensor(input)
     assert input.dtype in (tf.float16, tf.float32, tf.float64)
 
-    # inv of:
-    # [[    0.299,   0.587,    0.114],
-    #  [   -0.45 ,  -0.883,    1.333],
-    #  [   -1.333,   1.116,    0.217]]
-    kernel = tf.constant(
-        [
-            [1.00000000e00, 9.23037161e-05, -5.25912631e-01],
-            [1.00000000e00, -1.29132899e-01, 2.67899328e-01],
-            [1.00000000e00, 6.64679060e-01, -7.92025435e-05],
-        ],
-        input.dtype,
-    )
-
-    return tf.tensordot(input, tf.transpose(kernel), axes=((-1,), (0,)))
+    return _color_convert(input, "ydbdr", "rgb", name=name)
 
 
 def rgb_to_hsv(input, name=None):
@@ -344,20 +600,7 @@ def rgb_to_xyz(input, name=None):
     input = tf.convert_to_tensor(input)
     assert input.dtype in (tf.float16, tf.float32, tf.float64)
 
-    kernel = tf.constant(
-        [
-            [0.412453, 0.357580, 0.180423],
-            [0.212671, 0.715160, 0.072169],
-            [0.019334, 0.119193, 0.950227],
-        ],
-        input.dtype,
-    )
-    value = tf.where(
-        tf.math.greater(input, 0.04045),
-        tf.math.pow((input + 0.055) / 1.055, 2.4),
-        input / 12.92,
-    )
-    return tf.tensordot(value, tf.transpose(kernel), axes=((-1,), (0,)))
+    return _color_convert(input, "rgb", "xyz", name=name)
 
 
 def xyz_to_rgb(input, name=None):
@@ -374,25 +617,7 @@ def xyz_to_rgb(input, name=None):
     input = tf.convert_to_tensor(input)
     assert input.dtype in (tf.float16, tf.float32, tf.float64)
 
-    # inv of:
-    # [[0.412453, 0.35758 , 0.180423],
-    #  [0.212671, 0.71516 , 0.072169],
-    #  [0.019334, 0.119193, 0.950227]]
-    kernel = tf.constant(
-        [
-            [3.24048134, -1.53715152, -0.49853633],
-            [-0.96925495, 1.87599, 0.04155593],
-            [0.05564664, -0.20404134, 1.05731107],
-        ],
-        input.dtype,
-    )
-    value = tf.tensordot(input, tf.transpose(kernel), axes=((-1,), (0,)))
-    value = tf.where(
-        tf.math.greater(value, 0.0031308),
-        tf.math.pow(value, 1.0 / 2.4) * 1.055 - 0.055,
-        value * 12.92,
-    )
-    return tf.clip_by_value(value, 0, 1)
+    return _color_convert(input, "xyz", "rgb", name=name)
 
 
 def rgb_to_lab(input, illuminant="D65", observer="2", name=None):
@@ -413,51 +638,10 @@ def rgb_to_lab(input, illuminant="D65", observer="2", name=None):
     input = tf.convert_to_tensor(input)
     assert input.dtype in (tf.float16, tf.float32, tf.float64)
 
-    illuminants = {
-        "A": {
-            "2": (1.098466069456375, 1, 0.3558228003436005),
-            "10": (1.111420406956693, 1, 0.3519978321919493),
-        },
-        "D50": {
-            "2": (0.9642119944211994, 1, 0.8251882845188288),
-            "10": (0.9672062750333777, 1, 0.8142801513128616),
-        },
-        "D55": {
-            "2": (0.956797052643698, 1, 0.9214805860173273),
-            "10": (0.9579665682254781, 1, 0.9092525159847462),
-        },
-        "D65": {
-            "2": (0.95047, 1.0, 1.08883),
-            "10": (0.94809667673716, 1, 1.0730513595166162),
-        },
-        "D75": {
-            "2": (0.9497220898840717, 1, 1.226393520724154),
-            "10": (0.9441713925645873, 1, 1.2064272211720228),
-        },
-        "E": {"2": (1.0, 1.0, 1.0), "10": (1.0, 1.0, 1.0)},
-    }
-    coords = tf.constant(illuminants[illuminant.upper()][observer], input.dtype)
-
-    xyz = rgb_to_xyz(input)
-
-    xyz = xyz / coords
-
-    xyz = tf.where(
-        tf.math.greater(xyz, 0.008856),
-        tf.math.pow(xyz, 1.0 / 3.0),
-        xyz * 7.787 + 16.0 / 116.0,
+    return _color_convert(
+        input, "rgb", "lab", illuminant=illuminant, observer=observer, name=name
     )
 
-    xyz = tf.unstack(xyz, axis=-1)
-    x, y, z = xyz[0], xyz[1], xyz[2]
-
-    # Vector scaling
-    l = (y * 116.0) - 16.0
-    a = (x - y) * 500.0
-    b = (y - z) * 200.0
-
-    return tf.stack([l, a, b], axis=-1)
-
 
 def lab_to_rgb(input, illuminant="D65", observer="2", name=None):
     """
@@ -477,53 +661,10 @@ def lab_to_rgb(input, illuminant="D65", observer="2", name=None):
     input = tf.convert_to_tensor(input)
     assert input.dtype in (tf.float16, tf.float32, tf.float64)
 
-    lab = input
-    lab = tf.unstack(lab, axis=-1)
-    l, a, b = lab[0], lab[1], lab[2]
-
-    y = (l + 16.0) / 116.0
-    x = (a / 500.0) + y
-    z = y - (b / 200.0)
-
-    z = tf.math.maximum(z, 0)
-
-    xyz = tf.stack([x, y, z], axis=-1)
-
-    xyz = tf.where(
-        tf.math.greater(xyz, 0.2068966),
-        tf.math.pow(xyz, 3.0),
-        (xyz - 16.0 / 116.0) / 7.787,
+    return _color_convert(
+        input, "lab", "rgb", illuminant=illuminant, observer=observer, name=name
     )
 
-    illuminants = {
-        "A": {
-            "2": (1.098466069456375, 1, 0.3558228003436005),
-            "10": (1.111420406956693, 1, 0.3519978321919493),
-        },
-        "D50": {
-            "2": (0.9642119944211994, 1, 0.8251882845188288),
-            "10": (0.9672062750333777, 1, 0.8142801513128616),
-        },
-        "D55": {
-            "2": (0.956797052643698, 1, 0.9214805860173273),
-            "10": (0.9579665682254781, 1, 0.9092525159847462),
-        },
-        "D65": {
-            "2": (0.95047, 1.0, 1.08883),
-            "10": (0.94809667673716, 1, 1.0730513595166162),
-        },
-        "D75": {
-            "2": (0.9497220898840717, 1, 1.226393520724154),
-            "10": (0.9441713925645873, 1, 1.2064272211720228),
-        },
-        "E": {"2": (1.0, 1.0, 1.0), "10": (1.0, 1.0, 1.0)},
-    }
-    coords = tf.constant(illuminants[illuminant.upper()][observer], input.dtype)
-
-    xyz = xyz * coords
-
-    return xyz_to_rgb(xyz)
-
 
 def rgb_to_grayscale(input, name=None):
     """
@@ -14,6 +14,7 @@
 # ==============================================================================
 """ElasticsearchIODatasets"""
 
+import json
 from urllib.parse import urlparse
 import tensorflow as tf
 from tensorflow_io.python.ops import core_ops
@@ -25,13 +26,26 @@ class _ElasticsearchHandler:
     session data.
     """
 
-    def __init__(self, nodes, index, doc_type, headers_dict):
+    def __init__(
+        self,
+        nodes,
+        index,
+        doc_type,
+        headers_dict,
+        page_size=None,
+        source=None,
+        num_slices=1,
+    ):
         self.nodes = nodes
         self.index = index
         self.doc_type = doc_type
         self.headers_dict = headers_dict
+        self.page_size = page_size
+        self.source = source
+        self.num_slices = num_slices
         self.prepare_base_urls()
         self.prepare_connection_data()
+        self.prepare_request_bodies()
 
     def prepare_base_urls(self):
         """Prepares the base url for establish connection with the
@@ -88,6 +102,30 @@ class _ElasticsearchHandler:
                     "Headers should be a dict of key:value pairs. Got: ", self.headers
                 )
 
+    def prepare_request_bodies(self):
+        """Prepares the search request bodies, one per slice of the scroll.
+
+        Returns:
+            A list of JSON request bodies, each of type tf.string. An empty
+            body is used when no search options are set.
+        """
+
+        if self.num_slices < 1:
+            raise ValueError(
+                "num_slices should be a positive integer. Got: ", self.num_slices
+            )
+
+        self.request_bodies = []
+        for slice_id in range(self.num_slices):
+            body = {}
+            if self.page_size is not None:
+                body["size"] = self.page_size
+            if self.source is not None:
+                body["_source"] = self.source
+            if self.num_slices > 1:
+                body["slice"] = {"id": slice_id, "max": self.num_slices}
+            self.request_bodies.append(json.dumps(body) if body else "")
+
     def get_healthy_resource(self):
         """Retrieve the resource which is connected to a healthy node"""
 
@@ -100,6 +138,7 @@ class _ElasticsearchHandler:
                     healthcheck_field="status",
                     request_url=request_url,
                     headers=self.headers,
+                    request_bodies=self.request_bodies,
                 )
                 print(f"Connection successful: {healthcheck_url}")
                 dtypes = []
@@ -125,15 +164,14 @@ class _ElasticsearchHandler:
                 )
             )
 
-    def get_next_batch(self, resource, request_url):
+    def get_next_batch(self, resource, request_url, index=0):
         """Prepares the next batch of data based on the request url and
         the counter index.
 
         Args:
             resource: the init op resource.
-            columns: list of columns to prepare the structured data.
-            dtypes: tf.dtypes of the columns.
             request_url: The request url to fetch the data
+            index: the index of the slice to fetch the data from.
         Returns:
             A Tensor containing serialized JSON records.
         """
@@ -145,11 +183,89 @@ class _ElasticsearchHandler:
 
         values = core_ops.io_elasticsearch_readable_next(
             resource=resource,
+            index=index,
             request_url=request_url,
             scroll_request_url=scroll_request_url,
         )
         return values
 
+    def get_next_columns(self, resource, columns, dtypes, request_url, index=0):
+        """Prepares the next batch of data as column tensors, parsed directly
+        from the search response.
+
+        Args:
+            resource: the init op resource.
+            columns: list of columns to prepare the structured data.
+            dtypes: tf.dtypes of the columns.
+            request_url: The request url to fetch the data
+            index: the index of the slice to fetch the data from.
+        Returns:
+            Structured data with columns as keys and the corresponding batch
+            of values as tensors.
+        """
+
+        url_obj = urlparse(request_url)
+        scroll_request_url = "{}://{}/_search/scroll".format(
+            url_obj.scheme, url_obj.netloc
+        )
+
+        values = core_ops.io_elasticsearch_readable_next_columns(
+            resource=resource,
+            index=index,
+            request_url=request_url,
+            scroll_request_url=scroll_request_url,
+            columns=columns,
+            dtypes=dtypes,
+        )
+        return {column.decode("utf-8"): value for column, value in zip(columns, values)}
+
+    def get_slice_dataset(self, resource, columns, dtypes, request_url, index, typed):
+        """Prepares the dataset of items of one slice of the scroll.
+
+        Args:
+            resource: the init op resource.
+            columns: list of columns to prepare the structured data.
+            dtypes: tf.dtypes of the columns.
+            request_url: The request url to fetch the data
+            index: the index of the slice to fetch the data from.
+            typed: whether to parse the columns within the kernel.
+        Returns:
+            A `tf.data.Dataset` of structured data.
+        """
+
+        dataset = tf.data.experimental.Counter()
+        if typed:
+            dataset = dataset.map(
+                lambda i: self.get_next_columns(
+                    resource=resource,
+                    columns=columns,
+                    dtypes=dtypes,
+                    request_url=request_url,
+                    index=index,
+                )
+            )
+            dataset = dataset.apply(
+                tf.data.experimental.take_while(
+                    lambda v: tf.greater(tf.shape(tf.nest.flatten(v)[0])[0], 0)
+                )
+            )
+            return dataset.flat_map(lambda x: tf.data.Dataset.from_tensor_slices(x))
+
+        dataset = dataset.map(
+            lambda i: self.get_next_batch(
+                resource=resource, request_url=request_url, index=index
+            )
+        )
+        dataset = dataset.apply(
+            tf.data.experimental.take_while(lambda v: tf.greater(tf.shape(v)[0], 0))
+        )
+        dataset = dataset.flat_map(lambda x: tf.data.Dataset.from_tensor_slices(x))
+        dataset = dataset.map(
+            lambda v: self.parse_json(v, columns=columns, dtypes=dtypes),
+            num_parallel_calls=tf.data.experimental.AUTOTUNE,
+        )
+        return dataset
+
     def parse_json(self, raw_item, columns, dtypes):
         """Prepares the next batch of data based on the request url and
         the counter index.
@@ -223,9 +339,31 @@ class ElasticsearchIODataset(tf.compat.v2.data.Dataset):
                     index="people",
                     doc_type="survivors",
                     headers=HEADERS)
+
+    Large indices can be read with a sliced scroll, where each slice is
+    consumed in parallel. The page size and the `_source` fields returned
+    by the cluster can be configured as well:
+
+    >>> dataset = tfio.experimental.elasticsearch.ElasticsearchIODataset(
+                    nodes=["localhost:9092"],
+                    index="people",
+                    page_size=1000,
+                    source=["fare", "age", "survived"],
+                    num_slices=4)
     """
 
-    def __init__(self, nodes, index, doc_type=None, headers=None, internal=True):
+    def __init__(
+        self,
+        nodes,
+        index,
+        doc_type=None,
+        headers=None,
+        page_size=None,
+        source=None,
+        num_slices=1,
+        parse_in_kernel=True,
+        internal=True,
+    ):
         """Prepare the ElasticsearchIODataset.
 
         Args:
@@ -237,29 +375,55 @@ class ElasticsearchIODataset(tf.compat.v2.data.Dataset):
                 in the index to query.
             headers: (Optional) A dict of headers. For example:
                 {'Content-Type': 'application/json'}
+            page_size: (Optional) The number of hits fetched per scroll request.
+                Defaults to the cluster setting (10).
+            source: (Optional) A list of fields of `_source` returned by the
+                cluster. Defaults to all the fields.
+            num_slices: (Optional) The number of slices of the scroll, which
+                are read in parallel. When larger than 1, the items are not
+                returned in any particular order. Default: 1.
+            parse_in_kernel: (Optional) If True, the hits are written directly
+                into typed tensors while the response is parsed. Otherwise
+                each hit is serialized to JSON and decoded again with
+                `decode_json`. Default: True.
         """
         with tf.name_scope("ElasticsearchIODataset"):
             assert internal
 
             handler = _ElasticsearchHandler(
-                nodes=nodes, index=index, doc_type=doc_type, headers_dict=headers
+                nodes=nodes,
+                index=index,
+                doc_type=doc_type,
+                headers_dict=headers,
+                page_size=page_size,
+                source=source,
+                num_slices=num_slices,
             )
             resource, columns, dtypes, request_url = handler.get_healthy_resource()
 
-            dataset = tf.data.experimental.Counter()
-            dataset = dataset.map(
-                lambda i: handler.get_next_batch(
-                    resource=resource, request_url=request_url
+            if num_slices == 1:
+                dataset = handler.get_slice_dataset(
+                    resource=resource,
+                    columns=columns,
+                    dtypes=dtypes,
+                    request_url=request_url,
+                    index=0,
+                    typed=parse_in_kernel,
+                )
+            else:
+                dataset = tf.data.Dataset.range(num_slices).interleave(
+                    lambda index: handler.get_slice_dataset(
+                        resource=resource,
+                        columns=columns,
+                        dtypes=dtypes,
+                        request_url=request_url,
+                        index=index,
+                        typed=parse_in_kernel,
+                    ),
+                    cycle_length=num_slices,
+                    num_parallel_calls=num_slices,
+                    deterministic=False,
                 )
-            )
-            dataset = dataset.apply(
-                tf.data.experimental.take_while(lambda v: tf.greater(tf.shape(v)[0], 0))
-            )
-            dataset = dataset.flat_map(lambda x: tf.data.Dataset.from_tensor_slices(x))
-            dataset = dataset.map(
-                lambda v: handler.parse_json(v, columns=columns, dtypes=dtypes),
-                num_parallel_calls=tf.data.experimental.AUTOTUNE,
-            )
             self._dataset = dataset
 
             super().__init__(
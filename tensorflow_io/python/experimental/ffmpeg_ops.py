@@ -15,12 +15,36 @@
 """FFmpeg"""
 
 
-def decode_video(content, index=0, name=None):
+def decode_video(
+    content,
+    index=0,
+    frame_indices=None,
+    fps=None,
+    clip_duration=None,
+    size=None,
+    name=None,
+):
     """Decode video stream from a video file.
 
+    By default all frames are decoded. If any of `frame_indices`, `fps`,
+    `clip_duration` or `size` is provided, only the selected frames are
+    decoded: the packets are indexed first, then each selected frame is
+    reached by seeking to the keyframe before it, so only the GOPs that
+    contain selected frames are decoded.
+
     Args:
       content: A `Tensor` of type `string`.
       index: The stream index.
+      frame_indices: A 1-D `int64` `Tensor` of the frames to decode, in
+        display order. Frames are returned in the given order.
+      fps: The rate, in frames per second, to sample frames at when
+        `frame_indices` is not provided. Defaults to every frame.
+      clip_duration: The duration, in seconds from the start, to sample
+        frames from when `frame_indices` is not provided. Defaults to the
+        whole video.
+      size: A `[height, width]` to scale the frames to while they are
+        converted to RGB. Defaults to the size of the video.
+      name: A name for the operation (optional).
 
     Returns:
       value: A `uint8` Tensor.
@@ -29,4 +53,15 @@ def decode_video(content, index=0, name=None):
         ffmpeg_ops,
     )
 
-    return ffmpeg_ops.io_ffmpeg_decode_video(content, index, name=name)
+    if frame_indices is None and fps is None and clip_duration is None and size is None:
+        return ffmpeg_ops.io_ffmpeg_decode_video(content, index, name=name)
+
+    return ffmpeg_ops.io_ffmpeg_decode_video_sample(
+        content,
+        index,
+        frame_indices=[] if frame_indices is None else frame_indices,
+        fps=fps or 0.0,
+        clip_duration=clip_duration or 0.0,
+        size=[0, 0] if size is None else size,
+        name=name,
+    )
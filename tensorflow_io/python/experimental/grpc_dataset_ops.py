@@ -21,22 +21,41 @@ from tensorflow_io.python.ops import core_ops
 class GRPCStreamIODataset(tf.data.Dataset):
     """GRPCStreamIODataset"""
 
-    def __init__(self, endpoint, shape, dtype):
+    def __init__(
+        self, endpoint, shape, dtype, batch=None, channels=1, chunk=None, raw=False
+    ):
         """Create a GRPC Reader.
 
         Args:
             endpoint: A `tf.string` tensor containing one or more endpoints.
+            shape: The shape of the data to read.
+            dtype: The dtype of the data to read.
+            batch: (Optional) The number of records fetched per read. Default: 1.
+            channels: (Optional) The number of channels to the endpoint. Reads
+                are spread over the channels and run in parallel. Default: 1.
+            chunk: (Optional) If set, each read is a server-streaming call
+                where the server pushes `chunk` records per message.
+            raw: (Optional) If True, non-string records are requested as raw
+                bytes in the `content` of the response instead of a packed
+                `TensorProto`, which the server has to support. Default: False.
         """
         with tf.name_scope("GRPCStreamIODataset"):
             shape = tf.cast(shape, tf.int64)
 
-            resource = core_ops.io_grpc_readable_init(endpoint)
+            resource = core_ops.io_grpc_readable_init(endpoint, channels=channels)
 
             self._resource = resource
             self._shape = tf.cast(shape, tf.int64)
-            self._dtype = dtype
-
-            step = 1
+            self._dtype = tf.as_dtype(dtype)
+            # Raw bytes avoid the TensorProto round trip on both sides, but
+            # only for non-string records.
+            assert not (
+                raw and self._dtype == tf.string
+            ), "raw is not supported for tf.string"
+            self._raw = raw
+            self._chunk = chunk or 0
+
+            step = batch or 1
             indices_start = tf.data.Dataset.range(0, shape[0], step)
             indices_stop = indices_start.skip(1).concatenate(
                 tf.data.Dataset.from_tensor_slices([shape[0]])
@@ -49,10 +68,15 @@ class GRPCStreamIODataset(tf.data.Dataset):
                     axis=0,
                 )
                 return core_ops.io_grpc_readable_read(
-                    self._resource, start=start, shape=shape, dtype=self._dtype
+                    self._resource,
+                    start=start,
+                    shape=shape,
+                    chunk=self._chunk,
+                    raw=self._raw,
+                    dtype=self._dtype,
                 )
 
-            dataset = dataset.map(f)
+            dataset = dataset.map(f, num_parallel_calls=channels)
             dataset = dataset.unbatch()
 
             self._dataset = dataset
@@ -61,7 +85,7 @@ class GRPCStreamIODataset(tf.data.Dataset):
             )  # pylint: disable=protected-access
 
     @staticmethod
-    def from_numpy(a, internal=False):
+    def from_numpy(a, batch=None, channels=1, chunk=None, raw=False, internal=False):
         """from_numpy"""
         assert internal
 
@@ -69,13 +93,21 @@ class GRPCStreamIODataset(tf.data.Dataset):
             grpc_endpoint,
         )
 
-        grpc_server = grpc_endpoint.GRPCEndpoint(a)
+        grpc_server = grpc_endpoint.GRPCEndpoint(a, max_workers=max(4, channels))
         grpc_server.start()
         endpoint = grpc_server.endpoint()
         print("ENDPOINT: ", endpoint)
         dtype = a.dtype
         shape = list(a.shape)
-        dataset = GRPCStreamIODataset(endpoint, shape, dtype)
+        dataset = GRPCStreamIODataset(
+            endpoint,
+            shape,
+            dtype,
+            batch=batch,
+            channels=channels,
+            chunk=chunk,
+            raw=raw,
+        )
         dataset._grpc_server = grpc_server  # pylint: disable=protected-access
         return dataset
 
@@ -36,9 +36,9 @@ import endpoint_pb2_grpc  # pylint: disable=wrong-import-position
 class GRPCEndpoint(endpoint_pb2_grpc.GRPCEndpointServicer):
     """GRPCEndpoint"""
 
-    def __init__(self, data):
+    def __init__(self, data, max_workers=4):
         self._grpc_server = grpc.server(
-            concurrent.futures.ThreadPoolExecutor(max_workers=4)
+            concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
         )
         port = self._grpc_server.add_insecure_port("localhost:0")
         self._endpoint = "localhost:" + str(port)
@@ -55,16 +55,26 @@ class GRPCEndpoint(endpoint_pb2_grpc.GRPCEndpointServicer):
     def endpoint(self):
         return self._endpoint
 
-    def ReadRecord(self, request, context):  # pylint: disable=unused-argument
-        """ReadRecord"""
+    def _encode(self, offset, length, raw):
+        """Encodes the records as raw bytes or as a packed TensorProto"""
         if len(self._data.shape) == 1:
-            tensor = tf.compat.v1.make_tensor_proto(
-                self._data[request.offset : request.offset + request.length]
-            )
+            data = self._data[offset : offset + length]
         else:
-            tensor = tf.compat.v1.make_tensor_proto(
-                self._data[request.offset : request.offset + request.length, :]
-            )
+            data = self._data[offset : offset + length, :]
+        if raw:
+            return endpoint_pb2.Response(content=data.tobytes())
+        tensor = tf.compat.v1.make_tensor_proto(data)
         record = google.protobuf.any_pb2.Any()
         record.Pack(tensor)
         return endpoint_pb2.Response(record=record)
+
+    def ReadRecord(self, request, context):  # pylint: disable=unused-argument
+        """ReadRecord"""
+        return self._encode(request.offset, request.length, request.raw)
+
+    def StreamRecord(self, request, context):  # pylint: disable=unused-argument
+        """StreamRecord"""
+        chunk = request.chunk if request.chunk > 0 else request.length
+        for offset in range(request.offset, request.offset + request.length, chunk):
+            length = min(chunk, request.offset + request.length - offset)
+            yield self._encode(offset, length, request.raw)
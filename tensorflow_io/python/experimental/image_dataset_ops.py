@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-"""TIFFIODataset"""
+"""TIFFIODataset and TIFFPatchIODataset"""
+
+import uuid
 
 import tensorflow as tf
 from tensorflow_io.python.ops import core_ops
@@ -47,3 +49,111 @@ class TIFFIODataset(tf.data.Dataset):
     @property
     def element_spec(self):
         return self._dataset.element_spec
+
+
+class TIFFPatchIODataset(tf.data.Dataset):
+    """TIFFPatchIODataset reads patches of one page of a TIFF file.
+
+    The file stays open and is read on demand, and only the tiles or strips
+    under a patch are decoded, with the decoded tiles kept in a cache of
+    `cache_size` tiles shared by overlapping patches. Patches are taken on a
+    grid with a step of `stride`, row by row, or at `num_patches` random
+    locations if provided. Elements are tuples of the `[x, y]` location and
+    the patch of shape `[height, width, channels]`.
+    """
+
+    def __init__(
+        self,
+        filename,
+        patch_size,
+        page=0,
+        level=None,
+        stride=None,
+        num_patches=None,
+        seed=None,
+        dtype=None,
+        cache_size=None,
+        internal=True,
+    ):
+        if not internal:
+            raise ValueError(
+                "TIFFPatchIODataset constructor is private; please use one "
+                "of the factory methods instead (e.g., "
+                "IODataset.from_tiff_patches())"
+            )
+        with tf.name_scope("TIFFPatchIODataset"):
+            resource = core_ops.io_tiff_region_readable_init(
+                filename,
+                cache_size=256 if cache_size is None else cache_size,
+                shared_name=f"TIFFPatchIODataset/{uuid.uuid4().hex}",
+            )
+            shape, dtypes, levels = core_ops.io_tiff_region_readable_spec(resource)
+            if level is not None:
+                page = levels[level]
+            if tf.executing_eagerly():
+                dtype = tf.as_dtype(dtypes[page].numpy())
+            else:
+                assert dtype is not None, "dtype must be provided in graph mode"
+
+            patch_width, patch_height = patch_size
+            stride_width, stride_height = stride or patch_size
+            height, width = shape[page][0], shape[page][1]
+
+            if num_patches is None:
+                y, x = tf.meshgrid(
+                    tf.range(0, height - patch_height + 1, stride_height),
+                    tf.range(0, width - patch_width + 1, stride_width),
+                    indexing="ij",
+                )
+                locations = tf.stack([tf.reshape(x, [-1]), tf.reshape(y, [-1])], 1)
+                dataset = tf.data.Dataset.from_tensor_slices(locations)
+            else:
+                seed = tf.cast(seed or 0, tf.int64)
+
+                # Integer draws only take a scalar maxval, so x and y are
+                # drawn separately with their own seeds
+                def f(i):
+                    x = tf.random.stateless_uniform(
+                        [],
+                        seed=tf.stack([seed, 2 * i]),
+                        maxval=tf.cast(width - patch_width + 1, tf.int64),
+                        dtype=tf.int64,
+                    )
+                    y = tf.random.stateless_uniform(
+                        [],
+                        seed=tf.stack([seed, 2 * i + 1]),
+                        maxval=tf.cast(height - patch_height + 1, tf.int64),
+                        dtype=tf.int64,
+                    )
+                    return tf.stack([x, y])
+
+                dataset = tf.data.Dataset.range(num_patches)
+                dataset = dataset.map(f)
+
+            dataset = dataset.map(
+                lambda location: (
+                    location,
+                    core_ops.io_tiff_region_readable_read(
+                        resource,
+                        page,
+                        location[0],
+                        location[1],
+                        patch_width,
+                        patch_height,
+                        dtype=dtype,
+                    ),
+                )
+            )
+
+            self._resource = resource
+            self._dataset = dataset
+            super().__init__(
+                self._dataset._variant_tensor
+            )  # pylint: disable=protected-access
+
+    def _inputs(self):
+        return []
+
+    @property
+    def element_spec(self):
+        return self._dataset.element_spec
@@ -87,6 +87,54 @@ def decode_tiff(contents, index=0, name=None):
     return core_ops.io_decode_tiff(contents, index, name=name)
 
 
+def decode_tiff_region(
+    contents_or_filename,
+    page,
+    x,
+    y,
+    width,
+    height,
+    level=None,
+    dtype=tf.uint8,
+    name=None,
+):
+    """
+    Decode a region of a TIFF-encoded image in its native data type.
+
+    Only the tiles or strips that intersect the region are read and decoded.
+    A filename is read from the file on demand, so the file is not loaded
+    into memory.
+
+    Args:
+      contents_or_filename: A `Tensor` of type `string`. 0-D. The TIFF-encoded
+        image, or the filename of the TIFF image.
+      page: A `Tensor` of type int64. 0-D. The 0-based index of the page
+        inside TIFF-encoded image.
+      x: The column of the top-left corner of the region.
+      y: The row of the top-left corner of the region.
+      width: The width of the region.
+      height: The height of the region.
+      level: The pyramid level to read instead of `page` (optional). Levels
+        are the tiled pages in order, or all pages if none is tiled.
+      dtype: The data type of the samples of the page. Defaults to `uint8`.
+      name: A name for the operation (optional).
+
+    Returns:
+      A `Tensor` of type `dtype` and shape of `[height, width, channels]`.
+    """
+    return core_ops.io_decode_tiff_region(
+        contents_or_filename,
+        page,
+        level=-1 if level is None else level,
+        x=x,
+        y=y,
+        width=width,
+        height=height,
+        dtype=dtype,
+        name=name,
+    )
+
+
 def decode_exr_info(contents, name=None):
     """
     Decode a EXR-encoded image meta data.
@@ -149,36 +197,57 @@ def decode_hdr(contents, name=None):
     return core_ops.io_decode_hdr(contents, name=name)
 
 
-def decode_nv12(contents, size, name=None):
+def _decode_yuv_color(contents, size, format, color_space, name):
+    dtype = tf.uint8 if color_space == "ycbcr" else tf.float32
+    return core_ops.io_decode_yuv_color(
+        contents, size=size, format=format, dst=color_space, dtype=dtype, name=name
+    )
+
+
+def decode_nv12(contents, size, color_space="rgb", name=None):
     """
-    Decode a NV12-encoded image to a uint8 tensor.
+    Decode a NV12-encoded image to a tensor.
 
     Args:
       contents: A `Tensor` of type `string`. 0-D.  The NV12-encoded image.
       size: A 1-D int32 Tensor of 2 elements: height, width. The size
         for the images.
+      color_space: The color space of the output, one of `rgb`, `ycbcr`,
+        `ypbpr`, `ydbdr`, `xyz` or `lab` (D65, 2 degrees). Color spaces other
+        than `rgb` are converted while decoding, as with the functions of
+        `tfio.experimental.color`, without an intermediate RGB image.
       name: A name for the operation (optional).
 
     Returns:
-      A `Tensor` of type `uint8` and shape of `[height, width, 3]` (RGB).
+      A `Tensor` of shape `[height, width, 3]`, of type `uint8` for `rgb` and
+      `ycbcr`, or `float32` otherwise.
     """
-    return core_ops.io_decode_nv12(contents, size=size, name=name)
+    if color_space == "rgb":
+        return core_ops.io_decode_nv12(contents, size=size, name=name)
+    return _decode_yuv_color(contents, size, "nv12", color_space, name)
 
 
-def decode_yuy2(contents, size, name=None):
+def decode_yuy2(contents, size, color_space="rgb", name=None):
     """
-    Decode a YUY2-encoded image to a uint8 tensor.
+    Decode a YUY2-encoded image to a tensor.
 
     Args:
       contents: A `Tensor` of type `string`. 0-D.  The YUY2-encoded image.
       size: A 1-D int32 Tensor of 2 elements: height, width. The size
         for the images.
+      color_space: The color space of the output, one of `rgb`, `ycbcr`,
+        `ypbpr`, `ydbdr`, `xyz` or `lab` (D65, 2 degrees). Color spaces other
+        than `rgb` are converted while decoding, as with the functions of
+        `tfio.experimental.color`, without an intermediate RGB image.
       name: A name for the operation (optional).
 
     Returns:
-      A `Tensor` of type `uint8` and shape of `[height, width, 3]` (RGB).
+      A `Tensor` of shape `[height, width, 3]`, of type `uint8` for `rgb` and
+      `ycbcr`, or `float32` otherwise.
     """
-    return core_ops.io_decode_yuy2(contents, size=size, name=name)
+    if color_space == "rgb":
+        return core_ops.io_decode_yuy2(contents, size=size, name=name)
+    return _decode_yuv_color(contents, size, "yuy2", color_space, name)
 
 
 def decode_avif(contents, name=None):
@@ -210,6 +279,41 @@ def decode_jp2(contents, dtype=tf.uint8, name=None):
     return core_ops.io_decode_jpeg2k(contents, dtype=dtype, name=name)
 
 
+def decode_image_batch(contents, size=None, channels=3, dtype=tf.uint8, name=None):
+    """
+    Decode a batch of images of mixed formats in parallel.
+
+    The format of each image is detected from its content: WebP, AVIF,
+    JPEG2000, PNM, HDR, EXR, TIFF (first page), PNG, JPEG, GIF (first frame)
+    and BMP are supported. Images are decoded in parallel on the intra-op
+    thread pool, converted to `channels` and `dtype` (integer images are
+    scaled to the range of `dtype`, `[0, 1]` for `tf.float32`), and resized
+    with bilinear interpolation to `size` if provided.
+
+    Args:
+      contents: A `Tensor` of type `string`. 1-D. The encoded images.
+      size: An optional `[height, width]` to resize the images to. If not
+        provided, all images must have the same shape.
+      channels: The number of channels of the output, 1 (grayscale), 3 (RGB)
+        or 4 (RGBA). Default 3.
+      dtype: Data type of the output, `tf.uint8`, `tf.uint16` or `tf.float32`.
+        Default `tf.uint8`.
+      name: A name for the operation (optional).
+
+    Returns:
+      A tuple of a `Tensor` of type `dtype` and shape of
+      `[batch, height, width, channels]`, and a `bool` `Tensor` of shape
+      `[batch]`, the status of each image. Images that could not be decoded,
+      or did not have the shape of the first image if `size` is not provided,
+      are zeros with a `False` status.
+    """
+    with tf.name_scope(name or "DecodeImageBatch"):
+        size = tf.zeros([0], tf.int64) if size is None else size
+        return core_ops.io_decode_image_batch(
+            contents, tf.cast(size, tf.int64), channels=channels, dtype=dtype
+        )
+
+
 def decode_obj(contents, name=None):
     """
     Decode a Wavefront (obj) file into a float32 tensor.
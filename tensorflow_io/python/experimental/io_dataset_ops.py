@@ -17,6 +17,7 @@
 import tensorflow as tf
 
 from tensorflow_io.python.ops import io_dataset
+from tensorflow_io.python.ops import ffmpeg_dataset_ops
 from tensorflow_io.python.experimental import libsvm_dataset_ops
 from tensorflow_io.python.experimental import image_dataset_ops
 from tensorflow_io.python.experimental import kinesis_dataset_ops
@@ -100,19 +101,64 @@ class IODataset(io_dataset.IODataset):
             return image_dataset_ops.TIFFIODataset(filename, internal=True)
 
     @classmethod
-    def from_kinesis(cls, stream, shard="", **kwargs):
+    def from_tiff_patches(cls, filename, patch_size, **kwargs):
+        """Creates an `IODataset` from patches of a TIFF file.
+
+        Args:
+          filename: A string, the filename of a TIFF file.
+          patch_size: A `[width, height]`, the size of the patches.
+          page: The 0-based index of the page to read (optional).
+          level: The pyramid level to read instead of `page` (optional).
+          stride: A `[width, height]`, the step between patches of the grid.
+            Defaults to `patch_size` (optional).
+          num_patches: The number of patches to take at random locations
+            instead of a grid (optional).
+          seed: The seed of the random locations (optional).
+          dtype: The data type of the samples, required in graph mode
+            (optional).
+          cache_size: The number of decoded tiles to cache (optional).
+          name: A name prefix for the IODataset (optional).
+
+        Returns:
+          A `IODataset` of tuples of location and patch.
+        """
+        with tf.name_scope(kwargs.get("name", "IOFromTIFFPatches")):
+            return image_dataset_ops.TIFFPatchIODataset(
+                filename,
+                patch_size,
+                page=kwargs.get("page", 0),
+                level=kwargs.get("level", None),
+                stride=kwargs.get("stride", None),
+                num_patches=kwargs.get("num_patches", None),
+                seed=kwargs.get("seed", None),
+                dtype=kwargs.get("dtype", None),
+                cache_size=kwargs.get("cache_size", None),
+                internal=True,
+            )
+
+    @classmethod
+    def from_kinesis(cls, stream, shard="", checkpoint=None, **kwargs):
         """Creates an `IODataset` from a Kinesis stream.
 
         Args:
           stream: A string, the stream name.
-          shard: A string, the shard of kinesis.
+          shard: A string, the shard of kinesis, or empty to read all shards.
+          checkpoint: A dict of shard ids to the sequence numbers to resume
+            after, as returned by `checkpoint()` of the dataset (optional).
+          buffer_size: The maximum number of records buffered (optional).
           name: A name prefix for the IODataset (optional).
 
         Returns:
           A `IODataset`.
         """
         with tf.name_scope(kwargs.get("name", "IOFromKinesis")):
-            return kinesis_dataset_ops.KinesisIODataset(stream, shard, internal=True)
+            return kinesis_dataset_ops.KinesisIODataset(
+                stream,
+                shard,
+                checkpoint=checkpoint,
+                buffer_size=kwargs.get("buffer_size", None),
+                internal=True,
+            )
 
     @classmethod
     def from_numpy(cls, a, **kwargs):
@@ -221,7 +267,7 @@ class IODataset(io_dataset.IODataset):
         )
 
     @classmethod
-    def from_sql(cls, query, endpoint=None, spec=None):
+    def from_sql(cls, query, endpoint=None, spec=None, batch=None):
         """Creates an `GraphIODataset` from a postgresql server endpoint.
 
         Args:
@@ -230,12 +276,18 @@ class IODataset(io_dataset.IODataset):
           spec: A structured (tuple) tf.TensorSpec of the dataset.
             In graph mode, spec is needed. In eager mode,
             spec is probed automatically.
+          batch: An integer, the number of rows fetched at a time through
+            a server-side cursor (optional). By default the whole result
+            of the query is held in memory. Only `SELECT` or `VALUES`
+            queries could be used with a cursor.
           name: A name prefix for the IODataset (optional).
 
         Returns:
           A `IODataset`.
         """
-        return sql_dataset_ops.SQLIODataset(query, endpoint=endpoint, spec=spec)
+        return sql_dataset_ops.SQLIODataset(
+            query, endpoint=endpoint, spec=spec, batch=batch
+        )
 
     @classmethod
     def from_video(cls, filename):
@@ -250,6 +302,38 @@ class IODataset(io_dataset.IODataset):
         """
         return video_dataset_ops.VideoIODataset(filename)
 
+    @classmethod
+    def from_ffmpeg_videos(cls, filenames, index=0, **kwargs):
+        """Creates an `IODataset` from video files decoded by a pool of
+        FFmpeg decoders.
+
+        Args:
+          filenames: A list of strings, the names of the video files.
+          index: The index of the video stream in each file.
+          parallelism: The number of files decoded at the same time
+            (optional).
+          thread_count: The number of codec threads of each decoder, or 0 to
+            let FFmpeg decide (optional).
+          thread_type: The codec threading, `"frame"` or `"slice"`
+            (optional).
+          buffer_size: The maximum number of frames buffered across the
+            pool (optional).
+          name: A name prefix for the IODataset (optional).
+
+        Returns:
+          A `IODataset` of tuples of file index and frame.
+        """
+        with tf.name_scope(kwargs.get("name", "IOFromFFmpegVideos")):
+            return ffmpeg_dataset_ops.FFmpegVideoPoolIODataset(
+                filenames,
+                index,
+                parallelism=kwargs.get("parallelism", None),
+                thread_count=kwargs.get("thread_count", None),
+                thread_type=kwargs.get("thread_type", None),
+                buffer_size=kwargs.get("buffer_size", None),
+                internal=True,
+            )
+
     @classmethod
     def to_file(cls, dataset, filename, **kwargs):
         """Write dataset to a file.
@@ -313,6 +397,14 @@ class StreamIODataset(tf.data.Dataset):
           subscription: A string, the subscription of the pubsub messages.
           endpoint: A string, the address of pubsub endpoint.
           timeout: An integer, the timeout of the pubsub pull.
+          streaming: A boolean, whether to receive the messages with a
+            streaming pull in a background thread (optional). The messages
+            are buffered in memory and acknowledged in batches.
+          max_outstanding: An integer, the maximum number of received
+            messages not yet acknowledged, which also bounds the buffer of a
+            streaming pull (optional). Default: 1000.
+          batch: An integer, the maximum number of messages returned per
+            read (optional).
           name: A name prefix for the IODataset (optional).
 
         Returns:
@@ -320,7 +412,13 @@ class StreamIODataset(tf.data.Dataset):
         """
         with tf.name_scope(kwargs.get("name", "IOFromPubSub")):
             return pubsub_dataset_ops.PubSubStreamIODataset(
-                subscription, endpoint=endpoint, timeout=timeout, internal=True
+                subscription,
+                endpoint=endpoint,
+                timeout=timeout,
+                streaming=kwargs.get("streaming", False),
+                max_outstanding=kwargs.get("max_outstanding", 1000),
+                batch=kwargs.get("batch", None),
+                internal=True,
             )
 
     @classmethod
@@ -329,10 +427,24 @@ class StreamIODataset(tf.data.Dataset):
 
         Args:
           a: A numpy array.
+          batch: The number of records fetched per read (optional).
+          channels: The number of channels used to read in parallel (optional).
+          chunk: The number of records per message pushed by the server
+            through a streaming call (optional). By default each read is
+            a single unary call.
+          raw: Whether the records are transferred as raw bytes instead of
+            a packed TensorProto (optional). Default: False.
           name: A name prefix for the IODataset (optional).
 
         Returns:
           A `IODataset`.
         """
         with tf.name_scope(kwargs.get("name", "IOFromGRPC")):
-            return grpc_dataset_ops.GRPCStreamIODataset.from_numpy(a, internal=True)
+            return grpc_dataset_ops.GRPCStreamIODataset.from_numpy(
+                a,
+                batch=kwargs.get("batch", None),
+                channels=kwargs.get("channels", 1),
+                chunk=kwargs.get("chunk", None),
+                raw=kwargs.get("raw", False),
+                internal=True,
+            )
@@ -45,20 +45,46 @@ class KinesisIODataset(tf.data.Dataset):
     is `True`, then `KinesisIODataset` will keep retrying to retrieve data
     from the stream. If `read_indefinitely` is `False`, an `OutOfRangeError`
     is returned immediately instead.
+
+    Unless a `shard` is given, all shards of the stream are read in parallel,
+    with one polling thread per shard and a bounded buffer of records shared
+    by the shards. Records of a shard keep their order, and requests to a
+    throttled shard are backed off until they succeed again. The sequence
+    numbers of the last records consumed from each shard are returned by
+    `checkpoint()`, and can be passed as `checkpoint` to resume the stream:
+    ```python
+    shards, sequences = dataset.checkpoint()
+    dataset = tfio.experimental.IODataset.from_kinesis(
+        "kinesis_stream_name",
+        checkpoint=dict(zip(shards.numpy(), sequences.numpy())))
+    ```
     """
 
-    def __init__(self, stream, shard="", internal=False):
+    def __init__(
+        self, stream, shard="", checkpoint=None, buffer_size=None, internal=False
+    ):
         """Create a KinesisIODataset.
 
         Args:
           stream: A `tf.string` tensor containing the name of the stream.
-          shard: A `tf.string` tensor containing the id of the shard.
+          shard: A `tf.string` tensor containing the id of the shard, or empty
+            to read all shards.
+          checkpoint: A dict of shard ids to the sequence numbers to resume
+            after, as returned by `checkpoint()` (optional).
+          buffer_size: The maximum number of records buffered across all
+            shards (optional).
         """
         with tf.name_scope("KinesisIODataset"):
             assert internal
 
             metadata = []
             metadata.append("shard=%s" % shard)
+            for k, v in (checkpoint or {}).items():
+                metadata.append(
+                    "checkpoint=%s:%s" % (tf.compat.as_str(k), tf.compat.as_str(v))
+                )
+            if buffer_size is not None:
+                metadata.append("buffer_size=%d" % buffer_size)
             resource = core_ops.io_kinesis_readable_init(stream, metadata)
 
             self._resource = resource
@@ -74,11 +100,30 @@ class KinesisIODataset(tf.data.Dataset):
             )
             dataset = dataset.unbatch()
 
+            # Records are committed as they are consumed so that checkpoint()
+            # does not move past records still buffered in a batch
+            def f(v):
+                with tf.control_dependencies(
+                    [core_ops.io_kinesis_readable_commit(self._resource)]
+                ):
+                    return tf.nest.map_structure(tf.identity, v)
+
+            dataset = dataset.map(f)
+
             self._dataset = dataset
             super().__init__(
                 self._dataset._variant_tensor
             )  # pylint: disable=protected-access
 
+    def checkpoint(self):
+        """Returns the sequence numbers of the last records consumed.
+
+        Returns:
+          A tuple of `tf.string` tensors with the shard ids and the sequence
+          numbers of the last records consumed from each shard.
+        """
+        return core_ops.io_kinesis_readable_checkpoint(self._resource)
+
     def _inputs(self):
         return []
 
@@ -14,6 +14,7 @@
 # ==============================================================================
 """MongoDBIODatasets"""
 
+import json
 from urllib.parse import urlparse
 import tensorflow as tf
 from tensorflow_io.python.ops import core_ops
@@ -25,33 +26,127 @@ class _MongoDBHandler:
     session data.
     """
 
-    def __init__(self, uri, database, collection):
+    def __init__(
+        self,
+        uri,
+        database,
+        collection,
+        filter=None,
+        projection=None,
+        batch_size=1024,
+        num_splits=1,
+        specs=None,
+    ):
         self.uri = uri
         self.database = database
         self.collection = collection
+        self.batch_size = batch_size
+        self.num_splits = num_splits
+        self.prepare_specs(specs)
+        self.filter = self.prepare_document(filter, "filter")
+        if projection is None and self.columns is not None:
+            # Only the requested columns are transferred from the server
+            projection = {column: 1 for column in self.columns}
+        self.projection = self.prepare_document(projection, "projection")
+
+    def prepare_specs(self, specs):
+        """Prepares the column names and dtypes for typed output.
+
+        Args:
+            specs: A dict of column names to `tf.TensorSpec` or `tf.DType`.
+        """
+
+        self.columns, self.dtypes = None, None
+        if specs is None:
+            return
+        if not isinstance(specs, dict) or len(specs) == 0:
+            raise ValueError(
+                "specs should be a non-empty dict of column:dtype pairs. Got: ",
+                specs,
+            )
+        self.columns = list(specs.keys())
+        self.dtypes = [
+            spec.dtype if isinstance(spec, tf.TensorSpec) else tf.as_dtype(spec)
+            for spec in specs.values()
+        ]
+
+    def prepare_document(self, document, name):
+        """Serializes a filter or projection into the JSON form expected by
+        the init op.
+
+        Args:
+            document: None, a dict, or a JSON string (extended JSON is
+                supported, e.g. `{"_id": {"$oid": "..."}}`).
+            name: The name of the argument, used in error messages.
+        Returns:
+            A JSON string.
+        """
+
+        if document is None:
+            return "{}"
+        if isinstance(document, dict):
+            return json.dumps(document)
+        if isinstance(document, str):
+            return document
+        raise ValueError(
+            "{} should be a dict or a JSON string. Got: ".format(name), document
+        )
 
     def get_healthy_resource(self):
         """Retrieve the resource which is connected to a healthy node"""
 
-        resource = core_ops.io_mongo_db_readable_init(
+        resource, splits = core_ops.io_mongo_db_readable_init(
             uri=self.uri,
             database=self.database,
             collection=self.collection,
+            filter=self.filter,
+            projection=self.projection,
+            batch_size=self.batch_size,
+            num_splits=self.num_splits,
         )
         print(f"Connection successful: {self.uri}")
-        return resource
+        return resource, int(splits)
 
-    def get_next_batch(self, resource):
+    def get_next_batch(self, resource, index):
         """Prepares the next batch of data based on the request url and
         the counter index.
 
         Args:
             resource: the init op resource.
+            index: the index of the `_id` range to read from.
         Returns:
-            A Tensor containing serialized JSON records.
+            A Tensor containing serialized JSON records, or a dict of column
+            Tensors if specs were provided.
         """
 
-        return core_ops.io_mongo_db_readable_next(resource=resource)
+        if self.columns is None:
+            return core_ops.io_mongo_db_readable_next(resource=resource, index=index)
+        values = core_ops.io_mongo_db_readable_next_columns(
+            resource=resource, index=index, columns=self.columns, dtypes=self.dtypes
+        )
+        return dict(zip(self.columns, values))
+
+    def get_split_dataset(self, resource, index):
+        """Prepares the dataset of records within one `_id` range.
+
+        Args:
+            resource: the init op resource.
+            index: the index of the `_id` range to read from.
+        Returns:
+            A `tf.data.Dataset` of records.
+        """
+
+        dataset = tf.data.experimental.Counter()
+        dataset = dataset.map(
+            lambda i: self.get_next_batch(resource=resource, index=index)
+        )
+        dataset = dataset.apply(
+            tf.data.experimental.take_while(
+                lambda v: tf.greater(tf.shape(tf.nest.flatten(v)[0])[0], 0)
+            )
+        )
+        dataset = dataset.flat_map(lambda x: tf.data.Dataset.from_tensor_slices(x))
+        return dataset
 
 
 class MongoDBIODataset(tf.data.Dataset):
@@ -80,9 +175,30 @@ class MongoDBIODataset(tf.data.Dataset):
     >>> model.fit(dataset) # to train
     >>> model.predict(dataset) # to infer
 
+    Large collections can be scanned with several cursors in parallel, each
+    covering a range of `_id`. When `specs` are provided, the documents are
+    converted into typed columns directly, so they don't need to be decoded
+    with `tfio.experimental.serialization.decode_json` afterwards:
+
+    >>> dataset = tfio.experimental.mongodb.MongoDBIODataset(
+        uri=URI, database=DATABASE, collection=COLLECTION,
+        filter={"age": {"$gte": 18}},
+        specs={"age": tf.int32, "fare": tf.float64},
+        num_parallel_reads=4)
+
     """
 
-    def __init__(self, uri, database, collection):
+    def __init__(
+        self,
+        uri,
+        database,
+        collection,
+        filter=None,
+        projection=None,
+        batch_size=1024,
+        num_parallel_reads=1,
+        specs=None,
+    ):
         """Initialize the dataset with the following parameters
 
         Args:
@@ -107,15 +223,43 @@ class MongoDBIODataset(tf.data.Dataset):
                 server or a replica set to connect to.
             collection: A string, representing the collection from which the documents
                 have to be retrieved.
+            filter: (Optional) A dict or an extended JSON string, representing
+                the query filter evaluated by the server.
+            projection: (Optional) A dict or an extended JSON string, representing
+                the fields to be returned by the server. Defaults to the
+                columns in `specs` when `specs` are provided.
+            batch_size: (Optional) An int, representing the number of documents
+                fetched from the server per round trip. Default: 1024.
+            num_parallel_reads: (Optional) An int, representing the number of
+                `_id` ranges the collection is split into. Each range is scanned
+                by its own cursor in parallel, and the records are not returned
+                in any particular order. Default: 1.
+            specs: (Optional) A dict of column names to `tf.TensorSpec` or
+                `tf.DType`. If provided, the dataset yields a dict of scalar
+                tensors instead of JSON strings. Nested fields can be
+                addressed with dotted names, e.g. `"address.city"`.
         """
-        handler = _MongoDBHandler(uri=uri, database=database, collection=collection)
-        resource = handler.get_healthy_resource()
-        dataset = tf.data.experimental.Counter()
-        dataset = dataset.map(lambda i: handler.get_next_batch(resource=resource))
-        dataset = dataset.apply(
-            tf.data.experimental.take_while(lambda v: tf.greater(tf.shape(v)[0], 0))
+        handler = _MongoDBHandler(
+            uri=uri,
+            database=database,
+            collection=collection,
+            filter=filter,
+            projection=projection,
+            batch_size=batch_size,
+            num_splits=num_parallel_reads,
+            specs=specs,
         )
-        dataset = dataset.flat_map(lambda x: tf.data.Dataset.from_tensor_slices(x))
+        resource, splits = handler.get_healthy_resource()
+        if splits == 1:
+            dataset = handler.get_split_dataset(resource=resource, index=0)
+        else:
+            dataset = tf.data.Dataset.range(splits).interleave(
+                lambda index: handler.get_split_dataset(resource=resource, index=index),
+                cycle_length=splits,
+                block_length=batch_size,
+                num_parallel_calls=splits,
+                deterministic=False,
+            )
         self._dataset = dataset
 
         super().__init__(
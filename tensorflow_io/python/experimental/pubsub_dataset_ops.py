@@ -21,7 +21,16 @@ from tensorflow_io.python.ops import core_ops
 class PubSubStreamIODataset(tf.data.Dataset):
     """PubSubStreamGraphIODataset"""
 
-    def __init__(self, subscription, endpoint=None, timeout=10000, internal=True):
+    def __init__(
+        self,
+        subscription,
+        endpoint=None,
+        timeout=10000,
+        streaming=False,
+        max_outstanding=1000,
+        batch=None,
+        internal=True,
+    ):
         """PubSubStreamIODataset."""
         with tf.name_scope("PubSubStreamIODataset"):
             assert internal
@@ -30,6 +39,10 @@ class PubSubStreamIODataset(tf.data.Dataset):
             if endpoint is not None:
                 metadata.append("endpoint=%s" % endpoint)
             metadata.append("timeout=%d" % timeout)
+            metadata.append("streaming=%s" % ("true" if streaming else "false"))
+            metadata.append("max_outstanding=%d" % max_outstanding)
+            if batch is not None:
+                metadata.append("batch=%d" % batch)
             resource = core_ops.io_pub_sub_readable_init(subscription, metadata)
 
             self._resource = resource
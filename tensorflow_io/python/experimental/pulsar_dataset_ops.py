@@ -29,6 +29,9 @@ class PulsarIODataset(tf.data.Dataset):
         timeout,
         ack_grouping_time=-1,
         poll_timeout=100,
+        max_messages=1024,
+        max_bytes=None,
+        batch_timeout=None,
     ):
         """Creates a `PulsarIODataset` from pulsar server with a subscription
 
@@ -51,6 +54,16 @@ class PulsarIODataset(tf.data.Dataset):
             message was received, it would try again until `timeout` exceeds.
             `poll_timeout` must be positive and not larger than `timeout`.
             Default: 100
+          max_messages: A `tf.int64` tensor containing the maximum number of messages
+            received in a batch. Each batch is acknowledged with a single cumulative
+            acknowledgement, or per message on partitioned topics.
+            Default: 1024
+          max_bytes: A `tf.int64` tensor containing the maximum size in bytes of the
+            messages received in a batch, the batch is returned once it's exceeded.
+            Default: None, no limit.
+          batch_timeout: A `tf.int32` tensor containing the maximum time in milliseconds
+            to wait for a batch to be filled after its first message was received.
+            Default: None, wait until `timeout` without new messages.
         """
         with tf.name_scope("PulsarIODataset"):
             if timeout <= 0:
@@ -68,6 +81,14 @@ class PulsarIODataset(tf.data.Dataset):
                     )
                 )
 
+            if max_messages <= 0:
+                raise ValueError(
+                    f"Invalid max_messages value: {max_messages}, must be > 0"
+                )
+
+            max_bytes = -1 if max_bytes is None else max_bytes
+            batch_timeout = -1 if batch_timeout is None else batch_timeout
+
             resource = core_ops.io_pulsar_readable_init(
                 service_url, topic, subscription, ack_grouping_time
             )
@@ -75,7 +96,12 @@ class PulsarIODataset(tf.data.Dataset):
             dataset = tf.data.experimental.Counter()
             dataset = dataset.map(
                 lambda i: core_ops.io_pulsar_readable_next(
-                    input=self._resource, timeout=timeout, poll_timeout=poll_timeout
+                    input=self._resource,
+                    timeout=timeout,
+                    poll_timeout=poll_timeout,
+                    max_messages=max_messages,
+                    max_bytes=max_bytes,
+                    batch_timeout=batch_timeout,
                 )
             )
             dataset = dataset.apply(
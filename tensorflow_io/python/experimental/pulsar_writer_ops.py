@@ -36,9 +36,15 @@ class PulsarWriter:
     def write(self, value, key=""):
         """Write a message to pulsar topic asynchronously
 
+        Messages are batched by the producer, so writing a 1-D tensor of
+        messages in one call is much faster than writing them one by one.
+
         Args:
-          value: A `tf.string` tensor containing the value of message
+          value: A `tf.string` tensor containing the value of message, or a 1-D
+            tensor of messages.
           key: A `tf.string` tensor containing the key of message, if it's an empty string, the message will have no key.
+            For a 1-D `value`, either a single key for all messages or a 1-D tensor
+            with a key for each message.
             Default: ""
         """
         return core_ops.io_pulsar_writable_write(self._resource, value, key)
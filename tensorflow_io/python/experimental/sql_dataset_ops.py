@@ -21,13 +21,13 @@ from tensorflow_io.python.ops import core_ops
 class SQLIODataset(tf.data.Dataset):
     """SQLIODataset"""
 
-    def __init__(self, query, endpoint=None, spec=None, internal=True):
+    def __init__(self, query, endpoint=None, spec=None, batch=None, internal=True):
         """SQLIODataset."""
         with tf.name_scope("SQLIODataset"):
             assert internal
             endpoint = endpoint or ""
             resource, count, fields, dtypes = core_ops.io_sql_iterable_init(
-                query, endpoint
+                query, endpoint, batch or 0
             )
             if spec is None:
                 fields = tf.unstack(fields)
@@ -47,14 +47,32 @@ class SQLIODataset(tf.data.Dataset):
             dtypes = [e.dtype for e in flatten]
 
             self._resource = resource
-            dataset = tf.data.Dataset.range(0, count)
+            if batch:
+                # Rows are streamed from a server-side cursor, `batch` rows
+                # per fetch, until an empty batch is returned.
+                dataset = tf.data.experimental.Counter()
 
-            def f(index):
-                return tf.nest.pack_sequence_as(
-                    spec, core_ops.io_sql_iterable_read(resource, index, fields, dtypes)
+                def f(index):
+                    return tf.nest.pack_sequence_as(
+                        spec, core_ops.io_sql_iterable_fetch(resource, fields, dtypes)
+                    )
+
+                dataset = dataset.map(f)
+                dataset = dataset.apply(
+                    tf.data.experimental.take_while(
+                        lambda v: tf.greater(tf.shape(tf.nest.flatten(v)[0])[0], 0)
+                    )
                 )
+            else:
+                dataset = tf.data.Dataset.range(0, count)
+
+                def f(index):
+                    return tf.nest.pack_sequence_as(
+                        spec,
+                        core_ops.io_sql_iterable_read(resource, index, fields, dtypes),
+                    )
 
-            dataset = dataset.map(f)
+                dataset = dataset.map(f)
             dataset = dataset.unbatch()
             self._dataset = dataset
             super().__init__(
@@ -18,9 +18,11 @@ from functools import partial
 import io
 from itertools import chain
 import os
+import shutil
 import socket
 import threading
 import tempfile
+import weakref
 
 import tensorflow as tf
 from tensorflow import dtypes
@@ -349,6 +351,8 @@ class ArrowFeatherDataset(ArrowBaseDataset):
         output_shapes=None,
         batch_size=None,
         batch_mode="keep_remainder",
+        num_shards=None,
+        shard_index=None,
     ):
         """Create an ArrowDataset from one or more Feather file names.
 
@@ -367,12 +371,33 @@ class ArrowFeatherDataset(ArrowBaseDataset):
                         "keep_remainder" (default, keeps partial batch data),
                         "drop_remainder" (discard partial batch data),
                         "auto" (size to number of records in Arrow record batch)
+            num_shards: Optional number of shards that the record batches of
+                        each file are split into, see `shard()`
+            shard_index: Optional index of the shard of record batches to read
+                        from each file, required with `num_shards`
         """
+        self._args = (filenames, columns, output_types, output_shapes)
+        self._kwargs = dict(batch_size=batch_size, batch_mode=batch_mode)
+        self._sharded = num_shards is not None
+        if (num_shards is None) != (shard_index is None):
+            raise ValueError("num_shards and shard_index must be set together")
         filenames = tf.convert_to_tensor(
             filenames, dtype=dtypes.string, name="filenames"
         )
+        num_shards = tf.convert_to_tensor(
+            1 if num_shards is None else num_shards,
+            dtype=dtypes.int64,
+            name="num_shards",
+        )
+        shard_index = tf.convert_to_tensor(
+            0 if shard_index is None else shard_index,
+            dtype=dtypes.int64,
+            name="shard_index",
+        )
         super().__init__(
-            partial(core_ops.io_arrow_feather_dataset, filenames),
+            partial(
+                core_ops.io_arrow_feather_dataset, filenames, num_shards, shard_index
+            ),
             columns,
             output_types,
             output_shapes,
@@ -388,6 +413,8 @@ class ArrowFeatherDataset(ArrowBaseDataset):
         columns=None,
         batch_size=None,
         batch_mode="keep_remainder",
+        num_shards=None,
+        shard_index=None,
     ):
         """Create an Arrow Dataset for reading record batches from Arrow feather
         files, inferring output types and shapes from the given Arrow schema.
@@ -406,18 +433,134 @@ class ArrowFeatherDataset(ArrowBaseDataset):
                         "keep_remainder" (default, keeps partial batch data),
                         "drop_remainder" (discard partial batch data),
                         "auto" (size to number of records in Arrow record batch)
+            num_shards: Optional number of shards that the record batches of
+                        each file are split into, see `shard()`
+            shard_index: Optional index of the shard of record batches to read
+                        from each file, required with `num_shards`
         """
         if columns is None:
             columns = list(range(len(schema)))
         output_types, output_shapes = arrow_schema_to_tensor_types(schema)
         return cls(
-            filenames, columns, output_types, output_shapes, batch_size, batch_mode
+            filenames,
+            columns,
+            output_types,
+            output_shapes,
+            batch_size,
+            batch_mode,
+            num_shards=num_shards,
+            shard_index=shard_index,
+        )
+
+    def shard(self, num_shards, index, name=None):
+        """Creates a Dataset that reads only 1/`num_shards` of the record
+        batches of each file, so workers do not read and discard the rows of
+        other shards as with element-wise sharding.
+
+        The record batches of each file are split into `num_shards` contiguous
+        ranges and shard `index` reads the range at that position. Unlike
+        `tf.data.Dataset.shard`, shards hold whole record batches, so they are
+        balanced by record batch rather than by row. If the dataset is already
+        sharded, this falls back to element-wise sharding.
+
+        Args:
+            num_shards: A `tf.int64` scalar, the number of shards
+            index: A `tf.int64` scalar, the shard to read
+            name: Optional name, used only by element-wise sharding
+
+        Returns:
+            An `ArrowFeatherDataset` reading shard `index` of the record batches
+        """
+        if self._sharded:
+            return super().shard(num_shards, index, name=name)
+        return ArrowFeatherDataset(
+            *self._args, num_shards=num_shards, shard_index=index, **self._kwargs
         )
 
 
+def _serve_record_batches(record_batch_iter, record_batch_iter_factory=None):
+    """Serve Arrow record batches in a background thread and return the
+    endpoint and a function that stops the server. Each connection is served
+    on its own thread, the first with `record_batch_iter` and any later ones
+    with `record_batch_iter_factory`. Stopping the server removes its socket,
+    connections already accepted are served to the end.
+    This function requires pyarrow to be installed.
+    """
+    import pyarrow as pa  # pylint: disable=import-outside-toplevel
+
+    sock_dir = None
+    # Create a UDS server by default if not Windows
+    if os.name != "nt":
+        sock_dir = tempfile.mkdtemp(prefix="arrow_io_stream_")
+        sock_path = os.path.join(sock_dir, "arrow_io_stream.sock")
+        endpoint = f"unix://{sock_path}"
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.bind(sock_path)
+    # Create a TCP server
+    else:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.bind(("127.0.0.1", 0))
+        host_addr, port = sock.getsockname()
+        endpoint = f"{host_addr}:{port}"
+    sock.listen(socket.SOMAXCONN)
+
+    def serve_connection(conn, batch_iter):
+        """serve record batches on a connection"""
+        outfile = conn.makefile(mode="wb")
+        writer = None
+        try:
+            for batch in batch_iter:
+                if writer is None:
+                    writer = pa.RecordBatchStreamWriter(outfile, batch.schema)
+                writer.write_batch(batch)
+                # Send each batch as it is produced
+                outfile.flush()
+        finally:
+            if writer is not None:
+                writer.close()
+            outfile.close()
+            conn.close()
+
+    def run_server():
+        """accept connections"""
+        curr_iter = record_batch_iter
+        while True:
+            try:
+                conn, _ = sock.accept()
+            except OSError:
+                # The server was stopped
+                return
+            connection = threading.Thread(
+                target=serve_connection, args=(conn, curr_iter)
+            )
+            connection.daemon = True
+            connection.start()
+            if record_batch_iter_factory is not None:
+                curr_iter = record_batch_iter_factory()
+
+    # Run the server in a thread
+    server = threading.Thread(target=run_server)
+    server.daemon = True
+    server.start()
+
+    def stop():
+        """stop accepting connections and remove the socket"""
+        try:
+            # Wakes up the accept of the server thread
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        sock.close()
+        if sock_dir is not None:
+            shutil.rmtree(sock_dir, ignore_errors=True)
+
+    return endpoint, stop
+
+
 class ArrowStreamDataset(ArrowBaseDataset):
     """An Arrow Dataset for reading record batches from an input stream.
-    Currently supported input streams are a socket client or stdin.
+    Currently supported input streams are a socket client, a shared memory
+    file or stdin.
     """
 
     def __init__(
@@ -428,6 +571,7 @@ class ArrowStreamDataset(ArrowBaseDataset):
         output_shapes=None,
         batch_size=None,
         batch_mode="keep_remainder",
+        num_parallel_reads=None,
     ):
         """Create an ArrowDataset from an input stream.
 
@@ -438,6 +582,10 @@ class ArrowStreamDataset(ArrowBaseDataset):
                         - "host:port": IPv4 address (default)
                         - "tcp://<host:port>": IPv4 address,
                         - "unix://<path>": local path as unix socket address,
+                        - "shm://<path>": Arrow stream written to a shared memory
+                            file, e.g. under /dev/shm, by a producer on the same
+                            host. The file is memory mapped, so it must be
+                            complete when read.
                         - "fd://<number>": STDIN or file descriptor number. For
                             STDIN, use "fd://0" or "fd://-".
             columns: A list of column indices to be used in the Dataset
@@ -452,12 +600,20 @@ class ArrowStreamDataset(ArrowBaseDataset):
                         "keep_remainder" (default, keeps partial batch data),
                         "drop_remainder" (discard partial batch data),
                         "auto" (size to number of records in Arrow record batch)
+            num_parallel_reads: Optional number of endpoints to read and decode
+                        concurrently, record batches are interleaved in the order
+                        they arrive. Defaults to reading endpoints one at a time.
         """
         endpoints = tf.convert_to_tensor(
             endpoints, dtype=dtypes.string, name="endpoints"
         )
+        if num_parallel_reads is None:
+            num_parallel_reads = 1
+        num_parallel_reads = tf.convert_to_tensor(
+            num_parallel_reads, dtype=dtypes.int64, name="num_parallel_reads"
+        )
         super().__init__(
-            partial(core_ops.io_arrow_stream_dataset, endpoints),
+            partial(core_ops.io_arrow_stream_dataset, endpoints, num_parallel_reads),
             columns,
             output_types,
             output_shapes,
@@ -473,6 +629,7 @@ class ArrowStreamDataset(ArrowBaseDataset):
         columns=None,
         batch_size=None,
         batch_mode="keep_remainder",
+        num_parallel_reads=None,
     ):
         """Create an Arrow Dataset from an input stream, inferring output types
         and shapes from the given Arrow schema.
@@ -485,6 +642,10 @@ class ArrowStreamDataset(ArrowBaseDataset):
                         - "host:port": IPv4 address (default)
                         - "tcp://<host:port>": IPv4 address,
                         - "unix://<path>": local path as unix socket address,
+                        - "shm://<path>": Arrow stream written to a shared memory
+                            file, e.g. under /dev/shm, by a producer on the same
+                            host. The file is memory mapped, so it must be
+                            complete when read.
                         - "fd://<number>": STDIN or file descriptor number. For
                             STDIN, use "fd://0" or "fd://-".
             schema: Arrow schema defining the record batch data in the stream
@@ -497,12 +658,21 @@ class ArrowStreamDataset(ArrowBaseDataset):
                         "keep_remainder" (default, keeps partial batch data),
                         "drop_remainder" (discard partial batch data),
                         "auto" (size to number of records in Arrow record batch)
+            num_parallel_reads: Optional number of endpoints to read and decode
+                        concurrently, record batches are interleaved in the order
+                        they arrive. Defaults to reading endpoints one at a time.
         """
         if columns is None:
             columns = list(range(len(schema)))
         output_types, output_shapes = arrow_schema_to_tensor_types(schema)
         return cls(
-            endpoints, columns, output_types, output_shapes, batch_size, batch_mode
+            endpoints,
+            columns,
+            output_types,
+            output_shapes,
+            batch_size,
+            batch_mode,
+            num_parallel_reads=num_parallel_reads,
         )
 
     @classmethod
@@ -537,63 +707,103 @@ class ArrowStreamDataset(ArrowBaseDataset):
             record_batch_iter_factory: Optional factory to create additional record
                                         batch iterators for multiple iterations.
         """
-        import pyarrow as pa  # pylint: disable=import-outside-toplevel
-
-        # Create a UDS server by default if not Windows
-        if os.name != "nt":
-            sock_path = os.path.join(tempfile.gettempdir(), "arrow_io_stream.sock")
-            endpoint = f"unix://{sock_path}"
-            try:
-                os.unlink(sock_path)
-            except OSError:
-                if os.path.exists(sock_path):
-                    raise
-            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            sock.bind(sock_path)
-        # Create a TCP server
-        else:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.bind(("127.0.0.1", 0))
-            host_addr, port = sock.getsockname()
-            endpoint = f"{host_addr}:{port}"
-        sock.listen(1)
-
-        def run_server():
-            """serve record batches"""
-            curr_iter = record_batch_iter
-            while True:
-                conn, _ = sock.accept()
-                outfile = conn.makefile(mode="wb")
-                writer = None
-                try:
-                    for batch in curr_iter:
-                        if writer is None:
-                            writer = pa.RecordBatchStreamWriter(outfile, batch.schema)
-                        writer.write_batch(batch)
-                    if record_batch_iter_factory is not None:
-                        curr_iter = record_batch_iter_factory()
-                finally:
-                    if writer is not None:
-                        writer.close()
-                    outfile.close()
-                    conn.close()
-            sock.close()
-
-        # Run the server in a thread
-        server = threading.Thread(target=run_server)
-        server.daemon = True
-        server.start()
+        endpoint, stop = _serve_record_batches(
+            record_batch_iter, record_batch_iter_factory
+        )
 
         if columns is None:
             columns = list(range(len(output_types)))
 
-        return cls(
+        dataset = cls(
             endpoint, columns, output_types, output_shapes, batch_size, batch_mode
         )
+        # The server lives as long as the dataset
+        weakref.finalize(dataset, stop)
+        return dataset
+
+    @classmethod
+    def from_record_batch_iters(
+        cls,
+        record_batch_iters,
+        output_types,
+        output_shapes=None,
+        columns=None,
+        batch_size=None,
+        batch_mode="keep_remainder",
+        record_batch_iter_factories=None,
+        num_parallel_reads=None,
+    ):
+        """Create an ArrowStreamDataset by serving each of several sequences of
+        Arrow record batches on its own endpoint. The endpoints are read and
+        decoded concurrently, so independent producers are not serialized
+        behind a single stream. This constructor requires pyarrow to be
+        installed.
+
+        Args:
+            record_batch_iters: A list of sequences or iterators of Arrow record
+                                batches, one per endpoint
+            output_types: Tensor dtypes of the output tensors
+            output_shapes: TensorShapes of the output tensors or None to
+                            infer partial
+            columns: Optional list of column indices to be used, if None all are used
+            batch_size: Batch size of output tensors, setting a batch size here
+                        will create batched tensors from Arrow memory and can be more
+                        efficient than using tf.data.Dataset.batch().
+                        NOTE: batch_size does not need to be set if batch_mode='auto'
+            batch_mode: Mode of batching, supported strings:
+                        "keep_remainder" (default, keeps partial batch data),
+                        "drop_remainder" (discard partial batch data),
+                        "auto" (size to number of records in Arrow record batch)
+            record_batch_iter_factories: Optional list of factories, one per
+                                        iterator, to create additional record
+                                        batch iterators for multiple iterations.
+            num_parallel_reads: Optional number of endpoints to read concurrently,
+                                defaults to the number of iterators.
+        """
+        record_batch_iters = list(record_batch_iters)
+        if record_batch_iter_factories is None:
+            record_batch_iter_factories = [None] * len(record_batch_iters)
+        if len(record_batch_iter_factories) != len(record_batch_iters):
+            raise ValueError(
+                "record_batch_iter_factories must have one factory per iterator"
+            )
+        endpoints, stops = zip(
+            *[
+                _serve_record_batches(batch_iter, factory)
+                for batch_iter, factory in zip(
+                    record_batch_iters, record_batch_iter_factories
+                )
+            ]
+        )
+        endpoints = list(endpoints)
+        if num_parallel_reads is None:
+            num_parallel_reads = len(endpoints)
+
+        if columns is None:
+            columns = list(range(len(output_types)))
+
+        dataset = cls(
+            endpoints,
+            columns,
+            output_types,
+            output_shapes,
+            batch_size,
+            batch_mode,
+            num_parallel_reads=num_parallel_reads,
+        )
+        # The servers live as long as the dataset
+        for stop in stops:
+            weakref.finalize(dataset, stop)
+        return dataset
 
     @classmethod
     def from_pandas(
-        cls, data_frames, columns=None, preserve_index=True, batch_size=None
+        cls,
+        data_frames,
+        columns=None,
+        preserve_index=True,
+        batch_size=None,
+        num_parallel_reads=None,
     ):
         """Create an ArrowStreamDataset by serving a DataFrame, or batches of a
         DataFrame in a background thread. This constructor requires pandas and
@@ -607,6 +817,10 @@ class ArrowStreamDataset(ArrowBaseDataset):
                         will create batched tensors from Arrow memory and can be more
                         efficient than using tf.data.Dataset.batch().
                         NOTE: Currently, only 'keep_remainder' batch mode supported
+            num_parallel_reads: Optional number of endpoints to spread a sequence
+                        of DataFrames over. Each endpoint converts and serves its
+                        DataFrames independently and the endpoints are read
+                        concurrently, so the order of records is not kept.
         """
         import pandas as pd  # pylint: disable=import-outside-toplevel
         import pyarrow as pa  # pylint: disable=import-outside-toplevel
@@ -614,9 +828,9 @@ class ArrowStreamDataset(ArrowBaseDataset):
         if isinstance(data_frames, pd.DataFrame):
             data_frames = [data_frames]
 
-        def gen_record_batches():
+        def gen_record_batches(frames):
             """record batch generator"""
-            for df in data_frames:
+            for df in frames:
                 if columns is not None:
                     df = df.iloc[:, list(columns)]
 
@@ -636,18 +850,160 @@ class ArrowStreamDataset(ArrowBaseDataset):
                     )
                     yield batch
 
-        # Get first batch to convert schema to output types and shapes
-        record_batch_iter = gen_record_batches()
-        batch = next(record_batch_iter)
+        # Get first batch to convert schema to output types and shapes. This
+        # consumes the first DataFrame of a generator, so the DataFrame and
+        # its batches are chained back in front of the others.
+        frames = iter(data_frames)
+        first_frame = next(frames)
+        first_batches = gen_record_batches([first_frame])
+        batch = next(first_batches)
         output_types, output_shapes = arrow_schema_to_tensor_types(batch.schema)
 
-        return cls.from_record_batches(
-            chain([batch], record_batch_iter),
+        if num_parallel_reads is None or num_parallel_reads <= 1:
+            return cls.from_record_batches(
+                chain([batch], first_batches, gen_record_batches(frames)),
+                output_types,
+                output_shapes,
+                batch_size=batch_size,
+                batch_mode="keep_remainder",
+                record_batch_iter_factory=partial(gen_record_batches, data_frames),
+            )
+
+        # Deal the DataFrames round robin to one endpoint each
+        data_frames = [first_frame] + list(frames)
+        num_endpoints = min(num_parallel_reads, len(data_frames))
+        shards = [data_frames[i::num_endpoints] for i in range(num_endpoints)]
+        return cls.from_record_batch_iters(
+            [gen_record_batches(shard) for shard in shards],
             output_types,
             output_shapes,
             batch_size=batch_size,
             batch_mode="keep_remainder",
-            record_batch_iter_factory=gen_record_batches,
+            record_batch_iter_factories=[
+                partial(gen_record_batches, shard) for shard in shards
+            ],
+            num_parallel_reads=num_endpoints,
+        )
+
+
+class ArrowFlightDataset(ArrowBaseDataset):
+    """An Arrow Dataset for reading record batches from an Arrow Flight
+    service. The flight is looked up with `GetFlightInfo` and each of its
+    endpoints is fetched with `DoGet`, so a feature server can split its data
+    over several tickets and serve them with gRPC flow control.
+    """
+
+    def __init__(
+        self,
+        location,
+        descriptor,
+        columns,
+        output_types,
+        output_shapes=None,
+        batch_size=None,
+        batch_mode="keep_remainder",
+        num_parallel_reads=None,
+    ):
+        """Create an ArrowFlightDataset from a flight of an Arrow Flight service.
+
+        Args:
+            location: URI of the Flight service, e.g. "grpc://localhost:8815"
+            descriptor: The flight descriptor, a `bytes` or `str` command or a
+                        list of strings as path
+            columns: A list of column indices to be used in the Dataset
+            output_types: Tensor dtypes of the output tensors
+            output_shapes: TensorShapes of the output tensors or None to
+                            infer partial
+            batch_size: Batch size of output tensors, setting a batch size here
+                        will create batched tensors from Arrow memory and can be more
+                        efficient than using tf.data.Dataset.batch().
+                        NOTE: batch_size does not need to be set if batch_mode='auto'
+            batch_mode: Mode of batching, supported strings:
+                        "keep_remainder" (default, keeps partial batch data),
+                        "drop_remainder" (discard partial batch data),
+                        "auto" (size to number of records in Arrow record batch)
+            num_parallel_reads: Optional number of flight endpoints to fetch
+                        concurrently, record batches are interleaved in the order
+                        they arrive. Defaults to fetching endpoints one at a time.
+        """
+        if isinstance(descriptor, (bytes, str)):
+            descriptor_type = "cmd"
+            descriptor = [descriptor]
+        else:
+            descriptor_type = "path"
+            descriptor = list(descriptor)
+        location = tf.convert_to_tensor(location, dtype=dtypes.string, name="location")
+        descriptor_type = tf.convert_to_tensor(
+            descriptor_type, dtype=dtypes.string, name="descriptor_type"
+        )
+        descriptor = tf.convert_to_tensor(
+            descriptor, dtype=dtypes.string, name="descriptor"
+        )
+        if num_parallel_reads is None:
+            num_parallel_reads = 1
+        num_parallel_reads = tf.convert_to_tensor(
+            num_parallel_reads, dtype=dtypes.int64, name="num_parallel_reads"
+        )
+        super().__init__(
+            partial(
+                core_ops.io_arrow_flight_dataset,
+                location,
+                descriptor_type,
+                descriptor,
+                num_parallel_reads,
+            ),
+            columns,
+            output_types,
+            output_shapes,
+            batch_size,
+            batch_mode,
+        )
+
+    @classmethod
+    def from_schema(
+        cls,
+        location,
+        descriptor,
+        schema,
+        columns=None,
+        batch_size=None,
+        batch_mode="keep_remainder",
+        num_parallel_reads=None,
+    ):
+        """Create an ArrowFlightDataset, inferring output types and shapes from
+        the given Arrow schema. The schema of a flight is available from
+        `pyarrow.flight.FlightClient.get_schema`.
+        This method requires pyarrow to be installed.
+
+        Args:
+            location: URI of the Flight service, e.g. "grpc://localhost:8815"
+            descriptor: The flight descriptor, a `bytes` or `str` command or a
+                        list of strings as path
+            schema: Arrow schema defining the record batch data of the flight
+            columns: A list of column indicies to use from the schema, None for all
+            batch_size: Batch size of output tensors, setting a batch size here
+                        will create batched tensors from Arrow memory and can be more
+                        efficient than using tf.data.Dataset.batch().
+                        NOTE: batch_size does not need to be set if batch_mode='auto'
+            batch_mode: Mode of batching, supported strings:
+                        "keep_remainder" (default, keeps partial batch data),
+                        "drop_remainder" (discard partial batch data),
+                        "auto" (size to number of records in Arrow record batch)
+            num_parallel_reads: Optional number of flight endpoints to fetch
+                        concurrently, defaults to fetching endpoints one at a time.
+        """
+        if columns is None:
+            columns = list(range(len(schema)))
+        output_types, output_shapes = arrow_schema_to_tensor_types(schema)
+        return cls(
+            location,
+            descriptor,
+            columns,
+            output_types,
+            output_shapes,
+            batch_size,
+            batch_mode,
+            num_parallel_reads=num_parallel_reads,
         )
 
 
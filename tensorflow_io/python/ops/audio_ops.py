@@ -15,6 +15,7 @@
 """audio"""
 
 import sys
+import uuid
 
 import tensorflow as tf
 
@@ -149,6 +150,55 @@ def dbscale(input, top_db, name=None):
     return log_spec
 
 
+def mel_spectrogram(
+    input, rate, nfft, window, stride, mels, fmin, fmax, top_db=None, name=None
+):
+    """
+    Create mel spectrogram in dB from audio.
+
+    This is equivalent to `dbscale(melscale(spectrogram(input, ...), ...), ...)`
+    applied to each audio signal, with the magnitude, mel scale and dB scale
+    computed in one pass over each frame of the STFT. Mel filterbanks are
+    computed once per graph node, as `rate`, `mels`, `fmin` and `fmax` are
+    attributes of the op.
+
+    Args:
+      input: An audio signal Tensor with shape [..., samples]. Leading
+        dimensions are batch and channels, e.g. audio of shape [samples, channels]
+        has to be transposed to [channels, samples].
+      rate: Sample rate of the audio, a python int.
+      nfft: Size of FFT.
+      window: Size of window.
+      stride: Size of hops between windows.
+      mels: Number of mel filterbanks, a python int.
+      fmin: Minimum frequency, a python float.
+      fmax: Maximum frequency, a python float.
+      top_db: Minimum negative cut-off `max(10 * log10(S)) - top_db` of each
+        spectrogram, or None to keep all values.
+      name: A name for the operation (optional).
+
+    Returns:
+      A tensor of mel spectrogram in dB with shape [..., frames, mels].
+    """
+    stft = tf.signal.stft(
+        input,
+        frame_length=window,
+        frame_step=stride,
+        fft_length=nfft,
+        window_fn=tf.signal.hann_window,
+        pad_end=True,
+    )
+    return core_ops.io_audio_mel_spectrogram(
+        stft,
+        rate=rate,
+        mels=mels,
+        fmin=fmin,
+        fmax=fmax,
+        top_db=-1.0 if top_db is None else top_db,
+        name=name,
+    )
+
+
 def remix(input, axis, indices, name=None):
     """
     Remix the audio from segments indices.
@@ -425,15 +475,20 @@ def fade(input, fade_in, fade_out, mode, name=None):
     return factor_in * factor_out * input
 
 
-def resample(input, rate_in, rate_out, name=None):
+def resample(input, rate_in, rate_out, quality=4, name=None):
     """Resample audio.
 
+    A batch is resampled in one kernel invocation, with the items spread
+    over the intra-op thread pool.
+
     Args:
       input: A 1-D (`[samples]`) or 2-D (`[samples, channels]`) or 3-D
         (`[batch, samples, channels]`) `Tensor` of type
         `int16` or `float`. Audio input.
       rate_in: The rate of the audio input.
       rate_out: The rate of the audio output.
+      quality: The quality of the resampler, from 0 (fastest) to 10 (best).
+        Defaults to 4.
       name: A name for the operation (optional).
 
     Returns:
@@ -454,12 +509,9 @@ def resample(input, rate_in, rate_out, name=None):
         [(tf.math.equal(rank, 1), f1), (tf.math.equal(rank, 2), f2)], default=f3
     )
 
-    def f(i):
-        return core_ops.io_audio_resample(
-            i, rate_in=rate_in, rate_out=rate_out, name=name
-        )
-
-    value = tf.vectorized_map(f, input)
+    value = core_ops.io_audio_resample(
+        input, rate_in=rate_in, rate_out=rate_out, quality=quality, name=name
+    )
 
     def g1():
         return tf.squeeze(value, [0, -1])
@@ -475,6 +527,59 @@ def resample(input, rate_in, rate_out, name=None):
     )
 
 
+class AudioResampler:
+    """AudioResampler resamples a stream of audio chunk by chunk.
+
+    Unlike `resample`, the filter state is kept between calls so that
+    resampling consecutive chunks gives the same result as resampling the
+    whole signal at once, without artifacts at the chunk boundaries. The
+    last samples of each chunk are held back by the filter latency and are
+    returned with the next chunk.
+
+    ```python
+    resampler = tfio.audio.AudioResampler(44100, 16000, channels=2)
+    dataset = tfio.audio.AudioIODataset(filename, dtype=tf.int16)
+    dataset = dataset.batch(4096).map(resampler)
+    ```
+
+    Chunks have to be processed in order, so the dataset should not be
+    mapped with `num_parallel_calls`.
+    """
+
+    def __init__(self, rate_in, rate_out, channels, quality=4):
+        """Creates an `AudioResampler`.
+
+        Args:
+          rate_in: The rate of the audio input.
+          rate_out: The rate of the audio output.
+          channels: The number of channels of the audio.
+          quality: The quality of the resampler, from 0 (fastest) to 10
+            (best). Defaults to 4.
+        """
+        with tf.name_scope("AudioResampler"):
+            self._resource = core_ops.io_audio_resampler_init(
+                rate_in=rate_in,
+                rate_out=rate_out,
+                channels=channels,
+                quality=quality,
+                shared_name=f"AudioResampler/{uuid.uuid4().hex}",
+            )
+            self._channels = channels
+
+    def __call__(self, input, name=None):
+        """Resamples the next chunk of the stream.
+
+        Args:
+          input: A 2-D (`[samples, channels]`) `Tensor` of type `int16` or
+            `float`. The next chunk of audio.
+          name: A name for the operation (optional).
+
+        Returns:
+          output: Resampled audio of the chunk.
+        """
+        return core_ops.io_audio_resampler_process(self._resource, input, name=name)
+
+
 def decode_wav(
     input, shape=None, dtype=None, name=None
 ):  # pylint: disable=redefined-builtin
@@ -748,11 +853,64 @@ class AudioIOTensor:
 
 
 class AudioIODataset(tf.data.Dataset):
-    """AudioIODataset"""
+    """AudioIODataset
+
+    By default the samples of one file are read as they are decoded. If any of
+    `rate`, `channels`, `window` or `num_parallel_reads` is provided, or if a
+    list of files is passed, the files are instead decoded chunk by chunk,
+    resampled to `rate`, mixed to `channels` and framed into windows of
+    `window` samples with a step of `hop` samples, all inside the reader.
+    Memory is bounded by the chunk size rather than the file size, and up to
+    `num_parallel_reads` files are decoded in parallel with their frames
+    interleaved:
+
+    ```python
+    dataset = tfio.audio.AudioIODataset(
+        filenames, rate=16000, channels=1, window=400, hop=160,
+        num_parallel_reads=4)
+    ```
+
+    In that mode, samples are `tf.float32` in `[-1.0, 1.0)`, and the
+    elements are frames of shape `[window, channels]` (or samples of shape
+    `[channels]` if `window` is not provided). Files are resampled and mixed
+    to the rate and channels of the first file unless provided, and trailing
+    samples that do not fill a window are dropped.
+    """
 
-    def __init__(self, filename, dtype=None):
+    def __init__(
+        self,
+        filename,
+        dtype=None,
+        rate=None,
+        channels=None,
+        window=None,
+        hop=None,
+        quality=4,
+        num_parallel_reads=None,
+    ):
         """AudioIODataset."""
         with tf.name_scope("AudioIODataset"):
+            if (
+                isinstance(filename, (list, tuple))
+                or rate is not None
+                or channels is not None
+                or window is not None
+                or num_parallel_reads is not None
+            ):
+                self._dataset = self._stream(
+                    filename,
+                    rate,
+                    channels,
+                    window,
+                    hop,
+                    quality,
+                    num_parallel_reads,
+                )
+                super().__init__(
+                    self._dataset._variant_tensor
+                )  # pylint: disable=protected-access
+                return
+
             if not tf.executing_eagerly():
                 assert dtype is not None, "dtype must be provided in graph mode"
             resource = core_ops.io_audio_readable_init(filename)
@@ -780,6 +938,49 @@ class AudioIODataset(tf.data.Dataset):
                 self._dataset._variant_tensor
             )  # pylint: disable=protected-access
 
+    def _stream(
+        self, filename, rate, channels, window, hop, quality, num_parallel_reads
+    ):
+        """Decodes, resamples, mixes and frames the files inside the reader."""
+        if window is not None and hop is None:
+            hop = window
+        filename = tf.reshape(tf.convert_to_tensor(filename, tf.string), [-1])
+
+        if window is None:
+            shape = [None, channels]
+            capacity = 65536
+        else:
+            shape = [None, window, channels]
+            capacity = max(1, 65536 // window)
+
+        # The reader is initialized inside the dataset so that each iteration
+        # (or repetition) starts from the beginning of the files. Without a
+        # shared_name each init kernel, and thus each iterator, owns a reader.
+        def f(filename):
+            resource, _, _ = core_ops.io_audio_stream_readable_init(
+                filename,
+                rate=rate or 0,
+                channels=channels or 0,
+                window=window or 0,
+                hop=hop or 0,
+                cycle_length=num_parallel_reads or 1,
+                quality=quality,
+            )
+            dataset = tf.data.experimental.Counter()
+            dataset = dataset.map(
+                lambda i: tf.ensure_shape(
+                    core_ops.io_audio_stream_readable_read(resource, capacity), shape
+                )
+            )
+            dataset = dataset.apply(
+                tf.data.experimental.take_while(lambda v: tf.greater(tf.shape(v)[0], 0))
+            )
+            return dataset.unbatch()
+
+        dataset = tf.data.Dataset.from_tensors(filename)
+        dataset = dataset.flat_map(f)
+        return dataset
+
     def _inputs(self):
         return []
 
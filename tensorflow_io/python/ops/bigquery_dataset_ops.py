@@ -26,6 +26,7 @@ For background on Cloud BigQuery, see: https://cloud.google.com/bigquery .
 
 import collections
 import enum
+import functools
 import tensorflow as tf
 from operator import itemgetter
 
@@ -278,12 +279,17 @@ class BigQueryReadSession:
         """
         return self._streams
 
-    def read_rows(self, stream, offset=0):
+    def read_rows(self, stream, offset=0, batch_size=None):
         """Retrieves rows (including values) from the BigQuery service.
 
         Args:
             stream: name of the stream to read from.
             offset: Position in the stream.
+            batch_size: Optional. If set, each element holds up to `batch_size`
+                consecutive rows as `[batch]` column tensors instead of a
+                single row. Batches do not span stream responses, so the
+                last batch of each response may be smaller. Repeated fields
+                are not supported in this mode.
 
         Returns:
             A `tf.data.Dataset` returning the row keys and the cell contents.
@@ -301,6 +307,7 @@ class BigQueryReadSession:
             self._data_format,
             stream,
             offset,
+            batch_size,
         )
 
     def parallel_read_rows(
@@ -309,6 +316,7 @@ class BigQueryReadSession:
         sloppy=False,
         block_length=1,
         num_parallel_calls=None,
+        batch_size=None,
     ):
         """Retrieves rows from the BigQuery service in parallel streams.
 
@@ -331,6 +339,8 @@ class BigQueryReadSession:
                 If the value `tf.data.experimental.AUTOTUNE` is used, then the number of
                 parallel calls is set dynamically based on available CPU.
                 Defaulted to the number of streams in the read session.
+            batch_size: Optional. If set, each stream produces `[batch]` column
+                tensors of up to `batch_size` rows, see `read_rows`.
 
         Returns:
             A `tf.data.Dataset` returning the row keys and the cell contents.
@@ -346,7 +356,7 @@ class BigQueryReadSession:
             num_parallel_calls = streams_count
 
         return streams_ds.interleave(
-            map_func=self.read_rows,
+            map_func=functools.partial(self.read_rows, batch_size=batch_size),
             cycle_length=cycle_length,
             block_length=block_length,
             num_parallel_calls=num_parallel_calls,
@@ -368,7 +378,13 @@ class _BigQueryDataset(dataset_ops.DatasetSource):
         data_format,
         stream,
         offset,
+        batch_size=None,
     ):
+        if batch_size is not None:
+            if batch_size <= 0:
+                raise ValueError("`batch_size` must be a positive number")
+            if any(selected_fields_repeated):
+                raise ValueError("`batch_size` is not supported with repeated fields")
         # selected_fields and corresponding output_types have to be sorted because
         # of b/141251314
         sorted_fields_with_types = sorted(
@@ -389,7 +405,7 @@ class _BigQueryDataset(dataset_ops.DatasetSource):
             [
                 None,
             ]
-            if repeated
+            if repeated or batch_size is not None
             else []
             for repeated in selected_fields_repeated
         )
@@ -413,6 +429,7 @@ class _BigQueryDataset(dataset_ops.DatasetSource):
             data_format=data_format.value,
             stream=stream,
             offset=offset,
+            batch_size=batch_size or 0,
         )
         super().__init__(variant_tensor)
 
@@ -59,12 +59,18 @@ class BigtableTable:
         row_set: bigtable_row_set.RowSet,
         filter: filters.BigtableFilter = None,
         output_type=tf.string,
+        batch_size=None,
     ):
         """Retrieves values from Google Bigtable sorted by RowKeys.
         Args:
             columns (List[str]): the list of columns to read from; the order on
                 this list will determine the order in the output tensors
             row_set (RowSet): set of rows to read.
+            output_type: a dtype for all columns, returned together as one
+                `[len(columns)]` tensor, or a list with one dtype per column,
+                returned as a tuple with one tensor per column.
+            batch_size (int): if set, each element holds up to `batch_size`
+                rows, so the output tensors get a leading batch dimension.
 
         Returns:
             A `tf.data.Dataset` returning the cell contents.
@@ -78,7 +84,13 @@ class BigtableTable:
         if filter is None:
             filter = filters.latest()
         return _BigtableDataset(
-            self._client_resource, self._table_id, columns, row_set, filter, output_type
+            self._client_resource,
+            self._table_id,
+            columns,
+            row_set,
+            filter,
+            output_type,
+            batch_size,
         )
 
     def parallel_read_rows(
@@ -88,15 +100,27 @@ class BigtableTable:
         row_set: bigtable_row_set.RowSet = None,
         filter: filters.BigtableFilter = None,
         output_type=tf.string,
+        batch_size=None,
+        splits_per_worker=4,
     ):
         """Retrieves values from Google Bigtable in parallel. The ammount of work
         is split between workers based on SampleRowKeys. Keep in mind that when
         reading in parallel, rows are not read in any particular order.
+
+        The row set is cut into up to `splits_per_worker` chunks per worker,
+        which form a queue ordered from the largest to the smallest estimated
+        chunk. A worker that finishes its chunk takes the next one from the
+        queue, so fast workers pick up the remaining ranges instead of idling
+        while the slowest tablet is read.
         Args:
             columns (List[str]): the list of columns to read from; the order on
                 this list will determine the order in the output tensors
             num_parallel_calls: number of workers assigned to reading the data.
             row_set (RowSet): set of rows to read.
+            output_type: a dtype or a list of dtypes, see `read_rows`.
+            batch_size (int): number of rows per element, see `read_rows`.
+            splits_per_worker (int): number of chunks of work per worker. With
+                1 every worker reads a single fixed share of the row set.
 
         Returns:
             A `tf.data.Dataset` returning the cell contents.
@@ -111,19 +135,37 @@ class BigtableTable:
         if filter is None:
             filter = filters.latest()
 
+        if splits_per_worker is None or splits_per_worker <= 0:
+            raise ValueError("`splits_per_worker` must be a positive number")
+        # With AUTOTUNE the row set is already split into one chunk per tablet.
+        num_splits = num_parallel_calls
+        if num_parallel_calls != tf.data.AUTOTUNE:
+            num_splits = num_parallel_calls * splits_per_worker
+
         samples = core_ops.bigtable_split_row_set_evenly(
-            self._client_resource, row_set._impl, self._table_id, num_parallel_calls
+            self._client_resource,
+            row_set._impl,
+            self._table_id,
+            num_splits,
+            largest_first=True,
         )
 
         def map_func(idx):
             return self.read_rows(
-                columns, bigtable_row_set.RowSet(samples[idx]), filter, output_type
+                columns,
+                bigtable_row_set.RowSet(samples[idx]),
+                filter,
+                output_type,
+                batch_size,
             )
 
         # We interleave a dataset of sample's indexes instead of a dataset of
         # samples, because Dataset.from_tensor_slices attempts to copy the
         # resource tensors using DeepCopy from tensor_util.cc which is not
         # possible for tensors of type DT_RESOURCE.
+        # The interleave keeps num_parallel_calls chunks open and opens the
+        # next index as soon as one of them is exhausted, which makes the
+        # range of indexes the shared work queue.
         return tf.data.Dataset.range(samples.shape[0]).interleave(
             map_func=map_func,
             cycle_length=num_parallel_calls,
@@ -144,14 +186,40 @@ class _BigtableDataset(dataset_ops.DatasetSource):
         row_set: bigtable_row_set.RowSet,
         filter,
         output_type,
+        batch_size=None,
     ):
         self._table_id = table_id
         self._columns = columns
         self._filter = filter
-        self._element_spec = tf.TensorSpec(shape=[len(columns)], dtype=output_type)
+        if batch_size is not None and batch_size <= 0:
+            raise ValueError("`batch_size` must be a positive number")
+        batch_shape = [] if batch_size is None else [None]
+
+        if isinstance(output_type, (list, tuple)):
+            if len(output_type) != len(columns):
+                raise ValueError(
+                    "`output_type` must have one dtype per column when it is a list"
+                )
+            output_types = [tf.as_dtype(dtype) for dtype in output_type]
+            self._element_spec = tuple(
+                tf.TensorSpec(shape=batch_shape, dtype=dtype) for dtype in output_types
+            )
+            output_type = tf.string
+        else:
+            output_types = []
+            self._element_spec = tf.TensorSpec(
+                shape=batch_shape + [len(columns)], dtype=output_type
+            )
 
         variant_tensor = core_ops.bigtable_dataset(
-            client_resource, row_set._impl, filter._impl, table_id, columns, output_type
+            client_resource,
+            row_set._impl,
+            filter._impl,
+            table_id,
+            columns,
+            output_type,
+            output_types=output_types,
+            batch_size=batch_size or 0,
         )
         super().__init__(variant_tensor)
 
@@ -0,0 +1,4048 @@
+# Copyright 2019 Gradient Health Inc. All Rights Reserved.
+# Author: Marcelo Lerendegui <marcelo@gradienthealth.io>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+
+"""DICOM tag table used by `dicom_ops.dicom_tags`.
+
+Each line is the hexadecimal tag number followed by its keyword. The table
+is kept as one string so that importing it is cheap, and is only parsed on
+the first lookup of a tag.
+"""
+
+TAGS = """
+00020000 FileMetaInformationGroupLength
+00020001 FileMetaInformationVersion
+00020002 MediaStorageSOPClassUID
+00020003 MediaStorageSOPInstanceUID
+00020010 TransferSyntaxUID
+00020012 ImplementationClassUID
+00020013 ImplementationVersionName
+00020016 SourceApplicationEntityTitle
+00020017 SendingApplicationEntityTitle
+00020018 ReceivingApplicationEntityTitle
+00020100 PrivateInformationCreatorUID
+00020102 PrivateInformation
+00041130 FilesetID
+00041141 FilesetDescriptorFileID
+00041142 SpecificCharacterSetofFilesetDescriptorFile
+00041200 OffsetoftheFirstDirectoryRecordoftheRootDirectoryEntity
+00041202 OffsetoftheLastDirectoryRecordoftheRootDirectoryEntity
+00041212 FilesetConsistencyFlag
+00041220 DirectoryRecordSequence
+00041400 OffsetoftheNextDirectoryRecord
+00041410 RecordInuseFlag
+00041420 OffsetofReferencedLowerLevelDirectoryEntity
+00041430 DirectoryRecordType
+00041432 PrivateRecordUID
+00041500 ReferencedFileID
+00041504 MRDRDirectoryRecordOffset
+00041510 ReferencedSOPClassUIDinFile
+00041511 ReferencedSOPInstanceUIDinFile
+00041512 ReferencedTransferSyntaxUIDinFile
+0004151A ReferencedRelatedGeneralSOPClassUIDinFile
+00041600 NumberofReferences
+00080001 LengthtoEnd
+00080005 SpecificCharacterSet
+00080006 LanguageCodeSequence
+00080008 ImageType
+00080010 RecognitionCode
+00080012 InstanceCreationDate
+00080013 InstanceCreationTime
+00080014 InstanceCreatorUID
+00080015 InstanceCoercionDateTime
+00080016 SOPClassUID
+00080018 SOPInstanceUID
+0008001A RelatedGeneralSOPClassUID
+0008001B OriginalSpecializedSOPClassUID
+00080020 StudyDate
+00080021 SeriesDate
+00080022 AcquisitionDate
+00080023 ContentDate
+00080024 OverlayDate
+00080025 CurveDate
+0008002A AcquisitionDateTime
+00080030 StudyTime
+00080031 SeriesTime
+00080032 AcquisitionTime
+00080033 ContentTime
+00080034 OverlayTime
+00080035 CurveTime
+00080040 DataSetType
+00080041 DataSetSubtype
+00080042 NuclearMedicineSeriesType
+00080050 AccessionNumber
+00080051 IssuerofAccessionNumberSequence
+00080052 QueryRetrieveLevel
+00080053 QueryRetrieveView
+00080054 RetrieveAETitle
+00080055 StationAETitle
+00080056 InstanceAvailability
+00080058 FailedSOPInstanceUIDList
+00080060 Modality
+00080061 ModalitiesinStudy
+00080062 SOPClassesinStudy
+00080064 ConversionType
+00080068 PresentationIntentType
+00080070 Manufacturer
+00080080 InstitutionName
+00080081 InstitutionAddress
+00080082 InstitutionCodeSequence
+00080090 ReferringPhysiciansName
+00080092 ReferringPhysiciansAddress
+00080094 ReferringPhysiciansTelephoneNumbers
+00080096 ReferringPhysicianIdentificationSequence
+0008009C ConsultingPhysiciansName
+0008009D ConsultingPhysicianIdentificationSequence
+00080100 CodeValue
+00080101 ExtendedCodeValue
+00080102 CodingSchemeDesignator
+00080103 CodingSchemeVersion
+00080104 CodeMeaning
+00080105 MappingResource
+00080106 ContextGroupVersion
+00080107 ContextGroupLocalVersion
+00080108 ExtendedCodeMeaning
+0008010B ContextGroupExtensionFlag
+0008010C CodingSchemeUID
+0008010D ContextGroupExtensionCreatorUID
+0008010F ContextIdentifier
+00080110 CodingSchemeIdentificationSequence
+00080112 CodingSchemeRegistry
+00080114 CodingSchemeExternalID
+00080115 CodingSchemeName
+00080116 CodingSchemeResponsibleOrganization
+00080117 ContextUID
+00080118 MappingResourceUID
+00080119 LongCodeValue
+00080120 URNCodeValue
+00080121 EquivalentCodeSequence
+00080122 MappingResourceName
+00080123 ContextGroupIdentificationSequence
+00080124 MappingResourceIdentificationSequence
+00080201 TimezoneOffsetFromUTC
+00080300 PrivateDataElementCharacteristicsSequence
+00080301 PrivateGroupReference
+00080302 PrivateCreatorReference
+00080303 BlockIdentifyingInformationStatus
+00080304 NonidentifyingPrivateElements
+00080306 IdentifyingPrivateElements
+00080305 DeidentificationActionSequence
+00080307 DeidentificationAction
+00081000 NetworkID
+00081010 StationName
+00081030 StudyDescription
+00081032 ProcedureCodeSequence
+0008103E SeriesDescription
+0008103F SeriesDescriptionCodeSequence
+00081040 InstitutionalDepartmentName
+00081048 PhysiciansofRecord
+00081049 PhysiciansofRecordIdentificationSequence
+00081050 PerformingPhysiciansName
+00081052 PerformingPhysicianIdentificationSequence
+00081060 NameofPhysiciansReadingStudy
+00081062 PhysiciansReadingStudyIdentificationSequence
+00081070 OperatorsName
+00081072 OperatorIdentificationSequence
+00081080 AdmittingDiagnosesDescription
+00081084 AdmittingDiagnosesCodeSequence
+00081090 ManufacturersModelName
+00081100 ReferencedResultsSequence
+00081110 ReferencedStudySequence
+00081111 ReferencedPerformedProcedureStepSequence
+00081115 ReferencedSeriesSequence
+00081120 ReferencedPatientSequence
+00081125 ReferencedVisitSequence
+00081130 ReferencedOverlaySequence
+00081134 ReferencedStereometricInstanceSequence
+0008113A ReferencedWaveformSequence
+00081140 ReferencedImageSequence
+00081145 ReferencedCurveSequence
+0008114A ReferencedInstanceSequence
+0008114B ReferencedRealWorldValueMappingInstanceSequence
+00081150 ReferencedSOPClassUID
+00081155 ReferencedSOPInstanceUID
+0008115A SOPClassesSupported
+00081160 ReferencedFrameNumber
+00081161 SimpleFrameList
+00081162 CalculatedFrameList
+00081163 TimeRange
+00081164 FrameExtractionSequence
+00081167 MultiframeSourceSOPInstanceUID
+00081190 RetrieveURL
+00081195 TransactionUID
+00081196 WarningReason
+00081197 FailureReason
+00081198 FailedSOPSequence
+00081199 ReferencedSOPSequence
+0008119A OtherFailuresSequence
+00081200 StudiesContainingOtherReferencedInstancesSequence
+00081250 RelatedSeriesSequence
+00082110 LossyImageCompressionRetired
+00082111 DerivationDescription
+00082112 SourceImageSequence
+00082120 StageName
+00082122 StageNumber
+00082124 NumberofStages
+00082127 ViewName
+00082128 ViewNumber
+00082129 NumberofEventTimers
+0008212A NumberofViewsinStage
+00082130 EventElapsedTimes
+00082132 EventTimerNames
+00082133 EventTimerSequence
+00082134 EventTimeOffset
+00082135 EventCodeSequence
+00082142 StartTrim
+00082143 StopTrim
+00082144 RecommendedDisplayFrameRate
+00082200 TransducerPosition
+00082204 TransducerOrientation
+00082208 AnatomicStructure
+00082218 AnatomicRegionSequence
+00082220 AnatomicRegionModifierSequence
+00082228 PrimaryAnatomicStructureSequence
+00082229 AnatomicStructureSpaceorRegionSequence
+00082230 PrimaryAnatomicStructureModifierSequence
+00082240 TransducerPositionSequence
+00082242 TransducerPositionModifierSequence
+00082244 TransducerOrientationSequence
+00082246 TransducerOrientationModifierSequence
+00082251 AnatomicStructureSpaceOrRegionCodeSequenceTrial
+00082253 AnatomicPortalOfEntranceCodeSequenceTrial
+00082255 AnatomicApproachDirectionCodeSequenceTrial
+00082256 AnatomicPerspectiveDescriptionTrial
+00082257 AnatomicPerspectiveCodeSequenceTrial
+00082258 AnatomicLocationOfExaminingInstrumentDescriptionTrial
+00082259 AnatomicLocationOfExaminingInstrumentCodeSequenceTrial
+0008225A AnatomicStructureSpaceOrRegionModifierCodeSequenceTrial
+0008225C OnAxisBackgroundAnatomicStructureCodeSequenceTrial
+00083001 AlternateRepresentationSequence
+00083010 IrradiationEventUID
+00083011 SourceIrradiationEventSequence
+00083012 RadiopharmaceuticalAdministrationEventUID
+00084000 IdentifyingComments
+00089007 FrameType
+00089092 ReferencedImageEvidenceSequence
+00089121 ReferencedRawDataSequence
+00089123 CreatorVersionUID
+00089124 DerivationImageSequence
+00089154 SourceImageEvidenceSequence
+00089205 PixelPresentation
+00089206 VolumetricProperties
+00089207 VolumeBasedCalculationTechnique
+00089208 ComplexImageComponent
+00089209 AcquisitionContrast
+00089215 DerivationCodeSequence
+00089237 ReferencedPresentationStateSequence
+00089410 ReferencedOtherPlaneSequence
+00089458 FrameDisplaySequence
+00089459 RecommendedDisplayFrameRateinFloat
+00089460 SkipFrameRangeFlag
+00100010 PatientsName
+00100020 PatientID
+00100021 IssuerofPatientID
+00100022 TypeofPatientID
+00100024 IssuerofPatientIDQualifiersSequence
+00100026 SourcePatientGroupIdentificationSequence
+00100027 GroupofPatientsIdentificationSequence
+00100028 SubjectRelativePositioninImage
+00100030 PatientsBirthDate
+00100032 PatientsBirthTime
+00100033 PatientsBirthDateinAlternativeCalendar
+00100034 PatientsDeathDateinAlternativeCalendar
+00100035 PatientsAlternativeCalendar
+00100040 PatientsSex
+00100050 PatientsInsurancePlanCodeSequence
+00100101 PatientsPrimaryLanguageCodeSequence
+00100102 PatientsPrimaryLanguageModifierCodeSequence
+00100200 QualityControlSubject
+00100201 QualityControlSubjectTypeCodeSequence
+00100212 StrainDescription
+00100213 StrainNomenclature
+00100214 StrainStockNumber
+00100215 StrainSourceRegistryCodeSequence
+00100216 StrainStockSequence
+00100217 StrainSource
+00100218 StrainAdditionalInformation
+00100219 StrainCodeSequence
+00101000 OtherPatientIDs
+00101001 OtherPatientNames
+00101002 OtherPatientIDsSequence
+00101005 PatientsBirthName
+00101010 PatientsAge
+00101020 PatientsSize
+00101021 PatientsSizeCodeSequence
+00101030 PatientsWeight
+00101040 PatientsAddress
+00101050 InsurancePlanIdentification
+00101060 PatientsMothersBirthName
+00101080 MilitaryRank
+00101081 BranchofService
+00101090 MedicalRecordLocator
+00101100 ReferencedPatientPhotoSequence
+00102000 MedicalAlerts
+00102110 Allergies
+00102150 CountryofResidence
+00102152 RegionofResidence
+00102154 PatientsTelephoneNumbers
+00102155 PatientsTelecomInformation
+00102160 EthnicGroup
+00102180 Occupation
+001021A0 SmokingStatus
+001021B0 AdditionalPatientHistory
+001021C0 PregnancyStatus
+001021D0 LastMenstrualDate
+001021F0 PatientsReligiousPreference
+00102201 PatientSpeciesDescription
+00102202 PatientSpeciesCodeSequence
+00102203 PatientsSexNeutered
+00102210 AnatomicalOrientationType
+00102292 PatientBreedDescription
+00102293 PatientBreedCodeSequence
+00102294 BreedRegistrationSequence
+00102295 BreedRegistrationNumber
+00102296 BreedRegistryCodeSequence
+00102297 ResponsiblePerson
+00102298 ResponsiblePersonRole
+00102299 ResponsibleOrganization
+00104000 PatientComments
+00109431 ExaminedBodyThickness
+00120010 ClinicalTrialSponsorName
+00120020 ClinicalTrialProtocolID
+00120021 ClinicalTrialProtocolName
+00120030 ClinicalTrialSiteID
+00120031 ClinicalTrialSiteName
+00120040 ClinicalTrialSubjectID
+00120042 ClinicalTrialSubjectReadingID
+00120050 ClinicalTrialTimePointID
+00120051 ClinicalTrialTimePointDescription
+00120060 ClinicalTrialCoordinatingCenterName
+00120062 PatientIdentityRemoved
+00120063 DeidentificationMethod
+00120064 DeidentificationMethodCodeSequence
+00120071 ClinicalTrialSeriesID
+00120072 ClinicalTrialSeriesDescription
+00120081 ClinicalTrialProtocolEthicsCommitteeName
+00120082 ClinicalTrialProtocolEthicsCommitteeApprovalNumber
+00120083 ConsentforClinicalTrialUseSequence
+00120084 DistributionType
+00120085 ConsentforDistributionFlag
+00140023 CADFileFormat
+00140024 ComponentReferenceSystem
+00140025 ComponentManufacturingProcedure
+00140028 ComponentManufacturer
+00140030 MaterialThickness
+00140032 MaterialPipeDiameter
+00140034 MaterialIsolationDiameter
+00140042 MaterialGrade
+00140044 MaterialPropertiesDescription
+00140045 MaterialPropertiesFileFormatRetired
+00140046 MaterialNotes
+00140050 ComponentShape
+00140052 CurvatureType
+00140054 OuterDiameter
+00140056 InnerDiameter
+00140100 ComponentWelderIDs
+00140101 SecondaryApprovalStatus
+00140102 SecondaryReviewDate
+00140103 SecondaryReviewTime
+00140104 SecondaryReviewerName
+00140105 RepairID
+00140106 MultipleComponentApprovalSequence
+00140107 OtherApprovalStatus
+00140108 OtherSecondaryApprovalStatus
+00141010 ActualEnvironmentalConditions
+00141020 ExpiryDate
+00141040 EnvironmentalConditions
+00142002 EvaluatorSequence
+00142004 EvaluatorNumber
+00142006 EvaluatorName
+00142008 EvaluationAttempt
+00142012 IndicationSequence
+00142014 IndicationNumber
+00142016 IndicationLabel
+00142018 IndicationDescription
+0014201A IndicationType
+0014201C IndicationDisposition
+0014201E IndicationROISequence
+00142030 IndicationPhysicalPropertySequence
+00142032 PropertyLabel
+00142202 CoordinateSystemNumberofAxes
+00142204 CoordinateSystemAxesSequence
+00142206 CoordinateSystemAxisDescription
+00142208 CoordinateSystemDataSetMapping
+0014220A CoordinateSystemAxisNumber
+0014220C CoordinateSystemAxisType
+0014220E CoordinateSystemAxisUnits
+00142210 CoordinateSystemAxisValues
+00142220 CoordinateSystemTransformSequence
+00142222 TransformDescription
+00142224 TransformNumberofAxes
+00142226 TransformOrderofAxes
+00142228 TransformedAxisUnits
+0014222A CoordinateSystemTransformRotationandScaleMatrix
+0014222C CoordinateSystemTransformTranslationMatrix
+00143011 InternalDetectorFrameTime
+00143012 NumberofFramesIntegrated
+00143020 DetectorTemperatureSequence
+00143022 SensorName
+00143024 HorizontalOffsetofSensor
+00143026 VerticalOffsetofSensor
+00143028 SensorTemperature
+00143040 DarkCurrentSequence
+00143050 DarkCurrentCounts
+00143060 GainCorrectionReferenceSequence
+00143070 AirCounts
+00143071 KVUsedinGainCalibration
+00143072 MAUsedinGainCalibration
+00143073 NumberofFramesUsedforIntegration
+00143074 FilterMaterialUsedinGainCalibration
+00143075 FilterThicknessUsedinGainCalibration
+00143076 DateofGainCalibration
+00143077 TimeofGainCalibration
+00143080 BadPixelImage
+00143099 CalibrationNotes
+00144002 PulserEquipmentSequence
+00144004 PulserType
+00144006 PulserNotes
+00144008 ReceiverEquipmentSequence
+0014400A AmplifierType
+0014400C ReceiverNotes
+0014400E PreAmplifierEquipmentSequence
+0014400F PreAmplifierNotes
+00144010 TransmitTransducerSequence
+00144011 ReceiveTransducerSequence
+00144012 NumberofElements
+00144013 ElementShape
+00144014 ElementDimensionA
+00144015 ElementDimensionB
+00144016 ElementPitchA
+00144017 MeasuredBeamDimensionA
+00144018 MeasuredBeamDimensionB
+00144019 LocationofMeasuredBeamDiameter
+0014401A NominalFrequency
+0014401B MeasuredCenterFrequency
+0014401C MeasuredBandwidth
+0014401D ElementPitchB
+00144020 PulserSettingsSequence
+00144022 PulseWidth
+00144024 ExcitationFrequency
+00144026 ModulationType
+00144028 Damping
+00144030 ReceiverSettingsSequence
+00144031 AcquiredSoundpathLength
+00144032 AcquisitionCompressionType
+00144033 AcquisitionSampleSize
+00144034 RectifierSmoothing
+00144035 DACSequence
+00144036 DACType
+00144038 DACGainPoints
+0014403A DACTimePoints
+0014403C DACAmplitude
+00144040 PreAmplifierSettingsSequence
+00144050 TransmitTransducerSettingsSequence
+00144051 ReceiveTransducerSettingsSequence
+00144052 IncidentAngle
+00144054 CouplingTechnique
+00144056 CouplingMedium
+00144057 CouplingVelocity
+00144058 ProbeCenterLocationX
+00144059 ProbeCenterLocationZ
+0014405A SoundPathLength
+0014405C DelayLawIdentifier
+00144060 GateSettingsSequence
+00144062 GateThreshold
+00144064 VelocityofSound
+00144070 CalibrationSettingsSequence
+00144072 CalibrationProcedure
+00144074 ProcedureVersion
+00144076 ProcedureCreationDate
+00144078 ProcedureExpirationDate
+0014407A ProcedureLastModifiedDate
+0014407C CalibrationTime
+0014407E CalibrationDate
+00144080 ProbeDriveEquipmentSequence
+00144081 DriveType
+00144082 ProbeDriveNotes
+00144083 DriveProbeSequence
+00144084 ProbeInductance
+00144085 ProbeResistance
+00144086 ReceiveProbeSequence
+00144087 ProbeDriveSettingsSequence
+00144088 BridgeResistors
+00144089 ProbeOrientationAngle
+0014408B UserSelectedGainY
+0014408C UserSelectedPhase
+0014408D UserSelectedOffsetX
+0014408E UserSelectedOffsetY
+00144091 ChannelSettingsSequence
+00144092 ChannelThreshold
+0014409A ScannerSettingsSequence
+0014409B ScanProcedure
+0014409C TranslationRateX
+0014409D TranslationRateY
+0014409F ChannelOverlap
+001440A0 ImageQualityIndicatorType
+001440A1 ImageQualityIndicatorMaterial
+001440A2 ImageQualityIndicatorSize
+00145002 LINACEnergy
+00145004 LINACOutput
+00145100 ActiveAperture
+00145101 TotalAperture
+00145102 ApertureElevation
+00145103 MainLobeAngle
+00145104 MainRoofAngle
+00145105 ConnectorType
+00145106 WedgeModelNumber
+00145107 WedgeAngleFloat
+00145108 WedgeRoofAngle
+00145109 WedgeElement1Position
+0014510A WedgeMaterialVelocity
+0014510B WedgeMaterial
+0014510C WedgeOffsetZ
+0014510D WedgeOriginOffsetX
+0014510E WedgeTimeDelay
+0014510F WedgeName
+00145110 WedgeManufacturerName
+00145111 WedgeDescription
+00145112 NominalBeamAngle
+00145113 WedgeOffsetX
+00145114 WedgeOffsetY
+00145115 WedgeTotalLength
+00145116 WedgeInContactLength
+00145117 WedgeFrontGap
+00145118 WedgeTotalHeight
+00145119 WedgeFrontHeight
+0014511A WedgeRearHeight
+0014511B WedgeTotalWidth
+0014511C WedgeInContactWidth
+0014511D WedgeChamferHeight
+0014511E WedgeCurve
+0014511F RadiusAlongtheWedge
+00180010 ContrastBolusAgent
+00180012 ContrastBolusAgentSequence
+00180013 ContrastBolusT1Relaxivity
+00180014 ContrastBolusAdministrationRouteSequence
+00180015 BodyPartExamined
+00180020 ScanningSequence
+00180021 SequenceVariant
+00180022 ScanOptions
+00180023 MRAcquisitionType
+00180024 SequenceName
+00180025 AngioFlag
+00180026 InterventionDrugInformationSequence
+00180027 InterventionDrugStopTime
+00180028 InterventionDrugDose
+00180029 InterventionDrugCodeSequence
+0018002A AdditionalDrugSequence
+00180030 Radionuclide
+00180031 Radiopharmaceutical
+00180032 EnergyWindowCenterline
+00180033 EnergyWindowTotalWidth
+00180034 InterventionDrugName
+00180035 InterventionDrugStartTime
+00180036 InterventionSequence
+00180037 TherapyType
+00180038 InterventionStatus
+00180039 TherapyDescription
+0018003A InterventionDescription
+00180040 CineRate
+00180042 InitialCineRunState
+00180050 SliceThickness
+00180060 KVP
+00180070 CountsAccumulated
+00180071 AcquisitionTerminationCondition
+00180072 EffectiveDuration
+00180073 AcquisitionStartCondition
+00180074 AcquisitionStartConditionData
+00180075 AcquisitionTerminationConditionData
+00180080 RepetitionTime
+00180081 EchoTime
+00180082 InversionTime
+00180083 NumberofAverages
+00180084 ImagingFrequency
+00180085 ImagedNucleus
+00180086 EchoNumbers
+00180087 MagneticFieldStrength
+00180088 SpacingBetweenSlices
+00180089 NumberofPhaseEncodingSteps
+00180090 DataCollectionDiameter
+00180091 EchoTrainLength
+00180093 PercentSampling
+00180094 PercentPhaseFieldofView
+00180095 PixelBandwidth
+00181000 DeviceSerialNumber
+00181002 DeviceUID
+00181003 DeviceID
+00181004 PlateID
+00181005 GeneratorID
+00181006 GridID
+00181007 CassetteID
+00181008 GantryID
+00181010 SecondaryCaptureDeviceID
+00181011 HardcopyCreationDeviceID
+00181012 DateofSecondaryCapture
+00181014 TimeofSecondaryCapture
+00181016 SecondaryCaptureDeviceManufacturer
+00181017 HardcopyDeviceManufacturer
+00181018 SecondaryCaptureDeviceManufacturersModelName
+00181019 SecondaryCaptureDeviceSoftwareVersions
+0018101A HardcopyDeviceSoftwareVersion
+0018101B HardcopyDeviceManufacturersModelName
+00181020 SoftwareVersions
+00181022 VideoImageFormatAcquired
+00181023 DigitalImageFormatAcquired
+00181030 ProtocolName
+00181040 ContrastBolusRoute
+00181041 ContrastBolusVolume
+00181042 ContrastBolusStartTime
+00181043 ContrastBolusStopTime
+00181044 ContrastBolusTotalDose
+00181045 SyringeCounts
+00181046 ContrastFlowRate
+00181047 ContrastFlowDuration
+00181048 ContrastBolusIngredient
+00181049 ContrastBolusIngredientConcentration
+00181050 SpatialResolution
+00181060 TriggerTime
+00181061 TriggerSourceorType
+00181062 NominalInterval
+00181063 FrameTime
+00181064 CardiacFramingType
+00181065 FrameTimeVector
+00181066 FrameDelay
+00181067 ImageTriggerDelay
+00181068 MultiplexGroupTimeOffset
+00181069 TriggerTimeOffset
+0018106A SynchronizationTrigger
+0018106C SynchronizationChannel
+0018106E TriggerSamplePosition
+00181070 RadiopharmaceuticalRoute
+00181071 RadiopharmaceuticalVolume
+00181072 RadiopharmaceuticalStartTime
+00181073 RadiopharmaceuticalStopTime
+00181074 RadionuclideTotalDose
+00181075 RadionuclideHalfLife
+00181076 RadionuclidePositronFraction
+00181077 RadiopharmaceuticalSpecificActivity
+00181078 RadiopharmaceuticalStartDateTime
+00181079 RadiopharmaceuticalStopDateTime
+00181080 BeatRejectionFlag
+00181081 LowRRValue
+00181082 HighRRValue
+00181083 IntervalsAcquired
+00181084 IntervalsRejected
+00181085 PVCRejection
+00181086 SkipBeats
+00181088 HeartRate
+00181090 CardiacNumberofImages
+00181094 TriggerWindow
+00181100 ReconstructionDiameter
+00181110 DistanceSourcetoDetector
+00181111 DistanceSourcetoPatient
+00181114 EstimatedRadiographicMagnificationFactor
+00181120 GantryDetectorTilt
+00181121 GantryDetectorSlew
+00181130 TableHeight
+00181131 TableTraverse
+00181134 TableMotion
+00181135 TableVerticalIncrement
+00181136 TableLateralIncrement
+00181137 TableLongitudinalIncrement
+00181138 TableAngle
+0018113A TableType
+00181140 RotationDirection
+00181141 AngularPosition
+00181142 RadialPosition
+00181143 ScanArc
+00181144 AngularStep
+00181145 CenterofRotationOffset
+00181146 RotationOffset
+00181147 FieldofViewShape
+00181149 FieldofViewDimensions
+00181150 ExposureTime
+00181151 XRayTubeCurrent
+00181152 Exposure
+00181153 ExposureinAs
+00181154 AveragePulseWidth
+00181155 RadiationSetting
+00181156 RectificationType
+0018115A RadiationMode
+0018115E ImageandFluoroscopyAreaDoseProduct
+00181160 FilterType
+00181161 TypeofFilters
+00181162 IntensifierSize
+00181164 ImagerPixelSpacing
+00181166 Grid
+00181170 GeneratorPower
+00181180 CollimatorgridName
+00181181 CollimatorType
+00181182 FocalDistance
+00181183 XFocusCenter
+00181184 YFocusCenter
+00181190 FocalSpots
+00181191 AnodeTargetMaterial
+001811A0 BodyPartThickness
+001811A2 CompressionForce
+001811A4 PaddleDescription
+00181200 DateofLastCalibration
+00181201 TimeofLastCalibration
+00181202 DateTimeofLastCalibration
+00181210 ConvolutionKernel
+00181240 UpperLowerPixelValues
+00181242 ActualFrameDuration
+00181243 CountRate
+00181244 PreferredPlaybackSequencing
+00181250 ReceiveCoilName
+00181251 TransmitCoilName
+00181260 PlateType
+00181261 PhosphorType
+00181271 WaterEquivalentDiameter
+00181272 WaterEquivalentDiameterCalculationMethodCodeSequence
+00181300 ScanVelocity
+00181301 WholeBodyTechnique
+00181302 ScanLength
+00181310 AcquisitionMatrix
+00181312 InplanePhaseEncodingDirection
+00181314 FlipAngle
+00181315 VariableFlipAngleFlag
+00181316 SAR
+00181318 dBdt
+00181320 B1rms
+00181400 AcquisitionDeviceProcessingDescription
+00181401 AcquisitionDeviceProcessingCode
+00181402 CassetteOrientation
+00181403 CassetteSize
+00181404 ExposuresonPlate
+00181405 RelativeXRayExposure
+00181411 ExposureIndex
+00181412 TargetExposureIndex
+00181413 DeviationIndex
+00181450 ColumnAngulation
+00181460 TomoLayerHeight
+00181470 TomoAngle
+00181480 TomoTime
+00181490 TomoType
+00181491 TomoClass
+00181495 NumberofTomosynthesisSourceImages
+00181500 PositionerMotion
+00181508 PositionerType
+00181510 PositionerPrimaryAngle
+00181511 PositionerSecondaryAngle
+00181520 PositionerPrimaryAngleIncrement
+00181521 PositionerSecondaryAngleIncrement
+00181530 DetectorPrimaryAngle
+00181531 DetectorSecondaryAngle
+00181600 ShutterShape
+00181602 ShutterLeftVerticalEdge
+00181604 ShutterRightVerticalEdge
+00181606 ShutterUpperHorizontalEdge
+00181608 ShutterLowerHorizontalEdge
+00181610 CenterofCircularShutter
+00181612 RadiusofCircularShutter
+00181620 VerticesofthePolygonalShutter
+00181622 ShutterPresentationValue
+00181623 ShutterOverlayGroup
+00181624 ShutterPresentationColorCIELabValue
+00181700 CollimatorShape
+00181702 CollimatorLeftVerticalEdge
+00181704 CollimatorRightVerticalEdge
+00181706 CollimatorUpperHorizontalEdge
+00181708 CollimatorLowerHorizontalEdge
+00181710 CenterofCircularCollimator
+00181712 RadiusofCircularCollimator
+00181720 VerticesofthePolygonalCollimator
+00181800 AcquisitionTimeSynchronized
+00181801 TimeSource
+00181802 TimeDistributionProtocol
+00181803 NTPSourceAddress
+00182001 PageNumberVector
+00182002 FrameLabelVector
+00182003 FramePrimaryAngleVector
+00182004 FrameSecondaryAngleVector
+00182005 SliceLocationVector
+00182006 DisplayWindowLabelVector
+00182010 NominalScannedPixelSpacing
+00182020 DigitizingDeviceTransportDirection
+00182030 RotationofScannedFilm
+00182041 BiopsyTargetSequence
+00182042 TargetUID
+00182043 LocalizingCursorPosition
+00182044 CalculatedTargetPosition
+00182045 TargetLabel
+00182046 DisplayedZValue
+00183100 IVUSAcquisition
+00183101 IVUSPullbackRate
+00183102 IVUSGatedRate
+00183103 IVUSPullbackStartFrameNumber
+00183104 IVUSPullbackStopFrameNumber
+00183105 LesionNumber
+00184000 AcquisitionComments
+00185000 OutputPower
+00185010 TransducerData
+00185012 FocusDepth
+00185020 ProcessingFunction
+00185021 PostprocessingFunction
+00185022 MechanicalIndex
+00185024 BoneThermalIndex
+00185026 CranialThermalIndex
+00185027 SoftTissueThermalIndex
+00185028 SoftTissuefocusThermalIndex
+00185029 SoftTissuesurfaceThermalIndex
+00185030 DynamicRange
+00185040 TotalGain
+00185050 DepthofScanField
+00185100 PatientPosition
+00185101 ViewPosition
+00185104 ProjectionEponymousNameCodeSequence
+00185210 ImageTransformationMatrix
+00185212 ImageTranslationVector
+00186000 Sensitivity
+00186011 SequenceofUltrasoundRegions
+00186012 RegionSpatialFormat
+00186014 RegionDataType
+00186016 RegionFlags
+00186018 RegionLocationMinX0
+0018601A RegionLocationMinY0
+0018601C RegionLocationMaxX1
+0018601E RegionLocationMaxY1
+00186020 ReferencePixelX0
+00186022 ReferencePixelY0
+00186024 PhysicalUnitsXDirection
+00186026 PhysicalUnitsYDirection
+00186028 ReferencePixelPhysicalValueX
+0018602A ReferencePixelPhysicalValueY
+0018602C PhysicalDeltaX
+0018602E PhysicalDeltaY
+00186030 TransducerFrequency
+00186031 TransducerType
+00186032 PulseRepetitionFrequency
+00186034 DopplerCorrectionAngle
+00186036 SteeringAngle
+00186038 DopplerSampleVolumeXPositionRetired
+00186039 DopplerSampleVolumeXPosition
+0018603A DopplerSampleVolumeYPositionRetired
+0018603B DopplerSampleVolumeYPosition
+0018603C TMLinePositionX0Retired
+0018603D TMLinePositionX0
+0018603E TMLinePositionY0Retired
+0018603F TMLinePositionY0
+00186040 TMLinePositionX1Retired
+00186041 TMLinePositionX1
+00186042 TMLinePositionY1Retired
+00186043 TMLinePositionY1
+00186044 PixelComponentOrganization
+00186046 PixelComponentMask
+00186048 PixelComponentRangeStart
+0018604A PixelComponentRangeStop
+0018604C PixelComponentPhysicalUnits
+0018604E PixelComponentDataType
+00186050 NumberofTableBreakPoints
+00186052 TableofXBreakPoints
+00186054 TableofYBreakPoints
+00186056 NumberofTableEntries
+00186058 TableofPixelValues
+0018605A TableofParameterValues
+00186060 RWaveTimeVector
+00187000 DetectorConditionsNominalFlag
+00187001 DetectorTemperature
+00187004 DetectorType
+00187005 DetectorConfiguration
+00187006 DetectorDescription
+00187008 DetectorMode
+0018700A DetectorID
+0018700C DateofLastDetectorCalibration
+0018700E TimeofLastDetectorCalibration
+00187010 ExposuresonDetectorSinceLastCalibration
+00187011 ExposuresonDetectorSinceManufactured
+00187012 DetectorTimeSinceLastExposure
+00187014 DetectorActiveTime
+00187016 DetectorActivationOffsetFromExposure
+0018701A DetectorBinning
+00187020 DetectorElementPhysicalSize
+00187022 DetectorElementSpacing
+00187024 DetectorActiveShape
+00187026 DetectorActiveDimensions
+00187028 DetectorActiveOrigin
+0018702A DetectorManufacturerName
+0018702B DetectorManufacturersModelName
+00187030 FieldofViewOrigin
+00187032 FieldofViewRotation
+00187034 FieldofViewHorizontalFlip
+00187036 PixelDataAreaOriginRelativeToFOV
+00187038 PixelDataAreaRotationAngleRelativeToFOV
+00187040 GridAbsorbingMaterial
+00187041 GridSpacingMaterial
+00187042 GridThickness
+00187044 GridPitch
+00187046 GridAspectRatio
+00187048 GridPeriod
+0018704C GridFocalDistance
+00187050 FilterMaterial
+00187052 FilterThicknessMinimum
+00187054 FilterThicknessMaximum
+00187056 FilterBeamPathLengthMinimum
+00187058 FilterBeamPathLengthMaximum
+00187060 ExposureControlMode
+00187062 ExposureControlModeDescription
+00187064 ExposureStatus
+00187065 PhototimerSetting
+00188150 ExposureTimeinS
+00188151 XRayTubeCurrentinA
+00189004 ContentQualification
+00189005 PulseSequenceName
+00189006 MRImagingModifierSequence
+00189008 EchoPulseSequence
+00189009 InversionRecovery
+00189010 FlowCompensation
+00189011 MultipleSpinEcho
+00189012 MultiplanarExcitation
+00189014 PhaseContrast
+00189015 TimeofFlightContrast
+00189016 Spoiling
+00189017 SteadyStatePulseSequence
+00189018 EchoPlanarPulseSequence
+00189019 TagAngleFirstAxis
+00189020 MagnetizationTransfer
+00189021 T2Preparation
+00189022 BloodSignalNulling
+00189024 SaturationRecovery
+00189025 SpectrallySelectedSuppression
+00189026 SpectrallySelectedExcitation
+00189027 SpatialPresaturation
+00189028 Tagging
+00189029 OversamplingPhase
+00189030 TagSpacingFirstDimension
+00189032 GeometryofkSpaceTraversal
+00189033 SegmentedkSpaceTraversal
+00189034 RectilinearPhaseEncodeReordering
+00189035 TagThickness
+00189036 PartialFourierDirection
+00189037 CardiacSynchronizationTechnique
+00189041 ReceiveCoilManufacturerName
+00189042 MRReceiveCoilSequence
+00189043 ReceiveCoilType
+00189044 QuadratureReceiveCoil
+00189045 MultiCoilDefinitionSequence
+00189046 MultiCoilConfiguration
+00189047 MultiCoilElementName
+00189048 MultiCoilElementUsed
+00189049 MRTransmitCoilSequence
+00189050 TransmitCoilManufacturerName
+00189051 TransmitCoilType
+00189052 SpectralWidth
+00189053 ChemicalShiftReference
+00189054 VolumeLocalizationTechnique
+00189058 MRAcquisitionFrequencyEncodingSteps
+00189059 Decoupling
+00189060 DecoupledNucleus
+00189061 DecouplingFrequency
+00189062 DecouplingMethod
+00189063 DecouplingChemicalShiftReference
+00189064 kspaceFiltering
+00189065 TimeDomainFiltering
+00189066 NumberofZeroFills
+00189067 BaselineCorrection
+00189069 ParallelReductionFactorInplane
+00189070 CardiacRRIntervalSpecified
+00189073 AcquisitionDuration
+00189074 FrameAcquisitionDateTime
+00189075 DiffusionDirectionality
+00189076 DiffusionGradientDirectionSequence
+00189077 ParallelAcquisition
+00189078 ParallelAcquisitionTechnique
+00189079 InversionTimes
+00189080 MetaboliteMapDescription
+00189081 PartialFourier
+00189082 EffectiveEchoTime
+00189083 MetaboliteMapCodeSequence
+00189084 ChemicalShiftSequence
+00189085 CardiacSignalSource
+00189087 Diffusionbvalue
+00189089 DiffusionGradientOrientation
+00189090 VelocityEncodingDirection
+00189091 VelocityEncodingMinimumValue
+00189092 VelocityEncodingAcquisitionSequence
+00189093 NumberofkSpaceTrajectories
+00189094 CoverageofkSpace
+00189095 SpectroscopyAcquisitionPhaseRows
+00189096 ParallelReductionFactorInplaneRetired
+00189098 TransmitterFrequency
+00189100 ResonantNucleus
+00189101 FrequencyCorrection
+00189103 MRSpectroscopyFOVGeometrySequence
+00189104 SlabThickness
+00189105 SlabOrientation
+00189106 MidSlabPosition
+00189107 MRSpatialSaturationSequence
+00189112 MRTimingandRelatedParametersSequence
+00189114 MREchoSequence
+00189115 MRModifierSequence
+00189117 MRDiffusionSequence
+00189118 CardiacSynchronizationSequence
+00189119 MRAveragesSequence
+00189125 MRFOVGeometrySequence
+00189126 VolumeLocalizationSequence
+00189127 SpectroscopyAcquisitionDataColumns
+00189147 DiffusionAnisotropyType
+00189151 FrameReferenceDateTime
+00189152 MRMetaboliteMapSequence
+00189155 ParallelReductionFactoroutofplane
+00189159 SpectroscopyAcquisitionOutofplanePhaseSteps
+00189166 BulkMotionStatus
+00189168 ParallelReductionFactorSecondInplane
+00189169 CardiacBeatRejectionTechnique
+00189170 RespiratoryMotionCompensationTechnique
+00189171 RespiratorySignalSource
+00189172 BulkMotionCompensationTechnique
+00189173 BulkMotionSignalSource
+00189174 ApplicableSafetyStandardAgency
+00189175 ApplicableSafetyStandardDescription
+00189176 OperatingModeSequence
+00189177 OperatingModeType
+00189178 OperatingMode
+00189179 SpecificAbsorptionRateDefinition
+00189180 GradientOutputType
+00189181 SpecificAbsorptionRateValue
+00189182 GradientOutput
+00189183 FlowCompensationDirection
+00189184 TaggingDelay
+00189185 RespiratoryMotionCompensationTechniqueDescription
+00189186 RespiratorySignalSourceID
+00189195 ChemicalShiftMinimumIntegrationLimitinHz
+00189196 ChemicalShiftMaximumIntegrationLimitinHz
+00189197 MRVelocityEncodingSequence
+00189198 FirstOrderPhaseCorrection
+00189199 WaterReferencedPhaseCorrection
+00189200 MRSpectroscopyAcquisitionType
+00189214 RespiratoryCyclePosition
+00189217 VelocityEncodingMaximumValue
+00189218 TagSpacingSecondDimension
+00189219 TagAngleSecondAxis
+00189220 FrameAcquisitionDuration
+00189226 MRImageFrameTypeSequence
+00189227 MRSpectroscopyFrameTypeSequence
+00189231 MRAcquisitionPhaseEncodingStepsinplane
+00189232 MRAcquisitionPhaseEncodingStepsoutofplane
+00189234 SpectroscopyAcquisitionPhaseColumns
+00189236 CardiacCyclePosition
+00189239 SpecificAbsorptionRateSequence
+00189240 RFEchoTrainLength
+00189241 GradientEchoTrainLength
+00189250 ArterialSpinLabelingContrast
+00189251 MRArterialSpinLabelingSequence
+00189252 ASLTechniqueDescription
+00189253 ASLSlabNumber
+00189254 ASLSlabThickness
+00189255 ASLSlabOrientation
+00189256 ASLMidSlabPosition
+00189257 ASLContext
+00189258 ASLPulseTrainDuration
+00189259 ASLCrusherFlag
+0018925A ASLCrusherFlowLimit
+0018925B ASLCrusherDescription
+0018925C ASLBolusCutoffFlag
+0018925D ASLBolusCutoffTimingSequence
+0018925E ASLBolusCutoffTechnique
+0018925F ASLBolusCutoffDelayTime
+00189260 ASLSlabSequence
+00189295 ChemicalShiftMinimumIntegrationLimitinppm
+00189296 ChemicalShiftMaximumIntegrationLimitinppm
+00189297 WaterReferenceAcquisition
+00189298 EchoPeakPosition
+00189301 CTAcquisitionTypeSequence
+00189302 AcquisitionType
+00189303 TubeAngle
+00189304 CTAcquisitionDetailsSequence
+00189305 RevolutionTime
+00189306 SingleCollimationWidth
+00189307 TotalCollimationWidth
+00189308 CTTableDynamicsSequence
+00189309 TableSpeed
+00189310 TableFeedperRotation
+00189311 SpiralPitchFactor
+00189312 CTGeometrySequence
+00189313 DataCollectionCenterPatient
+00189314 CTReconstructionSequence
+00189315 ReconstructionAlgorithm
+00189316 ConvolutionKernelGroup
+00189317 ReconstructionFieldofView
+00189318 ReconstructionTargetCenterPatient
+00189319 ReconstructionAngle
+00189320 ImageFilter
+00189321 CTExposureSequence
+00189322 ReconstructionPixelSpacing
+00189323 ExposureModulationType
+00189324 EstimatedDoseSaving
+00189325 CTXRayDetailsSequence
+00189326 CTPositionSequence
+00189327 TablePosition
+00189328 ExposureTimeinms
+00189329 CTImageFrameTypeSequence
+00189330 XRayTubeCurrentinmA
+00189332 ExposureinmAs
+00189333 ConstantVolumeFlag
+00189334 FluoroscopyFlag
+00189335 DistanceSourcetoDataCollectionCenter
+00189337 ContrastBolusAgentNumber
+00189338 ContrastBolusIngredientCodeSequence
+00189340 ContrastAdministrationProfileSequence
+00189341 ContrastBolusUsageSequence
+00189342 ContrastBolusAgentAdministered
+00189343 ContrastBolusAgentDetected
+00189344 ContrastBolusAgentPhase
+00189345 CTDIvol
+00189346 CTDIPhantomTypeCodeSequence
+00189351 CalciumScoringMassFactorPatient
+00189352 CalciumScoringMassFactorDevice
+00189353 EnergyWeightingFactor
+00189360 CTAdditionalXRaySourceSequence
+00189401 ProjectionPixelCalibrationSequence
+00189402 DistanceSourcetoIsocenter
+00189403 DistanceObjecttoTableTop
+00189404 ObjectPixelSpacinginCenterofBeam
+00189405 PositionerPositionSequence
+00189406 TablePositionSequence
+00189407 CollimatorShapeSequence
+00189410 PlanesinAcquisition
+00189412 XAXRFFrameCharacteristicsSequence
+00189417 FrameAcquisitionSequence
+00189420 XRayReceptorType
+00189423 AcquisitionProtocolName
+00189424 AcquisitionProtocolDescription
+00189425 ContrastBolusIngredientOpaque
+00189426 DistanceReceptorPlanetoDetectorHousing
+00189427 IntensifierActiveShape
+00189428 IntensifierActiveDimensions
+00189429 PhysicalDetectorSize
+00189430 PositionofIsocenterProjection
+00189432 FieldofViewSequence
+00189433 FieldofViewDescription
+00189434 ExposureControlSensingRegionsSequence
+00189435 ExposureControlSensingRegionShape
+00189436 ExposureControlSensingRegionLeftVerticalEdge
+00189437 ExposureControlSensingRegionRightVerticalEdge
+00189438 ExposureControlSensingRegionUpperHorizontalEdge
+00189439 ExposureControlSensingRegionLowerHorizontalEdge
+00189440 CenterofCircularExposureControlSensingRegion
+00189441 RadiusofCircularExposureControlSensingRegion
+00189442 VerticesofthePolygonalExposureControlSensingRegion
+00189447 ColumnAngulationPatient
+00189449 BeamAngle
+00189451 FrameDetectorParametersSequence
+00189452 CalculatedAnatomyThickness
+00189455 CalibrationSequence
+00189456 ObjectThicknessSequence
+00189457 PlaneIdentification
+00189461 FieldofViewDimensionsinFloat
+00189462 IsocenterReferenceSystemSequence
+00189463 PositionerIsocenterPrimaryAngle
+00189464 PositionerIsocenterSecondaryAngle
+00189465 PositionerIsocenterDetectorRotationAngle
+00189466 TableXPositiontoIsocenter
+00189467 TableYPositiontoIsocenter
+00189468 TableZPositiontoIsocenter
+00189469 TableHorizontalRotationAngle
+00189470 TableHeadTiltAngle
+00189471 TableCradleTiltAngle
+00189472 FrameDisplayShutterSequence
+00189473 AcquiredImageAreaDoseProduct
+00189474 CarmPositionerTabletopRelationship
+00189476 XRayGeometrySequence
+00189477 IrradiationEventIdentificationSequence
+00189504 XRay3DFrameTypeSequence
+00189506 ContributingSourcesSequence
+00189507 XRay3DAcquisitionSequence
+00189508 PrimaryPositionerScanArc
+00189509 SecondaryPositionerScanArc
+00189510 PrimaryPositionerScanStartAngle
+00189511 SecondaryPositionerScanStartAngle
+00189514 PrimaryPositionerIncrement
+00189515 SecondaryPositionerIncrement
+00189516 StartAcquisitionDateTime
+00189517 EndAcquisitionDateTime
+00189518 PrimaryPositionerIncrementSign
+00189519 SecondaryPositionerIncrementSign
+00189524 ApplicationName
+00189525 ApplicationVersion
+00189526 ApplicationManufacturer
+00189527 AlgorithmType
+00189528 AlgorithmDescription
+00189530 XRay3DReconstructionSequence
+00189531 ReconstructionDescription
+00189538 PerProjectionAcquisitionSequence
+00189541 DetectorPositionSequence
+00189542 XRayAcquisitionDoseSequence
+00189543 XRaySourceIsocenterPrimaryAngle
+00189544 XRaySourceIsocenterSecondaryAngle
+00189545 BreastSupportIsocenterPrimaryAngle
+00189546 BreastSupportIsocenterSecondaryAngle
+00189547 BreastSupportXPositiontoIsocenter
+00189548 BreastSupportYPositiontoIsocenter
+00189549 BreastSupportZPositiontoIsocenter
+00189550 DetectorIsocenterPrimaryAngle
+00189551 DetectorIsocenterSecondaryAngle
+00189552 DetectorXPositiontoIsocenter
+00189553 DetectorYPositiontoIsocenter
+00189554 DetectorZPositiontoIsocenter
+00189555 XRayGridSequence
+00189556 XRayFilterSequence
+00189557 DetectorActiveAreaTLHCPosition
+00189558 DetectorActiveAreaOrientation
+00189559 PositionerPrimaryAngleDirection
+00189601 DiffusionbmatrixSequence
+00189602 DiffusionbvalueXX
+00189603 DiffusionbvalueXY
+00189604 DiffusionbvalueXZ
+00189605 DiffusionbvalueYY
+00189606 DiffusionbvalueYZ
+00189607 DiffusionbvalueZZ
+00189621 FunctionalMRSequence
+00189622 FunctionalSettlingPhaseFramesPresent
+00189623 FunctionalSyncPulse
+00189624 SettlingPhaseFrame
+00189701 DecayCorrectionDateTime
+00189715 StartDensityThreshold
+00189716 StartRelativeDensityDifferenceThreshold
+00189717 StartCardiacTriggerCountThreshold
+00189718 StartRespiratoryTriggerCountThreshold
+00189719 TerminationCountsThreshold
+00189720 TerminationDensityThreshold
+00189721 TerminationRelativeDensityThreshold
+00189722 TerminationTimeThreshold
+00189723 TerminationCardiacTriggerCountThreshold
+00189724 TerminationRespiratoryTriggerCountThreshold
+00189725 DetectorGeometry
+00189726 TransverseDetectorSeparation
+00189727 AxialDetectorDimension
+00189729 RadiopharmaceuticalAgentNumber
+00189732 PETFrameAcquisitionSequence
+00189733 PETDetectorMotionDetailsSequence
+00189734 PETTableDynamicsSequence
+00189735 PETPositionSequence
+00189736 PETFrameCorrectionFactorsSequence
+00189737 RadiopharmaceuticalUsageSequence
+00189738 AttenuationCorrectionSource
+00189739 NumberofIterations
+00189740 NumberofSubsets
+00189749 PETReconstructionSequence
+00189751 PETFrameTypeSequence
+00189755 TimeofFlightInformationUsed
+00189756 ReconstructionType
+00189758 DecayCorrected
+00189759 AttenuationCorrected
+00189760 ScatterCorrected
+00189761 DeadTimeCorrected
+00189762 GantryMotionCorrected
+00189763 PatientMotionCorrected
+00189764 CountLossNormalizationCorrected
+00189765 RandomsCorrected
+00189766 NonuniformRadialSamplingCorrected
+00189767 SensitivityCalibrated
+00189768 DetectorNormalizationCorrection
+00189769 IterativeReconstructionMethod
+00189770 AttenuationCorrectionTemporalRelationship
+00189771 PatientPhysiologicalStateSequence
+00189772 PatientPhysiologicalStateCodeSequence
+00189801 DepthsofFocus
+00189803 ExcludedIntervalsSequence
+00189804 ExclusionStartDateTime
+00189805 ExclusionDuration
+00189806 USImageDescriptionSequence
+00189807 ImageDataTypeSequence
+00189808 DataType
+00189809 TransducerScanPatternCodeSequence
+0018980B AliasedDataType
+0018980C PositionMeasuringDeviceUsed
+0018980D TransducerGeometryCodeSequence
+0018980E TransducerBeamSteeringCodeSequence
+0018980F TransducerApplicationCodeSequence
+00189810 ZeroVelocityPixelValue
+0018A001 ContributingEquipmentSequence
+0018A002 ContributionDateTime
+0018A003 ContributionDescription
+0020000D StudyInstanceUID
+0020000E SeriesInstanceUID
+00200010 StudyID
+00200011 SeriesNumber
+00200012 AcquisitionNumber
+00200013 InstanceNumber
+00200014 IsotopeNumber
+00200015 PhaseNumber
+00200016 IntervalNumber
+00200017 TimeSlotNumber
+00200018 AngleNumber
+00200019 ItemNumber
+00200020 PatientOrientation
+00200022 OverlayNumber
+00200024 CurveNumber
+00200026 LUTNumber
+00200030 ImagePosition
+00200032 ImagePositionPatient
+00200035 ImageOrientation
+00200037 ImageOrientationPatient
+00200050 Location
+00200052 FrameofReferenceUID
+00200060 Laterality
+00200062 ImageLaterality
+00200070 ImageGeometryType
+00200080 MaskingImage
+002000AA ReportNumber
+00200100 TemporalPositionIdentifier
+00200105 NumberofTemporalPositions
+00200110 TemporalResolution
+00200200 SynchronizationFrameofReferenceUID
+00200242 SOPInstanceUIDofConcatenationSource
+00201000 SeriesinStudy
+00201001 AcquisitionsinSeries
+00201002 ImagesinAcquisition
+00201003 ImagesinSeries
+00201004 AcquisitionsinStudy
+00201005 ImagesinStudy
+00201020 Reference
+00201040 PositionReferenceIndicator
+00201041 SliceLocation
+00201070 OtherStudyNumbers
+00201200 NumberofPatientRelatedStudies
+00201202 NumberofPatientRelatedSeries
+00201204 NumberofPatientRelatedInstances
+00201206 NumberofStudyRelatedSeries
+00201208 NumberofStudyRelatedInstances
+00201209 NumberofSeriesRelatedInstances
+00203401 ModifyingDeviceID
+00203402 ModifiedImageID
+00203403 ModifiedImageDate
+00203404 ModifyingDeviceManufacturer
+00203405 ModifiedImageTime
+00203406 ModifiedImageDescription
+00204000 ImageComments
+00205000 OriginalImageIdentification
+00205002 OriginalImageIdentificationNomenclature
+00209056 StackID
+00209057 InStackPositionNumber
+00209071 FrameAnatomySequence
+00209072 FrameLaterality
+00209111 FrameContentSequence
+00209113 PlanePositionSequence
+00209116 PlaneOrientationSequence
+00209128 TemporalPositionIndex
+00209153 NominalCardiacTriggerDelayTime
+00209154 NominalCardiacTriggerTimePriorToRPeak
+00209155 ActualCardiacTriggerTimePriorToRPeak
+00209156 FrameAcquisitionNumber
+00209157 DimensionIndexValues
+00209158 FrameComments
+00209161 ConcatenationUID
+00209162 InconcatenationNumber
+00209163 InconcatenationTotalNumber
+00209164 DimensionOrganizationUID
+00209165 DimensionIndexPointer
+00209167 FunctionalGroupPointer
+00209170 UnassignedSharedConvertedAttributesSequence
+00209171 UnassignedPerFrameConvertedAttributesSequence
+00209172 ConversionSourceAttributesSequence
+00209213 DimensionIndexPrivateCreator
+00209221 DimensionOrganizationSequence
+00209222 DimensionIndexSequence
+00209228 ConcatenationFrameOffsetNumber
+00209238 FunctionalGroupPrivateCreator
+00209241 NominalPercentageofCardiacPhase
+00209245 NominalPercentageofRespiratoryPhase
+00209246 StartingRespiratoryAmplitude
+00209247 StartingRespiratoryPhase
+00209248 EndingRespiratoryAmplitude
+00209249 EndingRespiratoryPhase
+00209250 RespiratoryTriggerType
+00209251 RRIntervalTimeNominal
+00209252 ActualCardiacTriggerDelayTime
+00209253 RespiratorySynchronizationSequence
+00209254 RespiratoryIntervalTime
+00209255 NominalRespiratoryTriggerDelayTime
+00209256 RespiratoryTriggerDelayThreshold
+00209257 ActualRespiratoryTriggerDelayTime
+00209301 ImagePositionVolume
+00209302 ImageOrientationVolume
+00209307 UltrasoundAcquisitionGeometry
+00209308 ApexPosition
+00209309 VolumetoTransducerMappingMatrix
+0020930A VolumetoTableMappingMatrix
+0020930B VolumetoTransducerRelationship
+0020930C PatientFrameofReferenceSource
+0020930D TemporalPositionTimeOffset
+0020930E PlanePositionVolumeSequence
+0020930F PlaneOrientationVolumeSequence
+00209310 TemporalPositionSequence
+00209311 DimensionOrganizationType
+00209312 VolumeFrameofReferenceUID
+00209313 TableFrameofReferenceUID
+00209421 DimensionDescriptionLabel
+00209450 PatientOrientationinFrameSequence
+00209453 FrameLabel
+00209518 AcquisitionIndex
+00209529 ContributingSOPInstancesReferenceSequence
+00209536 ReconstructionIndex
+00220001 LightPathFilterPassThroughWavelength
+00220002 LightPathFilterPassBand
+00220003 ImagePathFilterPassThroughWavelength
+00220004 ImagePathFilterPassBand
+00220005 PatientEyeMovementCommanded
+00220006 PatientEyeMovementCommandCodeSequence
+00220007 SphericalLensPower
+00220008 CylinderLensPower
+00220009 CylinderAxis
+0022000A EmmetropicMagnification
+0022000B IntraOcularPressure
+0022000C HorizontalFieldofView
+0022000D PupilDilated
+0022000E DegreeofDilation
+00220010 StereoBaselineAngle
+00220011 StereoBaselineDisplacement
+00220012 StereoHorizontalPixelOffset
+00220013 StereoVerticalPixelOffset
+00220014 StereoRotation
+00220015 AcquisitionDeviceTypeCodeSequence
+00220016 IlluminationTypeCodeSequence
+00220017 LightPathFilterTypeStackCodeSequence
+00220018 ImagePathFilterTypeStackCodeSequence
+00220019 LensesCodeSequence
+0022001A ChannelDescriptionCodeSequence
+0022001B RefractiveStateSequence
+0022001C MydriaticAgentCodeSequence
+0022001D RelativeImagePositionCodeSequence
+0022001E CameraAngleofView
+00220020 StereoPairsSequence
+00220021 LeftImageSequence
+00220022 RightImageSequence
+00220028 StereoPairsPresent
+00220030 AxialLengthoftheEye
+00220031 OphthalmicFrameLocationSequence
+00220032 ReferenceCoordinates
+00220035 DepthSpatialResolution
+00220036 MaximumDepthDistortion
+00220037 AlongscanSpatialResolution
+00220038 MaximumAlongscanDistortion
+00220039 OphthalmicImageOrientation
+00220041 DepthofTransverseImage
+00220042 MydriaticAgentConcentrationUnitsSequence
+00220048 AcrossscanSpatialResolution
+00220049 MaximumAcrossscanDistortion
+0022004E MydriaticAgentConcentration
+00220055 IlluminationWaveLength
+00220056 IlluminationPower
+00220057 IlluminationBandwidth
+00220058 MydriaticAgentSequence
+00221007 OphthalmicAxialMeasurementsRightEyeSequence
+00221008 OphthalmicAxialMeasurementsLeftEyeSequence
+00221009 OphthalmicAxialMeasurementsDeviceType
+00221010 OphthalmicAxialLengthMeasurementsType
+00221012 OphthalmicAxialLengthSequence
+00221019 OphthalmicAxialLength
+00221024 LensStatusCodeSequence
+00221025 VitreousStatusCodeSequence
+00221028 IOLFormulaCodeSequence
+00221029 IOLFormulaDetail
+00221033 KeratometerIndex
+00221035 SourceofOphthalmicAxialLengthCodeSequence
+00221037 TargetRefraction
+00221039 RefractiveProcedureOccurred
+00221040 RefractiveSurgeryTypeCodeSequence
+00221044 OphthalmicUltrasoundMethodCodeSequence
+00221050 OphthalmicAxialLengthMeasurementsSequence
+00221053 IOLPower
+00221054 PredictedRefractiveError
+00221059 OphthalmicAxialLengthVelocity
+00221065 LensStatusDescription
+00221066 VitreousStatusDescription
+00221090 IOLPowerSequence
+00221092 LensConstantSequence
+00221093 IOLManufacturer
+00221094 LensConstantDescription
+00221095 ImplantName
+00221096 KeratometryMeasurementTypeCodeSequence
+00221097 ImplantPartNumber
+00221100 ReferencedOphthalmicAxialMeasurementsSequence
+00221101 OphthalmicAxialLengthMeasurementsSegmentNameCodeSequence
+00221103 RefractiveErrorBeforeRefractiveSurgeryCodeSequence
+00221121 IOLPowerForExactEmmetropia
+00221122 IOLPowerForExactTargetRefraction
+00221125 AnteriorChamberDepthDefinitionCodeSequence
+00221127 LensThicknessSequence
+00221128 AnteriorChamberDepthSequence
+00221130 LensThickness
+00221131 AnteriorChamberDepth
+00221132 SourceofLensThicknessDataCodeSequence
+00221133 SourceofAnteriorChamberDepthDataCodeSequence
+00221134 SourceofRefractiveMeasurementsSequence
+00221135 SourceofRefractiveMeasurementsCodeSequence
+00221140 OphthalmicAxialLengthMeasurementModified
+00221150 OphthalmicAxialLengthDataSourceCodeSequence
+00221153 OphthalmicAxialLengthAcquisitionMethodCodeSequence
+00221155 SignaltoNoiseRatio
+00221159 OphthalmicAxialLengthDataSourceDescription
+00221210 OphthalmicAxialLengthMeasurementsTotalLengthSequence
+00221211 OphthalmicAxialLengthMeasurementsSegmentalLengthSequence
+00221212 OphthalmicAxialLengthMeasurementsLengthSummationSequence
+00221220 UltrasoundOphthalmicAxialLengthMeasurementsSequence
+00221225 OpticalOphthalmicAxialLengthMeasurementsSequence
+00221230 UltrasoundSelectedOphthalmicAxialLengthSequence
+00221250 OphthalmicAxialLengthSelectionMethodCodeSequence
+00221255 OpticalSelectedOphthalmicAxialLengthSequence
+00221257 SelectedSegmentalOphthalmicAxialLengthSequence
+00221260 SelectedTotalOphthalmicAxialLengthSequence
+00221262 OphthalmicAxialLengthQualityMetricSequence
+00221265 OphthalmicAxialLengthQualityMetricTypeCodeSequence
+00221273 OphthalmicAxialLengthQualityMetricTypeDescription
+00221300 IntraocularLensCalculationsRightEyeSequence
+00221310 IntraocularLensCalculationsLeftEyeSequence
+00221330 ReferencedOphthalmicAxialLengthMeasurementQCImageSequence
+00221415 OphthalmicMappingDeviceType
+00221420 AcquisitionMethodCodeSequence
+00221423 AcquisitionMethodAlgorithmSequence
+00221436 OphthalmicThicknessMapTypeCodeSequence
+00221443 OphthalmicThicknessMappingNormalsSequence
+00221445 RetinalThicknessDefinitionCodeSequence
+00221450 PixelValueMappingtoCodedConceptSequence
+00221452 MappedPixelValue
+00221454 PixelValueMappingExplanation
+00221458 OphthalmicThicknessMapQualityThresholdSequence
+00221460 OphthalmicThicknessMapThresholdQualityRating
+00221463 AnatomicStructureReferencePoint
+00221465 RegistrationtoLocalizerSequence
+00221466 RegisteredLocalizerUnits
+00221467 RegisteredLocalizerTopLeftHandCorner
+00221468 RegisteredLocalizerBottomRightHandCorner
+00221470 OphthalmicThicknessMapQualityRatingSequence
+00221472 RelevantOPTAttributesSequence
+00221512 TransformationMethodCodeSequence
+00221513 TransformationAlgorithmSequence
+00221515 OphthalmicAxialLengthMethod
+00221517 OphthalmicFOV
+00221518 TwoDimensionaltoThreeDimensionalMapSequence
+00221525 WideFieldOphthalmicPhotographyQualityRatingSequence
+00221526 WideFieldOphthalmicPhotographyQualityThresholdSequence
+00221527 WideFieldOphthalmicPhotographyThresholdQualityRating
+00221528 XCoordinatesCenterPixelViewAngle
+00221529 YCoordinatesCenterPixelViewAngle
+00221530 NumberofMapPoints
+00221531 TwoDimensionaltoThreeDimensionalMapData
+00240010 VisualFieldHorizontalExtent
+00240011 VisualFieldVerticalExtent
+00240012 VisualFieldShape
+00240016 ScreeningTestModeCodeSequence
+00240018 MaximumStimulusLuminance
+00240020 BackgroundLuminance
+00240021 StimulusColorCodeSequence
+00240024 BackgroundIlluminationColorCodeSequence
+00240025 StimulusArea
+00240028 StimulusPresentationTime
+00240032 FixationSequence
+00240033 FixationMonitoringCodeSequence
+00240034 VisualFieldCatchTrialSequence
+00240035 FixationCheckedQuantity
+00240036 PatientNotProperlyFixatedQuantity
+00240037 PresentedVisualStimuliDataFlag
+00240038 NumberofVisualStimuli
+00240039 ExcessiveFixationLossesDataFlag
+00240040 ExcessiveFixationLosses
+00240042 StimuliRetestingQuantity
+00240044 CommentsonPatientsPerformanceofVisualField
+00240045 FalseNegativesEstimateFlag
+00240046 FalseNegativesEstimate
+00240048 NegativeCatchTrialsQuantity
+00240050 FalseNegativesQuantity
+00240051 ExcessiveFalseNegativesDataFlag
+00240052 ExcessiveFalseNegatives
+00240053 FalsePositivesEstimateFlag
+00240054 FalsePositivesEstimate
+00240055 CatchTrialsDataFlag
+00240056 PositiveCatchTrialsQuantity
+00240057 TestPointNormalsDataFlag
+00240058 TestPointNormalsSequence
+00240059 GlobalDeviationProbabilityNormalsFlag
+00240060 FalsePositivesQuantity
+00240061 ExcessiveFalsePositivesDataFlag
+00240062 ExcessiveFalsePositives
+00240063 VisualFieldTestNormalsFlag
+00240064 ResultsNormalsSequence
+00240065 AgeCorrectedSensitivityDeviationAlgorithmSequence
+00240066 GlobalDeviationFromNormal
+00240067 GeneralizedDefectSensitivityDeviationAlgorithmSequence
+00240068 LocalizedDeviationFromNormal
+00240069 PatientReliabilityIndicator
+00240070 VisualFieldMeanSensitivity
+00240071 GlobalDeviationProbability
+00240072 LocalDeviationProbabilityNormalsFlag
+00240073 LocalizedDeviationProbability
+00240074 ShortTermFluctuationCalculated
+00240075 ShortTermFluctuation
+00240076 ShortTermFluctuationProbabilityCalculated
+00240077 ShortTermFluctuationProbability
+00240078 CorrectedLocalizedDeviationFromNormalCalculated
+00240079 CorrectedLocalizedDeviationFromNormal
+00240080 CorrectedLocalizedDeviationFromNormalProbabilityCalculated
+00240081 CorrectedLocalizedDeviationFromNormalProbability
+00240083 GlobalDeviationProbabilitySequence
+00240085 LocalizedDeviationProbabilitySequence
+00240086 FovealSensitivityMeasured
+00240087 FovealSensitivity
+00240088 VisualFieldTestDuration
+00240089 VisualFieldTestPointSequence
+00240090 VisualFieldTestPointXCoordinate
+00240091 VisualFieldTestPointYCoordinate
+00240092 AgeCorrectedSensitivityDeviationValue
+00240093 StimulusResults
+00240094 SensitivityValue
+00240095 RetestStimulusSeen
+00240096 RetestSensitivityValue
+00240097 VisualFieldTestPointNormalsSequence
+00240098 QuantifiedDefect
+00240100 AgeCorrectedSensitivityDeviationProbabilityValue
+00240102 GeneralizedDefectCorrectedSensitivityDeviationFlag
+00240103 GeneralizedDefectCorrectedSensitivityDeviationValue
+00240104 GeneralizedDefectCorrectedSensitivityDeviationProbabilityValue
+00240105 MinimumSensitivityValue
+00240106 BlindSpotLocalized
+00240107 BlindSpotXCoordinate
+00240108 BlindSpotYCoordinate
+00240110 VisualAcuityMeasurementSequence
+00240112 RefractiveParametersUsedonPatientSequence
+00240113 MeasurementLaterality
+00240114 OphthalmicPatientClinicalInformationLeftEyeSequence
+00240115 OphthalmicPatientClinicalInformationRightEyeSequence
+00240117 FovealPointNormativeDataFlag
+00240118 FovealPointProbabilityValue
+00240120 ScreeningBaselineMeasured
+00240122 ScreeningBaselineMeasuredSequence
+00240124 ScreeningBaselineType
+00240126 ScreeningBaselineValue
+00240202 AlgorithmSource
+00240306 DataSetName
+00240307 DataSetVersion
+00240308 DataSetSource
+00240309 DataSetDescription
+00240317 VisualFieldTestReliabilityGlobalIndexSequence
+00240320 VisualFieldGlobalResultsIndexSequence
+00240325 DataObservationSequence
+00240338 IndexNormalsFlag
+00240341 IndexProbability
+00240344 IndexProbabilitySequence
+00280002 SamplesperPixel
+00280003 SamplesperPixelUsed
+00280004 PhotometricInterpretation
+00280005 ImageDimensions
+00280006 PlanarConfiguration
+00280008 NumberofFrames
+00280009 FrameIncrementPointer
+0028000A FrameDimensionPointer
+00280010 Rows
+00280011 Columns
+00280012 Planes
+00280014 UltrasoundColorDataPresent
+00280030 PixelSpacing
+00280031 ZoomFactor
+00280032 ZoomCenter
+00280034 PixelAspectRatio
+00280040 ImageFormat
+00280050 ManipulatedImage
+00280051 CorrectedImage
+0028005F CompressionRecognitionCode
+00280060 CompressionCode
+00280061 CompressionOriginator
+00280062 CompressionLabel
+00280063 CompressionDescription
+00280065 CompressionSequence
+00280066 CompressionStepPointers
+00280068 RepeatInterval
+00280069 BitsGrouped
+00280070 PerimeterTable
+00280071 PerimeterValue
+00280080 PredictorRows
+00280081 PredictorColumns
+00280082 PredictorConstants
+00280090 BlockedPixels
+00280091 BlockRows
+00280092 BlockColumns
+00280093 RowOverlap
+00280094 ColumnOverlap
+00280100 BitsAllocated
+00280101 BitsStored
+00280102 HighBit
+00280103 PixelRepresentation
+00280104 SmallestValidPixelValue
+00280105 LargestValidPixelValue
+00280106 SmallestImagePixelValue
+00280107 LargestImagePixelValue
+00280108 SmallestPixelValueinSeries
+00280109 LargestPixelValueinSeries
+00280110 SmallestImagePixelValueinPlane
+00280111 LargestImagePixelValueinPlane
+00280120 PixelPaddingValue
+00280121 PixelPaddingRangeLimit
+00280122 FloatPixelPaddingValue
+00280123 DoubleFloatPixelPaddingValue
+00280124 FloatPixelPaddingRangeLimit
+00280125 DoubleFloatPixelPaddingRangeLimit
+00280200 ImageLocation
+00280300 QualityControlImage
+00280301 BurnedInAnnotation
+00280302 RecognizableVisualFeatures
+00280303 LongitudinalTemporalInformationModified
+00280304 ReferencedColorPaletteInstanceUID
+00280400 TransformLabel
+00280401 TransformVersionNumber
+00280402 NumberofTransformSteps
+00280403 SequenceofCompressedData
+00280404 DetailsofCoefficients
+00280700 DCTLabel
+00280701 DataBlockDescription
+00280702 DataBlock
+00280710 NormalizationFactorFormat
+00280720 ZonalMapNumberFormat
+00280721 ZonalMapLocation
+00280722 ZonalMapFormat
+00280730 AdaptiveMapFormat
+00280740 CodeNumberFormat
+00280A02 PixelSpacingCalibrationType
+00280A04 PixelSpacingCalibrationDescription
+00281040 PixelIntensityRelationship
+00281041 PixelIntensityRelationshipSign
+00281050 WindowCenter
+00281051 WindowWidth
+00281052 RescaleIntercept
+00281053 RescaleSlope
+00281054 RescaleType
+00281055 WindowCenterWidthExplanation
+00281056 VOILUTFunction
+00281080 GrayScale
+00281090 RecommendedViewingMode
+00281100 GrayLookupTableDescriptor
+00281101 RedPaletteColorLookupTableDescriptor
+00281102 GreenPaletteColorLookupTableDescriptor
+00281103 BluePaletteColorLookupTableDescriptor
+00281104 AlphaPaletteColorLookupTableDescriptor
+00281111 LargeRedPaletteColorLookupTableDescriptor
+00281112 LargeGreenPaletteColorLookupTableDescriptor
+00281113 LargeBluePaletteColorLookupTableDescriptor
+00281199 PaletteColorLookupTableUID
+00281200 GrayLookupTableData
+00281201 RedPaletteColorLookupTableData
+00281202 GreenPaletteColorLookupTableData
+00281203 BluePaletteColorLookupTableData
+00281204 AlphaPaletteColorLookupTableData
+00281211 LargeRedPaletteColorLookupTableData
+00281212 LargeGreenPaletteColorLookupTableData
+00281213 LargeBluePaletteColorLookupTableData
+00281214 LargePaletteColorLookupTableUID
+00281221 SegmentedRedPaletteColorLookupTableData
+00281222 SegmentedGreenPaletteColorLookupTableData
+00281223 SegmentedBluePaletteColorLookupTableData
+00281224 SegmentedAlphaPaletteColorLookupTableData
+00281300 BreastImplantPresent
+00281350 PartialView
+00281351 PartialViewDescription
+00281352 PartialViewCodeSequence
+0028135A SpatialLocationsPreserved
+00281401 DataFrameAssignmentSequence
+00281402 DataPathAssignment
+00281403 BitsMappedtoColorLookupTable
+00281404 BlendingLUT1Sequence
+00281405 BlendingLUT1TransferFunction
+00281406 BlendingWeightConstant
+00281407 BlendingLookupTableDescriptor
+00281408 BlendingLookupTableData
+0028140B EnhancedPaletteColorLookupTableSequence
+0028140C BlendingLUT2Sequence
+0028140D BlendingLUT2TransferFunction
+0028140E DataPathID
+0028140F RGBLUTTransferFunction
+00281410 AlphaLUTTransferFunction
+00282000 ICCProfile
+00282002 ColorSpace
+00282110 LossyImageCompression
+00282112 LossyImageCompressionRatio
+00282114 LossyImageCompressionMethod
+00283000 ModalityLUTSequence
+00283002 LUTDescriptor
+00283003 LUTExplanation
+00283004 ModalityLUTType
+00283006 LUTData
+00283010 VOILUTSequence
+00283110 SoftcopyVOILUTSequence
+00284000 ImagePresentationComments
+00285000 BiPlaneAcquisitionSequence
+00286010 RepresentativeFrameNumber
+00286020 FrameNumbersofInterestFOI
+00286022 FrameofInterestDescription
+00286023 FrameofInterestType
+00286030 MaskPointers
+00286040 RWavePointer
+00286100 MaskSubtractionSequence
+00286101 MaskOperation
+00286102 ApplicableFrameRange
+00286110 MaskFrameNumbers
+00286112 ContrastFrameAveraging
+00286114 MaskSubpixelShift
+00286120 TIDOffset
+00286190 MaskOperationExplanation
+00287000 EquipmentAdministratorSequence
+00287001 NumberofDisplaySubsystems
+00287002 CurrentConfigurationID
+00287003 DisplaySubsystemID
+00287004 DisplaySubsystemName
+00287005 DisplaySubsystemDescription
+00287006 SystemStatus
+00287007 SystemStatusComment
+00287008 TargetLuminanceCharacteristicsSequence
+00287009 LuminanceCharacteristicsID
+0028700A DisplaySubsystemConfigurationSequence
+0028700B ConfigurationID
+0028700C ConfigurationName
+0028700D ConfigurationDescription
+0028700E ReferencedTargetLuminanceCharacteristicsID
+0028700F QAResultsSequence
+00287010 DisplaySubsystemQAResultsSequence
+00287011 ConfigurationQAResultsSequence
+00287012 MeasurementEquipmentSequence
+00287013 MeasurementFunctions
+00287014 MeasurementEquipmentType
+00287015 VisualEvaluationResultSequence
+00287016 DisplayCalibrationResultSequence
+00287017 DDLValue
+00287018 CIExyWhitePoint
+00287019 DisplayFunctionType
+0028701A GammaValue
+0028701B NumberofLuminancePoints
+0028701C LuminanceResponseSequence
+0028701D TargetMinimumLuminance
+0028701E TargetMaximumLuminance
+0028701F LuminanceValue
+00287020 LuminanceResponseDescription
+00287021 WhitePointFlag
+00287022 DisplayDeviceTypeCodeSequence
+00287023 DisplaySubsystemSequence
+00287024 LuminanceResultSequence
+00287025 AmbientLightValueSource
+00287026 MeasuredCharacteristics
+00287027 LuminanceUniformityResultSequence
+00287028 VisualEvaluationTestSequence
+00287029 TestResult
+0028702A TestResultComment
+0028702B TestImageValidation
+0028702C TestPatternCodeSequence
+0028702D MeasurementPatternCodeSequence
+0028702E VisualEvaluationMethodCodeSequence
+00287FE0 PixelDataProviderURL
+00289001 DataPointRows
+00289002 DataPointColumns
+00289003 SignalDomainColumns
+00289099 LargestMonochromePixelValue
+00289108 DataRepresentation
+00289110 PixelMeasuresSequence
+00289132 FrameVOILUTSequence
+00289145 PixelValueTransformationSequence
+00289235 SignalDomainRows
+00289411 DisplayFilterPercentage
+00289415 FramePixelShiftSequence
+00289416 SubtractionItemID
+00289422 PixelIntensityRelationshipLUTSequence
+00289443 FramePixelDataPropertiesSequence
+00289444 GeometricalProperties
+00289445 GeometricMaximumDistortion
+00289446 ImageProcessingApplied
+00289454 MaskSelectionMode
+00289474 LUTFunction
+00289478 MaskVisibilityPercentage
+00289501 PixelShiftSequence
+00289502 RegionPixelShiftSequence
+00289503 VerticesoftheRegion
+00289505 MultiframePresentationSequence
+00289506 PixelShiftFrameRange
+00289507 LUTFrameRange
+00289520 ImagetoEquipmentMappingMatrix
+00289537 EquipmentCoordinateSystemIdentification
+0032000A StudyStatusID
+0032000C StudyPriorityID
+00320012 StudyIDIssuer
+00320032 StudyVerifiedDate
+00320033 StudyVerifiedTime
+00320034 StudyReadDate
+00320035 StudyReadTime
+00321000 ScheduledStudyStartDate
+00321001 ScheduledStudyStartTime
+00321010 ScheduledStudyStopDate
+00321011 ScheduledStudyStopTime
+00321020 ScheduledStudyLocation
+00321021 ScheduledStudyLocationAETitle
+00321030 ReasonforStudy
+00321031 RequestingPhysicianIdentificationSequence
+00321032 RequestingPhysician
+00321033 RequestingService
+00321034 RequestingServiceCodeSequence
+00321040 StudyArrivalDate
+00321041 StudyArrivalTime
+00321050 StudyCompletionDate
+00321051 StudyCompletionTime
+00321055 StudyComponentStatusID
+00321060 RequestedProcedureDescription
+00321064 RequestedProcedureCodeSequence
+00321070 RequestedContrastAgent
+00324000 StudyComments
+00380004 ReferencedPatientAliasSequence
+00380008 VisitStatusID
+00380010 AdmissionID
+00380011 IssuerofAdmissionID
+00380014 IssuerofAdmissionIDSequence
+00380016 RouteofAdmissions
+0038001A ScheduledAdmissionDate
+0038001B ScheduledAdmissionTime
+0038001C ScheduledDischargeDate
+0038001D ScheduledDischargeTime
+0038001E ScheduledPatientInstitutionResidence
+00380020 AdmittingDate
+00380021 AdmittingTime
+00380030 DischargeDate
+00380032 DischargeTime
+00380040 DischargeDiagnosisDescription
+00380044 DischargeDiagnosisCodeSequence
+00380050 SpecialNeeds
+00380060 ServiceEpisodeID
+00380061 IssuerofServiceEpisodeID
+00380062 ServiceEpisodeDescription
+00380064 IssuerofServiceEpisodeIDSequence
+00380100 PertinentDocumentsSequence
+00380101 PertinentResourcesSequence
+00380102 ResourceDescription
+00380300 CurrentPatientLocation
+00380400 PatientsInstitutionResidence
+00380500 PatientState
+00380502 PatientClinicalTrialParticipationSequence
+00384000 VisitComments
+003A0004 WaveformOriginality
+003A0005 NumberofWaveformChannels
+003A0010 NumberofWaveformSamples
+003A001A SamplingFrequency
+003A0020 MultiplexGroupLabel
+003A0200 ChannelDefinitionSequence
+003A0202 WaveformChannelNumber
+003A0203 ChannelLabel
+003A0205 ChannelStatus
+003A0208 ChannelSourceSequence
+003A0209 ChannelSourceModifiersSequence
+003A020A SourceWaveformSequence
+003A020C ChannelDerivationDescription
+003A0210 ChannelSensitivity
+003A0211 ChannelSensitivityUnitsSequence
+003A0212 ChannelSensitivityCorrectionFactor
+003A0213 ChannelBaseline
+003A0214 ChannelTimeSkew
+003A0215 ChannelSampleSkew
+003A0218 ChannelOffset
+003A021A WaveformBitsStored
+003A0220 FilterLowFrequency
+003A0221 FilterHighFrequency
+003A0222 NotchFilterFrequency
+003A0223 NotchFilterBandwidth
+003A0230 WaveformDataDisplayScale
+003A0231 WaveformDisplayBackgroundCIELabValue
+003A0240 WaveformPresentationGroupSequence
+003A0241 PresentationGroupNumber
+003A0242 ChannelDisplaySequence
+003A0244 ChannelRecommendedDisplayCIELabValue
+003A0245 ChannelPosition
+003A0246 DisplayShadingFlag
+003A0247 FractionalChannelDisplayScale
+003A0248 AbsoluteChannelDisplayScale
+003A0300 MultiplexedAudioChannelsDescriptionCodeSequence
+003A0301 ChannelIdentificationCode
+003A0302 ChannelMode
+00400001 ScheduledStationAETitle
+00400002 ScheduledProcedureStepStartDate
+00400003 ScheduledProcedureStepStartTime
+00400004 ScheduledProcedureStepEndDate
+00400005 ScheduledProcedureStepEndTime
+00400006 ScheduledPerformingPhysiciansName
+00400007 ScheduledProcedureStepDescription
+00400008 ScheduledProtocolCodeSequence
+00400009 ScheduledProcedureStepID
+0040000A StageCodeSequence
+0040000B ScheduledPerformingPhysicianIdentificationSequence
+00400010 ScheduledStationName
+00400011 ScheduledProcedureStepLocation
+00400012 PreMedication
+00400020 ScheduledProcedureStepStatus
+00400026 OrderPlacerIdentifierSequence
+00400027 OrderFillerIdentifierSequence
+00400031 LocalNamespaceEntityID
+00400032 UniversalEntityID
+00400033 UniversalEntityIDType
+00400035 IdentifierTypeCode
+00400036 AssigningFacilitySequence
+00400039 AssigningJurisdictionCodeSequence
+0040003A AssigningAgencyorDepartmentCodeSequence
+00400100 ScheduledProcedureStepSequence
+00400220 ReferencedNonImageCompositeSOPInstanceSequence
+00400241 PerformedStationAETitle
+00400242 PerformedStationName
+00400243 PerformedLocation
+00400244 PerformedProcedureStepStartDate
+00400245 PerformedProcedureStepStartTime
+00400250 PerformedProcedureStepEndDate
+00400251 PerformedProcedureStepEndTime
+00400252 PerformedProcedureStepStatus
+00400253 PerformedProcedureStepID
+00400254 PerformedProcedureStepDescription
+00400255 PerformedProcedureTypeDescription
+00400260 PerformedProtocolCodeSequence
+00400261 PerformedProtocolType
+00400270 ScheduledStepAttributesSequence
+00400275 RequestAttributesSequence
+00400280 CommentsonthePerformedProcedureStep
+00400281 PerformedProcedureStepDiscontinuationReasonCodeSequence
+00400293 QuantitySequence
+00400294 Quantity
+00400295 MeasuringUnitsSequence
+00400296 BillingItemSequence
+00400300 TotalTimeofFluoroscopy
+00400301 TotalNumberofExposures
+00400302 EntranceDose
+00400303 ExposedArea
+00400306 DistanceSourcetoEntrance
+00400307 DistanceSourcetoSupport
+0040030E ExposureDoseSequence
+00400310 CommentsonRadiationDose
+00400312 XRayOutput
+00400314 HalfValueLayer
+00400316 OrganDose
+00400318 OrganExposed
+00400320 BillingProcedureStepSequence
+00400321 FilmConsumptionSequence
+00400324 BillingSuppliesandDevicesSequence
+00400330 ReferencedProcedureStepSequence
+00400340 PerformedSeriesSequence
+00400400 CommentsontheScheduledProcedureStep
+00400440 ProtocolContextSequence
+00400441 ContentItemModifierSequence
+00400500 ScheduledSpecimenSequence
+0040050A SpecimenAccessionNumber
+00400512 ContainerIdentifier
+00400513 IssueroftheContainerIdentifierSequence
+00400515 AlternateContainerIdentifierSequence
+00400518 ContainerTypeCodeSequence
+0040051A ContainerDescription
+00400520 ContainerComponentSequence
+00400550 SpecimenSequence
+00400551 SpecimenIdentifier
+00400552 SpecimenDescriptionSequenceTrial
+00400553 SpecimenDescriptionTrial
+00400554 SpecimenUID
+00400555 AcquisitionContextSequence
+00400556 AcquisitionContextDescription
+0040059A SpecimenTypeCodeSequence
+00400560 SpecimenDescriptionSequence
+00400562 IssueroftheSpecimenIdentifierSequence
+00400600 SpecimenShortDescription
+00400602 SpecimenDetailedDescription
+00400610 SpecimenPreparationSequence
+00400612 SpecimenPreparationStepContentItemSequence
+00400620 SpecimenLocalizationContentItemSequence
+004006FA SlideIdentifier
+0040071A ImageCenterPointCoordinatesSequence
+0040072A XOffsetinSlideCoordinateSystem
+0040073A YOffsetinSlideCoordinateSystem
+0040074A ZOffsetinSlideCoordinateSystem
+004008D8 PixelSpacingSequence
+004008DA CoordinateSystemAxisCodeSequence
+004008EA MeasurementUnitsCodeSequence
+004009F8 VitalStainCodeSequenceTrial
+00401001 RequestedProcedureID
+00401002 ReasonfortheRequestedProcedure
+00401003 RequestedProcedurePriority
+00401004 PatientTransportArrangements
+00401005 RequestedProcedureLocation
+00401006 PlacerOrderNumberProcedure
+00401007 FillerOrderNumberProcedure
+00401008 ConfidentialityCode
+00401009 ReportingPriority
+0040100A ReasonforRequestedProcedureCodeSequence
+00401010 NamesofIntendedRecipientsofResults
+00401011 IntendedRecipientsofResultsIdentificationSequence
+00401012 ReasonForPerformedProcedureCodeSequence
+00401060 RequestedProcedureDescriptionTrial
+00401101 PersonIdentificationCodeSequence
+00401102 PersonsAddress
+00401103 PersonsTelephoneNumbers
+00401104 PersonsTelecomInformation
+00401400 RequestedProcedureComments
+00402001 ReasonfortheImagingServiceRequest
+00402004 IssueDateofImagingServiceRequest
+00402005 IssueTimeofImagingServiceRequest
+00402006 PlacerOrderNumberImagingServiceRequestRetired
+00402007 FillerOrderNumberImagingServiceRequestRetired
+00402008 OrderEnteredBy
+00402009 OrderEnterersLocation
+00402010 OrderCallbackPhoneNumber
+00402011 OrderCallbackTelecomInformation
+00402016 PlacerOrderNumberImagingServiceRequest
+00402017 FillerOrderNumberImagingServiceRequest
+00402400 ImagingServiceRequestComments
+00403001 ConfidentialityConstraintonPatientDataDescription
+00404001 GeneralPurposeScheduledProcedureStepStatus
+00404002 GeneralPurposePerformedProcedureStepStatus
+00404003 GeneralPurposeScheduledProcedureStepPriority
+00404004 ScheduledProcessingApplicationsCodeSequence
+00404005 ScheduledProcedureStepStartDateTime
+00404006 MultipleCopiesFlag
+00404007 PerformedProcessingApplicationsCodeSequence
+00404009 HumanPerformerCodeSequence
+00404010 ScheduledProcedureStepModificationDateTime
+00404011 ExpectedCompletionDateTime
+00404015 ResultingGeneralPurposePerformedProcedureStepsSequence
+00404016 ReferencedGeneralPurposeScheduledProcedureStepSequence
+00404018 ScheduledWorkitemCodeSequence
+00404019 PerformedWorkitemCodeSequence
+00404020 InputAvailabilityFlag
+00404021 InputInformationSequence
+00404022 RelevantInformationSequence
+00404023 ReferencedGeneralPurposeScheduledProcedureStepTransactionUID
+00404025 ScheduledStationNameCodeSequence
+00404026 ScheduledStationClassCodeSequence
+00404027 ScheduledStationGeographicLocationCodeSequence
+00404028 PerformedStationNameCodeSequence
+00404029 PerformedStationClassCodeSequence
+00404030 PerformedStationGeographicLocationCodeSequence
+00404031 RequestedSubsequentWorkitemCodeSequence
+00404032 NonDICOMOutputCodeSequence
+00404033 OutputInformationSequence
+00404034 ScheduledHumanPerformersSequence
+00404035 ActualHumanPerformersSequence
+00404036 HumanPerformersOrganization
+00404037 HumanPerformersName
+00404040 RawDataHandling
+00404041 InputReadinessState
+00404050 PerformedProcedureStepStartDateTime
+00404051 PerformedProcedureStepEndDateTime
+00404052 ProcedureStepCancellationDateTime
+00404070 OutputDestinationSequence
+00404071 DICOMStorageSequence
+00404072 STOWRSStorageSequence
+00404073 StorageURL
+00404074 XDSStorageSequence
+00408302 EntranceDoseinmGy
+00409092 ParametricMapFrameTypeSequence
+00409094 ReferencedImageRealWorldValueMappingSequence
+00409096 RealWorldValueMappingSequence
+00409098 PixelValueMappingCodeSequence
+00409210 LUTLabel
+00409211 RealWorldValueLastValueMapped
+00409212 RealWorldValueLUTData
+00409213 DoubleFloatRealWorldValueLastValueMapped
+00409214 DoubleFloatRealWorldValueFirstValueMapped
+00409216 RealWorldValueFirstValueMapped
+00409220 QuantityDefinitionSequence
+00409224 RealWorldValueIntercept
+00409225 RealWorldValueSlope
+0040A007 FindingsFlagTrial
+0040A010 RelationshipType
+0040A020 FindingsSequenceTrial
+0040A021 FindingsGroupUIDTrial
+0040A022 ReferencedFindingsGroupUIDTrial
+0040A023 FindingsGroupRecordingDateTrial
+0040A024 FindingsGroupRecordingTimeTrial
+0040A026 FindingsSourceCategoryCodeSequenceTrial
+0040A027 VerifyingOrganization
+0040A028 DocumentingOrganizationIdentifierCodeSequenceTrial
+0040A030 VerificationDateTime
+0040A032 ObservationDateTime
+0040A040 ValueType
+0040A043 ConceptNameCodeSequence
+0040A047 MeasurementPrecisionDescriptionTrial
+0040A050 ContinuityOfContent
+0040A057 UrgencyorPriorityAlertsTrial
+0040A060 SequencingIndicatorTrial
+0040A066 DocumentIdentifierCodeSequenceTrial
+0040A067 DocumentAuthorTrial
+0040A068 DocumentAuthorIdentifierCodeSequenceTrial
+0040A070 IdentifierCodeSequenceTrial
+0040A073 VerifyingObserverSequence
+0040A074 ObjectBinaryIdentifierTrial
+0040A075 VerifyingObserverName
+0040A076 DocumentingObserverIdentifierCodeSequenceTrial
+0040A078 AuthorObserverSequence
+0040A07A ParticipantSequence
+0040A07C CustodialOrganizationSequence
+0040A080 ParticipationType
+0040A082 ParticipationDateTime
+0040A084 ObserverType
+0040A085 ProcedureIdentifierCodeSequenceTrial
+0040A088 VerifyingObserverIdentificationCodeSequence
+0040A089 ObjectDirectoryBinaryIdentifierTrial
+0040A090 EquivalentCDADocumentSequence
+0040A0B0 ReferencedWaveformChannels
+0040A110 DateofDocumentorVerbalTransactionTrial
+0040A112 TimeofDocumentCreationorVerbalTransactionTrial
+0040A120 DateTime
+0040A121 Date
+0040A122 Time
+0040A123 PersonName
+0040A124 UID
+0040A125 ReportStatusIDTrial
+0040A130 TemporalRangeType
+0040A132 ReferencedSamplePositions
+0040A136 ReferencedFrameNumbers
+0040A138 ReferencedTimeOffsets
+0040A13A ReferencedDateTime
+0040A160 TextValue
+0040A161 FloatingPointValue
+0040A162 RationalNumeratorValue
+0040A163 RationalDenominatorValue
+0040A167 ObservationCategoryCodeSequenceTrial
+0040A168 ConceptCodeSequence
+0040A16A BibliographicCitationTrial
+0040A170 PurposeofReferenceCodeSequence
+0040A171 ObservationUID
+0040A172 ReferencedObservationUIDTrial
+0040A173 ReferencedObservationClassTrial
+0040A174 ReferencedObjectObservationClassTrial
+0040A180 AnnotationGroupNumber
+0040A192 ObservationDateTrial
+0040A193 ObservationTimeTrial
+0040A194 MeasurementAutomationTrial
+0040A195 ModifierCodeSequence
+0040A224 IdentificationDescriptionTrial
+0040A290 CoordinatesSetGeometricTypeTrial
+0040A296 AlgorithmCodeSequenceTrial
+0040A297 AlgorithmDescriptionTrial
+0040A29A PixelCoordinatesSetTrial
+0040A300 MeasuredValueSequence
+0040A301 NumericValueQualifierCodeSequence
+0040A307 CurrentObserverTrial
+0040A30A NumericValue
+0040A313 ReferencedAccessionSequenceTrial
+0040A33A ReportStatusCommentTrial
+0040A340 ProcedureContextSequenceTrial
+0040A352 VerbalSourceTrial
+0040A353 AddressTrial
+0040A354 TelephoneNumberTrial
+0040A358 VerbalSourceIdentifierCodeSequenceTrial
+0040A360 PredecessorDocumentsSequence
+0040A370 ReferencedRequestSequence
+0040A372 PerformedProcedureCodeSequence
+0040A375 CurrentRequestedProcedureEvidenceSequence
+0040A380 ReportDetailSequenceTrial
+0040A385 PertinentOtherEvidenceSequence
+0040A390 HL7StructuredDocumentReferenceSequence
+0040A402 ObservationSubjectUIDTrial
+0040A403 ObservationSubjectClassTrial
+0040A404 ObservationSubjectTypeCodeSequenceTrial
+0040A491 CompletionFlag
+0040A492 CompletionFlagDescription
+0040A493 VerificationFlag
+0040A494 ArchiveRequested
+0040A496 PreliminaryFlag
+0040A504 ContentTemplateSequence
+0040A525 IdenticalDocumentsSequence
+0040A600 ObservationSubjectContextFlagTrial
+0040A601 ObserverContextFlagTrial
+0040A603 ProcedureContextFlagTrial
+0040A730 ContentSequence
+0040A731 RelationshipSequenceTrial
+0040A732 RelationshipTypeCodeSequenceTrial
+0040A744 LanguageCodeSequenceTrial
+0040A992 UniformResourceLocatorTrial
+0040B020 WaveformAnnotationSequence
+0040DB00 TemplateIdentifier
+0040DB06 TemplateVersion
+0040DB07 TemplateLocalVersion
+0040DB0B TemplateExtensionFlag
+0040DB0C TemplateExtensionOrganizationUID
+0040DB0D TemplateExtensionCreatorUID
+0040DB73 ReferencedContentItemIdentifier
+0040E001 HL7InstanceIdentifier
+0040E004 HL7DocumentEffectiveTime
+0040E006 HL7DocumentTypeCodeSequence
+0040E008 DocumentClassCodeSequence
+0040E010 RetrieveURI
+0040E011 RetrieveLocationUID
+0040E020 TypeofInstances
+0040E021 DICOMRetrievalSequence
+0040E022 DICOMMediaRetrievalSequence
+0040E023 WADORetrievalSequence
+0040E024 XDSRetrievalSequence
+0040E025 WADORSRetrievalSequence
+0040E030 RepositoryUniqueID
+0040E031 HomeCommunityID
+00420010 DocumentTitle
+00420011 EncapsulatedDocument
+00420012 MIMETypeofEncapsulatedDocument
+00420013 SourceInstanceSequence
+00420014 ListofMIMETypes
+00440001 ProductPackageIdentifier
+00440002 SubstanceAdministrationApproval
+00440003 ApprovalStatusFurtherDescription
+00440004 ApprovalStatusDateTime
+00440007 ProductTypeCodeSequence
+00440008 ProductName
+00440009 ProductDescription
+0044000A ProductLotIdentifier
+0044000B ProductExpirationDateTime
+00440010 SubstanceAdministrationDateTime
+00440011 SubstanceAdministrationNotes
+00440012 SubstanceAdministrationDeviceID
+00440013 ProductParameterSequence
+00440019 SubstanceAdministrationParameterSequence
+00460012 LensDescription
+00460014 RightLensSequence
+00460015 LeftLensSequence
+00460016 UnspecifiedLateralityLensSequence
+00460018 CylinderSequence
+00460028 PrismSequence
+00460030 HorizontalPrismPower
+00460032 HorizontalPrismBase
+00460034 VerticalPrismPower
+00460036 VerticalPrismBase
+00460038 LensSegmentType
+00460040 OpticalTransmittance
+00460042 ChannelWidth
+00460044 PupilSize
+00460046 CornealSize
+00460050 AutorefractionRightEyeSequence
+00460052 AutorefractionLeftEyeSequence
+00460060 DistancePupillaryDistance
+00460062 NearPupillaryDistance
+00460063 IntermediatePupillaryDistance
+00460064 OtherPupillaryDistance
+00460070 KeratometryRightEyeSequence
+00460071 KeratometryLeftEyeSequence
+00460074 SteepKeratometricAxisSequence
+00460075 RadiusofCurvature
+00460076 KeratometricPower
+00460077 KeratometricAxis
+00460080 FlatKeratometricAxisSequence
+00460092 BackgroundColor
+00460094 Optotype
+00460095 OptotypePresentation
+00460097 SubjectiveRefractionRightEyeSequence
+00460098 SubjectiveRefractionLeftEyeSequence
+00460100 AddNearSequence
+00460101 AddIntermediateSequence
+00460102 AddOtherSequence
+00460104 AddPower
+00460106 ViewingDistance
+00460121 VisualAcuityTypeCodeSequence
+00460122 VisualAcuityRightEyeSequence
+00460123 VisualAcuityLeftEyeSequence
+00460124 VisualAcuityBothEyesOpenSequence
+00460125 ViewingDistanceType
+00460135 VisualAcuityModifiers
+00460137 DecimalVisualAcuity
+00460139 OptotypeDetailedDefinition
+00460145 ReferencedRefractiveMeasurementsSequence
+00460146 SpherePower
+00460147 CylinderPower
+00460201 CornealTopographySurface
+00460202 CornealVertexLocation
+00460203 PupilCentroidXCoordinate
+00460204 PupilCentroidYCoordinate
+00460205 EquivalentPupilRadius
+00460207 CornealTopographyMapTypeCodeSequence
+00460208 VerticesoftheOutlineofPupil
+00460210 CornealTopographyMappingNormalsSequence
+00460211 MaximumCornealCurvatureSequence
+00460212 MaximumCornealCurvature
+00460213 MaximumCornealCurvatureLocation
+00460215 MinimumKeratometricSequence
+00460218 SimulatedKeratometricCylinderSequence
+00460220 AverageCornealPower
+00460224 CornealISValue
+00460227 AnalyzedArea
+00460230 SurfaceRegularityIndex
+00460232 SurfaceAsymmetryIndex
+00460234 CornealEccentricityIndex
+00460236 KeratoconusPredictionIndex
+00460238 DecimalPotentialVisualAcuity
+00460242 CornealTopographyMapQualityEvaluation
+00460244 SourceImageCornealProcessedDataSequence
+00460247 CornealPointLocation
+00460248 CornealPointEstimated
+00460249 AxialPower
+00460250 TangentialPower
+00460251 RefractivePower
+00460252 RelativeElevation
+00460253 CornealWavefront
+00480001 ImagedVolumeWidth
+00480002 ImagedVolumeHeight
+00480003 ImagedVolumeDepth
+00480006 TotalPixelMatrixColumns
+00480007 TotalPixelMatrixRows
+00480008 TotalPixelMatrixOriginSequence
+00480010 SpecimenLabelinImage
+00480011 FocusMethod
+00480012 ExtendedDepthofField
+00480013 NumberofFocalPlanes
+00480014 DistanceBetweenFocalPlanes
+00480015 RecommendedAbsentPixelCIELabValue
+00480100 IlluminatorTypeCodeSequence
+00480102 ImageOrientationSlide
+00480105 OpticalPathSequence
+00480106 OpticalPathIdentifier
+00480107 OpticalPathDescription
+00480108 IlluminationColorCodeSequence
+00480110 SpecimenReferenceSequence
+00480111 CondenserLensPower
+00480112 ObjectiveLensPower
+00480113 ObjectiveLensNumericalAperture
+00480120 PaletteColorLookupTableSequence
+00480200 ReferencedImageNavigationSequence
+00480201 TopLeftHandCornerofLocalizerArea
+00480202 BottomRightHandCornerofLocalizerArea
+00480207 OpticalPathIdentificationSequence
+0048021A PlanePositionSlideSequence
+0048021E ColumnPositionInTotalImagePixelMatrix
+0048021F RowPositionInTotalImagePixelMatrix
+00480301 PixelOriginInterpretation
+00500004 CalibrationImage
+00500010 DeviceSequence
+00500012 ContainerComponentTypeCodeSequence
+00500013 ContainerComponentThickness
+00500014 DeviceLength
+00500015 ContainerComponentWidth
+00500016 DeviceDiameter
+00500017 DeviceDiameterUnits
+00500018 DeviceVolume
+00500019 InterMarkerDistance
+0050001A ContainerComponentMaterial
+0050001B ContainerComponentID
+0050001C ContainerComponentLength
+0050001D ContainerComponentDiameter
+0050001E ContainerComponentDescription
+00500020 DeviceDescription
+00520001 ContrastBolusIngredientPercentbyVolume
+00520002 OCTFocalDistance
+00520003 BeamSpotSize
+00520004 EffectiveRefractiveIndex
+00520006 OCTAcquisitionDomain
+00520007 OCTOpticalCenterWavelength
+00520008 AxialResolution
+00520009 RangingDepth
+00520011 AlineRate
+00520012 AlinesPerFrame
+00520013 CatheterRotationalRate
+00520014 AlinePixelSpacing
+00520016 ModeofPercutaneousAccessSequence
+00520025 IntravascularOCTFrameTypeSequence
+00520026 OCTZOffsetApplied
+00520027 IntravascularFrameContentSequence
+00520028 IntravascularLongitudinalDistance
+00520029 IntravascularOCTFrameContentSequence
+00520030 OCTZOffsetCorrection
+00520031 CatheterDirectionofRotation
+00520033 SeamLineLocation
+00520034 FirstAlineLocation
+00520036 SeamLineIndex
+00520038 NumberofPaddedAlines
+00520039 InterpolationType
+0052003A RefractiveIndexApplied
+00540010 EnergyWindowVector
+00540011 NumberofEnergyWindows
+00540012 EnergyWindowInformationSequence
+00540013 EnergyWindowRangeSequence
+00540014 EnergyWindowLowerLimit
+00540015 EnergyWindowUpperLimit
+00540016 RadiopharmaceuticalInformationSequence
+00540017 ResidualSyringeCounts
+00540018 EnergyWindowName
+00540020 DetectorVector
+00540021 NumberofDetectors
+00540022 DetectorInformationSequence
+00540030 PhaseVector
+00540031 NumberofPhases
+00540032 PhaseInformationSequence
+00540033 NumberofFramesinPhase
+00540036 PhaseDelay
+00540038 PauseBetweenFrames
+00540039 PhaseDescription
+00540050 RotationVector
+00540051 NumberofRotations
+00540052 RotationInformationSequence
+00540053 NumberofFramesinRotation
+00540060 RRIntervalVector
+00540061 NumberofRRIntervals
+00540062 GatedInformationSequence
+00540063 DataInformationSequence
+00540070 TimeSlotVector
+00540071 NumberofTimeSlots
+00540072 TimeSlotInformationSequence
+00540073 TimeSlotTime
+00540080 SliceVector
+00540081 NumberofSlices
+00540090 AngularViewVector
+00540100 TimeSliceVector
+00540101 NumberofTimeSlices
+00540200 StartAngle
+00540202 TypeofDetectorMotion
+00540210 TriggerVector
+00540211 NumberofTriggersinPhase
+00540220 ViewCodeSequence
+00540222 ViewModifierCodeSequence
+00540300 RadionuclideCodeSequence
+00540302 AdministrationRouteCodeSequence
+00540304 RadiopharmaceuticalCodeSequence
+00540306 CalibrationDataSequence
+00540308 EnergyWindowNumber
+00540400 ImageID
+00540410 PatientOrientationCodeSequence
+00540412 PatientOrientationModifierCodeSequence
+00540414 PatientGantryRelationshipCodeSequence
+00540500 SliceProgressionDirection
+00540501 ScanProgressionDirection
+00541000 SeriesType
+00541001 Units
+00541002 CountsSource
+00541004 ReprojectionMethod
+00541006 SUVType
+00541100 RandomsCorrectionMethod
+00541101 AttenuationCorrectionMethod
+00541102 DecayCorrection
+00541103 ReconstructionMethod
+00541104 DetectorLinesofResponseUsed
+00541105 ScatterCorrectionMethod
+00541200 AxialAcceptance
+00541201 AxialMash
+00541202 TransverseMash
+00541203 DetectorElementSize
+00541210 CoincidenceWindowWidth
+00541220 SecondaryCountsType
+00541300 FrameReferenceTime
+00541310 PrimaryPromptsCountsAccumulated
+00541311 SecondaryCountsAccumulated
+00541320 SliceSensitivityFactor
+00541321 DecayFactor
+00541322 DoseCalibrationFactor
+00541323 ScatterFractionFactor
+00541324 DeadTimeFactor
+00541330 ImageIndex
+00541400 CountsIncluded
+00541401 DeadTimeCorrectionFlag
+00603000 HistogramSequence
+00603002 HistogramNumberofBins
+00603004 HistogramFirstBinValue
+00603006 HistogramLastBinValue
+00603008 HistogramBinWidth
+00603010 HistogramExplanation
+00603020 HistogramData
+00620001 SegmentationType
+00620002 SegmentSequence
+00620003 SegmentedPropertyCategoryCodeSequence
+00620004 SegmentNumber
+00620005 SegmentLabel
+00620006 SegmentDescription
+00620008 SegmentAlgorithmType
+00620009 SegmentAlgorithmName
+0062000A SegmentIdentificationSequence
+0062000B ReferencedSegmentNumber
+0062000C RecommendedDisplayGrayscaleValue
+0062000D RecommendedDisplayCIELabValue
+0062000E MaximumFractionalValue
+0062000F SegmentedPropertyTypeCodeSequence
+00620010 SegmentationFractionalType
+00620011 SegmentedPropertyTypeModifierCodeSequence
+00620012 UsedSegmentsSequence
+00620020 TrackingID
+00620021 TrackingUID
+00640002 DeformableRegistrationSequence
+00640003 SourceFrameofReferenceUID
+00640005 DeformableRegistrationGridSequence
+00640007 GridDimensions
+00640008 GridResolution
+00640009 VectorGridData
+0064000F PreDeformationMatrixRegistrationSequence
+00640010 PostDeformationMatrixRegistrationSequence
+00660001 NumberofSurfaces
+00660002 SurfaceSequence
+00660003 SurfaceNumber
+00660004 SurfaceComments
+00660009 SurfaceProcessing
+0066000A SurfaceProcessingRatio
+0066000B SurfaceProcessingDescription
+0066000C RecommendedPresentationOpacity
+0066000D RecommendedPresentationType
+0066000E FiniteVolume
+00660010 Manifold
+00660011 SurfacePointsSequence
+00660012 SurfacePointsNormalsSequence
+00660013 SurfaceMeshPrimitivesSequence
+00660015 NumberofSurfacePoints
+00660016 PointCoordinatesData
+00660017 PointPositionAccuracy
+00660018 MeanPointDistance
+00660019 MaximumPointDistance
+0066001A PointsBoundingBoxCoordinates
+0066001B AxisofRotation
+0066001C CenterofRotation
+0066001E NumberofVectors
+0066001F VectorDimensionality
+00660020 VectorAccuracy
+00660021 VectorCoordinateData
+00660023 TrianglePointIndexList
+00660024 EdgePointIndexList
+00660025 VertexPointIndexList
+00660026 TriangleStripSequence
+00660027 TriangleFanSequence
+00660028 LineSequence
+00660029 PrimitivePointIndexList
+0066002A SurfaceCount
+0066002B ReferencedSurfaceSequence
+0066002C ReferencedSurfaceNumber
+0066002D SegmentSurfaceGenerationAlgorithmIdentificationSequence
+0066002E SegmentSurfaceSourceInstanceSequence
+0066002F AlgorithmFamilyCodeSequence
+00660030 AlgorithmNameCodeSequence
+00660031 AlgorithmVersion
+00660032 AlgorithmParameters
+00660034 FacetSequence
+00660035 SurfaceProcessingAlgorithmIdentificationSequence
+00660036 AlgorithmName
+00660037 RecommendedPointRadius
+00660038 RecommendedLineThickness
+00660040 LongPrimitivePointIndexList
+00660041 LongTrianglePointIndexList
+00660042 LongEdgePointIndexList
+00660043 LongVertexPointIndexList
+00660101 TrackSetSequence
+00660102 TrackSequence
+00660103 RecommendedDisplayCIELabValueList
+00660104 TrackingAlgorithmIdentificationSequence
+00660105 TrackSetNumber
+00660106 TrackSetLabel
+00660107 TrackSetDescription
+00660108 TrackSetAnatomicalTypeCodeSequence
+00660121 MeasurementsSequence
+00660124 TrackSetStatisticsSequence
+00660125 FloatingPointValues
+00660129 TrackPointIndexList
+00660130 TrackStatisticsSequence
+00660132 MeasurementValuesSequence
+00660133 DiffusionAcquisitionCodeSequence
+00660134 DiffusionModelCodeSequence
+00686210 ImplantSize
+00686221 ImplantTemplateVersion
+00686222 ReplacedImplantTemplateSequence
+00686223 ImplantType
+00686224 DerivationImplantTemplateSequence
+00686225 OriginalImplantTemplateSequence
+00686226 EffectiveDateTime
+00686230 ImplantTargetAnatomySequence
+00686260 InformationFromManufacturerSequence
+00686265 NotificationFromManufacturerSequence
+00686270 InformationIssueDateTime
+00686280 InformationSummary
+006862A0 ImplantRegulatoryDisapprovalCodeSequence
+006862A5 OverallTemplateSpatialTolerance
+006862C0 HPGLDocumentSequence
+006862D0 HPGLDocumentID
+006862D5 HPGLDocumentLabel
+006862E0 ViewOrientationCodeSequence
+006862F0 ViewOrientationModifier
+006862F2 HPGLDocumentScaling
+00686300 HPGLDocument
+00686310 HPGLContourPenNumber
+00686320 HPGLPenSequence
+00686330 HPGLPenNumber
+00686340 HPGLPenLabel
+00686345 HPGLPenDescription
+00686346 RecommendedRotationPoint
+00686347 BoundingRectangle
+00686350 ImplantTemplate3DModelSurfaceNumber
+00686360 SurfaceModelDescriptionSequence
+00686380 SurfaceModelLabel
+00686390 SurfaceModelScalingFactor
+006863A0 MaterialsCodeSequence
+006863A4 CoatingMaterialsCodeSequence
+006863A8 ImplantTypeCodeSequence
+006863AC FixationMethodCodeSequence
+006863B0 MatingFeatureSetsSequence
+006863C0 MatingFeatureSetID
+006863D0 MatingFeatureSetLabel
+006863E0 MatingFeatureSequence
+006863F0 MatingFeatureID
+00686400 MatingFeatureDegreeofFreedomSequence
+00686410 DegreeofFreedomID
+00686420 DegreeofFreedomType
+00686430 TwoDMatingFeatureCoordinatesSequence
+00686440 ReferencedHPGLDocumentID
+00686450 TwoDMatingPoint
+00686460 TwoDMatingAxes
+00686470 TwoDDegreeofFreedomSequence
+00686490 ThreeDDegreeofFreedomAxis
+006864A0 RangeofFreedom
+006864C0 ThreeDMatingPoint
+006864D0 ThreeDMatingAxes
+006864F0 TwoDDegreeofFreedomAxis
+00686500 PlanningLandmarkPointSequence
+00686510 PlanningLandmarkLineSequence
+00686520 PlanningLandmarkPlaneSequence
+00686530 PlanningLandmarkID
+00686540 PlanningLandmarkDescription
+00686545 PlanningLandmarkIdentificationCodeSequence
+00686550 TwoDPointCoordinatesSequence
+00686560 TwoDPointCoordinates
+00686590 ThreeDPointCoordinates
+006865A0 TwoDLineCoordinatesSequence
+006865B0 TwoDLineCoordinates
+006865D0 ThreeDLineCoordinates
+006865E0 TwoDPlaneCoordinatesSequence
+006865F0 TwoDPlaneIntersection
+00686610 ThreeDPlaneOrigin
+00686620 ThreeDPlaneNormal
+00700001 GraphicAnnotationSequence
+00700002 GraphicLayer
+00700003 BoundingBoxAnnotationUnits
+00700004 AnchorPointAnnotationUnits
+00700005 GraphicAnnotationUnits
+00700006 UnformattedTextValue
+00700008 TextObjectSequence
+00700009 GraphicObjectSequence
+00700010 BoundingBoxTopLeftHandCorner
+00700011 BoundingBoxBottomRightHandCorner
+00700012 BoundingBoxTextHorizontalJustification
+00700014 AnchorPoint
+00700015 AnchorPointVisibility
+00700020 GraphicDimensions
+00700021 NumberofGraphicPoints
+00700022 GraphicData
+00700023 GraphicType
+00700024 GraphicFilled
+00700040 ImageRotationRetired
+00700041 ImageHorizontalFlip
+00700042 ImageRotation
+00700050 DisplayedAreaTopLeftHandCornerTrial
+00700051 DisplayedAreaBottomRightHandCornerTrial
+00700052 DisplayedAreaTopLeftHandCorner
+00700053 DisplayedAreaBottomRightHandCorner
+0070005A DisplayedAreaSelectionSequence
+00700060 GraphicLayerSequence
+00700062 GraphicLayerOrder
+00700066 GraphicLayerRecommendedDisplayGrayscaleValue
+00700067 GraphicLayerRecommendedDisplayRGBValue
+00700068 GraphicLayerDescription
+00700080 ContentLabel
+00700081 ContentDescription
+00700082 PresentationCreationDate
+00700083 PresentationCreationTime
+00700084 ContentCreatorsName
+00700086 ContentCreatorsIdentificationCodeSequence
+00700087 AlternateContentDescriptionSequence
+00700100 PresentationSizeMode
+00700101 PresentationPixelSpacing
+00700102 PresentationPixelAspectRatio
+00700103 PresentationPixelMagnificationRatio
+00700207 GraphicGroupLabel
+00700208 GraphicGroupDescription
+00700209 CompoundGraphicSequence
+00700226 CompoundGraphicInstanceID
+00700227 FontName
+00700228 FontNameType
+00700229 CSSFontName
+00700230 RotationAngle
+00700231 TextStyleSequence
+00700232 LineStyleSequence
+00700233 FillStyleSequence
+00700234 GraphicGroupSequence
+00700241 TextColorCIELabValue
+00700242 HorizontalAlignment
+00700243 VerticalAlignment
+00700244 ShadowStyle
+00700245 ShadowOffsetX
+00700246 ShadowOffsetY
+00700247 ShadowColorCIELabValue
+00700248 Underlined
+00700249 Bold
+00700250 Italic
+00700251 PatternOnColorCIELabValue
+00700252 PatternOffColorCIELabValue
+00700253 LineThickness
+00700254 LineDashingStyle
+00700255 LinePattern
+00700256 FillPattern
+00700257 FillMode
+00700258 ShadowOpacity
+00700261 GapLength
+00700262 DiameterofVisibility
+00700273 RotationPoint
+00700274 TickAlignment
+00700278 ShowTickLabel
+00700279 TickLabelAlignment
+00700282 CompoundGraphicUnits
+00700284 PatternOnOpacity
+00700285 PatternOffOpacity
+00700287 MajorTicksSequence
+00700288 TickPosition
+00700289 TickLabel
+00700294 CompoundGraphicType
+00700295 GraphicGroupID
+00700306 ShapeType
+00700308 RegistrationSequence
+00700309 MatrixRegistrationSequence
+0070030A MatrixSequence
+0070030B FrameofReferencetoDisplayedCoordinateSystemTransformationMatrix
+0070030C FrameofReferenceTransformationMatrixType
+0070030D RegistrationTypeCodeSequence
+0070030F FiducialDescription
+00700310 FiducialIdentifier
+00700311 FiducialIdentifierCodeSequence
+00700312 ContourUncertaintyRadius
+00700314 UsedFiducialsSequence
+00700318 GraphicCoordinatesDataSequence
+0070031A FiducialUID
+0070031C FiducialSetSequence
+0070031E FiducialSequence
+00700401 GraphicLayerRecommendedDisplayCIELabValue
+00700402 BlendingSequence
+00700403 RelativeOpacity
+00700404 ReferencedSpatialRegistrationSequence
+00700405 BlendingPosition
+00701101 PresentationDisplayCollectionUID
+00701102 PresentationSequenceCollectionUID
+00701103 PresentationSequencePositionIndex
+00701104 RenderedImageReferenceSequence
+00701201 VolumetricPresentationStateInputSequence
+00701202 PresentationInputType
+00701203 InputSequencePositionIndex
+00701204 Crop
+00701205 CroppingSpecificationIndex
+00701206 CompositingMethod
+00701207 VolumetricPresentationInputNumber
+00701208 ImageVolumeGeometry
+00701301 VolumeCroppingSequence
+00701302 VolumeCroppingMethod
+00701303 BoundingBoxCrop
+00701304 ObliqueCroppingPlaneSequence
+00701305 Plane
+00701306 PlaneNormal
+00701309 CroppingSpecificationNumber
+00701501 MultiPlanarReconstructionStyle
+00701502 MPRThicknessType
+00701503 MPRSlabThickness
+00701505 MPRTopLeftHandCorner
+00701507 MPRViewWidthDirection
+00701508 MPRViewWidth
+0070150C NumberofVolumetricCurvePoints
+0070150D VolumetricCurvePoints
+00701511 MPRViewHeightDirection
+00701512 MPRViewHeight
+00701801 PresentationStateClassificationComponentSequence
+00701802 ComponentType
+00701803 ComponentInputSequence
+00701804 VolumetricPresentationInputIndex
+00701805 PresentationStateCompositorComponentSequence
+00701806 WeightingTransferFunctionSequence
+00701807 WeightingLookupTableDescriptor
+00701808 WeightingLookupTableData
+00701901 VolumetricAnnotationSequence
+00701903 ReferencedStructuredContextSequence
+00701904 ReferencedContentItem
+00701905 VolumetricPresentationInputAnnotationSequence
+00701907 AnnotationClipping
+00701A01 PresentationAnimationStyle
+00701A03 RecommendedAnimationRate
+00701A04 AnimationCurveSequence
+00701A05 AnimationStepSize
+00720002 HangingProtocolName
+00720004 HangingProtocolDescription
+00720006 HangingProtocolLevel
+00720008 HangingProtocolCreator
+0072000A HangingProtocolCreationDateTime
+0072000C HangingProtocolDefinitionSequence
+0072000E HangingProtocolUserIdentificationCodeSequence
+00720010 HangingProtocolUserGroupName
+00720012 SourceHangingProtocolSequence
+00720014 NumberofPriorsReferenced
+00720020 ImageSetsSequence
+00720022 ImageSetSelectorSequence
+00720024 ImageSetSelectorUsageFlag
+00720026 SelectorAttribute
+00720028 SelectorValueNumber
+00720030 TimeBasedImageSetsSequence
+00720032 ImageSetNumber
+00720034 ImageSetSelectorCategory
+00720038 RelativeTime
+0072003A RelativeTimeUnits
+0072003C AbstractPriorValue
+0072003E AbstractPriorCodeSequence
+00720040 ImageSetLabel
+00720050 SelectorAttributeVR
+00720052 SelectorSequencePointer
+00720054 SelectorSequencePointerPrivateCreator
+00720056 SelectorAttributePrivateCreator
+0072005E SelectorAEValue
+0072005F SelectorASValue
+00720060 SelectorATValue
+00720061 SelectorDAValue
+00720062 SelectorCSValue
+00720063 SelectorDTValue
+00720064 SelectorISValue
+00720065 SelectorOBValue
+00720066 SelectorLOValue
+00720067 SelectorOFValue
+00720068 SelectorLTValue
+00720069 SelectorOWValue
+0072006A SelectorPNValue
+0072006B SelectorTMValue
+0072006C SelectorSHValue
+0072006D SelectorUNValue
+0072006E SelectorSTValue
+0072006F SelectorUCValue
+00720070 SelectorUTValue
+00720071 SelectorURValue
+00720072 SelectorDSValue
+00720073 SelectorODValue
+00720074 SelectorFDValue
+00720075 SelectorOLValue
+00720076 SelectorFLValue
+00720078 SelectorULValue
+0072007A SelectorUSValue
+0072007C SelectorSLValue
+0072007E SelectorSSValue
+0072007F SelectorUIValue
+00720080 SelectorCodeSequenceValue
+00720100 NumberofScreens
+00720102 NominalScreenDefinitionSequence
+00720104 NumberofVerticalPixels
+00720106 NumberofHorizontalPixels
+00720108 DisplayEnvironmentSpatialPosition
+0072010A ScreenMinimumGrayscaleBitDepth
+0072010C ScreenMinimumColorBitDepth
+0072010E ApplicationMaximumRepaintTime
+00720200 DisplaySetsSequence
+00720202 DisplaySetNumber
+00720203 DisplaySetLabel
+00720204 DisplaySetPresentationGroup
+00720206 DisplaySetPresentationGroupDescription
+00720208 PartialDataDisplayHandling
+00720210 SynchronizedScrollingSequence
+00720212 DisplaySetScrollingGroup
+00720214 NavigationIndicatorSequence
+00720216 NavigationDisplaySet
+00720218 ReferenceDisplaySets
+00720300 ImageBoxesSequence
+00720302 ImageBoxNumber
+00720304 ImageBoxLayoutType
+00720306 ImageBoxTileHorizontalDimension
+00720308 ImageBoxTileVerticalDimension
+00720310 ImageBoxScrollDirection
+00720312 ImageBoxSmallScrollType
+00720314 ImageBoxSmallScrollAmount
+00720316 ImageBoxLargeScrollType
+00720318 ImageBoxLargeScrollAmount
+00720320 ImageBoxOverlapPriority
+00720330 CineRelativetoRealTime
+00720400 FilterOperationsSequence
+00720402 FilterbyCategory
+00720404 FilterbyAttributePresence
+00720406 FilterbyOperator
+00720420 StructuredDisplayBackgroundCIELabValue
+00720421 EmptyImageBoxCIELabValue
+00720422 StructuredDisplayImageBoxSequence
+00720424 StructuredDisplayTextBoxSequence
+00720427 ReferencedFirstFrameSequence
+00720430 ImageBoxSynchronizationSequence
+00720432 SynchronizedImageBoxList
+00720434 TypeofSynchronization
+00720500 BlendingOperationType
+00720510 ReformattingOperationType
+00720512 ReformattingThickness
+00720514 ReformattingInterval
+00720516 ReformattingOperationInitialViewDirection
+00720520 ThreeDRenderingType
+00720600 SortingOperationsSequence
+00720602 SortbyCategory
+00720604 SortingDirection
+00720700 DisplaySetPatientOrientation
+00720702 VOIType
+00720704 PseudoColorType
+00720705 PseudoColorPaletteInstanceReferenceSequence
+00720706 ShowGrayscaleInverted
+00720710 ShowImageTrueSizeFlag
+00720712 ShowGraphicAnnotationFlag
+00720714 ShowPatientDemographicsFlag
+00720716 ShowAcquisitionTechniquesFlag
+00720717 DisplaySetHorizontalJustification
+00720718 DisplaySetVerticalJustification
+00740120 ContinuationStartMeterset
+00740121 ContinuationEndMeterset
+00741000 ProcedureStepState
+00741002 ProcedureStepProgressInformationSequence
+00741004 ProcedureStepProgress
+00741006 ProcedureStepProgressDescription
+00741008 ProcedureStepCommunicationsURISequence
+0074100A ContactURI
+0074100C ContactDisplayName
+0074100E ProcedureStepDiscontinuationReasonCodeSequence
+00741020 BeamTaskSequence
+00741022 BeamTaskType
+00741024 BeamOrderIndexTrial
+00741025 AutosequenceFlag
+00741026 TableTopVerticalAdjustedPosition
+00741027 TableTopLongitudinalAdjustedPosition
+00741028 TableTopLateralAdjustedPosition
+0074102A PatientSupportAdjustedAngle
+0074102B TableTopEccentricAdjustedAngle
+0074102C TableTopPitchAdjustedAngle
+0074102D TableTopRollAdjustedAngle
+00741030 DeliveryVerificationImageSequence
+00741032 VerificationImageTiming
+00741034 DoubleExposureFlag
+00741036 DoubleExposureOrdering
+00741038 DoubleExposureMetersetTrial
+0074103A DoubleExposureFieldDeltaTrial
+00741040 RelatedReferenceRTImageSequence
+00741042 GeneralMachineVerificationSequence
+00741044 ConventionalMachineVerificationSequence
+00741046 IonMachineVerificationSequence
+00741048 FailedAttributesSequence
+0074104A OverriddenAttributesSequence
+0074104C ConventionalControlPointVerificationSequence
+0074104E IonControlPointVerificationSequence
+00741050 AttributeOccurrenceSequence
+00741052 AttributeOccurrencePointer
+00741054 AttributeItemSelector
+00741056 AttributeOccurrencePrivateCreator
+00741057 SelectorSequencePointerItems
+00741200 ScheduledProcedureStepPriority
+00741202 WorklistLabel
+00741204 ProcedureStepLabel
+00741210 ScheduledProcessingParametersSequence
+00741212 PerformedProcessingParametersSequence
+00741216 UnifiedProcedureStepPerformedProcedureSequence
+00741220 RelatedProcedureStepSequence
+00741222 ProcedureStepRelationshipType
+00741224 ReplacedProcedureStepSequence
+00741230 DeletionLock
+00741234 ReceivingAE
+00741236 RequestingAE
+00741238 ReasonforCancellation
+00741242 SCPStatus
+00741244 SubscriptionListStatus
+00741246 UnifiedProcedureStepListStatus
+00741324 BeamOrderIndex
+00741338 DoubleExposureMeterset
+0074133A DoubleExposureFieldDelta
+00741401 BrachyTaskSequence
+00741402 ContinuationStartTotalReferenceAirKerma
+00741403 ContinuationEndTotalReferenceAirKerma
+00741404 ContinuationPulseNumber
+00741405 ChannelDeliveryOrderSequence
+00741406 ReferencedChannelNumber
+00741407 StartCumulativeTimeWeight
+00741408 EndCumulativeTimeWeight
+00741409 OmittedChannelSequence
+0074140A ReasonforChannelOmission
+0074140B ReasonforChannelOmissionDescription
+0074140C ChannelDeliveryOrderIndex
+0074140D ChannelDeliveryContinuationSequence
+0074140E OmittedApplicationSetupSequence
+00760001 ImplantAssemblyTemplateName
+00760003 ImplantAssemblyTemplateIssuer
+00760006 ImplantAssemblyTemplateVersion
+00760008 ReplacedImplantAssemblyTemplateSequence
+0076000A ImplantAssemblyTemplateType
+0076000C OriginalImplantAssemblyTemplateSequence
+0076000E DerivationImplantAssemblyTemplateSequence
+00760010 ImplantAssemblyTemplateTargetAnatomySequence
+00760020 ProcedureTypeCodeSequence
+00760030 SurgicalTechnique
+00760032 ComponentTypesSequence
+00760034 ComponentTypeCodeSequence
+00760036 ExclusiveComponentType
+00760038 MandatoryComponentType
+00760040 ComponentSequence
+00760055 ComponentID
+00760060 ComponentAssemblySequence
+00760070 Component1ReferencedID
+00760080 Component1ReferencedMatingFeatureSetID
+00760090 Component1ReferencedMatingFeatureID
+007600A0 Component2ReferencedID
+007600B0 Component2ReferencedMatingFeatureSetID
+007600C0 Component2ReferencedMatingFeatureID
+00780001 ImplantTemplateGroupName
+00780010 ImplantTemplateGroupDescription
+00780020 ImplantTemplateGroupIssuer
+00780024 ImplantTemplateGroupVersion
+00780026 ReplacedImplantTemplateGroupSequence
+00780028 ImplantTemplateGroupTargetAnatomySequence
+0078002A ImplantTemplateGroupMembersSequence
+0078002E ImplantTemplateGroupMemberID
+00780050 ThreeDImplantTemplateGroupMemberMatchingPoint
+00780060 ThreeDImplantTemplateGroupMemberMatchingAxes
+00780070 ImplantTemplateGroupMemberMatching2DCoordinatesSequence
+00780090 TwoDImplantTemplateGroupMemberMatchingPoint
+007800A0 TwoDImplantTemplateGroupMemberMatchingAxes
+007800B0 ImplantTemplateGroupVariationDimensionSequence
+007800B2 ImplantTemplateGroupVariationDimensionName
+007800B4 ImplantTemplateGroupVariationDimensionRankSequence
+007800B6 ReferencedImplantTemplateGroupMemberID
+007800B8 ImplantTemplateGroupVariationDimensionRank
+00800001 SurfaceScanAcquisitionTypeCodeSequence
+00800002 SurfaceScanModeCodeSequence
+00800003 RegistrationMethodCodeSequence
+00800004 ShotDurationTime
+00800005 ShotOffsetTime
+00800006 SurfacePointPresentationValueData
+00800007 SurfacePointColorCIELabValueData
+00800008 UVMappingSequence
+00800009 TextureLabel
+00800010 UValueData
+00800011 VValueData
+00800012 ReferencedTextureSequence
+00800013 ReferencedSurfaceDataSequence
+00820001 AssessmentSummary
+00820003 AssessmentSummaryDescription
+00820004 AssessedSOPInstanceSequence
+00820005 ReferencedComparisonSOPInstanceSequence
+00820006 NumberofAssessmentObservations
+00820007 AssessmentObservationsSequence
+00820008 ObservationSignificance
+0082000A ObservationDescription
+0082000C StructuredConstraintObservationSequence
+00820010 AssessedAttributeValueSequence
+00820016 AssessmentSetID
+00820017 AssessmentRequesterSequence
+00820018 SelectorAttributeName
+00820019 SelectorAttributeKeyword
+00820021 AssessmentTypeCodeSequence
+00820022 ObservationBasisCodeSequence
+00820023 AssessmentLabel
+00820032 ConstraintType
+00820033 SpecificationSelectionGuidance
+00820034 ConstraintValueSequence
+00820035 RecommendedDefaultValueSequence
+00820036 ConstraintViolationSignificance
+00820037 ConstraintViolationCondition
+00880130 StorageMediaFilesetID
+00880140 StorageMediaFilesetUID
+00880200 IconImageSequence
+00880904 TopicTitle
+00880906 TopicSubject
+00880910 TopicAuthor
+00880912 TopicKeywords
+01000410 SOPInstanceStatus
+01000420 SOPAuthorizationDateTime
+01000424 SOPAuthorizationComment
+01000426 AuthorizationEquipmentCertificationNumber
+04000005 MACIDNumber
+04000010 MACCalculationTransferSyntaxUID
+04000015 MACAlgorithm
+04000020 DataElementsSigned
+04000100 DigitalSignatureUID
+04000105 DigitalSignatureDateTime
+04000110 CertificateType
+04000115 CertificateofSigner
+04000120 Signature
+04000305 CertifiedTimestampType
+04000310 CertifiedTimestamp
+04000401 DigitalSignaturePurposeCodeSequence
+04000402 ReferencedDigitalSignatureSequence
+04000403 ReferencedSOPInstanceMACSequence
+04000404 MAC
+04000500 EncryptedAttributesSequence
+04000510 EncryptedContentTransferSyntaxUID
+04000520 EncryptedContent
+04000550 ModifiedAttributesSequence
+04000561 OriginalAttributesSequence
+04000562 AttributeModificationDateTime
+04000563 ModifyingSystem
+04000564 SourceofPreviousValues
+04000565 ReasonfortheAttributeModification
+20000010 NumberofCopies
+2000001E PrinterConfigurationSequence
+20000020 PrintPriority
+20000030 MediumType
+20000040 FilmDestination
+20000050 FilmSessionLabel
+20000060 MemoryAllocation
+20000061 MaximumMemoryAllocation
+20000062 ColorImagePrintingFlag
+20000063 CollationFlag
+20000065 AnnotationFlag
+20000067 ImageOverlayFlag
+20000069 PresentationLUTFlag
+2000006A ImageBoxPresentationLUTFlag
+200000A0 MemoryBitDepth
+200000A1 PrintingBitDepth
+200000A2 MediaInstalledSequence
+200000A4 OtherMediaAvailableSequence
+200000A8 SupportedImageDisplayFormatsSequence
+20000500 ReferencedFilmBoxSequence
+20000510 ReferencedStoredPrintSequence
+20100010 ImageDisplayFormat
+20100030 AnnotationDisplayFormatID
+20100040 FilmOrientation
+20100050 FilmSizeID
+20100052 PrinterResolutionID
+20100054 DefaultPrinterResolutionID
+20100060 MagnificationType
+20100080 SmoothingType
+201000A6 DefaultMagnificationType
+201000A7 OtherMagnificationTypesAvailable
+201000A8 DefaultSmoothingType
+201000A9 OtherSmoothingTypesAvailable
+20100100 BorderDensity
+20100110 EmptyImageDensity
+20100120 MinDensity
+20100130 MaxDensity
+20100140 Trim
+20100150 ConfigurationInformation
+20100152 ConfigurationInformationDescription
+20100154 MaximumCollatedFilms
+2010015E Illumination
+20100160 ReflectedAmbientLight
+20100376 PrinterPixelSpacing
+20100500 ReferencedFilmSessionSequence
+20100510 ReferencedImageBoxSequence
+20100520 ReferencedBasicAnnotationBoxSequence
+20200010 ImageBoxPosition
+20200020 Polarity
+20200030 RequestedImageSize
+20200040 RequestedDecimateCropBehavior
+20200050 RequestedResolutionID
+202000A0 RequestedImageSizeFlag
+202000A2 DecimateCropResult
+20200110 BasicGrayscaleImageSequence
+20200111 BasicColorImageSequence
+20200130 ReferencedImageOverlayBoxSequence
+20200140 ReferencedVOILUTBoxSequence
+20300010 AnnotationPosition
+20300020 TextString
+20400010 ReferencedOverlayPlaneSequence
+20400011 ReferencedOverlayPlaneGroups
+20400020 OverlayPixelDataSequence
+20400060 OverlayMagnificationType
+20400070 OverlaySmoothingType
+20400072 OverlayorImageMagnification
+20400074 MagnifytoNumberofColumns
+20400080 OverlayForegroundDensity
+20400082 OverlayBackgroundDensity
+20400090 OverlayMode
+20400100 ThresholdDensity
+20400500 ReferencedImageBoxSequenceRetired
+20500010 PresentationLUTSequence
+20500020 PresentationLUTShape
+20500500 ReferencedPresentationLUTSequence
+21000010 PrintJobID
+21000020 ExecutionStatus
+21000030 ExecutionStatusInfo
+21000040 CreationDate
+21000050 CreationTime
+21000070 Originator
+21000140 DestinationAE
+21000160 OwnerID
+21000170 NumberofFilms
+21000500 ReferencedPrintJobSequencePullStoredPrint
+21100010 PrinterStatus
+21100020 PrinterStatusInfo
+21100030 PrinterName
+21100099 PrintQueueID
+21200010 QueueStatus
+21200050 PrintJobDescriptionSequence
+21200070 ReferencedPrintJobSequence
+21300010 PrintManagementCapabilitiesSequence
+21300015 PrinterCharacteristicsSequence
+21300030 FilmBoxContentSequence
+21300040 ImageBoxContentSequence
+21300050 AnnotationContentSequence
+21300060 ImageOverlayBoxContentSequence
+21300080 PresentationLUTContentSequence
+213000A0 ProposedStudySequence
+213000C0 OriginalImageSequence
+22000001 LabelUsingInformationExtractedFromInstances
+22000002 LabelText
+22000003 LabelStyleSelection
+22000004 MediaDisposition
+22000005 BarcodeValue
+22000006 BarcodeSymbology
+22000007 AllowMediaSplitting
+22000008 IncludeNonDICOMObjects
+22000009 IncludeDisplayApplication
+2200000A PreserveCompositeInstancesAfterMediaCreation
+2200000B TotalNumberofPiecesofMediaCreated
+2200000C RequestedMediaApplicationProfile
+2200000D ReferencedStorageMediaSequence
+2200000E FailureAttributes
+2200000F AllowLossyCompression
+22000020 RequestPriority
+30020002 RTImageLabel
+30020003 RTImageName
+30020004 RTImageDescription
+3002000A ReportedValuesOrigin
+3002000C RTImagePlane
+3002000D XRayImageReceptorTranslation
+3002000E XRayImageReceptorAngle
+30020010 RTImageOrientation
+30020011 ImagePlanePixelSpacing
+30020012 RTImagePosition
+30020020 RadiationMachineName
+30020022 RadiationMachineSAD
+30020024 RadiationMachineSSD
+30020026 RTImageSID
+30020028 SourcetoReferenceObjectDistance
+30020029 FractionNumber
+30020030 ExposureSequence
+30020032 MetersetExposure
+30020034 DiaphragmPosition
+30020040 FluenceMapSequence
+30020041 FluenceDataSource
+30020042 FluenceDataScale
+30020050 PrimaryFluenceModeSequence
+30020051 FluenceMode
+30020052 FluenceModeID
+30040001 DVHType
+30040002 DoseUnits
+30040004 DoseType
+30040005 SpatialTransformofDose
+30040006 DoseComment
+30040008 NormalizationPoint
+3004000A DoseSummationType
+3004000C GridFrameOffsetVector
+3004000E DoseGridScaling
+30040010 RTDoseROISequence
+30040012 DoseValue
+30040014 TissueHeterogeneityCorrection
+30040040 DVHNormalizationPoint
+30040042 DVHNormalizationDoseValue
+30040050 DVHSequence
+30040052 DVHDoseScaling
+30040054 DVHVolumeUnits
+30040056 DVHNumberofBins
+30040058 DVHData
+30040060 DVHReferencedROISequence
+30040062 DVHROIContributionType
+30040070 DVHMinimumDose
+30040072 DVHMaximumDose
+30040074 DVHMeanDose
+30060002 StructureSetLabel
+30060004 StructureSetName
+30060006 StructureSetDescription
+30060008 StructureSetDate
+30060009 StructureSetTime
+30060010 ReferencedFrameofReferenceSequence
+30060012 RTReferencedStudySequence
+30060014 RTReferencedSeriesSequence
+30060016 ContourImageSequence
+30060018 PredecessorStructureSetSequence
+30060020 StructureSetROISequence
+30060022 ROINumber
+30060024 ReferencedFrameofReferenceUID
+30060026 ROIName
+30060028 ROIDescription
+3006002A ROIDisplayColor
+3006002C ROIVolume
+30060030 RTRelatedROISequence
+30060033 RTROIRelationship
+30060036 ROIGenerationAlgorithm
+30060038 ROIGenerationDescription
+30060039 ROIContourSequence
+30060040 ContourSequence
+30060042 ContourGeometricType
+30060044 ContourSlabThickness
+30060045 ContourOffsetVector
+30060046 NumberofContourPoints
+30060048 ContourNumber
+30060049 AttachedContours
+30060050 ContourData
+30060080 RTROIObservationsSequence
+30060082 ObservationNumber
+30060084 ReferencedROINumber
+30060085 ROIObservationLabel
+30060086 RTROIIdentificationCodeSequence
+30060088 ROIObservationDescription
+300600A0 RelatedRTROIObservationsSequence
+300600A4 RTROIInterpretedType
+300600A6 ROIInterpreter
+300600B0 ROIPhysicalPropertiesSequence
+300600B2 ROIPhysicalProperty
+300600B4 ROIPhysicalPropertyValue
+300600B6 ROIElementalCompositionSequence
+300600B7 ROIElementalCompositionAtomicNumber
+300600B8 ROIElementalCompositionAtomicMassFraction
+300600B9 AdditionalRTROIIdentificationCodeSequence
+300600C0 FrameofReferenceRelationshipSequence
+300600C2 RelatedFrameofReferenceUID
+300600C4 FrameofReferenceTransformationType
+300600C6 FrameofReferenceTransformationMatrix
+300600C8 FrameofReferenceTransformationComment
+30080010 MeasuredDoseReferenceSequence
+30080012 MeasuredDoseDescription
+30080014 MeasuredDoseType
+30080016 MeasuredDoseValue
+30080020 TreatmentSessionBeamSequence
+30080021 TreatmentSessionIonBeamSequence
+30080022 CurrentFractionNumber
+30080024 TreatmentControlPointDate
+30080025 TreatmentControlPointTime
+3008002A TreatmentTerminationStatus
+3008002B TreatmentTerminationCode
+3008002C TreatmentVerificationStatus
+30080030 ReferencedTreatmentRecordSequence
+30080032 SpecifiedPrimaryMeterset
+30080033 SpecifiedSecondaryMeterset
+30080036 DeliveredPrimaryMeterset
+30080037 DeliveredSecondaryMeterset
+3008003A SpecifiedTreatmentTime
+3008003B DeliveredTreatmentTime
+30080040 ControlPointDeliverySequence
+30080041 IonControlPointDeliverySequence
+30080042 SpecifiedMeterset
+30080044 DeliveredMeterset
+30080045 MetersetRateSet
+30080046 MetersetRateDelivered
+30080047 ScanSpotMetersetsDelivered
+30080048 DoseRateDelivered
+30080050 TreatmentSummaryCalculatedDoseReferenceSequence
+30080052 CumulativeDosetoDoseReference
+30080054 FirstTreatmentDate
+30080056 MostRecentTreatmentDate
+3008005A NumberofFractionsDelivered
+30080060 OverrideSequence
+30080061 ParameterSequencePointer
+30080062 OverrideParameterPointer
+30080063 ParameterItemIndex
+30080064 MeasuredDoseReferenceNumber
+30080065 ParameterPointer
+30080066 OverrideReason
+30080068 CorrectedParameterSequence
+3008006A CorrectionValue
+30080070 CalculatedDoseReferenceSequence
+30080072 CalculatedDoseReferenceNumber
+30080074 CalculatedDoseReferenceDescription
+30080076 CalculatedDoseReferenceDoseValue
+30080078 StartMeterset
+3008007A EndMeterset
+30080080 ReferencedMeasuredDoseReferenceSequence
+30080082 ReferencedMeasuredDoseReferenceNumber
+30080090 ReferencedCalculatedDoseReferenceSequence
+30080092 ReferencedCalculatedDoseReferenceNumber
+300800A0 BeamLimitingDeviceLeafPairsSequence
+300800B0 RecordedWedgeSequence
+300800C0 RecordedCompensatorSequence
+300800D0 RecordedBlockSequence
+300800E0 TreatmentSummaryMeasuredDoseReferenceSequence
+300800F0 RecordedSnoutSequence
+300800F2 RecordedRangeShifterSequence
+300800F4 RecordedLateralSpreadingDeviceSequence
+300800F6 RecordedRangeModulatorSequence
+30080100 RecordedSourceSequence
+30080105 SourceSerialNumber
+30080110 TreatmentSessionApplicationSetupSequence
+30080116 ApplicationSetupCheck
+30080120 RecordedBrachyAccessoryDeviceSequence
+30080122 ReferencedBrachyAccessoryDeviceNumber
+30080130 RecordedChannelSequence
+30080132 SpecifiedChannelTotalTime
+30080134 DeliveredChannelTotalTime
+30080136 SpecifiedNumberofPulses
+30080138 DeliveredNumberofPulses
+3008013A SpecifiedPulseRepetitionInterval
+3008013C DeliveredPulseRepetitionInterval
+30080140 RecordedSourceApplicatorSequence
+30080142 ReferencedSourceApplicatorNumber
+30080150 RecordedChannelShieldSequence
+30080152 ReferencedChannelShieldNumber
+30080160 BrachyControlPointDeliveredSequence
+30080162 SafePositionExitDate
+30080164 SafePositionExitTime
+30080166 SafePositionReturnDate
+30080168 SafePositionReturnTime
+30080171 PulseSpecificBrachyControlPointDeliveredSequence
+30080172 PulseNumber
+30080173 BrachyPulseControlPointDeliveredSequence
+30080200 CurrentTreatmentStatus
+30080202 TreatmentStatusComment
+30080220 FractionGroupSummarySequence
+30080223 ReferencedFractionNumber
+30080224 FractionGroupType
+30080230 BeamStopperPosition
+30080240 FractionStatusSummarySequence
+30080250 TreatmentDate
+30080251 TreatmentTime
+300A0002 RTPlanLabel
+300A0003 RTPlanName
+300A0004 RTPlanDescription
+300A0006 RTPlanDate
+300A0007 RTPlanTime
+300A0009 TreatmentProtocols
+300A000A PlanIntent
+300A000B TreatmentSites
+300A000C RTPlanGeometry
+300A000E PrescriptionDescription
+300A0010 DoseReferenceSequence
+300A0012 DoseReferenceNumber
+300A0013 DoseReferenceUID
+300A0014 DoseReferenceStructureType
+300A0015 NominalBeamEnergyUnit
+300A0016 DoseReferenceDescription
+300A0018 DoseReferencePointCoordinates
+300A001A NominalPriorDose
+300A0020 DoseReferenceType
+300A0021 ConstraintWeight
+300A0022 DeliveryWarningDose
+300A0023 DeliveryMaximumDose
+300A0025 TargetMinimumDose
+300A0026 TargetPrescriptionDose
+300A0027 TargetMaximumDose
+300A0028 TargetUnderdoseVolumeFraction
+300A002A OrganatRiskFullvolumeDose
+300A002B OrganatRiskLimitDose
+300A002C OrganatRiskMaximumDose
+300A002D OrganatRiskOverdoseVolumeFraction
+300A0040 ToleranceTableSequence
+300A0042 ToleranceTableNumber
+300A0043 ToleranceTableLabel
+300A0044 GantryAngleTolerance
+300A0046 BeamLimitingDeviceAngleTolerance
+300A0048 BeamLimitingDeviceToleranceSequence
+300A004A BeamLimitingDevicePositionTolerance
+300A004B SnoutPositionTolerance
+300A004C PatientSupportAngleTolerance
+300A004E TableTopEccentricAngleTolerance
+300A004F TableTopPitchAngleTolerance
+300A0050 TableTopRollAngleTolerance
+300A0051 TableTopVerticalPositionTolerance
+300A0052 TableTopLongitudinalPositionTolerance
+300A0053 TableTopLateralPositionTolerance
+300A0055 RTPlanRelationship
+300A0070 FractionGroupSequence
+300A0071 FractionGroupNumber
+300A0072 FractionGroupDescription
+300A0078 NumberofFractionsPlanned
+300A0079 NumberofFractionPatternDigitsPerDay
+300A007A RepeatFractionCycleLength
+300A007B FractionPattern
+300A0080 NumberofBeams
+300A0082 BeamDoseSpecificationPoint
+300A0084 BeamDose
+300A0086 BeamMeterset
+300A0088 BeamDosePointDepth
+300A0089 BeamDosePointEquivalentDepth
+300A008A BeamDosePointSSD
+300A008B BeamDoseMeaning
+300A008C BeamDoseVerificationControlPointSequence
+300A008D AverageBeamDosePointDepth
+300A008E AverageBeamDosePointEquivalentDepth
+300A008F AverageBeamDosePointSSD
+300A0090 BeamDoseType
+300A0091 AlternateBeamDose
+300A0092 AlternateBeamDoseType
+300A00A0 NumberofBrachyApplicationSetups
+300A00A2 BrachyApplicationSetupDoseSpecificationPoint
+300A00A4 BrachyApplicationSetupDose
+300A00B0 BeamSequence
+300A00B2 TreatmentMachineName
+300A00B3 PrimaryDosimeterUnit
+300A00B4 SourceAxisDistance
+300A00B6 BeamLimitingDeviceSequence
+300A00B8 RTBeamLimitingDeviceType
+300A00BA SourcetoBeamLimitingDeviceDistance
+300A00BB IsocentertoBeamLimitingDeviceDistance
+300A00BC NumberofLeafJawPairs
+300A00BE LeafPositionBoundaries
+300A00C0 BeamNumber
+300A00C2 BeamName
+300A00C3 BeamDescription
+300A00C4 BeamType
+300A00C5 BeamDeliveryDurationLimit
+300A00C6 RadiationType
+300A00C7 HighDoseTechniqueType
+300A00C8 ReferenceImageNumber
+300A00CA PlannedVerificationImageSequence
+300A00CC ImagingDeviceSpecificAcquisitionParameters
+300A00CE TreatmentDeliveryType
+300A00D0 NumberofWedges
+300A00D1 WedgeSequence
+300A00D2 WedgeNumber
+300A00D3 WedgeType
+300A00D4 WedgeID
+300A00D5 WedgeAngle
+300A00D6 WedgeFactor
+300A00D7 TotalWedgeTrayWaterEquivalentThickness
+300A00D8 WedgeOrientation
+300A00D9 IsocentertoWedgeTrayDistance
+300A00DA SourcetoWedgeTrayDistance
+300A00DB WedgeThinEdgePosition
+300A00DC BolusID
+300A00DD BolusDescription
+300A00DE EffectiveWedgeAngle
+300A00E0 NumberofCompensators
+300A00E1 MaterialID
+300A00E2 TotalCompensatorTrayFactor
+300A00E3 CompensatorSequence
+300A00E4 CompensatorNumber
+300A00E5 CompensatorID
+300A00E6 SourcetoCompensatorTrayDistance
+300A00E7 CompensatorRows
+300A00E8 CompensatorColumns
+300A00E9 CompensatorPixelSpacing
+300A00EA CompensatorPosition
+300A00EB CompensatorTransmissionData
+300A00EC CompensatorThicknessData
+300A00ED NumberofBoli
+300A00EE CompensatorType
+300A00EF CompensatorTrayID
+300A00F0 NumberofBlocks
+300A00F2 TotalBlockTrayFactor
+300A00F3 TotalBlockTrayWaterEquivalentThickness
+300A00F4 BlockSequence
+300A00F5 BlockTrayID
+300A00F6 SourcetoBlockTrayDistance
+300A00F7 IsocentertoBlockTrayDistance
+300A00F8 BlockType
+300A00F9 AccessoryCode
+300A00FA BlockDivergence
+300A00FB BlockMountingPosition
+300A00FC BlockNumber
+300A00FE BlockName
+300A0100 BlockThickness
+300A0102 BlockTransmission
+300A0104 BlockNumberofPoints
+300A0106 BlockData
+300A0107 ApplicatorSequence
+300A0108 ApplicatorID
+300A0109 ApplicatorType
+300A010A ApplicatorDescription
+300A010C CumulativeDoseReferenceCoefficient
+300A010E FinalCumulativeMetersetWeight
+300A0110 NumberofControlPoints
+300A0111 ControlPointSequence
+300A0112 ControlPointIndex
+300A0114 NominalBeamEnergy
+300A0115 DoseRateSet
+300A0116 WedgePositionSequence
+300A0118 WedgePosition
+300A011A BeamLimitingDevicePositionSequence
+300A011C LeafJawPositions
+300A011E GantryAngle
+300A011F GantryRotationDirection
+300A0120 BeamLimitingDeviceAngle
+300A0121 BeamLimitingDeviceRotationDirection
+300A0122 PatientSupportAngle
+300A0123 PatientSupportRotationDirection
+300A0124 TableTopEccentricAxisDistance
+300A0125 TableTopEccentricAngle
+300A0126 TableTopEccentricRotationDirection
+300A0128 TableTopVerticalPosition
+300A0129 TableTopLongitudinalPosition
+300A012A TableTopLateralPosition
+300A012C IsocenterPosition
+300A012E SurfaceEntryPoint
+300A0130 SourcetoSurfaceDistance
+300A0131 AverageBeamDosePointSourcetoExternalContourDistance
+300A0132 SourcetoExternalContourDistance
+300A0133 ExternalContourEntryPoint
+300A0134 CumulativeMetersetWeight
+300A0140 TableTopPitchAngle
+300A0142 TableTopPitchRotationDirection
+300A0144 TableTopRollAngle
+300A0146 TableTopRollRotationDirection
+300A0148 HeadFixationAngle
+300A014A GantryPitchAngle
+300A014C GantryPitchRotationDirection
+300A014E GantryPitchAngleTolerance
+300A0150 FixationEye
+300A0151 ChairHeadFramePosition
+300A0152 HeadFixationAngleTolerance
+300A0153 ChairHeadFramePositionTolerance
+300A0154 FixationLightAzimuthalAngleTolerance
+300A0155 FixationLightPolarAngleTolerance
+300A0180 PatientSetupSequence
+300A0182 PatientSetupNumber
+300A0183 PatientSetupLabel
+300A0184 PatientAdditionalPosition
+300A0190 FixationDeviceSequence
+300A0192 FixationDeviceType
+300A0194 FixationDeviceLabel
+300A0196 FixationDeviceDescription
+300A0198 FixationDevicePosition
+300A0199 FixationDevicePitchAngle
+300A019A FixationDeviceRollAngle
+300A01A0 ShieldingDeviceSequence
+300A01A2 ShieldingDeviceType
+300A01A4 ShieldingDeviceLabel
+300A01A6 ShieldingDeviceDescription
+300A01A8 ShieldingDevicePosition
+300A01B0 SetupTechnique
+300A01B2 SetupTechniqueDescription
+300A01B4 SetupDeviceSequence
+300A01B6 SetupDeviceType
+300A01B8 SetupDeviceLabel
+300A01BA SetupDeviceDescription
+300A01BC SetupDeviceParameter
+300A01D0 SetupReferenceDescription
+300A01D2 TableTopVerticalSetupDisplacement
+300A01D4 TableTopLongitudinalSetupDisplacement
+300A01D6 TableTopLateralSetupDisplacement
+300A0200 BrachyTreatmentTechnique
+300A0202 BrachyTreatmentType
+300A0206 TreatmentMachineSequence
+300A0210 SourceSequence
+300A0212 SourceNumber
+300A0214 SourceType
+300A0216 SourceManufacturer
+300A0218 ActiveSourceDiameter
+300A021A ActiveSourceLength
+300A021B SourceModelID
+300A021C SourceDescription
+300A0222 SourceEncapsulationNominalThickness
+300A0224 SourceEncapsulationNominalTransmission
+300A0226 SourceIsotopeName
+300A0228 SourceIsotopeHalfLife
+300A0229 SourceStrengthUnits
+300A022A ReferenceAirKermaRate
+300A022B SourceStrength
+300A022C SourceStrengthReferenceDate
+300A022E SourceStrengthReferenceTime
+300A0230 ApplicationSetupSequence
+300A0232 ApplicationSetupType
+300A0234 ApplicationSetupNumber
+300A0236 ApplicationSetupName
+300A0238 ApplicationSetupManufacturer
+300A0240 TemplateNumber
+300A0242 TemplateType
+300A0244 TemplateName
+300A0250 TotalReferenceAirKerma
+300A0260 BrachyAccessoryDeviceSequence
+300A0262 BrachyAccessoryDeviceNumber
+300A0263 BrachyAccessoryDeviceID
+300A0264 BrachyAccessoryDeviceType
+300A0266 BrachyAccessoryDeviceName
+300A026A BrachyAccessoryDeviceNominalThickness
+300A026C BrachyAccessoryDeviceNominalTransmission
+300A0280 ChannelSequence
+300A0282 ChannelNumber
+300A0284 ChannelLength
+300A0286 ChannelTotalTime
+300A0288 SourceMovementType
+300A028A NumberofPulses
+300A028C PulseRepetitionInterval
+300A0290 SourceApplicatorNumber
+300A0291 SourceApplicatorID
+300A0292 SourceApplicatorType
+300A0294 SourceApplicatorName
+300A0296 SourceApplicatorLength
+300A0298 SourceApplicatorManufacturer
+300A029C SourceApplicatorWallNominalThickness
+300A029E SourceApplicatorWallNominalTransmission
+300A02A0 SourceApplicatorStepSize
+300A02A2 TransferTubeNumber
+300A02A4 TransferTubeLength
+300A02B0 ChannelShieldSequence
+300A02B2 ChannelShieldNumber
+300A02B3 ChannelShieldID
+300A02B4 ChannelShieldName
+300A02B8 ChannelShieldNominalThickness
+300A02BA ChannelShieldNominalTransmission
+300A02C8 FinalCumulativeTimeWeight
+300A02D0 BrachyControlPointSequence
+300A02D2 ControlPointRelativePosition
+300A02D4 ControlPoint3DPosition
+300A02D6 CumulativeTimeWeight
+300A02E0 CompensatorDivergence
+300A02E1 CompensatorMountingPosition
+300A02E2 SourcetoCompensatorDistance
+300A02E3 TotalCompensatorTrayWaterEquivalentThickness
+300A02E4 IsocentertoCompensatorTrayDistance
+300A02E5 CompensatorColumnOffset
+300A02E6 IsocentertoCompensatorDistances
+300A02E7 CompensatorRelativeStoppingPowerRatio
+300A02E8 CompensatorMillingToolDiameter
+300A02EA IonRangeCompensatorSequence
+300A02EB CompensatorDescription
+300A0302 RadiationMassNumber
+300A0304 RadiationAtomicNumber
+300A0306 RadiationChargeState
+300A0308 ScanMode
+300A0309 ModulatedScanModeType
+300A030A VirtualSourceAxisDistances
+300A030C SnoutSequence
+300A030D SnoutPosition
+300A030F SnoutID
+300A0312 NumberofRangeShifters
+300A0314 RangeShifterSequence
+300A0316 RangeShifterNumber
+300A0318 RangeShifterID
+300A0320 RangeShifterType
+300A0322 RangeShifterDescription
+300A0330 NumberofLateralSpreadingDevices
+300A0332 LateralSpreadingDeviceSequence
+300A0334 LateralSpreadingDeviceNumber
+300A0336 LateralSpreadingDeviceID
+300A0338 LateralSpreadingDeviceType
+300A033A LateralSpreadingDeviceDescription
+300A033C LateralSpreadingDeviceWaterEquivalentThickness
+300A0340 NumberofRangeModulators
+300A0342 RangeModulatorSequence
+300A0344 RangeModulatorNumber
+300A0346 RangeModulatorID
+300A0348 RangeModulatorType
+300A034A RangeModulatorDescription
+300A034C BeamCurrentModulationID
+300A0350 PatientSupportType
+300A0352 PatientSupportID
+300A0354 PatientSupportAccessoryCode
+300A0355 TrayAccessoryCode
+300A0356 FixationLightAzimuthalAngle
+300A0358 FixationLightPolarAngle
+300A035A MetersetRate
+300A0360 RangeShifterSettingsSequence
+300A0362 RangeShifterSetting
+300A0364 IsocentertoRangeShifterDistance
+300A0366 RangeShifterWaterEquivalentThickness
+300A0370 LateralSpreadingDeviceSettingsSequence
+300A0372 LateralSpreadingDeviceSetting
+300A0374 IsocentertoLateralSpreadingDeviceDistance
+300A0380 RangeModulatorSettingsSequence
+300A0382 RangeModulatorGatingStartValue
+300A0384 RangeModulatorGatingStopValue
+300A0386 RangeModulatorGatingStartWaterEquivalentThickness
+300A0388 RangeModulatorGatingStopWaterEquivalentThickness
+300A038A IsocentertoRangeModulatorDistance
+300A0390 ScanSpotTuneID
+300A0391 ScanSpotPrescribedIndices
+300A0392 NumberofScanSpotPositions
+300A0393 ScanSpotReordered
+300A0394 ScanSpotPositionMap
+300A0395 ScanSpotReorderingAllowed
+300A0396 ScanSpotMetersetWeights
+300A0398 ScanningSpotSize
+300A039A NumberofPaintings
+300A03A0 IonToleranceTableSequence
+300A03A2 IonBeamSequence
+300A03A4 IonBeamLimitingDeviceSequence
+300A03A6 IonBlockSequence
+300A03A8 IonControlPointSequence
+300A03AA IonWedgeSequence
+300A03AC IonWedgePositionSequence
+300A0401 ReferencedSetupImageSequence
+300A0402 SetupImageComment
+300A0410 MotionSynchronizationSequence
+300A0412 ControlPointOrientation
+300A0420 GeneralAccessorySequence
+300A0421 GeneralAccessoryID
+300A0422 GeneralAccessoryDescription
+300A0423 GeneralAccessoryType
+300A0424 GeneralAccessoryNumber
+300A0425 SourcetoGeneralAccessoryDistance
+300A0431 ApplicatorGeometrySequence
+300A0432 ApplicatorApertureShape
+300A0433 ApplicatorOpening
+300A0434 ApplicatorOpeningX
+300A0435 ApplicatorOpeningY
+300A0436 SourcetoApplicatorMountingPositionDistance
+300A0440 NumberofBlockSlabItems
+300A0441 BlockSlabSequence
+300A0442 BlockSlabThickness
+300A0443 BlockSlabNumber
+300A0450 DeviceMotionControlSequence
+300A0451 DeviceMotionExecutionMode
+300A0452 DeviceMotionObservationMode
+300A0453 DeviceMotionParameterCodeSequence
+300A0501 DistalDepthFraction
+300A0502 DistalDepth
+300A0503 NominalRangeModulationFractions
+300A0504 NominalRangeModulatedRegionDepths
+300A0505 DepthDoseParametersSequence
+300A0506 DeliveredDepthDoseParametersSequence
+300A0507 DeliveredDistalDepthFraction
+300A0508 DeliveredDistalDepth
+300A0509 DeliveredNominalRangeModulationFractions
+300A0510 DeliveredNominalRangeModulatedRegionDepths
+300A0511 DeliveredReferenceDoseDefinition
+300A0512 ReferenceDoseDefinition
+300C0002 ReferencedRTPlanSequence
+300C0004 ReferencedBeamSequence
+300C0006 ReferencedBeamNumber
+300C0007 ReferencedReferenceImageNumber
+300C0008 StartCumulativeMetersetWeight
+300C0009 EndCumulativeMetersetWeight
+300C000A ReferencedBrachyApplicationSetupSequence
+300C000C ReferencedBrachyApplicationSetupNumber
+300C000E ReferencedSourceNumber
+300C0020 ReferencedFractionGroupSequence
+300C0022 ReferencedFractionGroupNumber
+300C0040 ReferencedVerificationImageSequence
+300C0042 ReferencedReferenceImageSequence
+300C0050 ReferencedDoseReferenceSequence
+300C0051 ReferencedDoseReferenceNumber
+300C0055 BrachyReferencedDoseReferenceSequence
+300C0060 ReferencedStructureSetSequence
+300C006A ReferencedPatientSetupNumber
+300C0080 ReferencedDoseSequence
+300C00A0 ReferencedToleranceTableNumber
+300C00B0 ReferencedBolusSequence
+300C00C0 ReferencedWedgeNumber
+300C00D0 ReferencedCompensatorNumber
+300C00E0 ReferencedBlockNumber
+300C00F0 ReferencedControlPointIndex
+300C00F2 ReferencedControlPointSequence
+300C00F4 ReferencedStartControlPointIndex
+300C00F6 ReferencedStopControlPointIndex
+300C0100 ReferencedRangeShifterNumber
+300C0102 ReferencedLateralSpreadingDeviceNumber
+300C0104 ReferencedRangeModulatorNumber
+300C0111 OmittedBeamTaskSequence
+300C0112 ReasonforOmission
+300C0113 ReasonforOmissionDescription
+300E0002 ApprovalStatus
+300E0004 ReviewDate
+300E0005 ReviewTime
+300E0008 ReviewerName
+40000010 Arbitrary
+40004000 TextComments
+40080040 ResultsID
+40080042 ResultsIDIssuer
+40080050 ReferencedInterpretationSequence
+400800FF ReportProductionStatusTrial
+40080100 InterpretationRecordedDate
+40080101 InterpretationRecordedTime
+40080102 InterpretationRecorder
+40080103 ReferencetoRecordedSound
+40080108 InterpretationTranscriptionDate
+40080109 InterpretationTranscriptionTime
+4008010A InterpretationTranscriber
+4008010B InterpretationText
+4008010C InterpretationAuthor
+40080111 InterpretationApproverSequence
+40080112 InterpretationApprovalDate
+40080113 InterpretationApprovalTime
+40080114 PhysicianApprovingInterpretation
+40080115 InterpretationDiagnosisDescription
+40080117 InterpretationDiagnosisCodeSequence
+40080118 ResultsDistributionListSequence
+40080119 DistributionName
+4008011A DistributionAddress
+40080200 InterpretationID
+40080202 InterpretationIDIssuer
+40080210 InterpretationTypeID
+40080212 InterpretationStatusID
+40080300 Impressions
+40084000 ResultsComments
+40100001 LowEnergyDetectors
+40100002 HighEnergyDetectors
+40100004 DetectorGeometrySequence
+40101001 ThreatROIVoxelSequence
+40101004 ThreatROIBase
+40101005 ThreatROIExtents
+40101006 ThreatROIBitmap
+40101007 RouteSegmentID
+40101008 GantryType
+40101009 OOIOwnerType
+4010100A RouteSegmentSequence
+40101010 PotentialThreatObjectID
+40101011 ThreatSequence
+40101012 ThreatCategory
+40101013 ThreatCategoryDescription
+40101014 ATDAbilityAssessment
+40101015 ATDAssessmentFlag
+40101016 ATDAssessmentProbability
+40101017 Mass
+40101018 Density
+40101019 ZEffective
+4010101A BoardingPassID
+4010101B CenterofMass
+4010101C CenterofPTO
+4010101D BoundingPolygon
+4010101E RouteSegmentStartLocationID
+4010101F RouteSegmentEndLocationID
+40101020 RouteSegmentLocationIDType
+40101021 AbortReason
+40101023 VolumeofPTO
+40101024 AbortFlag
+40101025 RouteSegmentStartTime
+40101026 RouteSegmentEndTime
+40101027 TDRType
+40101028 InternationalRouteSegment
+40101029 ThreatDetectionAlgorithmandVersion
+4010102A AssignedLocation
+4010102B AlarmDecisionTime
+40101031 AlarmDecision
+40101033 NumberofTotalObjects
+40101034 NumberofAlarmObjects
+40101037 PTORepresentationSequence
+40101038 ATDAssessmentSequence
+40101039 TIPType
+4010103A Version
+40101041 OOIOwnerCreationTime
+40101042 OOIType
+40101043 OOISize
+40101044 AcquisitionStatus
+40101045 BasisMaterialsCodeSequence
+40101046 PhantomType
+40101047 OOIOwnerSequence
+40101048 ScanType
+40101051 ItineraryID
+40101052 ItineraryIDType
+40101053 ItineraryIDAssigningAuthority
+40101054 RouteID
+40101055 RouteIDAssigningAuthority
+40101056 InboundArrivalType
+40101058 CarrierID
+40101059 CarrierIDAssigningAuthority
+40101060 SourceOrientation
+40101061 SourcePosition
+40101062 BeltHeight
+40101064 AlgorithmRoutingCodeSequence
+40101067 TransportClassification
+40101068 OOITypeDescriptor
+40101069 TotalProcessingTime
+4010106C DetectorCalibrationData
+4010106D AdditionalScreeningPerformed
+4010106E AdditionalInspectionSelectionCriteria
+4010106F AdditionalInspectionMethodSequence
+40101070 AITDeviceType
+40101071 QRMeasurementsSequence
+40101072 TargetMaterialSequence
+40101073 SNRThreshold
+40101075 ImageScaleRepresentation
+40101076 ReferencedPTOSequence
+40101077 ReferencedTDRInstanceSequence
+40101078 PTOLocationDescription
+40101079 AnomalyLocatorIndicatorSequence
+4010107A AnomalyLocatorIndicator
+4010107B PTORegionSequence
+4010107C InspectionSelectionCriteria
+4010107D SecondaryInspectionMethodSequence
+4010107E PRCStoRCSOrientation
+4FFE0001 MACParametersSequence
+52009229 SharedFunctionalGroupsSequence
+52009230 PerframeFunctionalGroupsSequence
+54000100 WaveformSequence
+54000110 ChannelMinimumValue
+54000112 ChannelMaximumValue
+54001004 WaveformBitsAllocated
+54001006 WaveformSampleInterpretation
+5400100A WaveformPaddingValue
+54001010 WaveformData
+56000010 FirstOrderPhaseCorrectionAngle
+56000020 SpectroscopyData
+7FE00008 FloatPixelData
+7FE00009 DoubleFloatPixelData
+7FE00010 PixelData
+7FE00020 CoefficientsSDVN
+7FE00030 CoefficientsSDHN
+7FE00040 CoefficientsSDDN
+FFFAFFFA DigitalSignaturesSequence
+FFFCFFFC DataSetTrailingPadding
+FFFEE000 Item
+FFFEE00D ItemDelimitationItem
+FFFEE0DD SequenceDelimitationItem
+"""
@@ -95,6 +95,97 @@ class FFmpegVideoGraphIODataset(tf.data.Dataset):
         return self._dataset.element_spec
 
 
+class FFmpegVideoPoolIODataset(tf.data.Dataset):
+    """FFmpegVideoPoolIODataset decodes video files with a pool of decoders.
+
+    Up to `parallelism` files are decoded at the same time, each by a decoder
+    with its own codec context and `thread_count` codec threads. Decoded
+    frames are buffered up to `buffer_size` frames across the pool, so the
+    decoders wait for the input pipeline instead of using unbounded memory.
+
+    Elements are tuples of the index of the file in `filenames` and a frame
+    of shape `[height, width, 3]`. Frames of one file keep their order, while
+    frames of different files are interleaved as they are decoded.
+    """
+
+    def __init__(
+        self,
+        filenames,
+        index=0,
+        parallelism=None,
+        thread_count=None,
+        thread_type=None,
+        buffer_size=None,
+        internal=True,
+    ):
+        """FFmpegVideoPoolIODataset."""
+        with tf.name_scope("FFmpegVideoPoolIODataset"):
+            from tensorflow_io.python.ops import (  # pylint: disable=import-outside-toplevel
+                ffmpeg_ops,
+            )
+
+            assert internal
+
+            thread_types = {None: -1, "frame": 1, "slice": 2}
+            assert thread_type in thread_types, f"{thread_type} not supported"
+
+            filenames = tf.reshape(tf.convert_to_tensor(filenames, tf.string), [-1])
+            # Decoded frames of all iterations are counted for stats()
+            self._resource = ffmpeg_ops.io_ffmpeg_video_pool_stats_init(
+                shared_name=f"FFmpegVideoPoolIODataset/{uuid.uuid4().hex}",
+            )
+
+            # Each iteration starts a pool of its own inside the dataset, so
+            # that the files are decoded from the start and concurrent
+            # iterators do not share decoders
+            def f(filenames):
+                resource = ffmpeg_ops.io_ffmpeg_video_pool_init(
+                    filenames,
+                    index,
+                    parallelism=parallelism or 1,
+                    thread_count=-1 if thread_count is None else thread_count,
+                    thread_type=thread_types[thread_type],
+                    buffer_size=buffer_size or 256,
+                    stats=self._resource,
+                )
+                dataset = tf.data.experimental.Counter()
+                dataset = dataset.map(
+                    lambda i: ffmpeg_ops.io_ffmpeg_video_pool_next(resource)
+                )
+                dataset = dataset.apply(
+                    tf.data.experimental.take_while(
+                        lambda file, value: tf.greater(tf.shape(value)[0], 0)
+                    )
+                )
+                dataset = dataset.map(
+                    lambda file, value: (tf.fill([tf.shape(value)[0]], file), value)
+                )
+                return dataset.unbatch()
+
+            dataset = tf.data.Dataset.from_tensors(filenames)
+            dataset = dataset.flat_map(f)
+            self._dataset = dataset
+            super().__init__(
+                self._dataset._variant_tensor
+            )  # pylint: disable=protected-access
+
+    def stats(self):
+        """Returns the number of frames decoded so far, and the frames decoded
+        per second, since the pool of the latest iteration started."""
+        from tensorflow_io.python.ops import (  # pylint: disable=import-outside-toplevel
+            ffmpeg_ops,
+        )
+
+        return ffmpeg_ops.io_ffmpeg_video_pool_stats(self._resource)
+
+    def _inputs(self):
+        return []
+
+    @property
+    def element_spec(self):
+        return self._dataset.element_spec
+
+
 class _FFmpegIODatasetFunction:
     def __init__(self, function, resource, component, shape, dtype):
         self._function = function
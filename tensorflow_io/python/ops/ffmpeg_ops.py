@@ -57,7 +57,12 @@ io_ffmpeg_readable_init = _ffmpeg_ops.io_ffmpeg_readable_init
 io_ffmpeg_readable_spec = _ffmpeg_ops.io_ffmpeg_readable_spec
 io_ffmpeg_readable_read = _ffmpeg_ops.io_ffmpeg_readable_read
 io_ffmpeg_decode_video = _ffmpeg_ops.io_ffmpeg_decode_video
+io_ffmpeg_decode_video_sample = _ffmpeg_ops.io_ffmpeg_decode_video_sample
 io_ffmpeg_audio_readable_init = _ffmpeg_ops.io_ffmpeg_audio_readable_init
 io_ffmpeg_audio_readable_next = _ffmpeg_ops.io_ffmpeg_audio_readable_next
 io_ffmpeg_video_readable_init = _ffmpeg_ops.io_ffmpeg_video_readable_init
 io_ffmpeg_video_readable_next = _ffmpeg_ops.io_ffmpeg_video_readable_next
+io_ffmpeg_video_pool_stats_init = _ffmpeg_ops.io_ffmpeg_video_pool_stats_init
+io_ffmpeg_video_pool_init = _ffmpeg_ops.io_ffmpeg_video_pool_init
+io_ffmpeg_video_pool_next = _ffmpeg_ops.io_ffmpeg_video_pool_next
+io_ffmpeg_video_pool_stats = _ffmpeg_ops.io_ffmpeg_video_pool_stats
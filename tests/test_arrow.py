@@ -730,6 +730,121 @@ class ArrowDatasetTest(ArrowTestBase):
         for s in servers:
             s.join()
 
+    def test_parallel_stream_hosts(self):
+        """test_parallel_stream_hosts"""
+        import tensorflow_io.arrow as arrow_io
+
+        truth_data = TruthData(
+            self.scalar_data + self.list_data,
+            self.scalar_dtypes + self.list_dtypes,
+            self.scalar_shapes + self.list_shapes,
+        )
+
+        batch = self.make_record_batch(truth_data)
+
+        # Every endpoint serves the same batches, so the interleaved order of
+        # record batches does not change the result
+        num_endpoints = 3
+        num_batches = 2
+        dataset = arrow_io.ArrowStreamDataset.from_record_batch_iters(
+            [[batch] * num_batches for _ in range(num_endpoints)],
+            truth_data.output_types,
+            truth_data.output_shapes,
+        )
+        truth_data_mult = TruthData(
+            [d * num_endpoints * num_batches for d in truth_data.data],
+            truth_data.output_types,
+            truth_data.output_shapes,
+        )
+        self.run_test_case(dataset, truth_data_mult)
+
+    def test_stream_shared_memory(self):
+        """test_stream_shared_memory"""
+        import tensorflow_io.arrow as arrow_io
+
+        truth_data = TruthData(
+            self.scalar_data + self.list_data,
+            self.scalar_dtypes + self.list_dtypes,
+            self.scalar_shapes + self.list_shapes,
+        )
+
+        batch = self.make_record_batch(truth_data)
+
+        num_batches = 2
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            endpoints = []
+            for i in range(2):
+                path = os.path.join(tmp_dir, f"arrow_io_stream_{i}")
+                with pa.OSFile(path, "wb") as sink:
+                    writer = pa.RecordBatchStreamWriter(sink, batch.schema)
+                    for _ in range(num_batches):
+                        writer.write_batch(batch)
+                    writer.close()
+                endpoints.append(f"shm://{path}")
+
+            dataset = arrow_io.ArrowStreamDataset.from_schema(
+                endpoints, batch.schema, num_parallel_reads=len(endpoints)
+            )
+            truth_data_mult = TruthData(
+                [d * len(endpoints) * num_batches for d in truth_data.data],
+                truth_data.output_types,
+                truth_data.output_shapes,
+            )
+            self.run_test_case(dataset, truth_data_mult)
+
+    def test_flight_dataset(self):
+        """test_flight_dataset"""
+        import tensorflow_io.arrow as arrow_io
+
+        flight = pytest.importorskip("pyarrow.flight")
+
+        truth_data = TruthData(
+            self.scalar_data + self.list_data,
+            self.scalar_dtypes + self.list_dtypes,
+            self.scalar_shapes + self.list_shapes,
+        )
+
+        batch = self.make_record_batch(truth_data)
+        num_tickets = 3
+
+        class FeatureServer(flight.FlightServerBase):
+            """Serves the same record batch on each ticket of a flight"""
+
+            def get_flight_info(self, context, descriptor):
+                endpoints = [
+                    flight.FlightEndpoint(str(i).encode(), [])
+                    for i in range(num_tickets)
+                ]
+                return flight.FlightInfo(batch.schema, descriptor, endpoints, -1, -1)
+
+            def do_get(self, context, ticket):
+                return flight.RecordBatchStream(pa.Table.from_batches([batch, batch]))
+
+        server = FeatureServer("grpc://127.0.0.1:0")
+        location = f"grpc://127.0.0.1:{server.port}"
+        truth_data_mult = TruthData(
+            [d * num_tickets * 2 for d in truth_data.data],
+            truth_data.output_types,
+            truth_data.output_shapes,
+        )
+        try:
+            # Command descriptor, one ticket at a time
+            dataset = arrow_io.ArrowFlightDataset.from_schema(
+                location, b"features", batch.schema
+            )
+            self.run_test_case(dataset, truth_data_mult)
+
+            # Path descriptor, all tickets in parallel
+            dataset = arrow_io.ArrowFlightDataset.from_schema(
+                location,
+                ["features", "train"],
+                batch.schema,
+                num_parallel_reads=num_tickets,
+            )
+            self.run_test_case(dataset, truth_data_mult)
+        finally:
+            server.shutdown()
+
     def test_stream_from_pandas(self):
         """test_stream_from_pandas"""
         import tensorflow_io.arrow as arrow_io
@@ -798,6 +913,92 @@ class ArrowDatasetTest(ArrowTestBase):
 
         self.run_test_case(dataset, truth_data, batch_size=batch_size)
 
+    def test_stream_from_pandas_parallel(self):
+        """test_stream_from_pandas_parallel"""
+        import tensorflow_io.arrow as arrow_io
+
+        batch_data = TruthData(self.scalar_data, self.scalar_dtypes, self.scalar_shapes)
+
+        batch = self.make_record_batch(batch_data)
+        df = batch.to_pandas()
+
+        num_frames = 4
+        dataset = arrow_io.ArrowStreamDataset.from_pandas(
+            [df] * num_frames, preserve_index=False, num_parallel_reads=2
+        )
+
+        truth_data = TruthData(
+            [d * num_frames for d in batch_data.data],
+            batch_data.output_types,
+            batch_data.output_shapes,
+        )
+
+        self.run_test_case(dataset, truth_data)
+
+    def test_stream_from_pandas_generator(self):
+        """test_stream_from_pandas_generator"""
+        import tensorflow_io.arrow as arrow_io
+
+        batch_data = TruthData(self.scalar_data, self.scalar_dtypes, self.scalar_shapes)
+
+        batch = self.make_record_batch(batch_data)
+        df = batch.to_pandas()
+
+        # The first DataFrame of a generator is used for the schema, and must
+        # still be part of the dataset
+        num_frames = 3
+        truth_data = TruthData(
+            [d * num_frames for d in batch_data.data],
+            batch_data.output_types,
+            batch_data.output_shapes,
+        )
+        for num_parallel_reads in [None, 2]:
+            dataset = arrow_io.ArrowStreamDataset.from_pandas(
+                (df for _ in range(num_frames)),
+                preserve_index=False,
+                num_parallel_reads=num_parallel_reads,
+            )
+            self.run_test_case(dataset, truth_data)
+
+    def test_parallel_stream_cancel(self):
+        """test_parallel_stream_cancel"""
+        import tensorflow_io.arrow as arrow_io
+
+        truth_data = TruthData(self.scalar_data, self.scalar_dtypes, self.scalar_shapes)
+
+        batch = self.make_record_batch(truth_data)
+
+        # The producers stall after their first batch, so the readers are
+        # blocked on their sockets when the iterator is deleted
+        stalled = threading.Event()
+
+        def gen_record_batches():
+            yield batch
+            stalled.wait()
+
+        dataset = arrow_io.ArrowStreamDataset.from_record_batch_iters(
+            [gen_record_batches() for _ in range(2)],
+            truth_data.output_types,
+            truth_data.output_shapes,
+        )
+        iterator = iter(dataset)
+        next(iterator)
+        del iterator
+        stalled.set()
+
+    @pytest.mark.skipif(os.name == "nt", reason="unix sockets are not used")
+    def test_stream_server_stop(self):
+        """test_stream_server_stop"""
+        from tensorflow_io.python.ops.arrow_dataset_ops import (
+            _serve_record_batches,
+        )
+
+        endpoint, stop = _serve_record_batches([])
+        sock_path = endpoint[len("unix://") :]
+        assert os.path.exists(sock_path)
+        stop()
+        assert not os.path.exists(os.path.dirname(sock_path))
+
     def test_stream_from_pandas_not_batched(self):
         """test_stream_from_pandas_not_batched"""
         import tensorflow_io.arrow as arrow_io
@@ -1298,6 +1499,50 @@ class ArrowDatasetTest(ArrowTestBase):
 
         os.unlink(f.name)
 
+    def test_arrow_feather_dataset_shard(self):
+        """test_arrow_feather_dataset_shard"""
+        import tensorflow_io.arrow as arrow_io
+
+        from pyarrow import feather as pa_feather
+        import pyarrow as pa
+        import numpy as np
+
+        num_rows = 10
+        table = pa.Table.from_arrays(
+            [
+                pa.array(np.arange(num_rows, dtype=np.int32)),
+                pa.array(np.arange(num_rows, dtype=np.float32) * 2),
+                pa.array(np.arange(num_rows, dtype=np.int64) * 3),
+            ],
+            ["a", "b", "c"],
+        )
+
+        # 5 record batches of 2 rows each
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            pa_feather.write_feather(table, f, chunksize=2)
+
+        # Only the selected columns are read, in the requested order
+        dataset = arrow_io.ArrowFeatherDataset(
+            f.name,
+            columns=(2, 0),
+            output_types=(tf.int64, tf.int32),
+            output_shapes=([], []),
+        )
+        c, a = zip(*[(c.numpy(), a.numpy()) for c, a in dataset])
+        np.testing.assert_equal(c, np.arange(num_rows) * 3)
+        np.testing.assert_equal(a, np.arange(num_rows))
+
+        # Shards are contiguous ranges of record batches
+        shards = [[a.numpy() for _, a in dataset.shard(2, index)] for index in range(2)]
+        assert shards[0] == list(range(4))
+        assert shards[1] == list(range(4, num_rows))
+
+        # A shard with no record batches is empty
+        shard = dataset.shard(num_rows, 0)
+        assert len(list(shard)) == 0
+
+        os.unlink(f.name)
+
 
 if __name__ == "__main__":
     test.main()
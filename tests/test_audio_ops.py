@@ -885,6 +885,62 @@ def test_spectrogram():
     spec = tfio.audio.time_mask(spec, param=10)
 
 
+def test_mel_spectrogram():
+    """test_mel_spectrogram"""
+
+    path = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "test_audio",
+        "mono_10khz.wav",
+    )
+    audio = tfio.audio.decode_wav(tf.io.read_file(path), dtype=tf.int16)
+    audio = tf.cast(audio, tf.float32) / 32768.0
+    audio = tf.reshape(audio, [-1])
+
+    nfft, window, stride = 400, 400, 200
+    rate, mels, fmin, fmax = 10000, 64, 0.0, 5000.0
+
+    def chain(e):
+        spectrogram = tfio.audio.spectrogram(e, nfft=nfft, window=window, stride=stride)
+        mel_spectrogram = tfio.audio.melscale(
+            spectrogram, rate=rate, mels=mels, fmin=fmin, fmax=fmax
+        )
+        return tfio.audio.dbscale(mel_spectrogram, top_db=80)
+
+    expected = chain(audio)
+    mel_spectrogram = tfio.audio.mel_spectrogram(
+        audio,
+        rate=rate,
+        nfft=nfft,
+        window=window,
+        stride=stride,
+        mels=mels,
+        fmin=fmin,
+        fmax=fmax,
+        top_db=80,
+    )
+    assert mel_spectrogram.shape == [29, mels]
+    assert mel_spectrogram.dtype == tf.float32
+    assert np.allclose(mel_spectrogram, expected, atol=1e-3)
+
+    # Batch of channels, each spectrogram is cut off at its own maximum
+    channels = tf.stack([audio, audio * 0.5])
+    mel_spectrogram = tfio.audio.mel_spectrogram(
+        channels,
+        rate=rate,
+        nfft=nfft,
+        window=window,
+        stride=stride,
+        mels=mels,
+        fmin=fmin,
+        fmax=fmax,
+        top_db=80,
+    )
+    assert mel_spectrogram.shape == [2, 29, mels]
+    for i in range(2):
+        assert np.allclose(mel_spectrogram[i], chain(channels[i]), atol=1e-3)
+
+
 @pytest.mark.parametrize(
     "audio_file, shape, spectrogram_shape",
     [
@@ -960,6 +1016,92 @@ def test_fade():
         # plt.savefig("{}_fade.png".format(mode))
 
 
+def test_audio_resampler():
+    """test_audio_resampler"""
+
+    path = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "test_audio",
+        "mono_10khz.wav",
+    )
+    audio = tfio.audio.decode_wav(tf.io.read_file(path), dtype=tf.int16)
+    assert audio.shape == [5760, 1]
+    audio = tf.cast(audio, tf.float32) / 32768.0
+
+    # resampling chunk by chunk keeps the filter state across chunks
+    expected = tfio.audio.AudioResampler(10000, 16000, channels=1)(audio)
+    resampler = tfio.audio.AudioResampler(10000, 16000, channels=1)
+    chunks = [resampler(audio[i : i + 1000]) for i in range(0, 5760, 1000)]
+    chunked = tf.concat(chunks, axis=0)
+    assert chunked.shape == expected.shape
+    assert np.allclose(chunked, expected, atol=1e-5)
+
+    # a batch is resampled item by item in one kernel
+    batch = tf.stack([audio, audio[::-1]])
+    for quality in [0, 4, 10]:
+        value = tfio.audio.resample(batch, 10000, 16000, quality=quality)
+        assert value.shape == [2, 9216, 1]
+        for i in range(2):
+            item = tfio.audio.resample(batch[i], 10000, 16000, quality=quality)
+            assert np.allclose(value[i], item)
+
+    with pytest.raises(tf.errors.InvalidArgumentError):
+        tfio.audio.resample(audio, 10000, 16000, quality=11)
+
+
+def test_audio_dataset_stream():
+    """test_audio_dataset_stream"""
+
+    path = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "test_audio",
+        "mono_10khz.wav",
+    )
+    audio = tfio.audio.decode_wav(tf.io.read_file(path), dtype=tf.int16)
+    assert audio.shape == [5760, 1]
+    audio = tf.cast(audio, tf.float32) / 32768.0
+
+    # framing inside the reader
+    frames = tf.signal.frame(audio, 400, 160, axis=0)
+    dataset = tfio.audio.AudioIODataset(path, window=400, hop=160)
+    value = tf.stack(list(dataset))
+    assert value.shape == frames.shape
+    assert np.allclose(value, frames)
+
+    # files are interleaved frame by frame
+    dataset = tfio.audio.AudioIODataset(
+        [path, path], window=400, hop=160, num_parallel_reads=2
+    )
+    value = tf.stack(list(dataset))
+    assert np.allclose(value[0::2], frames)
+    assert np.allclose(value[1::2], frames)
+
+    # resampling inside the reader keeps the filter state across chunks
+    expected = tfio.audio.AudioResampler(10000, 16000, channels=1)(audio)
+    dataset = tfio.audio.AudioIODataset(path, rate=16000)
+    value = tf.stack(list(dataset))
+    assert value.shape == [9216, 1]
+    assert np.allclose(value[: expected.shape[0]], expected, atol=1e-5)
+
+    # mono is mixed to stereo
+    dataset = tfio.audio.AudioIODataset(path, channels=2)
+    value = tf.stack(list(dataset))
+    assert np.allclose(value, tf.concat([audio, audio], axis=1))
+
+    # each iteration reads the files from the beginning
+    dataset = tfio.audio.AudioIODataset(path, window=400, hop=160)
+    for _ in range(2):
+        value = tf.stack(list(dataset))
+        assert np.allclose(value, frames)
+    value = tf.stack(list(dataset.repeat(2)))
+    assert np.allclose(value, tf.concat([frames, frames], axis=0))
+
+    # concurrent iterators read the files independently
+    entries = list(zip(dataset, dataset))
+    assert np.allclose(tf.stack([e for e, _ in entries]), frames)
+    assert np.allclose(tf.stack([e for _, e in entries]), frames)
+
+
 def test_audio_trim_split_remix():
     """test_audio_trim_split_remix"""
 
@@ -0,0 +1,82 @@
+# Copyright 2021 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License.  You may obtain a copy of
+# the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the
+# License for the specific language governing permissions and limitations under
+# the License.
+# ==============================================================================
+"""ArrowDataset benchmark for batched Arrow to tensor conversion.
+
+Batch sizes that evenly divide the record batch length are served straight
+from Arrow memory, other batch sizes straddle record batches and are copied
+into a single preallocated tensor. Use `--benchmark-save` and
+`--benchmark-compare` to compare revisions.
+"""
+
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pytest
+
+import tensorflow_io.arrow as arrow_io
+from tensorflow_io.python.ops.arrow_dataset_ops import \
+  arrow_schema_to_tensor_types
+from tests.test_benchmark.benchmark.utils.benchmark_utils import benchmark_func
+
+NUM_ROWS = 1 << 16
+RECORD_BATCH_SIZE = 1 << 12
+
+
+def create_dataframe():
+  rng = np.random.default_rng(0)
+  return pd.DataFrame({
+    "int64": rng.integers(0, 1 << 20, NUM_ROWS, dtype=np.int64),
+    "float32": rng.random(NUM_ROWS, dtype=np.float32),
+    "float64": rng.random(NUM_ROWS, dtype=np.float64),
+  })
+
+
+def run_arrow_benchmark(dataset, benchmark, rounds=30):
+  count = benchmark.pedantic(
+      target=benchmark_func,
+      args=[dataset],
+      iterations=2,
+      rounds=rounds,
+      kwargs={}
+  )
+  assert count > 0, f"Arrow batch count: {count} must be greater than 0"
+
+
+@pytest.mark.benchmark(group="arrow_from_pandas",)
+@pytest.mark.parametrize("batch_size", [None, 1000, RECORD_BATCH_SIZE])
+def test_arrow_from_pandas(batch_size, benchmark):
+  df = create_dataframe()
+  dataset = arrow_io.ArrowDataset.from_pandas(
+      df, preserve_index=False, batch_size=batch_size)
+  run_arrow_benchmark(dataset, benchmark)
+
+
+@pytest.mark.benchmark(group="arrow_feather",)
+@pytest.mark.parametrize("batch_size", [1000, RECORD_BATCH_SIZE])
+def test_arrow_feather(batch_size, benchmark):
+  df = create_dataframe()
+  table = pa.Table.from_pandas(df, preserve_index=False)
+  with tempfile.TemporaryDirectory() as dir_path:
+    filename = os.path.join(dir_path, "benchmark.feather")
+    feather.write_feather(table, filename, chunksize=RECORD_BATCH_SIZE)
+    output_types, output_shapes = arrow_schema_to_tensor_types(table.schema)
+    dataset = arrow_io.ArrowFeatherDataset(
+        [filename], tuple(range(table.num_columns)), output_types,
+        output_shapes, batch_size=batch_size)
+    run_arrow_benchmark(dataset, benchmark)
@@ -0,0 +1,74 @@
+# Copyright 2021 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License.  You may obtain a copy of
+# the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the
+# License for the specific language governing permissions and limitations under
+# the License.
+# ==============================================================================
+"""Audio feature extraction benchmark.
+
+Compares the fused `tfio.audio.mel_spectrogram` against the chain of
+`spectrogram`, `melscale` and `dbscale` on a batch of audio clips. Use
+`--benchmark-save` and `--benchmark-compare` to compare revisions.
+"""
+
+import numpy as np
+import pytest
+import tensorflow as tf
+
+import tensorflow_io as tfio
+
+RATE = 16000
+NFFT = 512
+WINDOW = 400
+STRIDE = 160
+MELS = 80
+FMIN = 0.0
+FMAX = 8000.0
+TOP_DB = 80.0
+
+
+def create_audio(batch_size):
+  rng = np.random.default_rng(0)
+  return tf.constant(
+      rng.uniform(-1.0, 1.0, (batch_size, RATE)).astype(np.float32))
+
+
+@tf.function
+def chain(audio):
+  spectrogram = tfio.audio.spectrogram(
+      audio, nfft=NFFT, window=WINDOW, stride=STRIDE)
+  mel_spectrogram = tfio.audio.melscale(
+      spectrogram, rate=RATE, mels=MELS, fmin=FMIN, fmax=FMAX)
+  return tfio.audio.dbscale(mel_spectrogram, top_db=TOP_DB)
+
+
+@tf.function
+def fused(audio):
+  return tfio.audio.mel_spectrogram(
+      audio, rate=RATE, nfft=NFFT, window=WINDOW, stride=STRIDE, mels=MELS,
+      fmin=FMIN, fmax=FMAX, top_db=TOP_DB)
+
+
+def run_audio_benchmark(func, audio, benchmark, rounds=30):
+  output = benchmark.pedantic(
+      target=lambda: func(audio).numpy(),
+      iterations=2,
+      rounds=rounds,
+      warmup_rounds=1
+  )
+  assert output.shape[-1] == MELS
+
+
+@pytest.mark.benchmark(group="audio_mel_spectrogram",)
+@pytest.mark.parametrize("batch_size", [1, 32])
+@pytest.mark.parametrize("func", [chain, fused], ids=["chain", "fused"])
+def test_audio_mel_spectrogram(func, batch_size, benchmark):
+  run_audio_benchmark(func, create_audio(batch_size), benchmark)
@@ -596,6 +596,61 @@ class BigqueryOpsTest(test.TestCase):
         with self.assertRaises(errors.OutOfRangeError):
             itr1.get_next()
 
+    def test_read_rows_batch(self):
+        """Test for reading rows as column batches."""
+        client = BigQueryTestClient(BigqueryOpsTest.server.endpoint())
+        read_session = self._get_read_session(
+            client,
+            selected_fields=self.SELECTED_FIELDS_LIST,
+            output_types=self.OUTPUT_TYPES_LIST,
+        )
+
+        streams_list = read_session.get_streams()
+        dataset1 = read_session.read_rows(streams_list[0], batch_size=2)
+        itr1 = iter(dataset1)
+        rows = [self._get_nonrepeated_only_fields(row) for row in self.STREAM_1_ROWS]
+        self.assertEqual(
+            {key: [row[key] for row in rows] for key in rows[0]},
+            self._normalize_dictionary(itr1.get_next()),
+        )
+        with self.assertRaises(errors.OutOfRangeError):
+            itr1.get_next()
+
+        dataset2 = read_session.read_rows(streams_list[1], offset=1, batch_size=4)
+        itr2 = iter(dataset2)
+        self.assertEqual(
+            {
+                key: [value]
+                for key, value in self._get_nonrepeated_only_fields(
+                    self.DEFAULT_VALUES
+                ).items()
+            },
+            self._normalize_dictionary(itr2.get_next()),
+        )
+        with self.assertRaises(errors.OutOfRangeError):
+            itr2.get_next()
+
+    def test_read_rows_checkpoint(self):
+        """Test for restoring a read_rows iterator from a checkpoint."""
+        client = BigQueryTestClient(BigqueryOpsTest.server.endpoint())
+        read_session = self._get_read_session(
+            client, selected_fields=self.SELECTED_FIELDS_DICT
+        )
+
+        streams_list = read_session.get_streams()
+        dataset1 = read_session.read_rows(streams_list[0])
+        itr1 = iter(dataset1)
+        self.assertEqual(self.STREAM_1_ROWS[0], self._normalize_dictionary(next(itr1)))
+        checkpoint = tf.train.Checkpoint(iterator=itr1)
+        checkpoint_path = checkpoint.save(self.get_temp_dir() + "/ckpt")
+
+        itr2 = iter(dataset1)
+        checkpoint = tf.train.Checkpoint(iterator=itr2)
+        checkpoint.restore(checkpoint_path)
+        self.assertEqual(self.STREAM_1_ROWS[1], self._normalize_dictionary(next(itr2)))
+        with self.assertRaises(StopIteration):
+            next(itr2)
+
     def test_parallel_read_rows(self):
         """Test for reading rows in parallel."""
         client = BigQueryTestClient(BigqueryOpsTest.server.endpoint())
@@ -106,6 +106,42 @@ class BigtableParallelReadTest(test.TestCase):
         results = [[v.numpy().decode() for v in row] for row in dataset]
         self.assertEqual(repr(sorted(values)), repr(sorted(results)))
 
+    def test_parallel_read_work_queue(self):
+        os.environ["BIGTABLE_EMULATOR_HOST"] = self.emulator.get_addr()
+        self.emulator.create_table(
+            "fake_project",
+            "fake_instance",
+            "test-table",
+            ["fam1", "fam2"],
+            splits=["row005", "row010", "row015", "row020", "row025", "row030"],
+        )
+
+        values = [[f"[{i,j}]" for j in range(2)] for i in range(40)]
+
+        ten = tf.constant(values)
+
+        client = BigtableClient("fake_project", "fake_instance")
+        table = client.get_table("test-table")
+
+        self.emulator.write_tensor(
+            "fake_project",
+            "fake_instance",
+            "test-table",
+            ten,
+            ["row" + str(i).rjust(3, "0") for i in range(40)],
+            ["fam1:col1", "fam2:col2"],
+        )
+
+        for splits_per_worker in [1, 4]:
+            dataset = table.parallel_read_rows(
+                ["fam1:col1", "fam2:col2"],
+                row_set=row_set.from_rows_or_ranges(row_range.infinite()),
+                num_parallel_calls=2,
+                splits_per_worker=splits_per_worker,
+            )
+            results = [[v.numpy().decode() for v in row] for row in dataset]
+            self.assertEqual(repr(sorted(values)), repr(sorted(results)))
+
     def test_split_row_set(self):
         os.environ["BIGTABLE_EMULATOR_HOST"] = self.emulator.get_addr()
         self.emulator.create_table(
@@ -95,3 +95,41 @@ class BigtableReadTest(test.TestCase):
             r for r in table.read_rows(["fam1:col1", "fam2:col2"], row_set=row_s)
         ]
         self.assertEqual(len(read_rows), 10)
+
+    def test_read_checkpoint(self):
+        os.environ["BIGTABLE_EMULATOR_HOST"] = self.emulator.get_addr()
+        self.emulator.create_table(
+            "fake_project", "fake_instance", "test-table", ["fam1", "fam2"]
+        )
+
+        values = [[f"[{i,j}]" for j in range(2)] for i in range(20)]
+
+        ten = tf.constant(values)
+
+        client = BigtableClient("fake_project", "fake_instance")
+        table = client.get_table("test-table")
+
+        self.emulator.write_tensor(
+            "fake_project",
+            "fake_instance",
+            "test-table",
+            ten,
+            ["row" + str(i).rjust(3, "0") for i in range(20)],
+            ["fam1:col1", "fam2:col2"],
+        )
+
+        dataset = table.read_rows(
+            ["fam1:col1", "fam2:col2"],
+            row_set=row_set.from_rows_or_ranges(row_range.infinite()),
+        )
+        itr = iter(dataset)
+        for i in range(5):
+            self.assertEqual(values[i][0], next(itr)[0].numpy().decode())
+        checkpoint = tf.train.Checkpoint(iterator=itr)
+        checkpoint_path = checkpoint.save(self.get_temp_dir() + "/ckpt")
+
+        itr = iter(dataset)
+        checkpoint = tf.train.Checkpoint(iterator=itr)
+        checkpoint.restore(checkpoint_path)
+        read_rows = [r[0].numpy().decode() for r in itr]
+        self.assertEqual([v[0] for v in values[5:]], read_rows)
@@ -175,3 +175,25 @@ class BigtableReadTest(test.TestCase):
         table = client.get_table("test-table")
 
         self.check_values(values, table, "bool", tf.bool)
+
+    def test_per_column_types_batched(self):
+        client = BigtableClient("fake_project", "fake_instance")
+        table = client.get_table("test-table")
+
+        dataset = table.read_rows(
+            ["fam1:int32", "fam1:double", "fam1:bool"],
+            row_set=row_set.from_rows_or_ranges(row_range.infinite()),
+            output_type=[tf.int32, tf.float64, tf.bool],
+            batch_size=4,
+        )
+        int32_values, double_values, bool_values = [], [], []
+        for int32_batch, double_batch, bool_batch in dataset:
+            self.assertLessEqual(int32_batch.shape[0], 4)
+            int32_values.extend(int32_batch.numpy())
+            double_values.extend(double_batch.numpy())
+            bool_values.extend(bool_batch.numpy())
+
+        values = tf.constant(self.data["values"])
+        self.assertAllEqual(tf.cast(values, tf.int32), int32_values)
+        self.assertAllClose(tf.cast(values, tf.float64), double_values)
+        self.assertAllEqual(tf.cast(values, tf.bool), bool_values)
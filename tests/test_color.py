@@ -24,6 +24,7 @@ import skimage.color
 
 import tensorflow as tf
 import tensorflow_io as tfio
+from tensorflow_io.python.experimental import color_ops
 
 
 @pytest.mark.parametrize(
@@ -183,3 +184,190 @@ def test_color(data, func, check):
         assert np.allclose(output_4d, expected_4d, rtol=0.03)
     else:
         assert np.array_equal(output_4d, expected_4d)
+
+
+@pytest.mark.parametrize(
+    ("fmt", "func", "color_space"),
+    [
+        pytest.param("nv12", tfio.experimental.color.rgb_to_ycbcr, "ycbcr"),
+        pytest.param("nv12", tfio.experimental.color.rgb_to_lab, "lab"),
+        pytest.param("yuy2", tfio.experimental.color.rgb_to_xyz, "xyz"),
+        pytest.param("yuy2", tfio.experimental.color.rgb_to_lab, "lab"),
+    ],
+    ids=["nv12|ycbcr", "nv12|lab", "yuy2|xyz", "yuy2|lab"],
+)
+def test_color_decode_yuv(fmt, func, color_space):
+    """test_color_decode_yuv"""
+    filename = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "test_image",
+        "Jelly-Beans.{}".format(fmt),
+    )
+    contents = tf.io.read_file(filename)
+    decode = getattr(tfio.experimental.image, "decode_{}".format(fmt))
+
+    rgb = decode(contents, size=[256, 256])
+    if color_space != "ycbcr":
+        rgb = tf.image.convert_image_dtype(rgb, tf.float32)
+    expected = func(rgb)
+
+    image = decode(contents, size=[256, 256], color_space=color_space)
+    assert image.dtype == expected.dtype
+    assert image.shape == [256, 256, 3]
+    if color_space == "ycbcr":
+        assert np.array_equal(image, expected)
+    else:
+        assert np.allclose(image, expected, rtol=1e-4, atol=1e-3)
+
+
+@pytest.mark.parametrize(
+    ("data", "func", "src", "dst"),
+    [
+        pytest.param(
+            lambda: np.random.random((2, 8, 8, 3)),
+            tfio.experimental.color.rgb_to_ypbpr,
+            "rgb",
+            "ypbpr",
+        ),
+        pytest.param(
+            lambda: np.random.random((2, 8, 8, 3)),
+            tfio.experimental.color.rgb_to_ydbdr,
+            "rgb",
+            "ydbdr",
+        ),
+        pytest.param(
+            lambda: np.random.random((2, 8, 8, 3)),
+            tfio.experimental.color.rgb_to_xyz,
+            "rgb",
+            "xyz",
+        ),
+        pytest.param(
+            lambda: np.random.random((2, 8, 8, 3)) * 0.5,
+            tfio.experimental.color.xyz_to_rgb,
+            "xyz",
+            "rgb",
+        ),
+        pytest.param(
+            lambda: np.random.random((2, 8, 8, 3)),
+            tfio.experimental.color.rgb_to_lab,
+            "rgb",
+            "lab",
+        ),
+        pytest.param(
+            lambda: np.random.random((2, 8, 8, 3)) * [100.0, 40.0, 40.0],
+            tfio.experimental.color.lab_to_rgb,
+            "lab",
+            "rgb",
+        ),
+    ],
+    ids=[
+        "rgb_to_ypbpr",
+        "rgb_to_ydbdr",
+        "rgb_to_xyz",
+        "xyz_to_rgb",
+        "rgb_to_lab",
+        "lab_to_rgb",
+    ],
+)
+def test_color_gradient(data, func, src, dst):
+    """test_color_gradient"""
+    np.random.seed(1000)
+
+    input_4d = tf.constant(data(), tf.float64)
+
+    def gradient(f):
+        with tf.GradientTape() as tape:
+            tape.watch(input_4d)
+            output_4d = f(input_4d)
+            loss = tf.reduce_sum(output_4d * tf.range(1.0, 4.0, dtype=tf.float64))
+        return tape.gradient(loss, input_4d)
+
+    expected = gradient(
+        lambda e: color_ops._graph_color_convert(  # pylint: disable=protected-access
+            e, src, dst, "D65", "2"
+        )
+    )
+    assert expected is not None
+
+    value = gradient(func)
+    assert value is not None
+    assert np.allclose(value, expected)
+
+    value = tf.function(gradient)(func)
+    assert np.allclose(value, expected)
+
+
+def test_color_dataset():
+    """test_color_dataset"""
+    np.random.seed(1000)
+
+    rgb = tf.constant((np.random.random((4, 16, 16, 3)) * 256.0).astype(np.uint8))
+    expected = tfio.experimental.color.rgb_to_ycbcr(rgb)
+    dataset = tf.data.Dataset.from_tensor_slices(rgb)
+    dataset = dataset.map(tfio.experimental.color.rgb_to_ycbcr)
+    assert np.array_equal(tf.stack(list(dataset)), expected)
+
+    rgb = tf.image.convert_image_dtype(rgb, tf.float32)
+    expected = tfio.experimental.color.rgb_to_lab(rgb)
+    dataset = tf.data.Dataset.from_tensor_slices(rgb)
+    dataset = dataset.map(tfio.experimental.color.rgb_to_lab)
+    assert np.allclose(tf.stack(list(dataset)), expected, rtol=1e-5, atol=1e-4)
+
+    # Graphs use the native kernel as the placement is not known
+    graph = (
+        tf.function(tfio.experimental.color.rgb_to_lab)
+        .get_concrete_function(tf.TensorSpec([None, None, 3], tf.float32))
+        .graph
+    )
+    assert "IO>ColorConvert" in [op.type for op in graph.get_operations()]
+
+
+# This benchmark compares the native color conversions against the same
+# conversions composed of TensorFlow ops.
+@pytest.mark.benchmark(
+    group="color",
+)
+@pytest.mark.parametrize(
+    ("data", "func", "check"),
+    [
+        pytest.param(
+            lambda: (np.random.random((8, 512, 512, 3)) * 256.0).astype(np.uint8),
+            tfio.experimental.color.rgb_to_ycbcr,
+            color_ops._graph_rgb_to_ycbcr,  # pylint: disable=protected-access
+        ),
+        pytest.param(
+            lambda: (np.random.random((8, 512, 512, 3)) * 256.0).astype(np.uint8),
+            color_ops._graph_rgb_to_ycbcr,  # pylint: disable=protected-access
+            tfio.experimental.color.rgb_to_ycbcr,
+        ),
+        pytest.param(
+            lambda: (np.random.random((8, 512, 512, 3))).astype(np.float32),
+            tfio.experimental.color.rgb_to_lab,
+            lambda e: color_ops._graph_rgb_to_lab(  # pylint: disable=protected-access
+                e, "D65", "2"
+            ),
+        ),
+        pytest.param(
+            lambda: (np.random.random((8, 512, 512, 3))).astype(np.float32),
+            lambda e: color_ops._graph_rgb_to_lab(  # pylint: disable=protected-access
+                e, "D65", "2"
+            ),
+            tfio.experimental.color.rgb_to_lab,
+        ),
+    ],
+    ids=["rgb_to_ycbcr", "rgb_to_ycbcr[graph]", "rgb_to_lab", "rgb_to_lab[graph]"],
+)
+def test_color_benchmark(benchmark, data, func, check):
+    """test_color_benchmark"""
+    np.random.seed(1000)
+
+    input_4d = tf.constant(data())
+    f = tf.function(func)
+    f(input_4d)
+
+    output_4d = benchmark(f, input_4d)
+    expected_4d = check(input_4d)
+    if input_4d.dtype == tf.float32:
+        assert np.allclose(output_4d, expected_4d, rtol=1e-4, atol=1e-3)
+    else:
+        assert np.all(np.abs(output_4d.numpy() - expected_4d.numpy()) <= 1)
@@ -219,5 +219,117 @@ def test_dicom_sequence():
     assert np.array_equal(tags, [b"999.999.94827453"])
 
 
+def test_decode_dicom_data_batch():
+    """test_decode_dicom_data_batch"""
+
+    fnames = ["OT-MONO2-8-colon.dcm", "US-PAL-8-10x-echo.dcm"]
+    contents = tf.stack(
+        [
+            tf.io.read_file(
+                os.path.join(
+                    os.path.dirname(os.path.abspath(__file__)), "test_dicom", fname
+                )
+            )
+            for fname in fnames
+        ]
+    )
+    tags = [
+        tfio.image.dicom_tags.StudyInstanceUID,
+        tfio.image.dicom_tags.Rows,
+        tfio.image.dicom_tags.Columns,
+    ]
+    values = tfio.image.decode_dicom_data(contents, tags=tags)
+    assert values.shape == [2, 3]
+    for i in range(2):
+        expected = tfio.image.decode_dicom_data(contents[i], tags=tags)
+        assert np.array_equal(values[i], expected)
+    assert np.array_equal(
+        values,
+        [
+            [b"1.3.46.670589.17.1.7.1.1.16", b"512", b"512"],
+            [b"999.999.3859744", b"430", b"600"],
+        ],
+    )
+
+    values = tfio.image.decode_dicom_data(contents, tags=[["[0x0020,0x000E]"]])
+    assert values.shape == [2, 1, 1]
+    assert values[1, 0, 0].numpy() == b"999.999.94827453"
+
+    assert "PatientsName" in dir(tfio.image.dicom_tags)
+    assert tfio.image.dicom_tags.PatientsName == np.uint32(0x00100010)
+    with pytest.raises(AttributeError):
+        _ = tfio.image.dicom_tags.NotADICOMTag
+
+
+def test_decode_dicom_image_batch():
+    """test_decode_dicom_image_batch"""
+
+    fnames = ["CT-MONO2-16-ankle.dcm", "CT-MONO2-16-brain.dcm", "CT-MONO2-16-ort.dcm"]
+    contents = tf.stack(
+        [
+            tf.io.read_file(
+                os.path.join(
+                    os.path.dirname(os.path.abspath(__file__)), "test_dicom", fname
+                )
+            )
+            for fname in fnames
+        ]
+    )
+
+    images = tfio.image.decode_dicom_image_batch(contents)
+    assert images.shape == [3, 1, 512, 512, 1]
+    for i in range(3):
+        expected = tfio.image.decode_dicom_image(
+            contents[i], dtype=tf.float32, scale="auto", on_error="strict"
+        )
+        assert np.array_equal(images[i], expected)
+
+    shape, bits, rescale, _ = tfio.image.decode_dicom_info(contents)
+    assert np.array_equal(shape, [[1, 512, 512, 1]] * 3)
+    assert np.all(bits.numpy() > 0)
+
+    images = tfio.image.decode_dicom_image_batch(
+        contents, scale="modality", window=[40.0, 400.0]
+    )
+    assert np.all(images.numpy() >= -160.5) and np.all(images.numpy() <= 239.5)
+
+    # mismatched shapes
+    dcm_path = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "test_dicom",
+        "MR-MONO2-16-head.dcm",
+    )
+    contents = tf.concat([contents, [tf.io.read_file(dcm_path)]], 0)
+    with pytest.raises(tf.errors.InvalidArgumentError):
+        tfio.image.decode_dicom_image_batch(contents)
+    images = tfio.image.decode_dicom_image_batch(contents, on_error="skip")
+    assert images.shape == [4, 1, 512, 512, 1]
+    assert np.all(images[3] == 0)
+
+
+def test_decode_dicom_image_batch_frames():
+    """test_decode_dicom_image_batch_frames"""
+
+    dcm_path = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "test_dicom",
+        "MR-MONO2-8-16x-heart.dcm",
+    )
+    contents = tf.io.read_file(filename=dcm_path)
+
+    expected = tfio.image.decode_dicom_image(
+        contents, dtype=tf.uint16, scale="preserve", on_error="strict"
+    )
+    images = tfio.image.decode_dicom_image_batch(
+        [contents, contents], frames=[3, 15, 4], scale="preserve", dtype=tf.uint16
+    )
+    assert images.shape == [2, 3, 256, 256, 1]
+    for i in range(2):
+        assert np.array_equal(images[i], tf.gather(expected, [3, 15, 4]))
+
+    shape, _, _, _ = tfio.image.decode_dicom_info([contents])
+    assert np.array_equal(shape, [[16, 256, 256, 1]])
+
+
 if __name__ == "__main__":
     test.main()
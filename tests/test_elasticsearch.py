@@ -102,6 +102,31 @@ def test_elasticsearch_io_dataset():
             assert attr in item
 
 
+@pytest.mark.parametrize("parse_in_kernel", [True, False])
+@pytest.mark.skipif(not is_container_running(), reason="The container is not running")
+def test_elasticsearch_io_dataset_sliced(parse_in_kernel):
+    """Test the functionality of the ElasticsearchIODataset with a sliced
+    scroll, a small page size and `_source` filtering.
+    """
+
+    dataset = tfio.experimental.elasticsearch.ElasticsearchIODataset(
+        nodes=[NODE],
+        index=INDEX,
+        doc_type=DOC_TYPE,
+        headers=HEADERS,
+        page_size=1,
+        source=["name", "age"],
+        num_slices=2,
+        parse_in_kernel=parse_in_kernel,
+    )
+
+    names = []
+    for item in dataset:
+        assert sorted(item.keys()) == ["age", "name"]
+        names.append(item["name"].numpy())
+    assert sorted(names) == [b"person1", b"person2", b"person3", b"person4"]
+
+
 @pytest.mark.skipif(not is_container_running(), reason="The container is not running")
 def test_elasticsearch_io_dataset_no_auth():
     """Test the functionality of the ElasticsearchIODataset when basic auth is
@@ -90,5 +90,48 @@ def test_binary_feather_format():
     os.unlink(f.name)
 
 
+@pytest.mark.parametrize(
+    ("version"),
+    [
+        1,
+        2,
+    ],
+    ids=[
+        "v1",
+        "v2",
+    ],
+)
+def test_nullable_feather_format(version):
+    """test_nullable_feather_format"""
+    import numpy as np
+
+    from pyarrow import feather as pa_feather
+    import pyarrow as pa
+
+    values = [e if e % 3 else None for e in range(100)]
+    table = pa.Table.from_arrays(
+        [pa.array(values, pa.int64()), pa.array(values, pa.float64())],
+        ["int64", "double"],
+    )
+    with tempfile.NamedTemporaryFile(delete=False) as f:
+        if version == 1:
+            pa_feather.write_feather(table, f, version=version)
+        else:
+            pa_feather.write_feather(table, f, version=version, chunksize=30)
+
+    # Null slots are read with whatever value the array holds for them
+    valid = np.asarray([e is not None for e in values])
+    expected = np.asarray([e if e is not None else 0 for e in values])
+    feather = tfio.IOTensor.from_feather(f.name)
+    for column in ["int64", "double"]:
+        assert feather(column).shape == [100]
+        value = feather(column).to_tensor().numpy()
+        assert np.all(value[valid] == expected[valid])
+        value = feather(column)[20:70].numpy()
+        assert np.all(value[valid[20:70]] == expected[20:70][valid[20:70]])
+
+    os.unlink(f.name)
+
+
 if __name__ == "__main__":
     test.main()
@@ -95,6 +95,78 @@ def test_ffmpeg_decode_video(video_path):
     assert np.abs(video[0] - video[-1]).sum() > 0
 
 
+@pytest.mark.skipif(
+    sys.platform == "darwin",
+    reason="TODO: macOS on GitHub use ffmpeg 5.0, needs update",
+)
+def test_ffmpeg_decode_video_sample(video_path):
+    """test_ffmpeg_decode_video_sample"""
+    content = tf.io.read_file(video_path)
+    video = tfio.experimental.ffmpeg.decode_video(content, 0)
+
+    # frames are decoded by seeking, in the requested order
+    indices = [150, 3, 80, 80, 0, 165]
+    sample = tfio.experimental.ffmpeg.decode_video(content, 0, frame_indices=indices)
+    assert sample.shape == [6, 320, 560, 3]
+    assert np.all(sample.numpy() == tf.gather(video, indices).numpy())
+
+    # all frames are selected by default
+    sample = tfio.experimental.ffmpeg.decode_video(content, 0, size=[320, 560])
+    assert np.all(sample.numpy() == video.numpy())
+
+    # sampling by time, with frames scaled during conversion
+    sample = tfio.experimental.ffmpeg.decode_video(
+        content, 0, fps=2.0, clip_duration=2.0, size=[160, 280]
+    )
+    assert sample.shape[0] == 4
+    assert sample.shape[1:] == [160, 280, 3]
+
+    with pytest.raises(tf.errors.InvalidArgumentError):
+        tfio.experimental.ffmpeg.decode_video(content, 0, frame_indices=[166])
+
+
+@pytest.mark.skipif(
+    sys.platform == "darwin",
+    reason="TODO: macOS on GitHub use ffmpeg 5.0, needs update",
+)
+def test_ffmpeg_video_pool(video_path):
+    """test_ffmpeg_video_pool"""
+    video = tfio.experimental.ffmpeg.decode_video(tf.io.read_file(video_path), 0)
+
+    dataset = tfio.experimental.IODataset.from_ffmpeg_videos(
+        [video_path, video_path, video_path],
+        parallelism=2,
+        thread_count=1,
+        thread_type="slice",
+        buffer_size=16,
+    )
+    frames = [[], [], []]
+    for file, frame in dataset:
+        frames[file.numpy()].append(frame.numpy())
+    for e in frames:
+        assert np.all(np.stack(e) == video.numpy())
+
+    decoded, frames_per_second = dataset.stats()
+    assert decoded == 3 * video.shape[0]
+    assert frames_per_second > 0
+
+    # The pool is started again for each iteration
+    for _ in range(2):
+        frames = [[], [], []]
+        for file, frame in dataset:
+            frames[file.numpy()].append(frame.numpy())
+        for e in frames:
+            assert np.all(np.stack(e) == video.numpy())
+
+    # Concurrent iterators decode with pools of their own
+    frames = [[[], [], []], [[], [], []]]
+    for (file_0, frame_0), (file_1, frame_1) in zip(dataset, dataset):
+        frames[0][file_0.numpy()].append(frame_0.numpy())
+        frames[1][file_1.numpy()].append(frame_1.numpy())
+    for e in frames[0] + frames[1]:
+        assert np.all(np.stack(e) == video.numpy())
+
+
 @pytest.mark.skipif(
     sys.platform == "darwin",
     reason="TODO: macOS on GitHub use ffmpeg 5.0, needs update",
@@ -390,6 +390,91 @@ def test_decode_tiff_multipage():
         image = tfio.experimental.image.decode_tiff(tf.io.read_file(filename), index=i)
 
 
+def test_decode_tiff_region():
+    """Test case for decode_tiff_region and IODataset.from_tiff_patches"""
+    filename = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "test_image",
+        "multipage_tiff_example.tif",
+    )
+    content = tf.io.read_file(filename)
+    for i in (0, 9):
+        image = tfio.experimental.image.decode_tiff(content, index=i)
+        # decode from content and from filename
+        for source in (content, filename):
+            region = tfio.experimental.image.decode_tiff_region(
+                source, page=i, x=130, y=70, width=200, height=100
+            )
+            assert region.shape == [100, 200, 3]
+            assert np.array_equal(region, image[70:170, 130:330, :3])
+
+    dataset = tfio.experimental.IODataset.from_tiff_patches(
+        filename, [400, 300], page=9
+    )
+    locations = [[0, 0], [400, 0], [0, 300], [400, 300]]
+    entries = list(dataset)
+    assert len(entries) == len(locations)
+    for (location, patch), (x, y) in zip(entries, locations):
+        assert np.array_equal(location, [x, y])
+        assert np.array_equal(patch, image[y : y + 300, x : x + 400, :3])
+
+    dataset = tfio.experimental.IODataset.from_tiff_patches(
+        filename, [64, 64], page=9, num_patches=5, seed=1
+    )
+    entries = list(dataset)
+    assert len(entries) == 5
+    for location, patch in entries:
+        x, y = location.numpy()
+        assert 0 <= x <= image.shape[1] - 64 and 0 <= y <= image.shape[0] - 64
+        assert np.array_equal(patch, image[y : y + 64, x : x + 64, :3])
+
+    # the same seed gives the same locations
+    locations = [location.numpy() for location, _ in dataset]
+    assert np.array_equal(locations, [location for location, _ in entries])
+
+
+def test_decode_image_batch():
+    """Test case for decode_image_batch"""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_image")
+    filenames = [
+        "sample.webp",
+        "kodim03_yuv420_8bpc.avif",
+        "Jelly-Beans.jp2",
+        "r-1316653631.481244-81973200.ppm",
+        "sample.png",
+        "lena.bmp",
+    ]
+    contents = [tf.io.read_file(os.path.join(path, e)) for e in filenames]
+    expected = [
+        tfio.image.decode_webp(contents[0])[..., :3],
+        tfio.experimental.image.decode_avif(contents[1]),
+        tfio.experimental.image.decode_jp2(contents[2]),
+        tfio.experimental.image.decode_pnm(contents[3]),
+        tf.image.decode_png(contents[4], channels=3),
+        tf.image.decode_bmp(contents[5], channels=3),
+    ]
+
+    images, status = tfio.experimental.image.decode_image_batch(
+        contents + [tf.constant(b"not an image")], size=[64, 48], dtype=tf.float32
+    )
+    assert images.shape == [7, 64, 48, 3]
+    assert np.array_equal(status, [True] * 6 + [False])
+    assert np.all(images[6] == 0)
+    for i, e in enumerate(expected):
+        e = tf.image.resize(tf.image.convert_image_dtype(e, tf.float32), [64, 48])
+        assert np.allclose(images[i], e, atol=1e-4), filenames[i]
+
+    # without resize, images with a different shape than the first one fail
+    images, status = tfio.experimental.image.decode_image_batch(
+        [contents[1], contents[0], contents[1]], channels=1
+    )
+    assert np.array_equal(status, [True, False, True])
+    gray = tf.image.rgb_to_grayscale(expected[1])
+    assert np.allclose(
+        images[0].numpy().astype(np.int32), gray.numpy().astype(np.int32), atol=1
+    )
+
+
 def test_decode_jp2():
     """Test case for decode_jp2"""
     filename = os.path.join(
@@ -93,6 +93,46 @@ def test_dataset_read():
     assert count == len(RECORDS)
 
 
+@pytest.mark.skipif(not is_container_running(), reason="The container is not running")
+def test_dataset_read_parallel_columns():
+    """Test the parallel read operations with filter and typed columns"""
+
+    dataset = tfio.experimental.mongodb.MongoDBIODataset(
+        uri=URI,
+        database=DATABASE,
+        collection=COLLECTION,
+        filter={"gender": "Female"},
+        batch_size=100,
+        num_parallel_reads=4,
+        specs=SPECS,
+    )
+    assert dataset.element_spec == SPECS
+    count = 0
+    for d in dataset:
+        assert d["gender"].numpy() == b"Female"
+        assert d["vip"].numpy()
+        count += 1
+    assert count == len(RECORDS) // 2
+
+
+@pytest.mark.skipif(not is_container_running(), reason="The container is not running")
+def test_dataset_read_many_splits():
+    """Test the parallel read operations with more splits than pooled clients"""
+
+    dataset = tfio.experimental.mongodb.MongoDBIODataset(
+        uri=URI, database=DATABASE, collection=COLLECTION, num_parallel_reads=128
+    )
+    count = 0
+    for d in dataset:
+        count += 1
+    assert count == len(RECORDS)
+
+    with pytest.raises(tf.errors.InvalidArgumentError):
+        tfio.experimental.mongodb.MongoDBIODataset(
+            uri=URI, database=DATABASE, collection=COLLECTION, num_parallel_reads=0
+        )
+
+
 @pytest.mark.skipif(not is_container_running(), reason="The container is not running")
 def test_train_model():
     """Test the dataset by training a tf.keras model"""
@@ -239,5 +239,35 @@ def test_pulsar_write_keyed_messages():
     assert kv["2"] == [("msg-" + str(i)).encode() for i in range(2, 10, 3)]
 
 
+@pytest.mark.skipif(
+    sys.platform in ("win32",),
+    reason="TODO Pulsar not setup properly on Windows yet",
+)
+def test_pulsar_write_batch_messages():
+    """Test writing a tensor of messages and receiving them in batches"""
+
+    topic = "test-write-batch-messages"
+    writer = tfio.experimental.streaming.PulsarWriter(
+        service_url="pulsar://localhost:6650", topic=topic
+    )
+    # 1. Write 1000 keyed messages in a single call, the key set is 0,1,2,0,...
+    values = ["msg-" + str(i) for i in range(1000)]
+    keys = [str(i % 3) for i in range(1000)]
+    writer.write(value=tf.constant(values), key=tf.constant(keys))
+    writer.flush()
+
+    # 2. Consume messages in batches of at most 100 and verify
+    dataset = tfio.experimental.streaming.PulsarIODataset(
+        service_url="pulsar://localhost:6650",
+        topic=topic,
+        subscription="subscription-0",
+        timeout=default_pulsar_timeout,
+        max_messages=100,
+        batch_timeout=100,
+    )
+    entries = [(m.numpy(), k.numpy()) for (m, k) in dataset]
+    assert entries == [(v.encode(), k.encode()) for (v, k) in zip(values, keys)]
+
+
 if __name__ == "__main__":
     test.main()